@@ -50,27 +50,26 @@ def assemble_schedules(schedules, qobj_id, qobj_header, run_config):
     # Pack everything into the Qobj
     qobj_schedules = []
     user_pulselib = {}
+    # digest of the samples -> name of the pulse in the library
+    pulse_names = {}
     for idx, schedule in enumerate(schedules):
         # instructions
         qobj_instructions = []
         # Instructions are returned as tuple of shifted time and instruction
         for shift, instruction in schedule.instructions:
             # TODO: support conditional gate
+            pulse_name = None
             if isinstance(instruction, PulseInstruction):
-                name = instruction.command.name
-                if name in user_pulselib and instruction.command != user_pulselib[name]:
-                    name = "{0}-{1:x}".format(name, hash(instruction.command.samples.tostring()))
-                    instruction = PulseInstruction(
-                        command=SamplePulse(name=name, samples=instruction.command.samples),
-                        name=instruction.name,
-                        channel=instruction.timeslots.channels[0])
-                # add samples to pulse library
-                user_pulselib[name] = instruction.command
+                pulse_name = _add_to_pulse_library(instruction.command, user_pulselib,
+                                                   pulse_names)
             if isinstance(instruction, AcquireInstruction):
                 if meas_map:
                     # verify all acquires satisfy meas_map
                     _validate_meas_map(instruction, meas_map)
-            qobj_instructions.append(instruction_converter(shift, instruction))
+            qobj_instruction = instruction_converter(shift, instruction)
+            if pulse_name is not None:
+                qobj_instruction.name = pulse_name
+            qobj_instructions.append(qobj_instruction)
 
         # experiment header
         qobj_experiment_header = QobjExperimentHeader(
@@ -155,3 +154,30 @@ def _validate_meas_map(acquire, meas_map):
         raise QiskitError('Qubits to be acquired: {0} do not satisfy required qubits '
                           'in measurement map: {1}'.format(measured_qubits, tied_qubits))
     return True
+
+
+def _add_to_pulse_library(command, pulse_library, pulse_names):
+    """Add a pulse to the pulse library.
+
+    The library is addressed by the content of the pulses: the pulses with the same samples
+    share a single entry, named after the first of them. A pulse whose name is already used
+    by different samples is renamed.
+
+    Args:
+        command (SamplePulse): pulse to add
+        pulse_library (dict): library of the pulses by name
+        pulse_names (dict): names of the pulses in the library by digest of their samples
+
+    Returns:
+        str: the name of the pulse in the library
+    """
+    name = pulse_names.get(command.digest)
+    if name is None:
+        name = command.name
+        if name in pulse_library:
+            name = "{0}-{1}".format(name, command.digest[:16])
+            pulse_library[name] = SamplePulse(name=name, samples=command.samples)
+        else:
+            pulse_library[name] = command
+        pulse_names[command.digest] = name
+    return name
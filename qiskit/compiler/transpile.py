@@ -13,24 +13,34 @@
 # that they have been altered from the originals.
 
 """Circuit transpile function"""
+import heapq
 import warnings
 
 from qiskit.transpiler import Layout, CouplingMap
-from qiskit.tools.parallel import parallel_map
+from qiskit.tools.parallel import parallel_map, CPU_COUNT
 from qiskit.transpiler.transpile_config import TranspileConfig
-from qiskit.transpiler.transpile_circuit import transpile_circuit
+from qiskit.transpiler.transpile_circuit import _select_pass_manager
+from qiskit.tools.events.pubsub import Publisher
 from qiskit.pulse import Schedule
 from qiskit.circuit.quantumregister import Qubit
+from qiskit.circuit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.extensions.standard.barrier import Barrier
 from qiskit import user_config
 from qiskit.transpiler.exceptions import TranspilerError
 
+# Number of chunks of circuits sent to each process when transpiling in parallel
+_CHUNKS_PER_PROCESS = 4
+
 
 def transpile(circuits,
               backend=None,
               basis_gates=None, coupling_map=None, backend_properties=None,
               initial_layout=None, seed_transpiler=None,
               optimization_level=None,
-              pass_manager=None):
+              pass_manager=None,
+              profile_passes=False,
+              optimize_components=False,
+              routing_method=None):
     """transpile one or more circuits, according to some desired
     transpilation targets.
 
@@ -120,12 +130,43 @@ def transpile(circuits,
             pass manager will be used directly (Qiskit will not attempt to
             auto-select a pass manager based on transpile options).
 
+        profile_passes (bool):
+            If True, the running time, CPU time, peak memory and dag size of every
+            pass execution are measured (see ``PassManager.profile_passes``). The
+            profile of each circuit is published with the
+            ``terra.transpiler.transpile.profile`` event once the circuit is
+            transpiled, and can be collected with
+            ``qiskit.tools.events.PassProfiler``.
+
+        optimize_components (bool):
+            If True, each circuit is split into its components: the sets of
+            qubits and clbits connected by instructions or conditions. The
+            components are unrolled and optimized in parallel, as for a
+            simulator, and joined back into a circuit. Barriers are split
+            between the components. With a coupling map, the joined circuit
+            is then laid out, routed and optimized after routing. Ignored for
+            circuits with a custom ``pass_manager``.
+
+        routing_method (str):
+            How the preset pass managers map the circuits to the coupling map.
+                'legacy': the layout of the optimization level, and swaps
+                    inserted by the LegacySwap pass (the default, if None).
+                'sabre': swaps inserted by the SabreSwap pass. If no initial
+                    layout is given, the optimization levels 1 to 3 choose the
+                    layout with the SabreLayout pass, by routing the circuit
+                    forward and backward. It scales to devices of thousands
+                    of qubits.
 
     Returns:
         QuantumCircuit or list[QuantumCircuit]: transpiled circuit(s).
 
     Raises:
         TranspilerError: in case of bad inputs to transpiler or errors in passes
+
+    Events:
+        terra.transpiler.transpile.profile: A circuit has been transpiled with
+            ``profile_passes``. The event carries the name of the transpiled circuit
+            and the list of profile dictionaries of its pass executions.
     """
 
     # transpiling schedules is not supported yet.
@@ -142,7 +183,7 @@ def transpile(circuits,
     transpile_configs = _parse_transpile_args(circuits, backend, basis_gates, coupling_map,
                                               backend_properties, initial_layout,
                                               seed_transpiler, optimization_level,
-                                              pass_manager)
+                                              pass_manager, routing_method)
     # Check circuit width against number of qubits in coupling_map(s)
     coupling_maps_list = list(config.coupling_map for config in transpile_configs)
     for circuit, parsed_coupling_map in zip(circuits, coupling_maps_list):
@@ -156,34 +197,291 @@ def transpile(circuits,
                                       'is greater than maximum ({}) '.format(max_qubits) +
                                       'in the coupling_map')
     # Transpile circuits in parallel
-    circuits = parallel_map(_transpile_circuit, list(zip(circuits, transpile_configs)))
+    if optimize_components:
+        circuits = _transpile_components(circuits, transpile_configs, profile_passes)
+    else:
+        circuits = _parallel_transpile(list(zip(circuits, transpile_configs)), profile_passes)
+
+    if profile_passes:
+        circuits, profiles = zip(*circuits)
+        circuits = list(circuits)
+        for circuit, profile in zip(circuits, profiles):
+            Publisher().publish("terra.transpiler.transpile.profile", circuit.name, profile)
 
     if len(circuits) == 1:
         return circuits[0]
     return circuits
 
 
+def _parallel_transpile(tasks, profile_passes=False):
+    """Transpile circuits in parallel, sending them to the processes in chunks.
+
+    The chunks are balanced by circuit size and the largest circuits are
+    started first, so that no process is left transpiling a large circuit
+    after the others are done. A chunk also shares the configurations of its
+    circuits, which are then sent to a process once per chunk.
+
+    Args:
+        tasks (list[tuple]): (circuit, transpile_config) tuples to transpile
+        profile_passes (bool): profile the passes run on the circuits.
+
+    Returns:
+        list: the results of ``_transpile_circuit`` for the tasks, in order.
+    """
+    num_chunks = len(tasks)
+    if CPU_COUNT > 1:
+        num_chunks = min(num_chunks, _CHUNKS_PER_PROCESS * CPU_COUNT)
+    chunks = _balanced_chunks([len(circuit.data) for circuit, _ in tasks], num_chunks)
+
+    chunk_results = parallel_map(_transpile_chunk, [[tasks[index] for index in chunk]
+                                                    for chunk in chunks],
+                                 task_kwargs={'profile_passes': profile_passes})
+    results = [None] * len(tasks)
+    for chunk, chunk_result in zip(chunks, chunk_results):
+        for index, result in zip(chunk, chunk_result):
+            results[index] = result
+    return results
+
+
+def _balanced_chunks(sizes, num_chunks):
+    """Partition the indices of sizes into chunks of balanced total size.
+
+    The indices are assigned largest size first, each to the chunk of smallest
+    total size so far.
+
+    Args:
+        sizes (list[int]): size of each item
+        num_chunks (int): maximum number of chunks
+
+    Returns:
+        list[list[int]]: the non-empty chunks, by decreasing total size.
+    """
+    chunks = [[] for _ in range(num_chunks)]
+    totals = [(0, chunk) for chunk in range(num_chunks)]
+    for index in sorted(range(len(sizes)), key=lambda index: sizes[index], reverse=True):
+        total, chunk = heapq.heappop(totals)
+        chunks[chunk].append(index)
+        heapq.heappush(totals, (total + sizes[index], chunk))
+    totals.sort(key=lambda total_chunk: (-total_chunk[0], total_chunk[1]))
+    return [chunks[chunk] for _, chunk in totals if chunks[chunk]]
+
+
+def _transpile_chunk(chunk, profile_passes=False):
+    """Transpile a chunk of (circuit, transpile_config) tuples one after the other.
+
+    The preset pass managers built for the chunk are reused for its following
+    circuits with the same configuration.
+    """
+    pass_managers = {}
+    return [_transpile_circuit(task, profile_passes, pass_managers) for task in chunk]
+
+
 # FIXME: This is a helper function because of parallel tools.
-def _transpile_circuit(circuit_config_tuple):
+def _transpile_circuit(circuit_config_tuple, profile_passes=False, pass_managers=None):
     """Select a PassManager and run a single circuit through it.
 
     Args:
         circuit_config_tuple (tuple):
             circuit (QuantumCircuit): circuit to transpile
             transpile_config (TranspileConfig): configuration dictating how to transpile
+        profile_passes (bool): profile the passes run on the circuit.
+        pass_managers (dict): preset pass managers to reuse, keyed by their
+            configuration (see ``_select_pass_manager``).
 
     Returns:
-        QuantumCircuit: transpiled circuit
+        QuantumCircuit or tuple: transpiled circuit, along with the list of pass
+            profiles if ``profile_passes`` is set.
     """
     circuit, transpile_config = circuit_config_tuple
 
-    return transpile_circuit(circuit, transpile_config)
+    pass_manager = _select_pass_manager(transpile_config, pass_managers)
+    if not profile_passes:
+        return pass_manager.run(circuit)
+
+    previous_profile_passes = pass_manager.profile_passes
+    pass_manager.profile_passes = True
+    try:
+        circuit = pass_manager.run(circuit)
+    finally:
+        pass_manager.profile_passes = previous_profile_passes
+    return circuit, pass_manager.property_set['pass_profile'] or []
+
+
+def _transpile_components(circuits, transpile_configs, profile_passes=False):
+    """Transpile circuits, optimizing the components of each circuit in parallel.
+
+    The components of a circuit are unrolled and optimized by the pass
+    manager of its optimization level for a simulator, and joined back into
+    a circuit on the original registers. With a coupling map, the joined
+    circuit is then laid out, routed and optimized after routing by the
+    preset pass manager without its unrolling stage. Circuits with a custom
+    pass manager are transpiled as a whole.
+
+    Args:
+        circuits (list[QuantumCircuit]): circuits to transpile
+        transpile_configs (list[TranspileConfig]): configuration of each circuit
+        profile_passes (bool): profile the passes run on the circuits.
+
+    Returns:
+        list: the transpiled circuits, along with their list of pass profiles
+            if ``profile_passes`` is set.
+    """
+    circuits_components = []
+    tasks = []
+    for circuit, transpile_config in zip(circuits, transpile_configs):
+        components = []
+        if transpile_config.pass_manager is None:
+            components = _split_components(circuit)
+        if len(components) < 2:
+            circuits_components.append(None)
+            tasks.append((circuit, transpile_config))
+            continue
+        component_config = TranspileConfig(basis_gates=transpile_config.basis_gates,
+                                           coupling_map=None,
+                                           backend_properties=None,
+                                           initial_layout=None,
+                                           seed_transpiler=transpile_config.seed_transpiler,
+                                           optimization_level=transpile_config.optimization_level,
+                                           pass_manager=None,
+                                           routing_method=transpile_config.routing_method)
+        circuits_components.append([bit_map for _, bit_map in components])
+        tasks.extend((component, component_config) for component, _ in components)
+
+    task_results = iter(_parallel_transpile(tasks, profile_passes))
+
+    # Join the components on the registers of their circuit
+    results = []
+    routing_indices = []
+    routing_tasks = []
+    for circuit, transpile_config, bit_maps in zip(circuits, transpile_configs,
+                                                   circuits_components):
+        if bit_maps is None:
+            results.append(next(task_results))
+            continue
+        joined = QuantumCircuit(*circuit.qregs, *circuit.cregs, name=circuit.name)
+        profile = []
+        for bit_map in bit_maps:
+            component = next(task_results)
+            if profile_passes:
+                component, component_profile = component
+                profile.extend(component_profile)
+            for instruction, qargs, cargs in component.data:
+                joined._append(instruction,
+                               [bit_map[qubit] for qubit in qargs],
+                               [bit_map[clbit] for clbit in cargs])
+        if transpile_config.coupling_map is not None:
+            routing_indices.append(len(results))
+            routing_tasks.append((joined, TranspileConfig(
+                basis_gates=transpile_config.basis_gates,
+                coupling_map=transpile_config.coupling_map,
+                backend_properties=transpile_config.backend_properties,
+                initial_layout=transpile_config.initial_layout,
+                seed_transpiler=transpile_config.seed_transpiler,
+                optimization_level=transpile_config.optimization_level,
+                pass_manager=None,
+                routing_method=transpile_config.routing_method,
+                unrolled=True)))
+        results.append((joined, profile) if profile_passes else joined)
+
+    # Lay out and route the joined circuits on their coupling map
+    if routing_tasks:
+        for index, routed in zip(routing_indices,
+                                 _parallel_transpile(routing_tasks, profile_passes)):
+            if profile_passes:
+                routed, routed_profile = routed
+                routed = (routed, results[index][1] + routed_profile)
+            results[index] = routed
+    return results
+
+
+def _split_components(circuit):
+    """Split a circuit into the circuits of its components.
+
+    The components are the sets of bits connected by the instructions, except
+    barriers, and by conditions, which connect all the bits of their classical
+    register. Barriers are split between the components of their qubits.
+
+    Args:
+        circuit (QuantumCircuit): circuit to split
+
+    Returns:
+        list[tuple(QuantumCircuit, dict)]: a circuit for each component with
+            instructions, and the map from its bits to the bits of circuit.
+    """
+    parent = {}
+
+    def find(bit):
+        root = parent.setdefault(bit, bit)
+        while root != parent[root]:
+            root = parent[root]
+        while bit != root:
+            parent[bit], bit = root, parent[bit]
+        return root
+
+    for instruction, qargs, cargs in circuit.data:
+        if instruction.name == 'barrier' or not (qargs or cargs):
+            continue
+        bits = qargs + cargs
+        if instruction.control:
+            bits = bits + list(instruction.control[0])
+        root = find(bits[0])
+        for bit in bits[1:]:
+            parent[find(bit)] = root
+
+    # Instructions of each component, in the order of the circuit
+    component_data = {}
+    for instruction, qargs, cargs in circuit.data:
+        if instruction.name == 'barrier':
+            barrier_qargs = {}
+            for qubit in qargs:
+                barrier_qargs.setdefault(find(qubit), []).append(qubit)
+            for root, component_qargs in barrier_qargs.items():
+                component_data.setdefault(root, []).append(
+                    (Barrier(len(component_qargs)), component_qargs, []))
+        elif qargs or cargs:
+            component_data.setdefault(find((qargs + cargs)[0]), []).append(
+                (instruction, qargs, cargs))
+
+    component_qubits = {}
+    for qubit in circuit.qubits:
+        component_qubits.setdefault(find(qubit), []).append(qubit)
+    component_clbits = {}
+    for clbit in circuit.clbits:
+        component_clbits.setdefault(find(clbit), []).append(clbit)
+
+    components = []
+    for root, data in component_data.items():
+        # The registers of the conditions are kept, the other bits are
+        # renumbered in new registers
+        cregs = []
+        for instruction, _, _ in data:
+            if instruction.control and instruction.control[0] not in cregs:
+                cregs.append(instruction.control[0])
+        qubits = component_qubits.get(root, [])
+        clbits = [clbit for clbit in component_clbits.get(root, [])
+                  if clbit.register not in cregs]
+        registers = cregs[:]
+        if qubits:
+            registers.insert(0, QuantumRegister(len(qubits)))
+        if clbits:
+            registers.append(ClassicalRegister(len(clbits)))
+        component = QuantumCircuit(*registers, name=circuit.name)
+        bit_map = dict(zip(component.qubits, qubits))
+        bit_map.update(zip(component.clbits,
+                           [clbit for creg in cregs for clbit in creg] + clbits))
+        inverse_map = {bit: component_bit for component_bit, bit in bit_map.items()}
+        for instruction, qargs, cargs in data:
+            component._append(instruction,
+                              [inverse_map[qubit] for qubit in qargs],
+                              [inverse_map[clbit] for clbit in cargs])
+        components.append((component, bit_map))
+    return components
 
 
 def _parse_transpile_args(circuits, backend,
                           basis_gates, coupling_map, backend_properties,
                           initial_layout, seed_transpiler, optimization_level,
-                          pass_manager):
+                          pass_manager, routing_method=None):
     """Resolve the various types of args allowed to the transpile() function through
     duck typing, overriding args, etc. Refer to the transpile() docstring for details on
     what types of inputs are allowed.
@@ -195,6 +493,9 @@ def _parse_transpile_args(circuits, backend,
     Returns:
         list[TranspileConfig]: a transpile config for each circuit, which is a standardized
             object that configures the transpiler and determines the pass manager to use.
+
+    Raises:
+        TranspilerError: if a routing method is unknown.
     """
     # Each arg could be single or a list. If list, it must be the same size as
     # number of circuits. If single, duplicate to create a list of that size.
@@ -214,16 +515,19 @@ def _parse_transpile_args(circuits, backend,
 
     pass_manager = _parse_pass_manager(pass_manager, num_circuits)
 
+    routing_method = _parse_routing_method(routing_method, num_circuits)
+
     transpile_configs = []
     for args in zip(basis_gates, coupling_map, backend_properties, initial_layout,
-                    seed_transpiler, optimization_level, pass_manager):
+                    seed_transpiler, optimization_level, pass_manager, routing_method):
         transpile_config = TranspileConfig(basis_gates=args[0],
                                            coupling_map=args[1],
                                            backend_properties=args[2],
                                            initial_layout=args[3],
                                            seed_transpiler=args[4],
                                            optimization_level=args[5],
-                                           pass_manager=args[6])
+                                           pass_manager=args[6],
+                                           routing_method=args[7])
         transpile_configs.append(transpile_config)
 
     return transpile_configs
@@ -321,3 +625,13 @@ def _parse_pass_manager(pass_manager, num_circuits):
     if not isinstance(pass_manager, list):
         pass_manager = [pass_manager] * num_circuits
     return pass_manager
+
+
+def _parse_routing_method(routing_method, num_circuits):
+    if not isinstance(routing_method, list):
+        routing_method = [routing_method] * num_circuits
+    for method in routing_method:
+        if method not in (None, 'legacy', 'sabre'):
+            raise TranspilerError("Unknown routing_method %s, expected 'legacy' "
+                                  "or 'sabre'." % method)
+    return routing_method
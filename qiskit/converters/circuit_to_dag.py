@@ -17,11 +17,14 @@
 from qiskit.dagcircuit.dagcircuit import DAGCircuit
 
 
-def circuit_to_dag(circuit):
+def circuit_to_dag(circuit, copy_operations=True):
     """Build a ``DAGCircuit`` object from a ``QuantumCircuit``.
 
     Args:
         circuit (QuantumCircuit): the input circuit.
+        copy_operations (bool): if False, the instructions of ``circuit`` are
+            shared with the returned dag instead of being copied. Code that
+            needs to mutate a shared instruction must copy it first.
 
     Return:
         DAGCircuit: the DAG representing the input circuit.
@@ -34,6 +37,8 @@ def circuit_to_dag(circuit):
         dagcircuit.add_creg(register)
 
     for instruction, qargs, cargs in circuit.data:
-        dagcircuit.apply_operation_back(instruction.copy(), qargs, cargs, instruction.control)
+        if copy_operations:
+            instruction = instruction.copy()
+        dagcircuit.apply_operation_back(instruction, qargs, cargs, instruction.control)
 
     return dagcircuit
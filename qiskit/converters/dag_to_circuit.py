@@ -13,45 +13,32 @@
 # that they have been altered from the originals.
 
 """Helper function for converting a dag to a circuit"""
-import collections
 
 from qiskit.circuit import QuantumCircuit
-from qiskit.circuit import ClassicalRegister
-from qiskit.circuit import QuantumRegister
 
 
-def dag_to_circuit(dag):
+def dag_to_circuit(dag, copy_operations=True):
     """Build a ``QuantumCircuit`` object from a ``DAGCircuit``.
 
     Args:
         dag (DAGCircuit): the input dag.
+        copy_operations (bool): if False, the operations of ``dag`` are shared
+            with the returned circuit instead of being copied. An operation
+            whose ``control`` differs from the condition of its node is
+            always copied, so the dag is never modified.
 
     Return:
         QuantumCircuit: the circuit representing the input dag.
     """
-    qregs = collections.OrderedDict()
-    for qreg in dag.qregs.values():
-        qreg_tmp = QuantumRegister(qreg.size, name=qreg.name)
-        qregs[qreg.name] = qreg_tmp
-    cregs = collections.OrderedDict()
-    for creg in dag.cregs.values():
-        creg_tmp = ClassicalRegister(creg.size, name=creg.name)
-        cregs[creg.name] = creg_tmp
-
     name = dag.name or None
-    circuit = QuantumCircuit(*qregs.values(), *cregs.values(), name=name)
+    circuit = QuantumCircuit(*dag.qregs.values(), *dag.cregs.values(), name=name)
 
     for node in dag.topological_op_nodes():
-        qubits = []
-        for qubit in node.qargs:
-            qubits.append(qregs[qubit.register.name][qubit.index])
-
-        clbits = []
-        for clbit in node.cargs:
-            clbits.append(cregs[clbit.register.name][clbit.index])
-
+        inst = node.op
         # Get arguments for classical control (if any)
-        inst = node.op.copy()
-        inst.control = node.condition
-        circuit.append(inst, qubits, clbits)
+        if copy_operations or inst.control != node.condition:
+            inst = inst.copy()
+            inst.control = node.condition
+        # The node arguments are already expanded, so there is nothing to broadcast
+        circuit._append(inst, list(node.qargs), list(node.cargs))
     return circuit
@@ -15,4 +15,5 @@
 """Module for DAG Circuits."""
 from .dagcircuit import DAGCircuit
 from .dagnode import DAGNode
+from .daglayer import DAGLayer
 from .exceptions import DAGCircuitError
@@ -24,6 +24,7 @@ directly from the graph.
 """
 from collections import OrderedDict
 import copy
+import functools
 import itertools
 import networkx as nx
 
@@ -32,6 +33,7 @@ from qiskit.circuit.classicalregister import ClassicalRegister, Clbit
 from qiskit.circuit.gate import Gate
 from .exceptions import DAGCircuitError
 from .dagnode import DAGNode
+from .daglayer import DAGLayer
 
 
 class DAGCircuit:
@@ -64,6 +66,10 @@ class DAGCircuit:
         # Stores the max id of a node added to the DAG
         self._max_node_id = 0
 
+        # The topological order of the nodes, computed on demand and cleared
+        # by every method that modifies the graph
+        self._topological_order = None
+
         # Directed multigraph whose nodes are inputs, outputs, or operations.
         # Operation nodes have equal in- and out-degrees and carry
         # additional data about the operation, including the argument order
@@ -82,6 +88,10 @@ class DAGCircuit:
         # TO REMOVE WHEN NODE IS HAVE BEEN REMOVED FULLY
         self._id_to_node = {}
 
+        # Set of wires whose operations changed since the last call to
+        # reset_modified_wires(). Used to re-run analysis passes incrementally.
+        self._modified_wires = set()
+
     def to_networkx(self):
         """Returns a copy of the DAGCircuit in networkx format."""
         return copy.deepcopy(self._multi_graph)
@@ -101,6 +111,19 @@ class DAGCircuit:
         """
         return len(self._multi_graph)
 
+    def modified_wires(self):
+        """Return the wires whose operations changed since the last call to
+        ``reset_modified_wires``, or since the dag was created.
+
+        Returns:
+            set(Bit): the wires on which operations were added or removed.
+        """
+        return set(self._modified_wires)
+
+    def reset_modified_wires(self):
+        """Start tracking the wires whose operations change from now on."""
+        self._modified_wires.clear()
+
     def remove_all_ops_named(self, opname):
         """Remove all operation nodes with the given name."""
         for n in self.named_nodes(opname):
@@ -166,6 +189,8 @@ class DAGCircuit:
                 = "%s[%s]" % (wire.register.name, wire.index)
             self._multi_graph.adj[inp_node][outp_node][0]["wire"] \
                 = wire
+            self._modified_wires.add(wire)
+            self._topological_order = None
         else:
             raise DAGCircuitError("duplicate wire %s" % (wire,))
 
@@ -235,6 +260,8 @@ class DAGCircuit:
         new_node = DAGNode(data_dict=node_properties, nid=self._max_node_id)
         self._multi_graph.add_node(new_node)
         self._id_to_node[self._max_node_id] = new_node
+        self._modified_wires.update(qargs, cargs, self._bits_in_condition(condition))
+        self._topological_order = None
 
     def apply_operation_back(self, op, qargs=None, cargs=None, condition=None):
         """Apply an operation to the output of the circuit.
@@ -626,10 +653,13 @@ class DAGCircuit:
                 nodes of n.
         """
 
-        pred_map = {e[2]['wire']: e[0] for e in
-                    self._multi_graph.in_edges(nbunch=node, data=True)}
-        succ_map = {e[2]['wire']: e[1] for e in
-                    self._multi_graph.out_edges(nbunch=node, data=True)}
+        # Read the adjacency dicts directly, as the edge views are slow
+        pred_map = {data['wire']: pred
+                    for pred, edges in self._multi_graph.pred[node].items()
+                    for data in edges.values()}
+        succ_map = {data['wire']: succ
+                    for succ, edges in self._multi_graph.succ[node].items()
+                    for data in edges.values()}
         return pred_map, succ_map
 
     def _full_pred_succ_maps(self, pred_map, succ_map, input_circuit,
@@ -691,8 +721,12 @@ class DAGCircuit:
         Returns:
             generator(DAGNode): node in topological order
         """
-        return nx.lexicographical_topological_sort(self._multi_graph,
-                                                   key=lambda x: str(x.qargs))
+        # The order is kept until the graph is modified, so a DAG used as a
+        # template, e.g. by the Unroller, is sorted once.
+        if self._topological_order is None:
+            self._topological_order = list(nx.lexicographical_topological_sort(
+                self._multi_graph, key=lambda x: str(x.qargs)))
+        return iter(self._topological_order)
 
     def topological_op_nodes(self):
         """
@@ -725,13 +759,15 @@ class DAGCircuit:
             to_replay = []
             for sorted_node in input_dag.topological_nodes():
                 if sorted_node.type == "op":
-                    sorted_node.op.control = condition
-                    to_replay.append(sorted_node)
+                    # the op may be shared with other circuits (e.g. a gate
+                    # definition), so it is copied before being conditioned.
+                    op = sorted_node.op.copy()
+                    op.control = condition
+                    to_replay.append((op, sorted_node.qargs, sorted_node.cargs))
             for input_node in input_dag.op_nodes():
                 input_dag.remove_op_node(input_node)
-            for replay_node in to_replay:
-                input_dag.apply_operation_back(replay_node.op, replay_node.qargs,
-                                               replay_node.cargs, condition=condition)
+            for op, qargs, cargs in to_replay:
+                input_dag.apply_operation_back(op, qargs, cargs, condition=condition)
 
         if wires is None:
             qwires = [w for w in input_dag.wires if isinstance(w, Qubit)]
@@ -776,6 +812,8 @@ class DAGCircuit:
                                                                  input_dag, wire_map)
         # Now that we know the connections, delete node
         self._multi_graph.remove_node(node)
+        self._modified_wires.update(pred_map)
+        self._topological_order = None
 
         # Iterate over nodes of input_circuit
         for sorted_node in input_dag.topological_op_nodes():
@@ -816,6 +854,34 @@ class DAGCircuit:
 
                 self._multi_graph.remove_edge(p[0], self.output_map[w])
 
+    def substitute_node(self, node, op):
+        """Replace the operation of an op node, keeping its wires and position.
+
+        Unlike substitute_node_with_dag, the node is modified in place, so
+        no new node or edges are created.
+
+        Args:
+            node (DAGNode): op node to modify
+            op (Instruction): the new operation, acting on as many qubits
+                and clbits as the current one
+
+        Raises:
+            DAGCircuitError: if node is not an op node or the number of
+            qubits or clbits of op does not match
+        """
+        if node.type != 'op':
+            raise DAGCircuitError('Only op nodes can be substituted, not "%s" nodes.'
+                                  % node.type)
+        if node.op.num_qubits != op.num_qubits or node.op.num_clbits != op.num_clbits:
+            raise DAGCircuitError('Cannot replace node %s acting on %s qubits and %s clbits '
+                                  'with op %s acting on %s qubits and %s clbits.'
+                                  % (node.name, node.op.num_qubits, node.op.num_clbits,
+                                     op.name, op.num_qubits, op.num_clbits))
+        node.data_dict['op'] = op
+        node.name = op.name
+        self._modified_wires.update(node.qargs, node.cargs)
+        self._topological_order = None
+
     def node(self, node_id):
         """Get the node in the dag.
 
@@ -953,11 +1019,56 @@ class DAGCircuit:
 
         # remove from graph and map
         self._multi_graph.remove_node(node)
+        self._modified_wires.update(pred_map)
+        self._topological_order = None
 
         for w in pred_map.keys():
             self._multi_graph.add_edge(pred_map[w], succ_map[w],
                                        name="%s[%s]" % (w.register.name, w.index), wire=w)
 
+    def remove_op_nodes(self, nodes):
+        """Remove operation nodes, e.g. a run from collect_runs.
+
+        Each wire is reconnected once, from the nearest remaining predecessor
+        to the nearest remaining successor of the removed nodes, instead of
+        after removing every node.
+
+        Args:
+            nodes (list[DAGNode]): op nodes to remove, in topological order.
+
+        Raises:
+            DAGCircuitError: if a node is not an op node.
+        """
+        removed = set(nodes)
+        successors = self._multi_graph._succ  # pylint: disable=protected-access
+        predecessors = self._multi_graph._pred  # pylint: disable=protected-access
+        # Map each wire to the nearest remaining predecessor of the nodes
+        # removed so far, and collect the edges connecting it to the nearest
+        # remaining successor.
+        remaining_pred = {}
+        edges = []
+        for node in nodes:
+            if node.type != 'op':
+                raise DAGCircuitError('The method remove_op_nodes only works on op node '
+                                      'types. An "%s" node type was wrongly provided.'
+                                      % node.type)
+            for pred, pred_edges in predecessors[node].items():
+                if pred not in removed:
+                    for data in pred_edges.values():
+                        remaining_pred[data['wire']] = pred
+            for succ, succ_edges in successors[node].items():
+                if succ not in removed:
+                    for data in succ_edges.values():
+                        edges.append((remaining_pred[data['wire']], succ, data['wire']))
+        self._modified_wires.update(remaining_pred)
+        self._topological_order = None
+
+        self._multi_graph.remove_nodes_from(nodes)
+        for pred, succ, wire in edges:
+            self._multi_graph.add_edge(pred, succ, name="%s[%s]" % (wire.register.name,
+                                                                    wire.index),
+                                       wire=wire)
+
     def remove_ancestors_of(self, node):
         """Remove all of the ancestor operation nodes of node."""
         anc = nx.ancestors(self._multi_graph, node)
@@ -997,8 +1108,11 @@ class DAGCircuit:
         a layer has depth 1. The total number of layers equals the
         circuit depth d. The layers are indexed from 0 to d-1 with the
         earliest layer at index 0. The layers are constructed using a
-        greedy algorithm. Each returned layer is a dict containing
-        {"graph": circuit graph, "partition": list of qubit lists}.
+        greedy algorithm. Each returned layer is a DAGLayer with the op
+        nodes of the layer and the partition (list of qubit lists) of its
+        gates. It can also be used as a dict containing
+        {"graph": circuit graph, "partition": list of qubit lists}, where
+        the circuit graph is only built when it is accessed.
 
         TODO: Gates that use the same cbits will end up in different
         layers as this is currently implemented. This may not be
@@ -1010,11 +1124,6 @@ class DAGCircuit:
         except StopIteration:
             return
 
-        def add_nodes_from(layer, nodes):
-            """ Convert DAGNodes into a format that can be added to a
-             multigraph and then add to graph"""
-            layer._multi_graph.add_nodes_from(nodes)
-
         for graph_layer in graph_layers:
 
             # Get the op nodes from the layer, removing any input and output nodes.
@@ -1024,19 +1133,6 @@ class DAGCircuit:
             if not op_nodes:
                 return
 
-            # Construct a shallow copy of self
-            new_layer = DAGCircuit()
-            new_layer.name = self.name
-
-            for creg in self.cregs.values():
-                new_layer.add_creg(creg)
-            for qreg in self.qregs.values():
-                new_layer.add_qreg(qreg)
-
-            add_nodes_from(new_layer, self.input_map.values())
-            add_nodes_from(new_layer, self.output_map.values())
-            add_nodes_from(new_layer, op_nodes)
-
             # The quantum registers that have an operation in this layer.
             support_list = [
                 op_node.qargs
@@ -1044,21 +1140,38 @@ class DAGCircuit:
                 if op_node.name not in {"barrier", "snapshot", "save", "load", "noise"}
             ]
 
-            # Now add the edges to the multi_graph
-            # By default we just wire inputs to the outputs.
-            wires = {self.input_map[wire]: self.output_map[wire]
-                     for wire in self.wires}
-            # Wire inputs to op nodes, and op nodes to outputs.
-            for op_node in op_nodes:
-                args = self._bits_in_condition(op_node.condition) \
-                       + op_node.cargs + op_node.qargs
-                arg_ids = (self.input_map[(arg.register, arg.index)] for arg in args)
-                for arg_id in arg_ids:
-                    wires[arg_id], wires[op_node] = op_node, wires[arg_id]
-
-            # Add wiring to/from the operations and between unused inputs & outputs.
-            new_layer._multi_graph.add_edges_from(wires.items())
-            yield {"graph": new_layer, "partition": support_list}
+            yield DAGLayer(op_nodes, support_list,
+                           functools.partial(self._layer_graph, op_nodes))
+
+    def _layer_graph(self, op_nodes):
+        """Return a shallow copy of self with only the given op nodes of a layer."""
+        new_layer = DAGCircuit()
+        new_layer.name = self.name
+
+        for creg in self.cregs.values():
+            new_layer.add_creg(creg)
+        for qreg in self.qregs.values():
+            new_layer.add_qreg(qreg)
+
+        new_layer._multi_graph.add_nodes_from(self.input_map.values())
+        new_layer._multi_graph.add_nodes_from(self.output_map.values())
+        new_layer._multi_graph.add_nodes_from(op_nodes)
+
+        # Now add the edges to the multi_graph
+        # By default we just wire inputs to the outputs.
+        wires = {self.input_map[wire]: self.output_map[wire]
+                 for wire in self.wires}
+        # Wire inputs to op nodes, and op nodes to outputs.
+        for op_node in op_nodes:
+            args = self._bits_in_condition(op_node.condition) \
+                   + op_node.cargs + op_node.qargs
+            arg_ids = (self.input_map[(arg.register, arg.index)] for arg in args)
+            for arg_id in arg_ids:
+                wires[arg_id], wires[op_node] = op_node, wires[arg_id]
+
+        # Add wiring to/from the operations and between unused inputs & outputs.
+        new_layer._multi_graph.add_edges_from(wires.items())
+        return new_layer
 
     def serial_layers(self):
         """Yield a layer for all gates of this circuit.
@@ -1067,28 +1180,32 @@ class DAGCircuit:
         same structure as in layers().
         """
         for next_node in self.topological_op_nodes():
-            new_layer = DAGCircuit()
-            for qreg in self.qregs.values():
-                new_layer.add_qreg(qreg)
-            for creg in self.cregs.values():
-                new_layer.add_creg(creg)
             # Save the support of the operation we add to the layer
             support_list = []
-            # Operation data
-            op = copy.copy(next_node.op)
-            qa = copy.copy(next_node.qargs)
-            ca = copy.copy(next_node.cargs)
-            co = copy.copy(next_node.condition)
-            _ = self._bits_in_condition(co)
-
-            # Add node to new_layer
-            new_layer.apply_operation_back(op, qa, ca, co)
             # Add operation to partition
             if next_node.name not in ["barrier",
                                       "snapshot", "save", "load", "noise"]:
-                support_list.append(list(qa))
-            l_dict = {"graph": new_layer, "partition": support_list}
-            yield l_dict
+                support_list.append(list(next_node.qargs))
+            yield DAGLayer([next_node], support_list,
+                           functools.partial(self._serial_layer_graph, next_node))
+
+    def _serial_layer_graph(self, node):
+        """Return a circuit with the registers of self and a copy of the op node."""
+        new_layer = DAGCircuit()
+        for qreg in self.qregs.values():
+            new_layer.add_qreg(qreg)
+        for creg in self.cregs.values():
+            new_layer.add_creg(creg)
+        # Operation data
+        op = copy.copy(node.op)
+        qa = copy.copy(node.qargs)
+        ca = copy.copy(node.cargs)
+        co = copy.copy(node.condition)
+        _ = self._bits_in_condition(co)
+
+        # Add node to new_layer
+        new_layer.apply_operation_back(op, qa, ca, co)
+        return new_layer
 
     def multigraph_layers(self):
         """Yield layers of the multigraph."""
@@ -1127,28 +1244,49 @@ class DAGCircuit:
 
         Nodes must have only one successor to continue the run.
         """
+        # The adjacency dicts of the graph are read directly, without the
+        # views networkx creates for every lookup
+        successors = self._multi_graph._succ  # pylint: disable=protected-access
+        predecessors = self._multi_graph._pred  # pylint: disable=protected-access
+        names = set(namelist)
+
+        def in_run(node):
+            """Return True if node can be part of a run."""
+            data = node.data_dict
+            return (data['type'] == 'op' and data['name'] in names
+                    and data.get('condition') is None)
+
+        def next_in_run(node):
+            """Return the node continuing the run of node, or None."""
+            node_successors = successors[node]
+            if len(node_successors) == 1:
+                next_node = next(iter(node_successors))
+                if in_run(next_node):
+                    return next_node
+            return None
+
         group_list = []
 
-        # Iterate through the nodes of self in topological order
-        # and form tuples containing sequences of gates
-        # on the same qubit(s).
-        topo_ops = list(self.topological_op_nodes())
-        nodes_seen = dict(zip(topo_ops, [False] * len(topo_ops)))
-        for node in topo_ops:
-            if node.name in namelist and node.condition is None \
-                    and not nodes_seen[node]:
-                group = [node]
-                nodes_seen[node] = True
-                s = list(self._multi_graph.successors(node))
-                while len(s) == 1 and \
-                        s[0].type == "op" and \
-                        s[0].name in namelist and \
-                        s[0].condition is None:
-                    group.append(s[0])
-                    nodes_seen[s[0]] = True
-                    s = list(self._multi_graph.successors(s[0]))
-                if len(group) >= 1:
-                    group_list.append(tuple(group))
+        # A run starts at each node that does not continue the run of
+        # one of its predecessors, and follows the gates on the same
+        # qubit(s). Finding the first nodes this way does not need the
+        # nodes in topological order.
+        for node in self._multi_graph.nodes():
+            if not in_run(node):
+                continue
+            continues_run = False
+            for pred in predecessors[node]:
+                if len(successors[pred]) == 1 and in_run(pred):
+                    continues_run = True
+                    break
+            if continues_run:
+                continue
+            group = [node]
+            next_node = next_in_run(node)
+            while next_node is not None:
+                group.append(next_node)
+                next_node = next_in_run(next_node)
+            group_list.append(tuple(group))
         return set(group_list)
 
     def nodes_on_wire(self, wire, only_ops=False):
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Object to represent a layer of operations of a DAGCircuit
+"""
+
+from collections.abc import Mapping
+
+
+class DAGLayer(Mapping):
+    """
+    Object to represent a layer of a DAGCircuit: operation nodes that act
+    on disjoint wires.
+
+    It is returned by the layers() and serial_layers() methods of a
+    DAGCircuit. A layer only holds the op nodes of the circuit and the
+    partition of their qubits. The layer as a DAGCircuit of its own is
+    built when it is first used, so passes that only need the nodes
+    do not copy the circuit wires for every layer.
+
+    For backward compatibility, a layer is also a read-only mapping
+    {"graph": DAGCircuit, "partition": list of qubit lists}.
+    """
+
+    def __init__(self, nodes, partition, build_graph):
+        """Create a layer.
+
+        Args:
+            nodes (list[DAGNode]): the op nodes of the layer.
+            partition (list[list[Qubit]]): the qubits of each gate of the
+                layer, without the barrier-like instructions.
+            build_graph (callable): function of no arguments returning
+                the layer as a DAGCircuit.
+        """
+        self.nodes = nodes
+        self.partition = partition
+        self._build_graph = build_graph
+        self._graph = None
+
+    @property
+    def graph(self):
+        """Return the layer as a DAGCircuit, building it on first use."""
+        if self._graph is None:
+            self._graph = self._build_graph()
+        return self._graph
+
+    def __getitem__(self, key):
+        if key == 'graph':
+            return self.graph
+        if key == 'partition':
+            return self.partition
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(('graph', 'partition'))
+
+    def __len__(self):
+        return 2
@@ -15,6 +15,7 @@
 """
 Sample pulse.
 """
+import hashlib
 from typing import Callable
 
 import numpy as np
@@ -44,14 +45,34 @@ class SamplePulse(Command):
         if np.any(np.abs(samples) > 1):
             raise PulseError('Absolute value of pulse envelope amplitude exceeds 1.')
 
-        self._samples = np.asarray(samples, dtype=np.complex_)
+        # The samples are read-only, so that their digest stays valid. Read-only
+        # arrays, such as the cached samples of pulse_lib, are not copied.
+        if isinstance(samples, np.ndarray) and not samples.flags.writeable:
+            samples = np.asarray(samples, dtype=np.complex_)
+        else:
+            samples = np.array(samples, dtype=np.complex_)
+        samples.setflags(write=False)
+        self._samples = samples
         self._name = SamplePulse.create_name(name)
+        self._digest = None
 
     @property
     def samples(self):
         """Return sample values."""
         return self._samples
 
+    @property
+    def digest(self) -> str:
+        """Return a digest of the sample values.
+
+        Pulses with equal samples have the same digest, including samples that only differ by
+        the sign of zeros.
+        """
+        if self._digest is None:
+            # Adding zero turns negative zeros into positive zeros
+            self._digest = hashlib.sha1((self._samples + 0.0).tobytes()).hexdigest()
+        return self._digest
+
     def draw(self, dt: float = 1, style=None,
              filename: str = None, interp_method: Callable = None,
              scaling: float = 1, interactive: bool = False):
@@ -87,13 +108,15 @@ class SamplePulse(Command):
         Returns:
             bool: are self and other equal.
         """
-        if super().__eq__(other) and \
+        if self is other:
+            return True
+        if super().__eq__(other) and self.digest == other.digest and \
                 (self._samples == other._samples).all():
             return True
         return False
 
     def __hash__(self):
-        return hash((super().__hash__(), self._samples.tostring()))
+        return hash((super().__hash__(), self.digest))
 
     def __repr__(self):
         return '%s(%s, duration=%d)' % (self.__class__.__name__, self.name, self.duration)
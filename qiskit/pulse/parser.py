@@ -90,6 +90,8 @@ class PulseExpression(ast.NodeTransformer):
         # parse parameters
         self.visit(self._tree)
 
+        self._code = self._compile()
+
     @property
     def params(self):
         """Get parameters."""
@@ -127,6 +129,9 @@ class PulseExpression(ast.NodeTransformer):
                     raise PulseError("%s got an unexpected keyword argument '%s'"
                                      % (self.__class__.__name__, key))
 
+        if self._code is not None and len(self._locals_dict) == len(self._params):
+            return self._evaluate()
+
         expr = self.visit(self._tree)
 
         if not isinstance(expr.body, ast.Num):
@@ -136,6 +141,41 @@ class PulseExpression(ast.NodeTransformer):
                 raise PulseError('Parameters %s are not all bound.' % self.params)
         return expr.body.n
 
+    def _compile(self):
+        """Compile the expression tree into a code object.
+
+        Evaluating the code object is much faster than transforming the tree, which is
+        only required when the parameters are partially bound. The tree was validated by
+        the visitor, but only the calls to supported functions are compiled so that
+        unsafe expressions keep raising when they are evaluated.
+
+        Returns:
+            code or None: Compiled expression, or None if the expression cannot be compiled.
+        """
+        for node in ast.walk(self._tree):
+            if isinstance(node, ast.Call) and node.func.id not in self._math_ops.keys():
+                return None
+        return compile(self._tree, '<pulse expression>', 'eval')
+
+    def _evaluate(self):
+        """Evaluate the compiled expression with all the parameters bound.
+
+        Returns:
+            float or complex: Evaluated value.
+
+        Raises:
+            PulseError: When parameter value is not a number.
+        """
+        namespace = {}
+        for key, val in self._locals_dict.items():
+            try:
+                _val = complex(val)
+            except ValueError:
+                raise PulseError('Invalid parameter value %s = %s is specified.' % (key, val))
+            namespace[key] = _val if _val.imag else _val.real
+        namespace.update(_compiled_math_ops)
+        return eval(self._code, {'__builtins__': {}}, namespace)  # pylint: disable=eval-used
+
     @staticmethod
     def _match_ops(opr, opr_dict, *args):
         """Helper method to apply operators.
@@ -273,6 +313,21 @@ class PulseExpression(ast.NodeTransformer):
         raise PulseError('Unsupported node: %s' % node.__class__.__name__)
 
 
+def _real_if_possible(func):
+    """Wrap a math function to return a real number when the result has no imaginary part,
+    as when the function is applied by `PulseExpression.visit_Call`."""
+    def wrapper(*args):
+        val = func(*args)
+        if not val.imag:
+            return val.real
+        return val
+    return wrapper
+
+
+_compiled_math_ops = {name: (_real_if_possible(func) if callable(func) else func)
+                      for name, func in PulseExpression._math_ops.items()}
+
+
 def parse_string_expr(source, partial_binding=False):
     """Safe parsing of string expression.
 
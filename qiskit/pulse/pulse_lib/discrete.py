@@ -19,7 +19,12 @@
 Note the sampling strategy use for all discrete pulses is `left`.
 """
 
+from typing import Callable
+
+import numpy as np
+
 from qiskit.pulse.commands import SamplePulse
+from qiskit.pulse.exceptions import PulseError
 from qiskit.pulse.pulse_lib import continuous
 from qiskit.pulse import samplers
 
@@ -256,3 +261,41 @@ def drag(duration: int, amp: complex, sigma: float, beta: float, name: str = Non
     zeroed_width = duration + 2
     return _sampled_drag_pulse(duration, amp, center, sigma, beta,
                                zeroed_width=zeroed_width, rescale_amp=True, name=name)
+
+
+def sample_many(pulse: Callable, duration: int, *args, **kwargs) -> np.ndarray:
+    """Samples a family of discrete pulses into a 2-D array.
+
+    The arguments of the pulse function may be arrays, which are broadcast together. For
+    instance, an amplitude sweep of gaussian pulses is sampled with
+    `sample_many(gaussian, 160, np.linspace(0, 0.5, 51), sigma=40)`.
+
+    Sampled pulses are cached, so the pulses sharing the same arguments are only sampled once.
+
+    Args:
+        pulse: Discrete pulse function, such as `gaussian`.
+        duration: Duration of the pulses. Must be greater than zero.
+        *args: Arguments of the pulse function, or arrays of them.
+        **kwargs: Keyword arguments of the pulse function, or arrays of them.
+
+    Returns:
+        np.ndarray: Complex array of shape `(n, duration)`, whose rows are the samples of the
+            pulses for each set of arguments, in the order of the flattened broadcast arrays.
+
+    Raises:
+        PulseError: If the arrays of arguments cannot be broadcast together.
+    """
+    names = list(kwargs.keys())
+    values = list(args) + [kwargs[name] for name in names]
+    try:
+        shape = np.broadcast(*values).shape if values else ()
+    except ValueError:
+        raise PulseError('Pulse arguments of shapes %s cannot be broadcast together.'
+                         % [np.shape(value) for value in values])
+    values = [np.broadcast_to(value, shape).ravel().tolist() for value in values]
+
+    samples = np.empty((int(np.prod(shape)), duration), dtype=np.complex_)
+    for i, row in enumerate(zip(*values) if values else [()]):
+        samples[i] = pulse(duration, *row[:len(args)],
+                           **dict(zip(names, row[len(args):]))).samples
+    return samples
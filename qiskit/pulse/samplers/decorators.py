@@ -188,6 +188,24 @@ def _update_docstring(discretized_pulse: Callable, sampler_inst: Callable) -> Ca
     return discretized_pulse
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_sample(sample_function: Callable, continuous_pulse: Callable, duration: int,
+                   args: tuple, kwargs: tuple) -> np.ndarray:
+    """Sample a continuous pulse, caching the read-only samples.
+
+    Args:
+        sample_function: Sampling strategy.
+        continuous_pulse: Continuous pulse function to sample.
+        duration: Duration to sample for.
+        args: Continuous pulse function args.
+        kwargs: Continuous pulse function kwargs, as sorted (key, value) pairs.
+    """
+    samples = np.array(sample_function(continuous_pulse, duration, *args, **dict(kwargs)),
+                       dtype=np.complex_)
+    samples.setflags(write=False)
+    return samples
+
+
 def sampler(sample_function: Callable) -> Callable:
     """Sampler decorator base method.
 
@@ -203,6 +221,10 @@ def sampler(sample_function: Callable) -> Callable:
     Note if your continuous pulse function outputs a `complex` scalar rather than a
     `np.ndarray`, you should first vectorize it before applying a sampler.
 
+    The samples are cached by sampling strategy, continuous pulse function, duration and
+    arguments, so the continuous pulse function must be deterministic. Sampling with the
+    same hashable arguments returns the same read-only array of samples.
+
 
     This class implements the sampler boilerplate for the sampler.
 
@@ -217,8 +239,15 @@ def sampler(sample_function: Callable) -> Callable:
         def call_sampler(duration: int, *args, **kwargs) -> commands.SamplePulse:
             """Replace the call to the continuous function with a call to the sampler applied
             to the analytic pulse function."""
-            sampled_pulse = sample_function(continuous_pulse, duration, *args, **kwargs)
-            return np.asarray(sampled_pulse, dtype=np.complex_)
+            key = (sample_function, continuous_pulse, duration, args,
+                   tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                # unhashable arguments, such as arrays, cannot be cached
+                sampled_pulse = sample_function(continuous_pulse, duration, *args, **kwargs)
+                return np.asarray(sampled_pulse, dtype=np.complex_)
+            return _cached_sample(*key)
 
         # Update type annotations for wrapped continuous function to be discrete
         call_sampler = _update_annotations(call_sampler)
@@ -14,10 +14,11 @@
 
 """Schedule."""
 
-import itertools
 import abc
 from typing import List, Tuple, Iterable, Union, Dict, Callable, Set, Optional, Type
 
+import numpy as np
+
 from . import ops
 from .timeslots import Interval
 from .channels import Channel
@@ -45,7 +46,7 @@ class Schedule(ScheduleComponent):
         """
         self._name = name
         try:
-            timeslots = []
+            timeslots = None
             _children = []
             for sched_pair in schedules:
                 # recreate as sequence starting at 0.
@@ -57,11 +58,15 @@ class Schedule(ScheduleComponent):
                 sched_timeslots = sched.timeslots
                 if insert_time:
                     sched_timeslots = sched_timeslots.shift(insert_time)
-                timeslots.append(sched_timeslots.timeslots)
+                if timeslots is None:
+                    timeslots = sched_timeslots
+                else:
+                    timeslots = timeslots.merged(sched_timeslots)
                 _children.append(sched_pair)
 
-            self._timeslots = TimeslotCollection(*itertools.chain(*timeslots))
+            self._timeslots = timeslots if timeslots is not None else TimeslotCollection()
             self.__children = tuple(_children)
+            self._flat_instructions = None
             self._buffer = max([child.buffer for _, child in _children]) if _children else 0
 
         except PulseError as ts_err:
@@ -102,8 +107,13 @@ class Schedule(ScheduleComponent):
 
     @property
     def instructions(self) -> Tuple[Tuple[int, 'Instruction']]:
-        """Iterable for getting instructions from Schedule tree."""
-        return tuple(self._instructions())
+        """Iterable for getting instructions from Schedule tree.
+
+        Schedules are immutable, so the flattened instructions are computed once and cached.
+        """
+        if self._flat_instructions is None:
+            self._flat_instructions = self._flatten_instructions()
+        return self._flat_instructions
 
     def ch_duration(self, *channels: List[Channel]) -> int:
         """Return duration of schedule over supplied channels.
@@ -139,8 +149,40 @@ class Schedule(ScheduleComponent):
             Tuple[int, ScheduleComponent]: Tuple containing time `ScheduleComponent` starts
                 at and the flattened `ScheduleComponent`.
         """
-        for insert_time, child_sched in self._children:
-            yield from child_sched._instructions(time + insert_time)
+        for insert_time, inst in self.instructions:
+            yield (time + insert_time, inst)
+
+    def _flatten_instructions(self) -> Tuple[Tuple[int, 'Instruction']]:
+        """Flatten the Schedule tree into a tuple of (time, instruction) pairs.
+
+        The tree is walked iteratively, so deeply nested schedules, such as the ones built by
+        appending repeatedly, do not hit the recursion limit. The instructions of a sub-schedule
+        are only expanded once: other occurrences of it in the tree, and sub-schedules whose
+        instructions were already flattened, are copied with a time shift.
+        """
+        flat = []
+        # id of an expanded Schedule -> (time, begin, end) of its instructions in `flat`
+        expanded = {}
+        # items are (time, component, begin), with begin set once the children were pushed
+        stack = [(0, self, None)]
+        while stack:
+            time, sched, begin = stack.pop()
+            if begin is not None:
+                expanded[id(sched)] = (time, begin, len(flat))
+            elif not isinstance(sched, Schedule):
+                flat.extend(sched._instructions(time))
+            elif sched._flat_instructions is not None:
+                flat.extend((time + inst_time, inst)
+                            for inst_time, inst in sched._flat_instructions)
+            elif id(sched) in expanded:
+                exp_time, exp_begin, exp_end = expanded[id(sched)]
+                flat.extend((inst_time + time - exp_time, inst)
+                            for inst_time, inst in flat[exp_begin:exp_end])
+            else:
+                stack.append((time, sched, len(flat)))
+                stack.extend((time + insert_time, child, None)
+                             for insert_time, child in reversed(sched._children))
+        return tuple(flat)
 
     def union(self, *schedules: List[ScheduleComponent], name: str = None) -> 'Schedule':
         """Return a new schedule which is the union of `self` and `schedule`.
@@ -349,7 +391,7 @@ class ParameterizedSchedule:
     def __init__(self, *schedules, parameters=None, name=None):
         full_schedules = []
         parameterized = []
-        parameters = parameters or []
+        parameters = list(parameters or [])
         self.name = name or ''
         # partition schedules into callable and schedules
         for schedule in schedules:
@@ -365,7 +407,13 @@ class ParameterizedSchedule:
 
         self._parameterized = tuple(parameterized)
         self._schedules = tuple(full_schedules)
-        self._parameters = tuple(sorted(parameters))
+        self._parameters = tuple(sorted(set(parameters)))
+        # parameters passed on to each parameterized callable
+        self._predefined = tuple(
+            param_sched.parameters if isinstance(param_sched, ParameterizedSchedule)
+            # assuming no other parametrized instructions
+            else self._parameters
+            for param_sched in self._parameterized)
 
     @property
     def parameters(self) -> Tuple[str]:
@@ -376,9 +424,46 @@ class ParameterizedSchedule:
                         *args: List[Union[int, float, complex]],
                         **kwargs: Dict[str, Union[int, float, complex]]) -> Schedule:
         """Generate the Schedule from params to evaluate command expressions"""
-        bound_schedule = Schedule(name=self.name)
-        schedules = list(self._schedules)
+        return self._bind(self._named_parameters(args, kwargs))
+
+    def bind_many(self,
+                  *args: List[Iterable[Union[int, float, complex]]],
+                  **kwargs: Dict[str, Iterable[Union[int, float, complex]]]) -> List[Schedule]:
+        """Generate a Schedule for each set of parameter values.
+
+        The values of each parameter are given as an array, and the arrays are broadcast
+        together, so a scalar value is used for all the schedules. The parameters are matched
+        with the arguments only once for the whole sweep.
 
+        Args:
+            *args: Arrays of values of the parameters, in the order of `parameters`
+            **kwargs: Arrays of values of the parameters, by name
+
+        Returns:
+            List[Schedule]: The bound schedules, in the order of the flattened broadcast arrays.
+
+        Raises:
+            PulseError: If the arrays of values cannot be broadcast together.
+        """
+        named_values = self._named_parameters(args, kwargs)
+        names = list(named_values.keys())
+        try:
+            shape = np.broadcast(*named_values.values()).shape if names else ()
+        except ValueError:
+            raise PulseError('Parameter values of shapes %s cannot be broadcast together.'
+                             % [np.shape(val) for val in named_values.values()])
+        values = [np.broadcast_to(named_values[name], shape).ravel().tolist() for name in names]
+        size = int(np.prod(shape))
+
+        return [self._bind(dict(zip(names, [val[i] for val in values])))
+                for i in range(size)]
+
+    def _named_parameters(self, args, kwargs) -> Dict[str, Union[int, float, complex]]:
+        """Match the positional and keyword arguments with the parameters.
+
+        Raises:
+            PulseError: If an argument is unexpected or given more than once.
+        """
         named_parameters = {}
         if args:
             for key, val in zip(self.parameters, args):
@@ -394,22 +479,19 @@ class ParameterizedSchedule:
                 else:
                     raise PulseError("%s got an unexpected keyword argument '%s'"
                                      % (self.__class__.__name__, key))
+        return named_parameters
+
+    def _bind(self, named_parameters: Dict[str, Union[int, float, complex]]) -> Schedule:
+        """Generate the Schedule from parameters matched with their names."""
+        schedules = list(self._schedules)
 
-        for param_sched in self._parameterized:
+        for param_sched, predefined in zip(self._parameterized, self._predefined):
             # recursively call until based callable is reached
-            if isinstance(param_sched, type(self)):
-                predefined = param_sched.parameters
-            else:
-                # assuming no other parametrized instructions
-                predefined = self.parameters
             sub_params = {k: v for k, v in named_parameters.items() if k in predefined}
             schedules.append(param_sched(**sub_params))
 
         # construct evaluated schedules
-        for sched in schedules:
-            bound_schedule |= sched
-
-        return bound_schedule
+        return Schedule(*schedules, name=self.name)
 
     def __call__(self,
                  *args: List[Union[int, float, complex]],
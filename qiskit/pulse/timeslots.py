@@ -15,6 +15,7 @@
 """
 Timeslots for channels.
 """
+import bisect
 from collections import defaultdict
 import itertools
 from typing import List, Tuple
@@ -136,7 +137,17 @@ class Timeslot:
 
 
 class TimeslotCollection:
-    """Collection of `Timeslot`s."""
+    """Collection of `Timeslot`s.
+
+    The intervals of each channel are stored as two lists of begin and end times sorted by
+    begin time. As the intervals of a channel never overlap, the end times are sorted too, so
+    overlaps are found with a binary search instead of scanning the whole channel.
+
+    Collections are immutable. Merged and shifted collections share the interval lists of the
+    channels they leave untouched, intervals merged after the end of a channel are appended to
+    its shared lists (see `_ChannelIntervals`), and `timeslots` are built lazily, which keeps
+    the incremental construction of schedules linear.
+    """
 
     def __init__(self, *timeslots: List[Timeslot]):
         """Create a new time-slot collection.
@@ -146,19 +157,53 @@ class TimeslotCollection:
         Raises:
             PulseError: when overlapped time slots are specified
         """
-        self._table = defaultdict(list)
-
+        intervals = defaultdict(list)
         for slot in timeslots:
-            for interval in self._table[slot.channel]:
-                if slot.interval.has_overlap(interval):
+            intervals[slot.channel].append((slot.interval.begin, slot.interval.end))
+
+        self._table = {}
+        for channel, ch_intervals in intervals.items():
+            ch_intervals.sort()
+            for (begin, end), (next_begin, next_end) in zip(ch_intervals, ch_intervals[1:]):
+                if next_begin < end and begin < next_end:
                     raise PulseError("Cannot create TimeslotCollection from overlapped timeslots")
-            self._table[slot.channel].append(slot.interval)
+            self._table[channel] = _ChannelIntervals([begin for begin, _ in ch_intervals],
+                                                     [end for _, end in ch_intervals])
 
         self._timeslots = tuple(timeslots)
+        self._sources = None
+
+    @classmethod
+    def _from_table(cls, table, sources) -> 'TimeslotCollection':
+        """Create a collection from sorted interval lists, without validation.
+
+        Args:
+            table (dict): map of channel to its sorted `_ChannelIntervals`
+            sources (tuple): linked list of `(previous, slots, time)` nodes, where `slots` is a
+                collection or a tuple of timeslots; the slots of all the nodes shifted by their
+                `time` make up the timeslots of the new collection
+        """
+        collection = cls.__new__(cls)
+        collection._table = table
+        collection._timeslots = None
+        collection._sources = sources
+        return collection
 
     @property
     def timeslots(self) -> Tuple[Timeslot]:
         """`Timeslot`s in collection."""
+        if self._timeslots is None:
+            parts = []
+            node = self._sources
+            while node is not None:
+                node, slots, time = node
+                if isinstance(slots, TimeslotCollection):
+                    slots = slots.timeslots
+                if time:
+                    slots = [slot.shift(time) for slot in slots]
+                parts.append(slots)
+            self._timeslots = tuple(itertools.chain.from_iterable(reversed(parts)))
+            self._sources = None
         return self._timeslots
 
     @property
@@ -187,10 +232,9 @@ class TimeslotCollection:
         Args:
             *channels: Channels over which to obtain start_time.
         """
-        intervals = list(itertools.chain(*(self._table[chan] for chan in channels
-                                           if chan in self._table)))
-        if intervals:
-            return min(interval.begin for interval in intervals)
+        begins = [self._table[chan].begin for chan in channels if chan in self._table]
+        if begins:
+            return min(begins)
         return 0
 
     def ch_stop_time(self, *channels: List[Channel]) -> int:
@@ -199,10 +243,9 @@ class TimeslotCollection:
         Args:
             *channels: Channels over which to obtain stop time.
         """
-        intervals = list(itertools.chain(*(self._table[chan] for chan in channels
-                                           if chan in self._table)))
-        if intervals:
-            return max(interval.end for interval in intervals)
+        ends = [self._table[chan].end for chan in channels if chan in self._table]
+        if ends:
+            return max(ends)
         return 0
 
     def ch_duration(self, *channels: List[Channel]) -> int:
@@ -219,10 +262,13 @@ class TimeslotCollection:
         Args:
             timeslots: TimeslotCollection to be checked
         """
-        for slot in timeslots.timeslots:
-            if slot.channel in self.channels:
-                for interval in self._table[slot.channel]:
-                    if slot.interval.has_overlap(interval):
+        for channel, intervals in timeslots._table.items():
+            if channel in self._table:
+                own_intervals = self._table[channel]
+                if intervals.begin >= own_intervals.end or intervals.end <= own_intervals.begin:
+                    continue
+                for begin, end in intervals:
+                    if own_intervals.has_overlap(begin, end):
                         return False
         return True
 
@@ -231,19 +277,55 @@ class TimeslotCollection:
 
         Args:
             timeslots: TimeslotCollection to be merged
+
+        Raises:
+            PulseError: when the collections have overlapping time slots
         """
-        slots = [Timeslot(slot.interval, slot.channel) for slot in self.timeslots]
-        slots.extend([Timeslot(slot.interval, slot.channel) for slot in timeslots.timeslots])
-        return TimeslotCollection(*slots)
+        table = dict(self._table)
+        for channel, intervals in timeslots._table.items():
+            if channel not in table:
+                table[channel] = intervals
+                continue
+            own_intervals = table[channel]
+            if intervals.begin >= own_intervals.end:
+                table[channel] = own_intervals.extended(intervals)
+            elif intervals.end <= own_intervals.begin:
+                table[channel] = intervals.extended(own_intervals)
+            else:
+                own_begins, own_ends = own_intervals.lists()
+                for begin, end in intervals:
+                    if _has_overlap(own_begins, own_ends, begin, end):
+                        raise PulseError(
+                            "Cannot create TimeslotCollection from overlapped timeslots")
+                    if begin == end:
+                        index = bisect.bisect_left(own_begins, begin)
+                    else:
+                        index = bisect.bisect_right(own_begins, begin)
+                    own_begins.insert(index, begin)
+                    own_ends.insert(index, end)
+                table[channel] = _ChannelIntervals(own_begins, own_ends)
+
+        # link to the sources of self rather than to self, so that a chain of merges does not
+        # keep the interval tables of all the intermediate collections alive
+        if self._timeslots is None:
+            sources = self._sources
+        else:
+            sources = (None, self._timeslots, 0)
+        return TimeslotCollection._from_table(table, (sources, timeslots, 0))
 
     def shift(self, time: int) -> 'TimeslotCollection':
         """Return a new TimeslotCollection shifted by `time`.
 
         Args:
             time: time to be shifted by
+
+        Raises:
+            PulseError: when the collection is shifted to a negative time
         """
-        slots = [Timeslot(slot.interval.shift(time), slot.channel) for slot in self.timeslots]
-        return TimeslotCollection(*slots)
+        if time < 0 and self._table and self.start_time + time < 0:
+            raise PulseError("Cannot create Interval with negative begin time")
+        table = {channel: intervals.shifted(time) for channel, intervals in self._table.items()}
+        return TimeslotCollection._from_table(table, (None, self, time))
 
     def __eq__(self, other) -> bool:
         """Two time-slot collections are the same if they have the same time-slots.
@@ -254,3 +336,72 @@ class TimeslotCollection:
         if self.timeslots == other.timeslots:
             return True
         return False
+
+
+class _ChannelIntervals:
+    """Sorted intervals of a channel, as a view of the first `size` items of shared lists.
+
+    The lists are shared by the collections built from each other. A view that covers its whole
+    lists appends the intervals merged after its end to them in place: the views made before
+    keep their size, so they do not see the new intervals. Any other view copies its items
+    first, so building a collection by appending intervals takes amortized constant time per
+    interval, however the collections branch.
+    """
+
+    __slots__ = ('_begins', '_ends', '_size')
+
+    def __init__(self, begins: List[int], ends: List[int], size: int = None):
+        self._begins = begins
+        self._ends = ends
+        self._size = len(begins) if size is None else size
+
+    @property
+    def begin(self) -> int:
+        """Begin time of the first interval."""
+        return self._begins[0]
+
+    @property
+    def end(self) -> int:
+        """End time of the last interval."""
+        return self._ends[self._size - 1]
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return zip(itertools.islice(self._begins, self._size),
+                   itertools.islice(self._ends, self._size))
+
+    def lists(self) -> Tuple[List[int], List[int]]:
+        """Return copies of the begin and end lists."""
+        return self._begins[:self._size], self._ends[:self._size]
+
+    def has_overlap(self, begin: int, end: int) -> bool:
+        """Return if the interval (begin, end) overlaps the intervals."""
+        return _has_overlap(self._begins, self._ends, begin, end, self._size)
+
+    def extended(self, other: '_ChannelIntervals') -> '_ChannelIntervals':
+        """Return the intervals followed by the intervals of `other`, which start after them."""
+        other_begins, other_ends = other.lists()
+        if len(self._begins) == self._size:
+            begins, ends = self._begins, self._ends
+        else:
+            begins, ends = self.lists()
+        begins.extend(other_begins)
+        ends.extend(other_ends)
+        return _ChannelIntervals(begins, ends)
+
+    def shifted(self, time: int) -> '_ChannelIntervals':
+        """Return the intervals shifted by `time`."""
+        return _ChannelIntervals([begin + time for begin in self._begins[:self._size]],
+                                 [end + time for end in self._ends[:self._size]])
+
+
+def _has_overlap(begins: List[int], ends: List[int], begin: int, end: int,
+                 size: int = None) -> bool:
+    """Return if the interval (begin, end) overlaps the sorted intervals of a channel.
+
+    Only the last interval starting before `end` has to be checked, as it has the latest end.
+    """
+    index = bisect.bisect_left(begins, end, 0, len(begins) if size is None else size)
+    return index > 0 and ends[index - 1] > begin
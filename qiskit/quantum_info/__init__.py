@@ -16,8 +16,12 @@
 
 from .operators.operator import Operator
 from .operators.pauli import Pauli, pauli_group
+from .operators.pauli_table import PauliTable
 from .operators.channel import Choi, SuperOp, Kraus, Stinespring, Chi, PTM
 from .operators.measures import process_fidelity
 from .states.states import basis_state, projector, purity
+from .states.states import partial_trace, partial_trace_stream
+from .states.statevector import Statevector
+from .states.densitymatrix import DensityMatrix
 from .states.measures import state_fidelity
 from .random import random_unitary, random_state, random_density_matrix
@@ -16,4 +16,5 @@
 
 from .operator import Operator
 from .pauli import Pauli, pauli_group
+from .pauli_table import PauliTable
 from .channel import Choi, SuperOp, Kraus, Stinespring, Chi, PTM
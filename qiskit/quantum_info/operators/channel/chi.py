@@ -39,7 +39,6 @@ from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.channel.choi import Choi
 from qiskit.quantum_info.operators.channel.superop import SuperOp
-from qiskit.quantum_info.operators.channel.transformations import _to_chi
 
 
 class Chi(QuantumChannel):
@@ -107,7 +106,7 @@ class Chi(QuantumChannel):
                 data = self._init_transformer(data)
             input_dim, output_dim = data.dim
             # Now that the input is an operator we convert it to a Chi object
-            chi_mat = _to_chi(data.rep, data._data, input_dim, output_dim)
+            chi_mat = self._transform_data(data, 'Chi')
             if input_dims is None:
                 input_dims = data.input_dims()
             if output_dims is None:
@@ -39,7 +39,6 @@ from qiskit.circuit.instruction import Instruction
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.channel.superop import SuperOp
-from qiskit.quantum_info.operators.channel.transformations import _to_choi
 from qiskit.quantum_info.operators.channel.transformations import _bipartite_tensor
 
 
@@ -107,7 +106,7 @@ class Choi(QuantumChannel):
                 data = self._init_transformer(data)
             input_dim, output_dim = data.dim
             # Now that the input is an operator we convert it to a Choi object
-            choi_mat = _to_choi(data.rep, data._data, input_dim, output_dim)
+            choi_mat = self._transform_data(data, 'Choi')
             if input_dims is None:
                 input_dims = data.input_dims()
             if output_dims is None:
@@ -42,9 +42,11 @@ from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.instruction import Instruction
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.predicates import is_identity_matrix
+from qiskit.quantum_info.operators.operator import _apply_gates
 from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.channel.choi import Choi
 from qiskit.quantum_info.operators.channel.superop import SuperOp
+from qiskit.quantum_info.operators.channel.transformations import _to_choi
 from qiskit.quantum_info.operators.channel.transformations import _to_kraus
 
 
@@ -141,7 +143,7 @@ class Kraus(QuantumChannel):
                 data = self._init_transformer(data)
             input_dim, output_dim = data.dim
             # Now that the input is an operator we convert it to a Kraus
-            kraus = _to_kraus(data.rep, data._data, input_dim, output_dim)
+            kraus = self._transform_data(data, 'Kraus')
             if input_dims is None:
                 input_dims = data.input_dims()
             if output_dims is None:
@@ -184,6 +186,27 @@ class Kraus(QuantumChannel):
             accum += np.dot(np.transpose(np.conj(op)), op)
         return is_identity_matrix(accum, rtol=rtol, atol=atol)
 
+    def is_cp(self, atol=None, rtol=None):
+        """Test if the channel is completely-positive (CP)."""
+        if self._data[1] is None:
+            # A single set of Kraus matrices is always a CP map
+            return True
+        return super().is_cp(atol=atol, rtol=rtol)
+
+    def is_tp(self, atol=None, rtol=None):
+        """Test if the channel is trace-preserving (TP)."""
+        if atol is None:
+            atol = self._atol
+        if rtol is None:
+            rtol = self._rtol
+        kraus_l, kraus_r = self._data
+        if kraus_r is None:
+            kraus_r = kraus_l
+        accum = 0j
+        for op_l, op_r in zip(kraus_l, kraus_r):
+            accum += np.dot(np.transpose(np.conj(op_r)), op_l)
+        return is_identity_matrix(accum, rtol=rtol, atol=atol)
+
     def conjugate(self):
         """Return the conjugate of the QuantumChannel."""
         kraus_l, kraus_r = self._data
@@ -219,12 +242,10 @@ class Kraus(QuantumChannel):
             QiskitError: if other cannot be converted to a channel, or
             has incompatible dimensions.
         """
-        if qargs is not None:
-            return Kraus(
-                SuperOp(self).compose(other, qargs=qargs, front=front))
-
         if not isinstance(other, Kraus):
             other = Kraus(other)
+        if qargs is not None:
+            return self._compose_subsystem(other, qargs, front)
         # Check dimensions match up
         if front and self._input_dim != other._output_dim:
             raise QiskitError(
@@ -253,7 +274,8 @@ class Kraus(QuantumChannel):
             kab_r = [np.dot(a, b) for a in ka_r for b in kb_l]
         else:
             kab_r = [np.dot(a, b) for a in ka_r for b in kb_r]
-        return Kraus((kab_l, kab_r), input_dim, output_dim)
+        data = self._truncate_kraus((kab_l, kab_r), input_dim, output_dim)
+        return Kraus(data, input_dim, output_dim)
 
     def power(self, n):
         """The matrix power of the channel.
@@ -381,9 +403,16 @@ class Kraus(QuantumChannel):
             QiskitError: if the operator dimension does not match the
             specified QuantumState subsystem dimensions.
         """
-        # If subsystem evolution we use the SuperOp representation
         if qargs is not None:
-            return SuperOp(self)._evolve(state, qargs)
+            if self.input_dims() != self.output_dims():
+                # If subsystem evolution changes the dimension we use the
+                # SuperOp representation
+                return SuperOp(self)._evolve(state, qargs)
+            # Otherwise we contract the Kraus matrices with the subsystems
+            # of the density matrix. Place import here to avoid cyclic import
+            from qiskit.quantum_info.states.densitymatrix import DensityMatrix
+            state = self._format_state(state, density_matrix=True)
+            return DensityMatrix(state).evolve(self, qargs=qargs).data
 
         # Otherwise we compute full evolution directly
         state = self._format_state(state)
@@ -404,6 +433,62 @@ class Kraus(QuantumChannel):
         return np.einsum('AiB,BC,AjC->ij', kraus_l, state,
                          np.conjugate(kraus_r))
 
+    def _compose_subsystem(self, other, qargs, front=False):
+        """Return the composition channel with other acting on subsystems."""
+        if other.input_dims() != other.output_dims():
+            # Subsystem composition changing the dimension uses the
+            # SuperOp representation
+            return Kraus(
+                SuperOp(self).compose(other, qargs=qargs, front=front))
+        if front and self.input_dims(qargs=qargs) != other.output_dims():
+            raise QiskitError(
+                'output_dims of other must match subsystem input_dims')
+        if not front and self.output_dims(qargs=qargs) != other.input_dims():
+            raise QiskitError(
+                'input_dims of other must match subsystem output_dims')
+        # Multiply each pair of Kraus matrices by applying the Kraus matrix
+        # of other to the subsystems of the rows (or columns if front)
+        # without expanding it to the full dimension.
+        if front:
+            dims = self.input_dims()
+
+            def product(mat_a, mat_b):
+                return _apply_gates(mat_a.T, dims, [(mat_b.T, qargs)]).T
+        else:
+            dims = self.output_dims()
+
+            def product(mat_a, mat_b):
+                return _apply_gates(mat_a, dims, [(mat_b, qargs)])
+
+        ka_l, ka_r = self._data
+        kb_l, kb_r = other._data
+        kab_l = [product(a, b) for a in ka_l for b in kb_l]
+        if ka_r is None and kb_r is None:
+            kab_r = None
+        else:
+            if ka_r is None:
+                ka_r = ka_l
+            if kb_r is None:
+                kb_r = kb_l
+            kab_r = [product(a, b) for a in ka_r for b in kb_r]
+        data = self._truncate_kraus((kab_l, kab_r), self._input_dim,
+                                    self._output_dim)
+        return Kraus(data, self.input_dims(), self.output_dims())
+
+    @staticmethod
+    def _truncate_kraus(data, input_dim, output_dim):
+        """Reduce a set of Kraus matrices larger than the maximum Choi rank.
+
+        A channel has at most input_dim * output_dim linearly independent
+        Kraus matrices. Larger sets, as produced by composing channels, are
+        reduced to a minimal set through the Choi matrix so that repeated
+        composition does not grow the number of Kraus matrices.
+        """
+        if len(data[0]) <= input_dim * output_dim:
+            return data
+        choi = _to_choi('Kraus', data, input_dim, output_dim)
+        return _to_kraus('Choi', choi, input_dim, output_dim)
+
     def _tensor_product(self, other, reverse=False):
         """Return the tensor product channel.
 
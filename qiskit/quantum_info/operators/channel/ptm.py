@@ -44,7 +44,6 @@ from qiskit.circuit.instruction import Instruction
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.channel.superop import SuperOp
-from qiskit.quantum_info.operators.channel.transformations import _to_ptm
 
 
 class PTM(QuantumChannel):
@@ -102,7 +101,7 @@ class PTM(QuantumChannel):
                 data = self._init_transformer(data)
             input_dim, output_dim = data.dim
             # Now that the input is an operator we convert it to a PTM object
-            ptm = _to_ptm(data.rep, data._data, input_dim, output_dim)
+            ptm = self._transform_data(data, 'PTM')
             if input_dims is None:
                 input_dims = data.input_dims()
             if output_dims is None:
@@ -25,9 +25,7 @@ from qiskit.quantum_info.operators.base_operator import BaseOperator
 from qiskit.quantum_info.operators.operator import Operator
 from qiskit.quantum_info.operators.predicates import is_identity_matrix
 from qiskit.quantum_info.operators.predicates import is_positive_semidefinite_matrix
-from qiskit.quantum_info.operators.channel.transformations import _to_choi
-from qiskit.quantum_info.operators.channel.transformations import _to_kraus
-from qiskit.quantum_info.operators.channel.transformations import _to_operator
+from qiskit.quantum_info.operators.channel.transformations import _TRANSFORMATIONS
 
 
 class QuantumChannel(BaseOperator):
@@ -35,18 +33,18 @@ class QuantumChannel(BaseOperator):
 
     def is_cptp(self, atol=None, rtol=None):
         """Return True if completely-positive trace-preserving (CPTP)."""
-        choi = _to_choi(self.rep, self._data, *self.dim)
+        choi = self._converted_data('Choi')
         return self._is_cp_helper(choi, atol, rtol) and self._is_tp_helper(
             choi, atol, rtol)
 
     def is_tp(self, atol=None, rtol=None):
         """Test if a channel is completely-positive (CP)"""
-        choi = _to_choi(self.rep, self._data, *self.dim)
+        choi = self._converted_data('Choi')
         return self._is_tp_helper(choi, atol, rtol)
 
     def is_cp(self, atol=None, rtol=None):
         """Test if Choi-matrix is completely-positive (CP)"""
-        choi = _to_choi(self.rep, self._data, *self.dim)
+        choi = self._converted_data('Choi')
         return self._is_cp_helper(choi, atol, rtol)
 
     def is_unitary(self, atol=None, rtol=None):
@@ -59,7 +57,7 @@ class QuantumChannel(BaseOperator):
 
     def to_operator(self):
         """Try to convert channel to a unitary representation Operator."""
-        mat = _to_operator(self.rep, self._data, *self.dim)
+        mat = _copy_data(self._converted_data('Operator'))
         return Operator(mat, self.input_dims(), self.output_dims())
 
     def to_instruction(self):
@@ -87,7 +85,7 @@ class QuantumChannel(BaseOperator):
             )
         # Next we convert to the Kraus representation. Since channel is CPTP we know
         # that there is only a single set of Kraus operators
-        kraus, _ = _to_kraus(self.rep, self._data, *self.dim)
+        kraus, _ = _copy_data(self._converted_data('Kraus'))
         # If we only have a single Kraus operator then the channel is
         # a unitary channel so can be converted to a UnitaryGate. We do this by
         # converting to an Operator and using its to_instruction method
@@ -95,6 +93,36 @@ class QuantumChannel(BaseOperator):
             return Operator(kraus[0]).to_instruction()
         return Instruction('kraus', n_qubits, 0, kraus)
 
+    def _converted_data(self, rep):
+        """Return the data of the channel in another representation.
+
+        Conversions are cached on the channel so that converting it to a
+        representation again, for example to the Choi matrix to test for
+        complete positivity, does not repeat the transformation. The cached
+        arrays are read-only, and must be copied to become the data of
+        another object.
+        """
+        if rep == self.rep:
+            return self._data
+        cache = getattr(self, '_conversions', None)
+        # The cache is discarded if the channel data has been replaced or
+        # modified in place since the conversions were cached
+        if cache is None or not _equal_data(cache[0], self._data):
+            cache = (_copy_data(self._data), {})
+            self._conversions = cache  # pylint: disable=attribute-defined-outside-init
+        if rep not in cache[1]:
+            converted = _copy_data(_TRANSFORMATIONS[rep](self.rep, self._data, *self.dim))
+            _map_data(lambda array: array.setflags(write=False), converted)
+            cache[1][rep] = converted
+        return cache[1][rep]
+
+    @staticmethod
+    def _transform_data(data, rep):
+        """Return the data of a QuantumChannel or Operator in another representation."""
+        if isinstance(data, QuantumChannel):
+            return _copy_data(data._converted_data(rep))
+        return _TRANSFORMATIONS[rep](data.rep, data._data, *data.dim)
+
     def _is_cp_helper(self, choi, atol, rtol):
         """Test if a channel is completely-positive (CP)"""
         if atol is None:
@@ -158,3 +186,32 @@ class QuantumChannel(BaseOperator):
         # 'to_quantumchannel' conversion method we try and initialize it as a
         # regular matrix Operator which can be converted into a QuantumChannel.
         return Operator(data)
+
+
+def _map_data(func, data):
+    """Apply a function to the arrays of the data of a channel.
+
+    The data is an array, or a tuple of the arrays or lists of arrays of
+    the Kraus and Stinespring representations, with None for the right
+    operators of channels given by a single set.
+    """
+    if isinstance(data, (tuple, list)):
+        return type(data)(_map_data(func, item) for item in data)
+    if data is None:
+        return None
+    return func(data)
+
+
+def _copy_data(data):
+    """Return a copy of the data of a channel, with writeable arrays."""
+    return _map_data(np.array, data)
+
+
+def _equal_data(data1, data2):
+    """Return True if the data of two channels are equal."""
+    if isinstance(data1, (tuple, list)):
+        return (type(data1) is type(data2) and len(data1) == len(data2) and
+                all(_equal_data(item1, item2) for item1, item2 in zip(data1, data2)))
+    if data1 is None or data2 is None:
+        return data1 is data2
+    return data1.shape == data2.shape and np.array_equal(data1, data2)
@@ -44,7 +44,6 @@ from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.channel.kraus import Kraus
 from qiskit.quantum_info.operators.channel.choi import Choi
 from qiskit.quantum_info.operators.channel.superop import SuperOp
-from qiskit.quantum_info.operators.channel.transformations import _to_stinespring
 
 
 class Stinespring(QuantumChannel):
@@ -115,8 +114,7 @@ class Stinespring(QuantumChannel):
             input_dim, output_dim = data.dim
             # Now that the input is an operator we convert it to a
             # Stinespring operator
-            stine = _to_stinespring(data.rep, data._data, input_dim,
-                                    output_dim)
+            stine = self._transform_data(data, 'Stinespring')
             if input_dims is None:
                 input_dims = data.input_dims()
             if output_dims is None:
@@ -95,11 +95,10 @@ class SuperOp(QuantumChannel):
                 # We use the QuantumChannel init transform to initialize
                 # other objects into a QuantumChannel or Operator object.
                 data = self._init_transformer(data)
+            input_dim, output_dim = data.dim
             # Now that the input is an operator we convert it to a
             # SuperOp object
-            input_dim, output_dim = data.dim
-            super_mat = _to_superop(data.rep, data._data, input_dim,
-                                    output_dim)
+            super_mat = self._transform_data(data, 'SuperOp')
             if input_dims is None:
                 input_dims = data.input_dims()
             if output_dims is None:
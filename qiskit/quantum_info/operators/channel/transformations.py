@@ -133,6 +133,18 @@ def _to_operator(rep, data, input_dim, output_dim):
     return _kraus_to_operator(data, input_dim, output_dim)
 
 
+# Transformation to each QuantumChannel representation
+_TRANSFORMATIONS = {
+    'Choi': _to_choi,
+    'SuperOp': _to_superop,
+    'Kraus': _to_kraus,
+    'Chi': _to_chi,
+    'PTM': _to_ptm,
+    'Stinespring': _to_stinespring,
+    'Operator': _to_operator
+}
+
+
 def _from_operator(rep, data, input_dim, output_dim):
     """Transform Operator representation to other representation."""
     if rep == 'Operator':
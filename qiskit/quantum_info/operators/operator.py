@@ -426,43 +426,204 @@ class Operator(BaseOperator):
     @classmethod
     def _instruction_to_operator(cls, instruction):
         """Convert a QuantumCircuit or Instruction to an Operator."""
-        # Convert circuit to an instruction
         if isinstance(instruction, QuantumCircuit):
-            instruction = instruction.to_instruction()
+            num_qubits = len(instruction.qubits)
+        else:
+            num_qubits = instruction.num_qubits
         # Initialize an identity operator of the correct size of the circuit
-        op = Operator(np.eye(2 ** instruction.num_qubits))
+        op = Operator(np.eye(2 ** num_qubits))
         op._append_instruction(instruction)
         return op
 
     def _append_instruction(self, obj, qargs=None):
-        """Update the current Operator by apply an instruction."""
-        if isinstance(obj, Instruction):
-            mat = None
-            if hasattr(obj, 'to_matrix'):
-                # If instruction is a gate first we see if it has a
-                # `to_matrix` definition and if so use that.
-                try:
-                    mat = obj.to_matrix()
-                except QiskitError:
-                    pass
-            if mat is not None:
-                # Perform the composition and inplace update the current state
-                # of the operator
-                op = self.compose(mat, qargs=qargs)
-                self._data = op.data
-            else:
-                # If the instruction doesn't have a matrix defined we use its
-                # circuit decomposition definition if it exists, otherwise we
-                # cannot compose this gate and raise an error.
-                if obj.definition is None:
-                    raise QiskitError('Cannot apply Instruction: {}'.format(obj.name))
-                for instr, qregs, cregs in obj.definition:
-                    if cregs:
-                        raise QiskitError(
-                            'Cannot apply instruction with classical registers: {}'.format(
-                                instr.name))
-                    # Get the integer position of the flat register
-                    new_qargs = [tup.index for tup in qregs]
-                    self._append_instruction(instr, qargs=new_qargs)
+        """Update the current Operator by apply an instruction.
+
+        The instruction is unrolled to gates with a matrix definition,
+        which are fused into blocks on a few qubits before being applied
+        to the operator matrix.
+        """
+        if isinstance(obj, QuantumCircuit):
+            num_qubits = len(obj.qubits)
+        elif isinstance(obj, Instruction):
+            num_qubits = obj.num_qubits
         else:
             raise QiskitError('Input is not an instruction.')
+        if qargs is None:
+            if num_qubits != len(self._output_dims):
+                raise QiskitError(
+                    'input_dims of other must match subsystem output_dims')
+            qargs = list(range(num_qubits))
+        if any(self._output_dims[qubit] != 2 for qubit in qargs):
+            raise QiskitError(
+                'input_dims of other must match subsystem output_dims')
+        gates = _fuse_gates(_gate_sequence(obj, qargs))
+        self._data = _apply_gates(self._data, self._output_dims, gates)
+
+
+def _apply_gates(data, dims, gates):
+    """Left multiply a matrix by a sequence of gates on its subsystems.
+
+    Args:
+        data (np.array): a matrix with the subsystem dimensions dims on its
+            rows, or a vector.
+        dims (tuple): the subsystem dimensions, least significant first.
+        gates (iterable): (matrix, qargs) pairs of the gates to apply in order.
+
+    Returns:
+        np.array: the multiplied matrix, of the same shape as data.
+    """
+    # The matrix is kept as a tensor with one index per subsystem plus a
+    # column index. The indices are stored in the order `axes`, which puts
+    # the subsystems of the last applied gate first, so each gate is a
+    # single matrix product into a second buffer.
+    num_subsystems = len(dims)
+    shape = tuple(reversed(dims)) + (data.size // int(np.product(dims)),)
+    axes = list(range(num_subsystems + 1))
+    # Both buffers must be C-contiguous so reshapes are views of them
+    tensor = np.array(data, dtype=complex, order='C').reshape(shape)
+    buffer = np.empty(shape, dtype=complex)
+    for mat, qargs in gates:
+        # Tensor axes of the gate subsystems, most significant first
+        gate_axes = [num_subsystems - 1 - qubit for qubit in reversed(qargs)]
+        perm = [axes.index(axis) for axis in gate_axes]
+        perm += [pos for pos in range(len(axes)) if pos not in perm]
+        if perm != sorted(perm):
+            current = tensor.reshape([shape[axis] for axis in axes])
+            axes = [axes[pos] for pos in perm]
+            np.copyto(buffer.reshape([shape[axis] for axis in axes]),
+                      current.transpose(perm))
+            tensor, buffer = buffer, tensor
+        np.dot(mat, tensor.reshape(len(mat), -1), out=buffer.reshape(len(mat), -1))
+        tensor, buffer = buffer, tensor
+    tensor = tensor.reshape([shape[axis] for axis in axes])
+    return np.reshape(tensor.transpose(np.argsort(axes)), data.shape)
+
+
+# Matrices of gates keyed by gate class, name and parameters
+_GATE_MATRICES = {}
+_GATE_MATRICES_SIZE = 1024
+
+
+def _gate_matrix(gate):
+    """Return the (cached) matrix of a gate, or None if it does not define one."""
+    if not hasattr(gate, 'to_matrix'):
+        return None
+    try:
+        key = (type(gate), gate.name, tuple(gate.params))
+        mat = _GATE_MATRICES.get(key)
+    except TypeError:
+        # Parameters such as unitary matrices are not hashable
+        key = mat = None
+    if mat is None:
+        try:
+            mat = np.array(gate.to_matrix(), dtype=complex)
+        except QiskitError:
+            return None
+        if key is not None:
+            if len(_GATE_MATRICES) >= _GATE_MATRICES_SIZE:
+                _GATE_MATRICES.clear()
+            mat.setflags(write=False)
+            _GATE_MATRICES[key] = mat
+    return mat
+
+
+def _gate_sequence(obj, qargs):
+    """Yield the (matrix, qargs) of the gates a circuit or instruction unrolls to."""
+    if isinstance(obj, QuantumCircuit):
+        positions = {qubit: pos for pos, qubit in enumerate(obj.qubits)}
+        for instr, qregs, cregs in obj.data:
+            if cregs:
+                raise QiskitError(
+                    'Cannot apply instruction with classical registers: {}'.format(
+                        instr.name))
+            yield from _gate_sequence(instr, [qargs[positions[tup]] for tup in qregs])
+        return
+    mat = _gate_matrix(obj)
+    if mat is not None:
+        yield mat, list(qargs)
+        return
+    # If the instruction doesn't have a matrix defined we use its
+    # circuit decomposition definition if it exists, otherwise we
+    # cannot compose this gate and raise an error.
+    if obj.definition is None:
+        raise QiskitError('Cannot apply Instruction: {}'.format(obj.name))
+    for instr, qregs, cregs in obj.definition:
+        if cregs:
+            raise QiskitError(
+                'Cannot apply instruction with classical registers: {}'.format(
+                    instr.name))
+        # Get the integer position of the flat register
+        yield from _gate_sequence(instr, [qargs[tup.index] for tup in qregs])
+
+
+def _fuse_gates(gates, max_qubits=4):
+    """Fuse a sequence of (matrix, qargs) gates into fewer, larger gates.
+
+    Gates are accumulated in open blocks acting on disjoint qubits. A gate
+    is merged with the open blocks sharing its qubits while they act on at
+    most max_qubits qubits (or the qubits of the gate itself); otherwise
+    those blocks are emitted first. Blocks on disjoint qubits commute, so
+    emitting them in any order preserves the product.
+    """
+    blocks = {}
+    for mat, qargs in gates:
+        touched = []
+        for qubit in qargs:
+            block = blocks.get(qubit)
+            if block is not None and all(block is not other for other in touched):
+                touched.append(block)
+        num_qubits = len(set(qargs).union(*(block[1] for block in touched)))
+        if num_qubits > max(max_qubits, len(qargs)):
+            for block in touched:
+                for qubit in block[1]:
+                    del blocks[qubit]
+                yield block
+            touched = []
+        for block in touched:
+            mat, qargs = _compose_gates(block[0], block[1], mat, qargs)
+        block = (mat, qargs)
+        for qubit in qargs:
+            blocks[qubit] = block
+    emitted = set()
+    for block in blocks.values():
+        if id(block) not in emitted:
+            emitted.add(id(block))
+            yield block
+
+
+def _compose_gates(first, first_qargs, second, second_qargs):
+    """Return the (matrix, qargs) of the gate `second` applied after `first`."""
+    qargs = list(second_qargs) + [q for q in first_qargs if q not in second_qargs]
+    dim = 2 ** len(qargs)
+    tensor = np.reshape(np.eye(dim, dtype=complex), len(qargs) * (2,) + (dim,))
+    tensor = _apply_gate(tensor, first, [qargs.index(q) for q in first_qargs])
+    tensor = _apply_gate(tensor, second, list(range(len(second_qargs))))
+    return np.reshape(tensor, (dim, dim)), qargs
+
+
+def _apply_gate(tensor, mat, qargs, out=None):
+    """Left multiply a matrix, reshaped to a tensor, by a gate on qargs.
+
+    Args:
+        tensor (np.array): a matrix reshaped to a tensor with one index for
+            each output subsystem, most significant first, and an input index.
+        mat (np.array): the matrix of the gate.
+        qargs (list): the subsystems the gate acts on.
+        out (np.array): optional array to store the result in.
+
+    Returns:
+        np.array: the multiplied tensor.
+    """
+    rank = tensor.ndim
+    axes = [rank - 2 - qubit for qubit in qargs]
+    contract = [rank + j for j in range(len(qargs))]
+    indices = list(range(rank))
+    for axis, index in zip(axes, contract):
+        indices[axis] = index
+    # The most significant qubit of the gate is the last of its qargs
+    indices_mat = axes[::-1] + contract[::-1]
+    operands = [np.reshape(mat, 2 * len(qargs) * (2,)), indices_mat,
+                tensor, indices, list(range(rank))]
+    if out is None:
+        return np.einsum(*operands)
+    return np.einsum(*operands, out=out)
@@ -270,8 +270,11 @@ class Pauli:
         Returns:
             numpy.array: a matrix that represents the pauli.
         """
-        mat = self.to_spmatrix()
-        return mat.toarray()
+        cols, values = self._matrix_entries()
+        dim = len(cols)
+        mat = np.zeros((dim, dim), dtype=complex)
+        mat[np.arange(dim), cols] = values
+        return mat
 
     def to_spmatrix(self):
         r"""
@@ -283,19 +286,87 @@ class Pauli:
             scipy.sparse.csr_matrix: a sparse matrix with CSR format that
             represents the pauli.
         """
-        mat = sparse.coo_matrix(1)
-        for z, x in zip(self._z, self._x):
-            if not z and not x:  # I
-                mat = sparse.bmat([[mat, None], [None, mat]], format='coo')
-            elif z and not x:  # Z
-                mat = sparse.bmat([[mat, None], [None, -mat]], format='coo')
-            elif not z and x:  # X
-                mat = sparse.bmat([[None, mat], [mat, None]], format='coo')
-            else:  # Y
-                mat = mat * 1j
-                mat = sparse.bmat([[None, -mat], [mat, None]], format='coo')
-
-        return mat.tocsr()
+        cols, values = self._matrix_entries()
+        dim = len(cols)
+        return sparse.csr_matrix((values, cols, np.arange(dim + 1, dtype=cols.dtype)),
+                                 shape=(dim, dim))
+
+    def _matrix_entries(self):
+        """Return the non-zero entries of the matrix of the Pauli.
+
+        Z^z X^x maps the basis state |j> to (-1)^{z.(j ^ x)} |j ^ x>, so
+        row i of the matrix has a single entry (-i)^{z.x} (-1)^{z.i} in
+        column i ^ x.
+
+        Returns:
+            tuple: (cols, values) arrays with the column and value of the
+            entry of each row.
+
+        Raises:
+            QiskitError: if the Pauli has too many qubits for a matrix.
+        """
+        num_qubits = len(self)
+        if num_qubits > 62:
+            raise QiskitError("Cannot construct the matrix of a "
+                              "{}-qubit Pauli.".format(num_qubits))
+        x_int = sum(1 << int(i) for i in np.flatnonzero(self._x))
+        index_dtype = np.int32 if num_qubits < 31 else np.int64
+        cols = np.arange(2 ** num_qubits, dtype=index_dtype) ^ index_dtype(x_int)
+        # (-1)^{z.i}, doubled up one qubit at a time
+        signs = np.ones(1, dtype=np.int8)
+        for z in self._z:
+            signs = np.concatenate([signs, -signs if z else signs])
+        phase = (-1j) ** np.count_nonzero(self._z & self._x)
+        return cols, phase * signs
+
+    def evolve(self, state):
+        r"""Apply the Pauli to a state without constructing its matrix.
+
+        Order is q_{n-1} .... q_0, i.e., $P_{n-1} \otimes ... P_0$
+
+        Args:
+            state (numpy.ndarray): a statevector, or a density matrix.
+
+        Returns:
+            numpy.ndarray: P|psi> for a statevector, or P.rho.P^dagger for
+            a density matrix.
+
+        Raises:
+            QiskitError: if the dimension of the state does not match the Pauli.
+        """
+        state = self._check_state(state)
+        cols, values = self._matrix_entries()
+        if state.ndim == 1:
+            return values * state[cols]
+        return values[:, None] * state[cols][:, cols] * values.conj()
+
+    def expectation(self, state):
+        r"""Return the expectation value of the Pauli for a state.
+
+        Args:
+            state (numpy.ndarray): a statevector, or a density matrix.
+
+        Returns:
+            float: <psi|P|psi> for a statevector, or Tr[P.rho] for a
+            density matrix.
+
+        Raises:
+            QiskitError: if the dimension of the state does not match the Pauli.
+        """
+        state = self._check_state(state)
+        cols, values = self._matrix_entries()
+        if state.ndim == 1:
+            return np.real(np.vdot(state, values * state[cols]))
+        return np.real(np.dot(values, state[cols, np.arange(len(cols))]))
+
+    def _check_state(self, state):
+        """Return the state as an array, checking it matches the Pauli."""
+        state = np.asarray(state)
+        dim = 2 ** len(self)
+        if state.shape not in [(dim,), (dim, dim)]:
+            raise QiskitError("State of shape {} does not match a {}-qubit "
+                              "Pauli.".format(state.shape, len(self)))
+        return state
 
     def to_operator(self):
         """Convert to Operator object."""
@@ -536,8 +607,6 @@ def pauli_group(number_of_qubits, case='weight'):
         QiskitError: number_of_qubits is larger than 4
     """
     if number_of_qubits < 5:
-        temp_set = []
-
         if case == 'weight':
             tmp = pauli_group(number_of_qubits, case='tensor')
             # sort on the weight of the Pauli operator
@@ -545,22 +614,12 @@ def pauli_group(number_of_qubits, case='weight'):
                 np.array(x.to_label(), 'c') == b'I'))
         elif case == 'tensor':
             # the Pauli set is in tensor order II IX IY IZ XI ...
-            for k in range(4 ** number_of_qubits):
-                z = np.zeros(number_of_qubits, dtype=np.bool)
-                x = np.zeros(number_of_qubits, dtype=np.bool)
-                # looping over all the qubits
-                for j in range(number_of_qubits):
-                    # making the Pauli for each j fill it in from the
-                    # end first
-                    element = (k // (4 ** j)) % 4
-                    if element == 1:
-                        x[j] = True
-                    elif element == 2:
-                        z[j] = True
-                        x[j] = True
-                    elif element == 3:
-                        z[j] = True
-                temp_set.append(Pauli(z, x))
+            # element j of Pauli k is digit j of k in base 4 (I, X, Y, Z)
+            elements = (np.arange(4 ** number_of_qubits)[:, None] //
+                        4 ** np.arange(number_of_qubits)) % 4
+            zs = elements >= 2
+            xs = (elements == 1) | (elements == 2)
+            temp_set = [Pauli(z, x) for z, x in zip(zs, xs)]
             return temp_set
         else:
             raise QiskitError("Only support 'weight' or 'tensor' cases "
@@ -0,0 +1,436 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=invalid-name
+
+"""
+Table of Pauli operators stored as packed bit matrices.
+"""
+
+import numpy as np
+from scipy import sparse
+
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.operators.pauli import Pauli
+
+_WORD_SIZE = 64
+_SHIFTS = np.arange(_WORD_SIZE, dtype=np.uint64)
+_ONE = np.uint64(1)
+# Number of set bits of every byte value
+_POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+# Powers of -i indexed by the exponent modulo 4
+_PHASES = np.array([1, -1j, -1, 1j])
+
+
+def _pack(bits):
+    """Pack a (size, num_qubits) bool array into (size, num_words) uint64 words."""
+    size, num_qubits = bits.shape
+    num_words = max(1, -(-num_qubits // _WORD_SIZE))
+    padded = np.zeros((size, num_words * _WORD_SIZE), dtype=np.uint64)
+    padded[:, :num_qubits] = bits
+    padded = padded.reshape(size, num_words, _WORD_SIZE) << _SHIFTS
+    # the shifted bits are distinct so their sum is their bitwise or
+    return padded.sum(axis=2, dtype=np.uint64)
+
+
+def _unpack(words, num_qubits):
+    """Unpack (size, num_words) uint64 words into a (size, num_qubits) bool array."""
+    bits = (words[:, :, None] >> _SHIFTS) & _ONE
+    return bits.reshape(len(words), -1)[:, :num_qubits].astype(bool)
+
+
+def _popcount(words):
+    """Return the number of set bits summed over the last axis of a uint64 array."""
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    counts = _POPCOUNT8[words.view(np.uint8)]
+    return counts.reshape(words.shape[:-1] + (-1,)).sum(axis=-1)
+
+
+def _parity(words):
+    """Return the parity of the set bits over the last axis of a uint64 array."""
+    folded = words
+    for shift in (32, 16, 8, 4, 2, 1):
+        folded = folded ^ (folded >> np.uint64(shift))
+    return ((folded & _ONE).sum(axis=-1) % 2).astype(bool)
+
+
+class PauliTable:
+    """A table of Pauli operators stored as packed bit matrices.
+
+    Each row of the table is a Pauli in the same (-i)^dot(z,x) Z^z X^x
+    convention as :class:`Pauli`, without a phase. The z and x vectors of
+    all rows are packed into two uint64 matrices with 64 qubits per word so
+    multiplication, commutation checks and phase tracking are vectorized
+    over the whole table.
+    """
+
+    def __init__(self, z, x):
+        """Make the Pauli table.
+
+        Args:
+            z (numpy.ndarray): boolean, z vectors of shape (size, num_qubits)
+                or a single z vector
+            x (numpy.ndarray): boolean, x vectors of shape (size, num_qubits)
+                or a single x vector
+
+        Raises:
+            QiskitError: if the shapes of z and x are invalid or different.
+        """
+        z = np.atleast_2d(np.asarray(z, dtype=bool))
+        x = np.atleast_2d(np.asarray(x, dtype=bool))
+        if z.ndim != 2 or z.shape != x.shape:
+            raise QiskitError("z and x must be arrays of the same shape "
+                              "(size, num_qubits). (z: {} vs x: {})".format(z.shape, x.shape))
+        self._num_qubits = z.shape[1]
+        self._z = _pack(z)
+        self._x = _pack(x)
+
+    @classmethod
+    def _from_packed(cls, z, x, num_qubits):
+        """Make a Pauli table from packed words without packing them again."""
+        table = cls.__new__(cls)
+        table._num_qubits = num_qubits
+        table._z = z
+        table._x = x
+        return table
+
+    @classmethod
+    def from_labels(cls, labels):
+        """Take a list of Pauli labels to construct a Pauli table.
+
+        The qubit index of each label is q_{n-1} ... q_0, as in
+        :meth:`Pauli.from_label`.
+
+        Args:
+            labels (list[str]): Pauli labels of equal length
+
+        Returns:
+            PauliTable: the constructed table
+
+        Raises:
+            QiskitError: invalid character in the labels or labels of
+                different length.
+        """
+        labels = list(labels)
+        if not labels:
+            raise QiskitError("Cannot construct a Pauli table from no labels.")
+        num_qubits = len(labels[0])
+        try:
+            chars = np.array([list(label) for label in labels], dtype='U1')
+        except ValueError:
+            chars = None
+        if chars is None or chars.shape != (len(labels), num_qubits):
+            raise QiskitError("Pauli labels must all have the same length.")
+        chars = chars[:, ::-1]
+        invalid = ~np.isin(chars, ['I', 'X', 'Y', 'Z'])
+        if invalid.any():
+            raise QiskitError("Pauli string must be only consisted of 'I', 'X', "
+                              "'Y' or 'Z' but you have {}.".format(chars[invalid][0]))
+        z = (chars == 'Z') | (chars == 'Y')
+        x = (chars == 'X') | (chars == 'Y')
+        return cls(z, x)
+
+    @classmethod
+    def from_paulis(cls, paulis):
+        """Take a list of Pauli objects to construct a Pauli table.
+
+        Args:
+            paulis (list[Pauli]): Paulis on the same number of qubits
+
+        Returns:
+            PauliTable: the constructed table
+
+        Raises:
+            QiskitError: if the Paulis have a different number of qubits.
+        """
+        paulis = list(paulis)
+        if not paulis:
+            raise QiskitError("Cannot construct a Pauli table from no Paulis.")
+        if len({len(pauli) for pauli in paulis}) != 1:
+            raise QiskitError("Paulis must all have the same number of qubits.")
+        return cls(np.array([pauli.z for pauli in paulis]),
+                   np.array([pauli.x for pauli in paulis]))
+
+    @property
+    def num_qubits(self):
+        """Number of qubits of each Pauli."""
+        return self._num_qubits
+
+    @property
+    def size(self):
+        """Number of Paulis in the table."""
+        return len(self._z)
+
+    @property
+    def z(self):
+        """The z vectors as a (size, num_qubits) bool array."""
+        return _unpack(self._z, self._num_qubits)
+
+    @property
+    def x(self):
+        """The x vectors as a (size, num_qubits) bool array."""
+        return _unpack(self._x, self._num_qubits)
+
+    def __len__(self):
+        """Return the number of Paulis in the table."""
+        return self.size
+
+    def __getitem__(self, key):
+        """Return a row as a Pauli, or a sub-table for slices and index arrays."""
+        if isinstance(key, (int, np.integer)):
+            z = _unpack(self._z[[key]], self._num_qubits)[0]
+            x = _unpack(self._x[[key]], self._num_qubits)[0]
+            return Pauli(z, x)
+        return PauliTable._from_packed(np.atleast_2d(self._z[key]),
+                                       np.atleast_2d(self._x[key]),
+                                       self._num_qubits)
+
+    def __iter__(self):
+        """Iterate over the rows as Pauli objects."""
+        for i in range(self.size):
+            yield self[i]
+
+    def __eq__(self, other):
+        """Return True if both tables contain the same Paulis in the same order."""
+        if not isinstance(other, PauliTable):
+            return False
+        return (self._num_qubits == other.num_qubits and
+                np.array_equal(self._z, other._z) and
+                np.array_equal(self._x, other._x))
+
+    def __repr__(self):
+        """Return the representation of self."""
+        return "{}.from_labels({})".format(self.__class__.__name__, self.to_labels())
+
+    def to_labels(self):
+        """Return the labels of the Paulis in I, X, Y, Z format.
+
+        Returns:
+            list[str]: Pauli labels with qubit order q_{n-1} .... q_0
+        """
+        chars = np.array(['I', 'X', 'Z', 'Y'])[self.x + 2 * self.z]
+        return [''.join(row[::-1]) for row in chars]
+
+    def to_paulis(self):
+        """Return the rows of the table as a list of Pauli objects."""
+        return list(self)
+
+    def _broadcast(self, other):
+        """Return packed words of self and other broadcast to the same number of rows."""
+        if not isinstance(other, PauliTable):
+            other = PauliTable.from_paulis([other])
+        if self._num_qubits != other.num_qubits:
+            raise QiskitError("Pauli tables must have the same number of qubits. "
+                              "({} vs {})".format(self._num_qubits, other.num_qubits))
+        if self.size != other.size and 1 not in (self.size, other.size):
+            raise QiskitError("Pauli tables of size {} and {} cannot be "
+                              "broadcast.".format(self.size, other.size))
+        return self._z, self._x, other._z, other._x
+
+    def __mul__(self, other):
+        """Multiply the Paulis row by row, ignoring the phase.
+
+        Args:
+            other (PauliTable or Pauli): table of the same size, or a single
+                Pauli (or table of size 1) to multiply every row by.
+
+        Returns:
+            PauliTable: the multiplied Paulis.
+
+        Raises:
+            QiskitError: if the number of qubits or sizes are incompatible.
+        """
+        z1, x1, z2, x2 = self._broadcast(other)
+        return PauliTable._from_packed(z1 ^ z2, x1 ^ x2, self._num_qubits)
+
+    def sgn_prod(self, other):
+        """Multiply the Paulis row by row and track the phase.
+
+        This is the vectorized equivalent of :meth:`Pauli.sgn_prod` applied
+        to every pair of rows.
+
+        Args:
+            other (PauliTable or Pauli): table of the same size, or a single
+                Pauli (or table of size 1) to multiply every row by.
+
+        Returns:
+            PauliTable: the multiplied Paulis
+            numpy.ndarray: the phases of the multiplications, 1, -1, 1j or -1j
+
+        Raises:
+            QiskitError: if the number of qubits or sizes are incompatible.
+        """
+        z1, x1, z2, x2 = self._broadcast(other)
+        z3 = z1 ^ z2
+        x3 = x1 ^ x2
+        # (-i)^(z1.x1) Z^z1 X^x1 (-i)^(z2.x2) Z^z2 X^x2
+        #   = (-i)^(z1.x1 + z2.x2 + 2 x1.z2 - z3.x3) (-i)^(z3.x3) Z^z3 X^x3
+        exponent = (_popcount(z1 & x1) + _popcount(z2 & x2) +
+                    2 * _popcount(x1 & z2) - _popcount(z3 & x3))
+        table = PauliTable._from_packed(z3, x3, self._num_qubits)
+        return table, _PHASES[exponent % 4]
+
+    def kron(self, other):
+        r"""Kronecker product of the Paulis row by row.
+
+        Order is $P_2 (other) \otimes P_1 (self)$, as in :meth:`Pauli.kron`.
+
+        Args:
+            other (PauliTable or Pauli): table of the same size, or a single
+                Pauli (or table of size 1).
+
+        Returns:
+            PauliTable: the tensor product Paulis.
+
+        Raises:
+            QiskitError: if the sizes are incompatible.
+        """
+        if not isinstance(other, PauliTable):
+            other = PauliTable.from_paulis([other])
+        size = max(self.size, other.size)
+        if self.size != other.size and 1 not in (self.size, other.size):
+            raise QiskitError("Pauli tables of size {} and {} cannot be "
+                              "broadcast.".format(self.size, other.size))
+        z = np.hstack([np.broadcast_to(self.z, (size, self._num_qubits)),
+                       np.broadcast_to(other.z, (size, other.num_qubits))])
+        x = np.hstack([np.broadcast_to(self.x, (size, self._num_qubits)),
+                       np.broadcast_to(other.x, (size, other.num_qubits))])
+        return PauliTable(z, x)
+
+    def commutes(self, other):
+        """Return whether the Paulis commute row by row.
+
+        Args:
+            other (PauliTable or Pauli): table of the same size, or a single
+                Pauli (or table of size 1) to compare every row with.
+
+        Returns:
+            numpy.ndarray: bool array, True where the Paulis commute.
+
+        Raises:
+            QiskitError: if the number of qubits or sizes are incompatible.
+        """
+        z1, x1, z2, x2 = self._broadcast(other)
+        return ~_parity((x1 & z2) ^ (z1 & x2))
+
+    def commutes_qubitwise(self, other):
+        """Return whether the Paulis commute on every qubit row by row.
+
+        Args:
+            other (PauliTable or Pauli): table of the same size, or a single
+                Pauli (or table of size 1) to compare every row with.
+
+        Returns:
+            numpy.ndarray: bool array, True where the Paulis commute qubit-wise.
+
+        Raises:
+            QiskitError: if the number of qubits or sizes are incompatible.
+        """
+        z1, x1, z2, x2 = self._broadcast(other)
+        return ~np.any((x1 & z2) ^ (z1 & x2), axis=-1)
+
+    def group_commuting(self, qubit_wise=False):
+        """Partition the table into sets of mutually commuting Paulis.
+
+        Rows are assigned greedily, in order, to the first set they commute
+        with. General commutation compares each row with the rows assigned
+        before it. Qubit-wise commuting sets are tracked by the union of
+        their z and x vectors, so each row is only compared with one
+        Pauli per set.
+
+        Args:
+            qubit_wise (bool): group by qubit-wise commutation instead of
+                general commutation.
+
+        Returns:
+            list[numpy.ndarray]: the row indices of each set.
+        """
+        colors = np.zeros(self.size, dtype=int)
+        num_colors = 0
+        if qubit_wise:
+            basis_z = np.zeros(self._z.shape, dtype=np.uint64)
+            basis_x = np.zeros(self._x.shape, dtype=np.uint64)
+            for i in range(self.size):
+                z, x = self._z[i], self._x[i]
+                used_z = basis_z[:num_colors]
+                used_x = basis_x[:num_colors]
+                clash = np.any((used_z | used_x) & (z | x) &
+                               ((used_z ^ z) | (used_x ^ x)), axis=1)
+                color = np.argmin(clash) if not clash.all() else num_colors
+                num_colors = max(num_colors, color + 1)
+                basis_z[color] |= z
+                basis_x[color] |= x
+                colors[i] = color
+        else:
+            for i in range(self.size):
+                anti = _parity((self._x[:i] & self._z[i]) ^ (self._z[:i] & self._x[i]))
+                used = np.zeros(num_colors + 1, dtype=bool)
+                used[colors[:i][anti]] = True
+                color = np.argmin(used)
+                num_colors = max(num_colors, color + 1)
+                colors[i] = color
+        order = np.argsort(colors, kind='stable')
+        bounds = np.cumsum(np.bincount(colors, minlength=num_colors))[:-1]
+        return np.split(order, bounds)
+
+    def to_spmatrix(self, coeffs=None):
+        r"""Return the weighted sum of the Paulis as a sparse matrix (CSR format).
+
+        The matrix is built directly from the bit vectors: a Pauli maps the
+        basis state |j> to |j ^ x> with sign (-1)^{z.(j ^ x)}, so Paulis
+        with the same x vector share a sparsity pattern and are summed on
+        it without building the matrix of each term.
+
+        Order is q_{n-1} .... q_0, i.e., $P_{n-1} \otimes ... P_0$
+
+        Args:
+            coeffs (list or numpy.ndarray): the coefficient of each Pauli.
+                [Default: all ones]
+
+        Returns:
+            scipy.sparse.csr_matrix: the weighted sum of the Paulis.
+
+        Raises:
+            QiskitError: if the number of coefficients does not match the
+                table, or the matrix is too large to index.
+        """
+        if self._num_qubits > 62:
+            raise QiskitError("Cannot construct the matrix of a "
+                              "{}-qubit Pauli.".format(self._num_qubits))
+        if coeffs is None:
+            coeffs = np.ones(self.size)
+        coeffs = np.asarray(coeffs, dtype=complex)
+        if coeffs.shape != (self.size,):
+            raise QiskitError("Number of coefficients ({}) does not match the "
+                              "size of the table ({}).".format(coeffs.size, self.size))
+        dim = 2 ** self._num_qubits
+        z_ints = self._z[:, 0]
+        x_ints = self._x[:, 0]
+        coeffs = coeffs * _PHASES[_popcount(self._z & self._x) % 4]
+        cols = np.arange(dim, dtype=np.uint64)
+        rows, data = [], []
+        for x_int in np.unique(x_ints):
+            row = cols ^ x_int
+            values = np.zeros(dim, dtype=complex)
+            for z_int, coeff in zip(z_ints[x_ints == x_int], coeffs[x_ints == x_int]):
+                sign = 1 - 2 * _parity((row & z_int)[:, None]).astype(int)
+                values += coeff * sign
+            rows.append(row)
+            data.append(values)
+        mat = sparse.csr_matrix((np.concatenate(data),
+                                 (np.concatenate(rows).astype(np.int64),
+                                  np.tile(cols.astype(np.int64), len(rows)))),
+                                shape=(dim, dim))
+        mat.eliminate_zeros()
+        return mat
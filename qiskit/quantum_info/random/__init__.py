@@ -15,3 +15,4 @@
 """Methods for generating random quantum information objects."""
 
 from .utils import random_unitary, random_state, random_density_matrix
+from .utils import random_unitaries, random_states, random_density_matrices
@@ -20,7 +20,6 @@ Methods to create random unitaries, states, etc.
 
 import math
 import numpy as np
-from scipy.stats import unitary_group
 
 from qiskit.quantum_info.operators import Operator
 from qiskit.exceptions import QiskitError
@@ -34,21 +33,43 @@ def random_state(dim, seed=None):
 
     Args:
         dim (int): the dim of the state space
-        seed (int): Optional. To set a random seed.
+        seed (int or RandomState): Optional. To set a random seed, or a
+            numpy RandomState to draw from.
 
     Returns:
         ndarray:  state(2**num) a random quantum state.
     """
-    if seed is None:
-        seed = np.random.randint(0, np.iinfo(np.int32).max)
-    rng = np.random.RandomState(seed)
-    # Random array over interval (0, 1]
-    x = rng.rand(dim)
-    x += x == 0
-    x = -np.log(x)
-    sumx = sum(x)
-    phases = rng.rand(dim)*2.0*np.pi
-    return np.sqrt(x/sumx)*np.exp(1j*phases)
+    return random_states(1, dim, seed)[0]
+
+
+def random_states(num, dim, seed=None):
+    """
+    Return a batch of random quantum states from the uniform (Haar) measure
+    on state space.
+
+    The states are drawn in turn from a single random number generator,
+    so the first state is the one returned by random_state for the same
+    seed, and drawing from a shared RandomState gives the same states as
+    repeated calls to random_state with it.
+
+    Args:
+        num (int): the number of states.
+        dim (int): the dim of the state space
+        seed (int or RandomState): Optional. To set a random seed, or a
+            numpy RandomState to draw from.
+
+    Returns:
+        ndarray: states(num, dim) an array of random quantum states.
+    """
+    rng = _random_state(seed)
+    # Random arrays over interval (0, 1] for the amplitudes and phases of
+    # each state
+    x = rng.rand(num, 2, dim)
+    amps = x[:, 0]
+    amps += amps == 0
+    amps = -np.log(amps)
+    amps /= np.sum(amps, axis=1, keepdims=True)
+    return np.sqrt(amps) * np.exp(2j * np.pi * x[:, 1])
 
 
 def random_unitary(dim, seed=None):
@@ -57,7 +78,8 @@ def random_unitary(dim, seed=None):
 
     Args:
         dim (int): the dim of the state space.
-        seed (int): Optional. To set a random seed.
+        seed (int or RandomState): Optional. To set a random seed, or a
+            numpy RandomState to draw from.
 
     Returns:
         Operator: (dim, dim) unitary operator.
@@ -65,11 +87,40 @@ def random_unitary(dim, seed=None):
     Raises:
         QiskitError: if dim is not a positive power of 2.
     """
-    if seed is not None:
-        np.random.seed(seed)
     if dim == 0 or not math.log2(dim).is_integer():
         raise QiskitError("Desired unitary dimension not a positive power of 2.")
-    return Operator(unitary_group.rvs(dim))
+    return Operator(random_unitaries(1, dim, seed)[0])
+
+
+def random_unitaries(num, dim, seed=None):
+    """
+    Return a batch of random dim x dim unitary matrices from the Haar measure.
+
+    The unitaries are drawn in turn from a single random number generator,
+    so the first unitary is the one returned by random_unitary for the
+    same seed.
+
+    Args:
+        num (int): the number of unitaries.
+        dim (int): the dim of the state space.
+        seed (int or RandomState): Optional. To set a random seed, or a
+            numpy RandomState to draw from.
+
+    Returns:
+        ndarray: unitaries(num, dim, dim) an array of unitary matrices.
+
+    Raises:
+        QiskitError: if dim is not positive.
+    """
+    if dim < 1:
+        raise QiskitError("Desired unitary dimension not positive.")
+    rng = _random_state(seed)
+    # The QR decomposition of a Ginibre matrix, with the phases of the
+    # diagonal of R moved to Q, is distributed with the Haar measure.
+    mats = __ginibre_matrices(rng, num, dim, dim) / np.sqrt(2)
+    unitaries, diag = __qr_stack(mats)
+    unitaries *= (diag / np.abs(diag))[:, None, :]
+    return unitaries
 
 
 # TODO: return a DensityMatrix object.
@@ -84,71 +135,92 @@ def random_density_matrix(length, rank=None, method='Hilbert-Schmidt', seed=None
         method (string): the method to use.
             'Hilbert-Schmidt': sample rho from the Hilbert-Schmidt metric.
             'Bures': sample rho from the Bures metric.
-        seed (int): Optional. To set a random seed.
+        seed (int or RandomState): Optional. To set a random seed, or a
+            numpy RandomState to draw from.
     Returns:
         ndarray: rho (length, length) a density matrix.
     Raises:
         QiskitError: if the method is not valid.
     """
-    if method == 'Hilbert-Schmidt':
-        return __random_density_hs(length, rank, seed)
-    elif method == 'Bures':
-        return __random_density_bures(length, rank, seed)
-    else:
-        raise QiskitError('Error: unrecognized method {}'.format(method))
+    return random_density_matrices(1, length, rank, method, seed)[0]
 
 
-def __ginibre_matrix(nrow, ncol=None, seed=None):
-    """
-    Return a normally distributed complex random matrix.
-
-    Args:
-        nrow (int): number of rows in output matrix.
-        ncol (int): number of columns in output matrix.
-        seed (int): Optional. To set a random seed.
-    Returns:
-        ndarray: A complex rectangular matrix where each real and imaginary
-            entry is sampled from the normal distribution.
+def random_density_matrices(num, length, rank=None, method='Hilbert-Schmidt',
+                            seed=None):
     """
-    if ncol is None:
-        ncol = nrow
-    if seed is not None:
-        np.random.seed(seed)
-    G = np.random.normal(size=(nrow, ncol)) + \
-        np.random.normal(size=(nrow, ncol)) * 1j
-    return G
-
+    Generate a batch of random density matrices.
 
-def __random_density_hs(N, rank=None, seed=None):
-    """
-    Generate a random density matrix from the Hilbert-Schmidt metric.
+    The matrices are sampled from a single random number generator. For
+    the Hilbert-Schmidt metric the first matrix is the one returned by
+    random_density_matrix for the same seed. For the Bures metric all
+    the unitaries are sampled before the Ginibre matrices.
 
     Args:
-        N (int): the length of the density matrix.
-        rank (int or None): the rank of the density matrix. The default
+        num (int): the number of density matrices.
+        length (int): the length of the density matrices.
+        rank (int or None): the rank of the density matrices. The default
             value is full-rank.
-        seed (int): Optional. To set a random seed.
+        method (string): the method to use.
+            'Hilbert-Schmidt': sample rho from the Hilbert-Schmidt metric.
+            'Bures': sample rho from the Bures metric.
+        seed (int or RandomState): Optional. To set a random seed, or a
+            numpy RandomState to draw from.
     Returns:
-        ndarray: rho (N,N  a density matrix.
+        ndarray: rhos (num, length, length) an array of density matrices.
+    Raises:
+        QiskitError: if the method is not valid.
     """
-    G = __ginibre_matrix(N, rank, seed)
-    G = G.dot(G.conj().T)
-    return G / np.trace(G)
+    if method not in ['Hilbert-Schmidt', 'Bures']:
+        raise QiskitError('Error: unrecognized method {}'.format(method))
+    if rank is None:
+        rank = length
+    rng = _random_state(seed)
+    if method == 'Bures':
+        mats = np.eye(length) + random_unitaries(num, length, rng)
+        mats = np.matmul(mats, __ginibre_matrices(rng, num, length, rank))
+    else:
+        mats = __ginibre_matrices(rng, num, length, rank)
+    rhos = np.matmul(mats, np.conj(np.swapaxes(mats, 1, 2)))
+    return rhos / np.trace(rhos, axis1=1, axis2=2)[:, None, None]
 
 
-def __random_density_bures(N, rank=None, seed=None):
+def _random_state(seed):
+    """Return a numpy RandomState for a seed or RandomState."""
+    if isinstance(seed, np.random.RandomState):
+        return seed
+    if seed is None:
+        seed = np.random.randint(0, np.iinfo(np.int32).max)
+    return np.random.RandomState(seed)
+
+
+def __ginibre_matrices(rng, num, nrow, ncol):
     """
-    Generate a random density matrix from the Bures metric.
+    Return a batch of normally distributed complex random matrices.
 
     Args:
-        N (int): the length of the density matrix.
-        rank (int or None): the rank of the density matrix. The default
-            value is full-rank.
-        seed (int): Optional. To set a random seed.
+        rng (RandomState): the random number generator.
+        num (int): number of matrices.
+        nrow (int): number of rows in output matrices.
+        ncol (int): number of columns in output matrices.
     Returns:
-        ndarray: rho (N,N) a density matrix.
+        ndarray: An array of complex rectangular matrices where each real
+            and imaginary entry is sampled from the normal distribution.
     """
-    P = np.eye(N) + random_unitary(N).data
-    G = P.dot(__ginibre_matrix(N, rank, seed))
-    G = G.dot(G.conj().T)
-    return G / np.trace(G)
+    # The real and imaginary parts of each matrix are drawn in turn
+    mats = rng.normal(size=(num, 2, nrow, ncol))
+    return mats[:, 0] + 1j * mats[:, 1]
+
+
+def __qr_stack(mats):
+    """Return the Q matrices and R diagonals of the QR decomposition of a stack."""
+    try:
+        unitaries, upper = np.linalg.qr(mats)
+        return unitaries, np.diagonal(upper, axis1=1, axis2=2)
+    except np.linalg.LinAlgError:
+        # numpy < 1.22 only decomposes a single matrix at a time
+        unitaries = np.empty_like(mats)
+        diag = np.empty(mats.shape[:2], dtype=mats.dtype)
+        for i, mat in enumerate(mats):
+            unitaries[i], upper = np.linalg.qr(mat)
+            diag[i] = np.diagonal(upper)
+        return unitaries, diag
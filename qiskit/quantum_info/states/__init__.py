@@ -14,4 +14,6 @@
 
 """Quantum States."""
 
-from .states import basis_state, projector, purity
+from .states import basis_state, projector, purity, partial_trace, partial_trace_stream
+from .statevector import Statevector
+from .densitymatrix import DensityMatrix
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+DensityMatrix quantum state class.
+"""
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.operators.operator import _apply_gates
+from qiskit.quantum_info.operators.pauli import Pauli
+from qiskit.quantum_info.operators.predicates import is_hermitian_matrix
+from qiskit.quantum_info.operators.predicates import is_positive_semidefinite_matrix
+from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
+from qiskit.quantum_info.operators.channel.kraus import Kraus
+from qiskit.quantum_info.states.quantum_state import QuantumState
+
+
+class DensityMatrix(QuantumState):
+    """DensityMatrix class"""
+
+    def __init__(self, data, dims=None):
+        """Initialize a density matrix object.
+
+        Args:
+            data (matrix_like or vector_like or QuantumState): a density
+                matrix, or a statevector to take the projector of.
+            dims (int or tuple or list): Optional. The subsystem dimension
+                                         of the state (See additional
+                                         information).
+
+        Raises:
+            QiskitError: if input data is not a valid density matrix.
+
+        Additional Information
+        ----------------------
+        If the dimensions are None, they will be automatically determined
+        from the input data. If the input data is a matrix of shape
+        (2**N, 2**N) qubit subsystems will be used, otherwise a single
+        subsystem with dimension specified by the shape of the input is
+        assigned.
+        """
+        if isinstance(data, QuantumState):
+            if dims is None:
+                dims = data.dims()
+            data = data.data
+        if isinstance(data, (list, np.ndarray)):
+            mat = np.array(data, dtype=complex)
+            if mat.ndim == 2 and mat.shape[1] == 1:
+                # flatten column-vector to vector
+                mat = np.reshape(mat, mat.shape[0])
+            if mat.ndim == 1:
+                mat = np.outer(mat, np.conj(mat))
+            if mat.ndim != 2 or mat.shape[0] != mat.shape[1]:
+                raise QiskitError("Invalid input: not a square matrix.")
+        else:
+            raise QiskitError("Invalid input data format for DensityMatrix")
+        super().__init__('DensityMatrix', mat, self._automatic_dims(dims, len(mat)))
+
+    def is_valid(self, atol=None, rtol=None):
+        """Return True if a Hermitian, positive semidefinite matrix with trace 1."""
+        if atol is None:
+            atol = self.ATOL
+        if rtol is None:
+            rtol = self.RTOL
+        if not np.allclose(np.trace(self._data), 1, rtol=rtol, atol=atol):
+            return False
+        if not is_hermitian_matrix(self._data, rtol=rtol, atol=atol):
+            return False
+        return is_positive_semidefinite_matrix(self._data, rtol=rtol, atol=atol)
+
+    def purity(self):
+        """Return the purity Tr[rho^2] of the quantum state."""
+        # Tr[rho^2] = Tr[rho^dagger rho] for a Hermitian matrix
+        return np.real(np.vdot(self._data, self._data))
+
+    def evolve(self, other, qargs=None):
+        """Evolve a quantum state by an operator.
+
+        Quantum channels are applied in Kraus form, one pair of Kraus
+        matrices at a time, so the superoperator is never constructed.
+
+        Args:
+            other (Operator or QuantumChannel or QuantumCircuit or
+                   Instruction): the operator to evolve by.
+            qargs (list): a list of subsystems to apply the operator on.
+
+        Returns:
+            DensityMatrix: the output density matrix.
+
+        Raises:
+            QiskitError: if the operator dimension does not match the
+            specified subsystem dimensions.
+        """
+        if isinstance(other, QuantumChannel):
+            return DensityMatrix(self._evolve_kraus(other, qargs), dims=self._dims)
+        if isinstance(other, Pauli) and qargs is None:
+            return DensityMatrix(other.evolve(self._data), dims=self._dims)
+        # Materialize the fused gates as they are applied twice
+        gates = list(self._operator_gates(other, qargs))
+        return DensityMatrix(self._conjugate_by(gates, gates), dims=self._dims)
+
+    def expectation_value(self, oper, qargs=None):
+        """Compute the expectation value Tr[oper.rho] of an operator.
+
+        Args:
+            oper (Operator or Pauli): an operator to evaluate.
+            qargs (list): a list of subsystems the operator acts on.
+
+        Returns:
+            complex: the expectation value.
+
+        Raises:
+            QiskitError: if the operator dimension does not match the
+            specified subsystem dimensions.
+        """
+        if isinstance(oper, Pauli) and qargs is None:
+            # Pauli.expectation returns a real value
+            return complex(oper.expectation(self._data))
+        gates = self._operator_gates(oper, qargs)
+        return complex(np.trace(_apply_gates(self._data, self._dims, gates)))
+
+    def _probabilities(self):
+        """Return the measurement probabilities of the full state."""
+        return np.real(np.diag(self._data))
+
+    def _conjugate_by(self, left, right):
+        """Return A.rho.B^dagger for the products A, B of the left and right gates."""
+        mat = _apply_gates(self._data, self._dims, left)
+        # A.rho.B^dagger = (B.(A.rho)^dagger)^dagger
+        return np.conj(_apply_gates(np.conj(mat.T), self._dims, right).T)
+
+    def _evolve_kraus(self, channel, qargs):
+        """Return the density matrix evolved by a channel in Kraus form."""
+        if qargs is None:
+            qargs = list(range(len(self._dims)))
+        if channel.input_dims() != self.dims(qargs) or \
+                channel.output_dims() != self.dims(qargs):
+            raise QiskitError(
+                "Channel dimensions do not match the state subsystem dimensions.")
+        if not isinstance(channel, Kraus):
+            channel = Kraus(channel)
+        kraus_left, kraus_right = channel._data
+        if kraus_right is None:
+            kraus_right = kraus_left
+        mat = np.zeros_like(self._data)
+        for left, right in zip(kraus_left, kraus_right):
+            mat += self._conjugate_by([(left, qargs)], [(right, qargs)])
+        return mat
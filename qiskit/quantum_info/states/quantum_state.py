@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Abstract QuantumState class.
+"""
+
+import copy
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.circuit.instruction import Instruction
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.operators.operator import Operator
+from qiskit.quantum_info.operators.operator import _fuse_gates, _gate_sequence
+from qiskit.quantum_info.operators.predicates import ATOL_DEFAULT, RTOL_DEFAULT
+
+
+class QuantumState(ABC):
+    """Abstract quantum state base class"""
+
+    ATOL = ATOL_DEFAULT
+    RTOL = RTOL_DEFAULT
+
+    def __init__(self, rep, data, dims):
+        """Initialize a state object."""
+        self._rep = rep
+        self._data = data
+        # Dimension of each subsystem starting from least significant
+        self._dims = tuple(dims)
+        self._dim = int(np.product(dims))
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__) and self.dims() == other.dims():
+            return np.allclose(
+                self._data, other._data, rtol=self.RTOL, atol=self.ATOL)
+        return False
+
+    def __repr__(self):
+        return '{}({}, dims={})'.format(self.rep, self._data, self._dims)
+
+    def __array__(self, dtype=None):
+        return np.asarray(self._data, dtype=dtype)
+
+    @property
+    def rep(self):
+        """Return state representation string."""
+        return self._rep
+
+    @property
+    def dim(self):
+        """Return total state dimension."""
+        return self._dim
+
+    @property
+    def data(self):
+        """Return data."""
+        return self._data
+
+    def dims(self, qargs=None):
+        """Return tuple of subsystem dimensions for specified qargs."""
+        if qargs is None:
+            return self._dims
+        return tuple(self._dims[i] for i in qargs)
+
+    def copy(self):
+        """Make a copy of current state."""
+        ret = copy.copy(self)
+        ret._data = self._data.copy()
+        return ret
+
+    @abstractmethod
+    def is_valid(self, atol=None, rtol=None):
+        """Return True if a valid quantum state."""
+        pass
+
+    @abstractmethod
+    def purity(self):
+        """Return the purity of the quantum state."""
+        pass
+
+    @abstractmethod
+    def evolve(self, other, qargs=None):
+        """Evolve a quantum state by an operator.
+
+        Args:
+            other (Operator or QuantumChannel or QuantumCircuit or
+                   Instruction): the operator to evolve by.
+            qargs (list): a list of subsystems to apply the operator on.
+
+        Returns:
+            QuantumState: the output quantum state.
+        """
+        pass
+
+    @abstractmethod
+    def expectation_value(self, oper, qargs=None):
+        """Compute the expectation value of an operator.
+
+        Args:
+            oper (Operator or Pauli): an operator to evaluate.
+            qargs (list): a list of subsystems the operator acts on.
+
+        Returns:
+            complex: the expectation value.
+        """
+        pass
+
+    @abstractmethod
+    def _probabilities(self):
+        """Return the measurement probabilities of the full state."""
+        pass
+
+    def probabilities(self, qargs=None):
+        """Return the measurement probabilities of subsystems.
+
+        Args:
+            qargs (list): subsystems to return probabilities for. The first
+                subsystem is the least significant in the returned array.
+                [Default: all subsystems]
+
+        Returns:
+            np.array: the marginal probabilities of the subsystems.
+        """
+        probs = self._probabilities()
+        if qargs is None:
+            return probs
+        num_subsystems = len(self._dims)
+        tensor = np.reshape(probs, tuple(reversed(self._dims)))
+        kept = [num_subsystems - 1 - qubit for qubit in qargs]
+        traced = tuple(axis for axis in range(num_subsystems) if axis not in kept)
+        tensor = np.sum(tensor, axis=traced)
+        # Order the remaining axes with the last qarg most significant
+        remaining = sorted(kept)
+        tensor = np.transpose(tensor, [remaining.index(axis) for axis in reversed(kept)])
+        return np.reshape(tensor, tensor.size)
+
+    def sample_memory(self, shots, qargs=None, seed=None):
+        """Sample measurement outcomes of subsystems.
+
+        Args:
+            shots (int): the number of samples.
+            qargs (list): subsystems to sample. [Default: all subsystems]
+            seed (int): Optional. Seed for the random number generator.
+
+        Returns:
+            np.array: the measurement outcome label of each shot.
+        """
+        outcomes, labels = self._sample(shots, qargs, seed)
+        indices, inverse = np.unique(outcomes, return_inverse=True)
+        return np.array([labels(index) for index in indices])[inverse]
+
+    def sample_counts(self, shots, qargs=None, seed=None):
+        """Sample the measurement counts of subsystems.
+
+        Args:
+            shots (int): the number of samples.
+            qargs (list): subsystems to sample. [Default: all subsystems]
+            seed (int): Optional. Seed for the random number generator.
+
+        Returns:
+            dict: the number of shots of each measurement outcome label.
+        """
+        outcomes, labels = self._sample(shots, qargs, seed)
+        indices, counts = np.unique(outcomes, return_counts=True)
+        return {labels(index): int(count) for index, count in zip(indices, counts)}
+
+    def _sample(self, shots, qargs, seed):
+        """Return sampled outcome indices and a function labelling them."""
+        dims = self.dims(qargs)
+        if any(dim > 10 for dim in dims):
+            raise QiskitError("Cannot label outcomes of subsystems with "
+                              "dimension larger than 10.")
+        probs = self.probabilities(qargs)
+        rng = np.random.RandomState(seed)
+        outcomes = rng.choice(len(probs), size=shots, p=probs / np.sum(probs))
+
+        def labels(index):
+            digits = np.unravel_index(index, tuple(reversed(dims)))
+            return ''.join(str(digit) for digit in digits)
+
+        return outcomes, labels
+
+    def _operator_gates(self, other, qargs=None):
+        """Return the (matrix, qargs) gates of an operator on the state subsystems.
+
+        Circuits and instructions are unrolled and fused as when
+        initializing an Operator from them.
+
+        Returns:
+            list: (matrix, qargs) pairs of the gates to apply in order.
+
+        Raises:
+            QiskitError: if the operator does not match the subsystem
+            dimensions.
+        """
+        if qargs is None:
+            qargs = list(range(len(self._dims)))
+        if isinstance(other, (QuantumCircuit, Instruction)):
+            if isinstance(other, QuantumCircuit):
+                num_qubits = len(other.qubits)
+            else:
+                num_qubits = other.num_qubits
+            if num_qubits != len(qargs) or self.dims(qargs) != len(qargs) * (2,):
+                raise QiskitError(
+                    "Instruction qubits do not match the state subsystems.")
+            return _fuse_gates(_gate_sequence(other, qargs))
+        if not isinstance(other, Operator):
+            other = Operator(other)
+        if other.input_dims() != self.dims(qargs) or other.output_dims() != self.dims(qargs):
+            raise QiskitError(
+                "Operator dimensions do not match the state subsystem dimensions.")
+        return [(other.data, list(qargs))]
+
+    @classmethod
+    def _automatic_dims(cls, dims, size):
+        """Check if input dimension corresponds to qubit subsystems."""
+        if dims is None:
+            dims = size
+        elif np.product(dims) != size:
+            raise QiskitError("dimensions do not match size.")
+        if isinstance(dims, (int, np.integer)):
+            num_qubits = int(np.log2(dims))
+            if 2 ** num_qubits == size:
+                return num_qubits * (2,)
+            return (dims,)
+        return tuple(dims)
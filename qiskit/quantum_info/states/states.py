@@ -71,3 +71,185 @@ def purity(state):
     if rho.ndim == 1:
         return 1.0
     return np.real(np.trace(rho.dot(rho)))
+
+
+def partial_trace(state, qargs):
+    """Return the reduced density matrix of a state with subsystems traced out.
+
+    Args:
+        state (Statevector or DensityMatrix): the input state.
+        qargs (list): the subsystems to trace over.
+
+    Returns:
+        DensityMatrix: the reduced state of the remaining subsystems.
+
+    Raises:
+        QiskitError: if the input is not a quantum state or the subsystems
+        are invalid.
+    """
+    # Place import here to avoid cyclic import
+    from qiskit.quantum_info.states.quantum_state import QuantumState
+    from qiskit.quantum_info.states.densitymatrix import DensityMatrix
+    if not isinstance(state, QuantumState):
+        raise QiskitError("Input is not a Statevector or DensityMatrix.")
+    dims = state.dims()
+    _check_traced_subsystems(dims, qargs)
+    if state.data.ndim == 1:
+        rho = _partial_trace_vec(state.data, dims, qargs)
+    else:
+        rho = _partial_trace_mat(state.data, dims, qargs)
+    kept = [dim for i, dim in enumerate(dims) if i not in qargs]
+    return DensityMatrix(rho, dims=kept)
+
+
+def partial_trace_stream(vec, qargs, dims=None, chunk_size=2 ** 20):
+    """Return the reduced density matrix of a large statevector array.
+
+    The statevector is read in blocks, so it may be a memory-mapped array
+    (numpy.memmap) larger than the available memory. The blocks read at
+    once hold at most chunk_size amplitudes in total. If the dimension of
+    the remaining subsystems is larger than chunk_size, the reduced density
+    matrix, which is always kept in memory, is built from the products of
+    pairs of blocks of rows, and the statevector is read several times.
+
+    Args:
+        vec (array_like): the statevector.
+        qargs (list): the subsystems to trace over.
+        dims (tuple): Optional. The subsystem dimensions, least significant
+            first. [Default: qubit subsystems]
+        chunk_size (int): the maximum number of amplitudes to read at once.
+
+    Returns:
+        DensityMatrix: the reduced state of the remaining subsystems.
+
+    Raises:
+        QiskitError: if the input is not a vector or the subsystems are
+        invalid.
+    """
+    # Place import here to avoid cyclic import
+    from qiskit.quantum_info.states.densitymatrix import DensityMatrix
+    if not isinstance(vec, np.ndarray):
+        vec = np.asarray(vec)
+    if vec.ndim != 1:
+        raise QiskitError("Input is not a vector.")
+    if dims is None:
+        num_qubits = int(np.log2(vec.size))
+        if 2 ** num_qubits != vec.size:
+            raise QiskitError("Input is not a multi-qubit state, "
+                              "specify input state dims.")
+        dims = num_qubits * (2,)
+    elif np.product(dims) != vec.size:
+        raise QiskitError("dimensions do not match size.")
+    dims = tuple(dims)
+    _check_traced_subsystems(dims, qargs)
+    rho = _partial_trace_vec(vec, dims, qargs, chunk_size=chunk_size)
+    kept = [dim for i, dim in enumerate(dims) if i not in qargs]
+    return DensityMatrix(rho, dims=kept)
+
+
+def _check_traced_subsystems(dims, qargs):
+    """Raise if qargs are not distinct subsystems of a state with dims."""
+    if len(set(qargs)) != len(qargs) or \
+            any(not 0 <= qubit < len(dims) for qubit in qargs):
+        raise QiskitError("Invalid subsystems to trace over.")
+
+
+def _partial_trace_vec(vec, dims, qargs, chunk_size=None):
+    """Partial trace over subsystems of a statevector.
+
+    Args:
+        vec (np.array): a statevector.
+        dims (tuple): the subsystem dimensions, least significant first.
+        qargs (list): the subsystems to trace over.
+        chunk_size (int): the maximum number of amplitudes to copy at once.
+            If None the whole vector is contracted in one step.
+
+    Returns:
+        np.array: the reduced density matrix.
+    """
+    num_subsystems = len(dims)
+    shape = tuple(reversed(dims))
+    tensor = np.reshape(vec, shape)
+    # Contracting the traced axes in memory order avoids transposing
+    traced = sorted(num_subsystems - 1 - qubit for qubit in qargs)
+    kept = [axis for axis in range(num_subsystems) if axis not in traced]
+    dim_kept = int(np.product([shape[axis] for axis in kept]))
+    if chunk_size is None or vec.size <= chunk_size:
+        # rho[k, k'] = sum_t psi[k, t] psi*[k', t]
+        rho = np.tensordot(tensor, np.conj(tensor), axes=(traced, traced))
+        return np.reshape(rho, (dim_kept, dim_kept))
+
+    # Fix the most significant traced subsystems in turn so each block
+    # of amplitudes summed over at once has at most chunk_size entries
+    outer_traced = []
+    block_size = vec.size
+    for axis in traced:
+        if block_size <= chunk_size:
+            break
+        outer_traced.append(axis)
+        block_size //= shape[axis]
+    # If a block is still too large, all the traced subsystems are fixed and
+    # the block is a column of rho. Fix the most significant kept subsystems
+    # too, and multiply pairs of blocks of at most chunk_size / 2 entries
+    # into the blocks of rows and columns of rho they belong to.
+    outer_kept = []
+    if block_size > chunk_size:
+        for axis in kept:
+            if block_size <= chunk_size // 2:
+                break
+            outer_kept.append(axis)
+            block_size //= shape[axis]
+    outer = outer_traced + outer_kept
+    remaining = [axis for axis in range(num_subsystems) if axis not in outer]
+    perm = [remaining.index(axis) for axis in kept if axis not in outer_kept]
+    perm += [remaining.index(axis) for axis in traced if axis not in outer_traced]
+    rows = dim_kept // int(np.product([shape[axis] for axis in outer_kept]))
+
+    def read_block(index):
+        fixed = dict(zip(outer, index))
+        block = tensor[tuple(fixed.get(axis, slice(None))
+                             for axis in range(num_subsystems))]
+        return np.reshape(np.transpose(block, perm), (rows, -1))
+
+    rho = np.zeros((dim_kept, dim_kept), dtype=complex)
+    kept_indices = list(np.ndindex(*[shape[axis] for axis in outer_kept]))
+    for traced_index in np.ndindex(*[shape[axis] for axis in outer_traced]):
+        for row, row_index in enumerate(kept_indices):
+            row_block = read_block(traced_index + row_index)
+            row_slice = slice(row * rows, (row + 1) * rows)
+            rho[row_slice, row_slice] += np.dot(row_block, np.conj(row_block.T))
+            # rho is Hermitian, so the blocks below the diagonal are the
+            # adjoints of the blocks above it
+            for col in range(row + 1, len(kept_indices)):
+                col_block = read_block(traced_index + kept_indices[col])
+                col_slice = slice(col * rows, (col + 1) * rows)
+                product = np.dot(row_block, np.conj(col_block.T))
+                rho[row_slice, col_slice] += product
+                rho[col_slice, row_slice] += np.conj(product.T)
+    return rho
+
+
+def _partial_trace_mat(mat, dims, qargs):
+    """Partial trace over subsystems of a density matrix.
+
+    Args:
+        mat (np.array): a density matrix.
+        dims (tuple): the subsystem dimensions, least significant first.
+        qargs (list): the subsystems to trace over.
+
+    Returns:
+        np.array: the reduced density matrix.
+    """
+    num_subsystems = len(dims)
+    shape = tuple(reversed(dims))
+    traced = [num_subsystems - 1 - qubit for qubit in qargs]
+    kept = [axis for axis in range(num_subsystems) if axis not in traced]
+    dim_kept = int(np.product([shape[axis] for axis in kept]))
+    # Trace all subsystems in a single contraction by giving the row and
+    # column index of each traced subsystem the same label
+    row_labels = list(range(num_subsystems))
+    col_labels = [axis if axis in traced else num_subsystems + axis
+                  for axis in range(num_subsystems)]
+    out_labels = kept + [num_subsystems + axis for axis in kept]
+    rho = np.einsum(np.reshape(mat, shape + shape), row_labels + col_labels, out_labels)
+    return np.reshape(rho, (dim_kept, dim_kept))
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Statevector quantum state class.
+"""
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.operators.operator import _apply_gates
+from qiskit.quantum_info.operators.pauli import Pauli
+from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
+from qiskit.quantum_info.states.quantum_state import QuantumState
+
+
+class Statevector(QuantumState):
+    """Statevector class"""
+
+    def __init__(self, data, dims=None):
+        """Initialize a statevector object.
+
+        Args:
+            data (vector_like or Statevector): a complex statevector.
+            dims (int or tuple or list): Optional. The subsystem dimension
+                                         of the state (See additional
+                                         information).
+
+        Raises:
+            QiskitError: if input data is not a valid vector.
+
+        Additional Information
+        ----------------------
+        If the dimensions are None, they will be automatically determined
+        from the input data. If the input data is a vector of length 2**N
+        qubit subsystems will be used, otherwise a single subsystem with
+        dimension specified by the length of the input is assigned.
+        """
+        if isinstance(data, Statevector):
+            if dims is None:
+                dims = data.dims()
+            vec = np.array(data.data, dtype=complex)
+        elif isinstance(data, (list, np.ndarray)):
+            vec = np.array(data, dtype=complex)
+            if vec.ndim == 2 and vec.shape[1] == 1:
+                # flatten column-vector to vector
+                vec = np.reshape(vec, vec.shape[0])
+            if vec.ndim != 1:
+                raise QiskitError("Invalid input: not a vector.")
+        else:
+            raise QiskitError("Invalid input data format for Statevector")
+        super().__init__('Statevector', vec, self._automatic_dims(dims, len(vec)))
+
+    def is_valid(self, atol=None, rtol=None):
+        """Return True if a statevector has norm 1."""
+        if atol is None:
+            atol = self.ATOL
+        if rtol is None:
+            rtol = self.RTOL
+        return np.allclose(np.linalg.norm(self._data), 1, rtol=rtol, atol=atol)
+
+    def purity(self):
+        """Return the purity of the quantum state."""
+        return np.linalg.norm(self._data) ** 4
+
+    def evolve(self, other, qargs=None):
+        """Evolve a quantum state by an operator.
+
+        Args:
+            other (Operator or QuantumChannel or QuantumCircuit or
+                   Instruction): the operator to evolve by.
+            qargs (list): a list of subsystems to apply the operator on.
+
+        Returns:
+            QuantumState: the output statevector, or the output density
+            matrix if other is a quantum channel.
+
+        Raises:
+            QiskitError: if the operator dimension does not match the
+            specified subsystem dimensions.
+        """
+        if isinstance(other, QuantumChannel):
+            # Place import here to avoid cyclic import
+            from qiskit.quantum_info.states.densitymatrix import DensityMatrix
+            return DensityMatrix(self).evolve(other, qargs=qargs)
+        if isinstance(other, Pauli) and qargs is None:
+            return Statevector(other.evolve(self._data), dims=self._dims)
+        gates = self._operator_gates(other, qargs)
+        return Statevector(_apply_gates(self._data, self._dims, gates), dims=self._dims)
+
+    def expectation_value(self, oper, qargs=None):
+        """Compute the expectation value <psi|oper|psi> of an operator.
+
+        Args:
+            oper (Operator or Pauli): an operator to evaluate.
+            qargs (list): a list of subsystems the operator acts on.
+
+        Returns:
+            complex: the expectation value.
+
+        Raises:
+            QiskitError: if the operator dimension does not match the
+            specified subsystem dimensions.
+        """
+        if isinstance(oper, Pauli) and qargs is None:
+            # Pauli.expectation returns a real value
+            return complex(oper.expectation(self._data))
+        gates = self._operator_gates(oper, qargs)
+        return complex(np.vdot(self._data, _apply_gates(self._data, self._dims, gates)))
+
+    def _probabilities(self):
+        """Return the measurement probabilities of the full state."""
+        return np.abs(self._data) ** 2
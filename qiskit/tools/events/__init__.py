@@ -16,3 +16,4 @@
 """
 
 from .progressbar import TextProgressBar
+from .passprofiler import PassProfiler
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Collector of the transpiler pass profiles"""
+
+from collections import OrderedDict
+
+from qiskit.tools.events.pubsub import Subscriber
+
+
+class PassProfiler(Subscriber):
+    """Collects the pass profiles of the circuits transpiled with ``profile_passes``.
+
+    Example::
+
+        with PassProfiler() as profiler:
+            transpile(circuits, backend, profile_passes=True)
+        for entry in profiler.summary():
+            print(entry['name'], entry['running_time'])
+
+    Attributes:
+        reports (list[dict]): one report per transpiled circuit, with the keys
+            ``circuit`` (the circuit name) and ``passes`` (the list of profile
+            dictionaries of its pass executions, in order of execution).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.reports = []
+        self.subscribe("terra.transpiler.transpile.profile", self._add_report)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _add_report(self, circuit_name, profile):
+        """Store the pass profiles of a transpiled circuit."""
+        self.reports.append({'circuit': circuit_name, 'passes': profile})
+
+    def stop(self):
+        """Stop collecting reports."""
+        self.unsubscribe("terra.transpiler.transpile.profile", self._add_report)
+
+    def summary(self):
+        """Aggregate the collected profiles by pass name.
+
+        Returns:
+            list[dict]: one dictionary per pass name, with the keys ``name``,
+                ``count`` (number of executions), ``running_time`` and ``cpu_time``
+                (totals, in seconds) and ``memory_peak`` (largest peak, in bytes),
+                sorted by decreasing running time.
+        """
+        totals = OrderedDict()
+        for report in self.reports:
+            for profile in report['passes']:
+                total = totals.setdefault(profile['name'], {'name': profile['name'],
+                                                            'count': 0,
+                                                            'running_time': 0.0,
+                                                            'cpu_time': 0.0,
+                                                            'memory_peak': 0})
+                total['count'] += 1
+                total['running_time'] += profile['running_time']
+                total['cpu_time'] += profile['cpu_time']
+                total['memory_peak'] = max(total['memory_peak'], profile['memory_peak'])
+        return sorted(totals.values(), key=lambda total: total['running_time'], reverse=True)
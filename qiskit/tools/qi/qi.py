@@ -29,6 +29,7 @@ import scipy.linalg as la
 from qiskit.quantum_info import pauli_group
 from qiskit.quantum_info import purity as new_purity
 from qiskit.quantum_info import random
+from qiskit.quantum_info.states.states import _partial_trace_vec, _partial_trace_mat
 
 
 ###############################################################
@@ -86,94 +87,18 @@ def partial_trace(state, trace_systems, dimensions=None, reverse=True):
 
     if isinstance(trace_systems, int):
         trace_systems = [trace_systems]
-    else:  # reverse sort trace sys
-        trace_systems = sorted(trace_systems, reverse=True)
 
-    # trace out subsystems
+    # convert to subsystems ordered with system-0 the right most system
+    if not reverse:
+        dimensions = dimensions[::-1]
+        trace_systems = [len(dimensions) - 1 - j for j in trace_systems]
+
+    # trace out all subsystems in a single contraction
     if state.ndim == 1:
         # optimized partial trace for input state vector
-        return __partial_trace_vec(state, trace_systems, dimensions, reverse)
+        return _partial_trace_vec(state, dimensions, trace_systems)
     # standard partial trace for input density matrix
-    return __partial_trace_mat(state, trace_systems, dimensions, reverse)
-
-
-def __partial_trace_vec(vec, trace_systems, dimensions, reverse=True):
-    """
-    Partial trace over subsystems of multi-partite vector.
-
-    Args:
-        vec (vector_like): complex vector N
-        trace_systems (list(int)): a list of subsystems (starting from 0) to
-                                  trace over.
-        dimensions (list(int)): a list of the dimensions of the subsystems.
-                                If this is not set it will assume all
-                                subsystems are qubits.
-        reverse (bool): ordering of systems in operator.
-            If True system-0 is the right most system in tensor product.
-            If False system-0 is the left most system in tensor product.
-
-    Returns:
-        ndarray: A density matrix with the appropriate subsystems traced over.
-    """
-
-    # trace sys positions
-    if reverse:
-        dimensions = dimensions[::-1]
-        trace_systems = len(dimensions) - 1 - np.array(trace_systems)
-
-    rho = vec.reshape(dimensions)
-    rho = np.tensordot(rho, rho.conj(), axes=(trace_systems, trace_systems))
-    d = int(np.sqrt(np.product(rho.shape)))
-
-    return rho.reshape(d, d)
-
-
-def __partial_trace_mat(mat, trace_systems, dimensions, reverse=True):
-    """
-    Partial trace over subsystems of multi-partite matrix.
-
-    Note that subsystems are ordered as rho012 = rho0(x)rho1(x)rho2.
-
-    Args:
-        mat (matrix_like): a matrix NxN.
-        trace_systems (list(int)): a list of subsystems (starting from 0) to
-                                  trace over.
-        dimensions (list(int)): a list of the dimensions of the subsystems.
-                                If this is not set it will assume all
-                                subsystems are qubits.
-        reverse (bool): ordering of systems in operator.
-            If True system-0 is the right most system in tensor product.
-            If False system-0 is the left most system in tensor product.
-
-    Returns:
-        ndarray: A density matrix with the appropriate subsystems traced over.
-    """
-
-    trace_systems = sorted(trace_systems, reverse=True)
-    for j in trace_systems:
-        # Partition subsystem dimensions
-        dimension_trace = int(dimensions[j])  # traced out system
-        if reverse:
-            left_dimensions = dimensions[j + 1:]
-            right_dimensions = dimensions[:j]
-            dimensions = right_dimensions + left_dimensions
-        else:
-            left_dimensions = dimensions[:j]
-            right_dimensions = dimensions[j + 1:]
-            dimensions = left_dimensions + right_dimensions
-        # Contract remaining dimensions
-        dimension_left = int(np.prod(left_dimensions))
-        dimension_right = int(np.prod(right_dimensions))
-
-        # Reshape input array into tri-partite system with system to be
-        # traced as the middle index
-        mat = mat.reshape([dimension_left, dimension_trace, dimension_right,
-                           dimension_left, dimension_trace, dimension_right])
-        # trace out the middle system and reshape back to a matrix
-        mat = mat.trace(axis1=1, axis2=4).reshape(
-            dimension_left * dimension_right,
-            dimension_left * dimension_right)
-    return mat
+    return _partial_trace_mat(state, dimensions, trace_systems)
 
 
 def vectorize(density_matrix, method='col'):
@@ -93,7 +93,25 @@ class BasePass(metaclass=MetaPass):
 
 class AnalysisPass(BasePass):  # pylint: disable=abstract-method
     """ An analysis pass: change property set, not DAG. """
-    pass
+
+    def run_on_wires(self, dag, wires):  # pylint: disable=unused-argument
+        """
+        Update the analysis of a DAGCircuit on which this pass already ran, after the
+        operations on some of its wires changed. Passes whose analysis can be computed
+        wire by wire override this method, and the pass manager then calls it instead
+        of ``run`` when only a region of the dag was modified since the last run.
+        By default, the whole dag is analyzed again.
+        Args:
+            dag (DAGCircuit): the dag on which the pass is run.
+            wires (set(Bit)): the wires whose operations changed since the last run.
+        """
+        self.run(dag)
+
+    @property
+    def is_incremental(self):
+        """ If the pass implements ``run_on_wires``, the pass manager can update its analysis
+        on the modified wires only, instead of running it again on the whole DAG. """
+        return type(self).run_on_wires is not AnalysisPass.run_on_wires
 
 
 class TransformationPass(BasePass):  # pylint: disable=abstract-method
@@ -135,19 +135,29 @@ class CouplingMap:
     def _compute_distance_matrix(self):
         """Compute the full distance matrix on pairs of nodes.
 
-        The distance map self._dist_matrix is computed from the graph using
-        all_pairs_shortest_path_length.
+        The distance map self._dist_matrix is computed from the graph by a
+        breadth-first search from every node on the undirected sparse
+        adjacency matrix.
         """
         if not self.is_connected():
             raise CouplingError("coupling graph not connected")
-        lengths = nx.all_pairs_shortest_path_length(self.graph.to_undirected(as_view=True))
-        lengths = dict(lengths)
-        size = len(lengths)
-        cmap = np.zeros((size, size))
-        for idx in range(size):
-            cmap[idx, np.fromiter(lengths[idx].keys(), dtype=int)] = np.fromiter(
-                lengths[idx].values(), dtype=int)
-        self._dist_matrix = cmap
+        size = self.size()
+        edges = np.asarray(self.get_edges(), dtype=int).reshape(-1, 2)
+        adjacency = sp.coo_matrix((np.ones(len(edges)), (edges[:, 0], edges[:, 1])),
+                                  shape=(size, size)).tocsr()
+        self._dist_matrix = cs.shortest_path(adjacency, directed=False, unweighted=True)
+
+    @property
+    def distance_matrix(self):
+        """Return the undirected distance matrix between the physical qubits.
+
+        Returns:
+            ndarray: the distance between each pair of physical qubits, indexed
+                by physical qubit. The matrix is shared and must not be modified.
+        """
+        if self._dist_matrix is None:
+            self._compute_distance_matrix()
+        return self._dist_matrix
 
     def distance(self, physical_qubit1, physical_qubit2):
         """Returns the undirected distance between physical_qubit1 and physical_qubit2.
@@ -50,3 +50,5 @@ from .mapping.lookahead_swap import LookaheadSwap
 from .remove_diagonal_gates_before_measure import RemoveDiagonalGatesBeforeMeasure
 from .mapping.stochastic_swap import StochasticSwap
 from .mapping.legacy_swap import LegacySwap
+from .mapping.sabre_swap import SabreSwap
+from .mapping.sabre_swap import SabreLayout
@@ -14,14 +14,13 @@
 
 """
 Traverse the DAG and find blocks of gates that act consecutively on
-pairs of qubits. Write the blocks to propert_set as a dictionary
-of the form:
+pairs of qubits. Write the blocks to propert_set as a list of tuples
+of "op" nodes, in topological order:
 
-    {(q0, q1): [[g0, g1, g2], [g5]],
-     (q0, q2): [[g3, g4]]
+    [(g0, g1, g2), (g3, g4), (g5,)
      ..
      .
-    }
+    ]
 
 Based on implementation by Andrew Cross.
 """
@@ -33,163 +32,106 @@ from qiskit.transpiler.basepasses import AnalysisPass
 
 class Collect2qBlocks(AnalysisPass):
     """Pass to collect sequences of uninterrupted gates acting on 2 qubits.
+
+    The DAG is walked once in topological order. Each qubit has at most one
+    open block, which the gates on that qubit are added to while the block
+    acts on no more than max_block_width qubits.
     """
+
+    def __init__(self, gates=None, max_block_width=2):
+        """
+        Args:
+            gates (list[str]): names of the gates that can be collected in a
+                block. Defaults to ["cx", "u1", "u2", "u3", "id"].
+            max_block_width (int): maximum number of qubits of a block.
+        """
+        super().__init__()
+        self.gates = ["cx", "u1", "u2", "u3", "id"] if gates is None else list(gates)
+        self.max_block_width = max_block_width
+
     def run(self, dag):
-        """collect blocks of adjacent gates acting on a pair of "cx" qubits.
+        """collect blocks of adjacent gates acting on at most max_block_width qubits.
 
         The blocks contain "op" nodes in topological sort order
-        such that all gates in a block act on the same pair of
-        qubits and are adjacent in the circuit. the blocks are built
-        by examining predecessors and successors of "cx" gates in
-        the circuit. u1, u2, u3, cx, id gates will be included.
+        such that all gates in a block act on the same set of
+        qubits and are adjacent in the circuit. A block is closed when
+        one of its qubits is used by a gate that cannot be added to it,
+        and the blocks are listed in the order they are closed, which is
+        a topological order of the blocks. Blocks acting on a single qubit
+        are not collected.
 
         Return a list of tuples of "op" node labels.
         """
         # Initiate the commutation set
         self.property_set['commutation_set'] = defaultdict(list)
 
-        good_names = ["cx", "u1", "u2", "u3", "id"]
+        good_names = set(self.gates)
         block_list = []
-        nodes = list(dag.topological_nodes())
-        nodes_seen = dict(zip(nodes, [False] * len(nodes)))
+        # Blocks are lists [nodes, qubits, open], in the order they are
+        # started. The open block of a qubit is the block of the last node
+        # on that qubit, if that block is still open.
+        blocks = []
+        node_block = {}
+
+        def close(block):
+            block[2] = False
+            if len(block[1]) > 1:
+                block_list.append(tuple(block[0]))
+
         for nd in dag.topological_op_nodes():
-            group = []
-            # Explore predecessors and successors of cx gates
-            if nd.name == "cx" and nd.condition is None and not nodes_seen[nd]:
-                these_qubits = set(nd.qargs)
-                # Explore predecessors of the "cx" node
-                pred = list(dag.predecessors(nd))
-                explore = True
-                while explore:
-                    pred_next = []
-                    # If there is one predecessor, add it if it's on the right qubits
-                    if len(pred) == 1 and not nodes_seen[pred[0]]:
-                        pnd = pred[0]
-                        if pnd.name in good_names:
-                            if (pnd.name == "cx" and set(pnd.qargs) == these_qubits) or \
-                                    pnd.name != "cx":
-                                group.append(pnd)
-                                nodes_seen[pnd] = True
-                                pred_next.extend(dag.predecessors(pnd))
-                    # If there are two, then we consider cases
-                    elif len(pred) == 2:
-                        # First, check if there is a relationship
-                        if pred[0] in dag.predecessors(pred[1]):
-                            sorted_pred = [pred[1]]   # was [pred[1], pred[0]]
-                        elif pred[1] in dag.predecessors(pred[0]):
-                            sorted_pred = [pred[0]]   # was [pred[0], pred[1]]
-                        else:
-                            # We need to avoid accidentally adding a cx on these_qubits
-                            # since these must have a dependency through the other predecessor
-                            # in this case
-                            if pred[0].name == "cx" and set(pred[0].qargs) == these_qubits:
-                                sorted_pred = [pred[1]]
-                            elif pred[1].name == "cx" and set(pred[1].qargs) == these_qubits:
-                                sorted_pred = [pred[0]]
-                            else:
-                                sorted_pred = pred
-                        if len(sorted_pred) == 2 and sorted_pred[0].name == "cx" and \
-                           sorted_pred[1].name == "cx":
-                            break  # stop immediately if we hit a pair of cx
-                        # Examine each predecessor
-                        for pnd in sorted_pred:
-                            if pnd.name not in good_names:
-                                continue
-                            # If a predecessor is a single qubit gate, add it
-                            if pnd.name != "cx":
-                                if not nodes_seen[pnd]:
-                                    group.append(pnd)
-                                    nodes_seen[pnd] = True
-                                    pred_next.extend(dag.predecessors(pnd))
-                            # If cx, check qubits
-                            else:
-                                pred_qubits = set(pnd.qargs)
-                                if pred_qubits == these_qubits:
-                                    # add if on same qubits
-                                    if not nodes_seen[pnd]:
-                                        group.append(pnd)
-                                        nodes_seen[pnd] = True
-                                        pred_next.extend(dag.predecessors(pnd))
-                                else:
-                                    # remove qubit from consideration if not
-                                    these_qubits = list(set(these_qubits) -
-                                                        set(pred_qubits))
-                    # Update predecessors
-                    # Stop if there aren't any more
-                    pred = list(set(pred_next))
-                    if not pred:
-                        explore = False
-                # Reverse the predecessor list and append the "cx" node
-                group.reverse()
-                group.append(nd)
-                nodes_seen[nd] = True
-                # Reset these_qubits
-                these_qubits = set(nd.qargs)
-                # Explore successors of the "cx" node
-                succ = list(dag.successors(nd))
-                explore = True
-                while explore:
-                    succ_next = []
-                    # If there is one successor, add it if its on the right qubits
-                    if len(succ) == 1 and not nodes_seen[succ[0]]:
-                        snd = succ[0]
-                        if snd.name in good_names:
-                            if (snd.name == "cx" and set(snd.qargs) == these_qubits) or \
-                                    snd.name != "cx":
-                                group.append(snd)
-                                nodes_seen[snd] = True
-                                succ_next.extend(dag.successors(snd))
-                    # If there are two, then we consider cases
-                    elif len(succ) == 2:
-                        # First, check if there is a relationship
-                        if succ[0] in dag.successors(succ[1]):
-                            sorted_succ = [succ[1]]  # was [succ[1], succ[0]]
-                        elif succ[1] in dag.successors(succ[0]):
-                            sorted_succ = [succ[0]]  # was [succ[0], succ[1]]
-                        else:
-                            # We need to avoid accidentally adding a cx on these_qubits
-                            # since these must have a dependency through the other successor
-                            # in this case
-                            if succ[0].name == "cx" and set(succ[0].qargs) == these_qubits:
-                                sorted_succ = [succ[1]]
-                            elif succ[1].name == "cx" and set(succ[1].qargs) == these_qubits:
-                                sorted_succ = [succ[0]]
-                            else:
-                                sorted_succ = succ
-                        if len(sorted_succ) == 2 and \
-                           sorted_succ[0].name == "cx" and \
-                           sorted_succ[1].name == "cx":
-                            break  # stop immediately if we hit a pair of cx
-                        # Examine each successor
-                        for snd in sorted_succ:
-                            if snd.name not in good_names:
-                                continue
-                            # If a successor is a single qubit gate, add it
-                            if snd.name != "cx":
-                                if not nodes_seen[snd]:
-                                    group.append(snd)
-                                    nodes_seen[snd] = True
-                                    succ_next.extend(dag.successors(snd))
-                            else:
-                                # If cx, check qubits
-                                succ_qubits = set(snd.qargs)
-                                if succ_qubits == these_qubits:
-                                    # add if on same qubits
-                                    if not nodes_seen[snd]:
-                                        group.append(snd)
-                                        nodes_seen[snd] = True
-                                        succ_next.extend(dag.successors(snd))
-                                else:
-                                    # remove qubit from consideration if not
-                                    these_qubits = list(set(these_qubits) -
-                                                        set(succ_qubits))
-                    # Update successors
-                    # Stop if there aren't any more
-                    succ = list(set(succ_next))
-                    if not succ:
-                        explore = False
-
-                block_list.append(tuple(group))
+            open_blocks = []
+            preds_in_open_blocks = True
+            for pred in dag.predecessors(nd):
+                block = node_block.get(pred)
+                if block is None or not block[2]:
+                    preds_in_open_blocks = False
+                elif not any(block is b for b in open_blocks):
+                    open_blocks.append(block)
+
+            if (nd.name not in good_names or nd.condition is not None or nd.cargs
+                    or len(nd.qargs) > self.max_block_width):
+                for block in open_blocks:
+                    close(block)
+                continue
+
+            if len(open_blocks) == 1 and preds_in_open_blocks:
+                # The qubits of the gate are all in the same open block
+                open_blocks[0][0].append(nd)
+                node_block[nd] = open_blocks[0]
+                continue
+
+            # Add the open blocks of the qubits of the gate to its block,
+            # as long as the block is narrow enough, and close the others
+            qubits = set(nd.qargs)
+            merged = []
+            for block in open_blocks:
+                if len(qubits | block[1]) <= self.max_block_width:
+                    qubits |= block[1]
+                    merged.append(block)
+                else:
+                    close(block)
+            if merged:
+                # The open blocks act on different qubits, so their nodes
+                # can be concatenated in any order. The longest block is
+                # extended with the others.
+                merged.sort(key=lambda block: len(block[0]), reverse=True)
+                new_block = merged[0]
+                for block in merged[1:]:
+                    block[2] = False
+                    new_block[0].extend(block[0])
+                    for node in block[0]:
+                        node_block[node] = new_block
+                new_block[1] = qubits
+            else:
+                new_block = [[], qubits, True]
+                blocks.append(new_block)
+            new_block[0].append(nd)
+            node_block[nd] = new_block
+
+        # Close the blocks left open at the end of the circuit
+        for block in blocks:
+            if block[2]:
+                close(block)
 
         self.property_set['block_list'] = block_list
 
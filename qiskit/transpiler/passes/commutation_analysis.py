@@ -54,42 +54,54 @@ class CommutationAnalysis(AnalysisPass):
         # self.property_set['commutation_set'][wire_name][(node, wire_name)] will give the
         # commutation set that contains node.
 
-        for wire in dag.wires:
-            wire_name = "{0}[{1}]".format(str(wire.register.name), str(wire.index))
-            self.property_set['commutation_set'][wire_name] = []
-
-        # Add edges to the dictionary for each qubit
-        for node in dag.topological_op_nodes():
-            for (_, _, edge_data) in dag.edges(node):
-
-                edge_name = edge_data['name']
-                self.property_set['commutation_set'][(node, edge_name)] = -1
-
         # Construct the commutation set
         for wire in dag.wires:
-            wire_name = "{0}[{1}]".format(str(wire.register.name), str(wire.index))
+            self._analyze_wire(dag, wire)
 
-            for current_gate in dag.nodes_on_wire(wire):
+    def run_on_wires(self, dag, wires):
+        """
+        Update the commutation relations in the property_set on the wires whose
+        gates changed since the last run. The commutation sets of a wire only
+        depend on the gates on that wire, so the other wires are kept as they are.
+        """
+        commutation_set = self.property_set['commutation_set']
+        if commutation_set is None:
+            self.run(dag)
+            return
 
-                current_comm_set = self.property_set['commutation_set'][wire_name]
-                if not current_comm_set:
+        for wire in wires:
+            wire_name = "{0}[{1}]".format(str(wire.register.name), str(wire.index))
+            # Forget the gates previously on the wire, some of them may have been removed
+            for com_set in commutation_set.get(wire_name, []):
+                for node in com_set:
+                    commutation_set.pop((node, wire_name), None)
+            self._analyze_wire(dag, wire)
+
+    def _analyze_wire(self, dag, wire):
+        """Group the successive gates on a wire into sets of commuting gates."""
+        wire_name = "{0}[{1}]".format(str(wire.register.name), str(wire.index))
+        current_comm_set = self.property_set['commutation_set'][wire_name] = []
+
+        for current_gate in dag.nodes_on_wire(wire):
+
+            if not current_comm_set:
+                current_comm_set.append([current_gate])
+
+            if current_gate not in current_comm_set[-1]:
+                prev_gate = current_comm_set[-1][-1]
+                does_commute = False
+                try:
+                    does_commute = _commute(current_gate, prev_gate)
+                except TranspilerError:
+                    pass
+                if does_commute:
+                    current_comm_set[-1].append(current_gate)
+
+                else:
                     current_comm_set.append([current_gate])
 
-                if current_gate not in current_comm_set[-1]:
-                    prev_gate = current_comm_set[-1][-1]
-                    does_commute = False
-                    try:
-                        does_commute = _commute(current_gate, prev_gate)
-                    except TranspilerError:
-                        pass
-                    if does_commute:
-                        current_comm_set[-1].append(current_gate)
-
-                    else:
-                        current_comm_set.append([current_gate])
-
-                temp_len = len(current_comm_set)
-                self.property_set['commutation_set'][(current_gate, wire_name)] = temp_len - 1
+            temp_len = len(current_comm_set)
+            self.property_set['commutation_set'][(current_gate, wire_name)] = temp_len - 1
 
 
 def _commute(node1, node2):
@@ -19,7 +19,9 @@ Replace each block of consecutive gates by a single Unitary node.
 The blocks are collected by a previous pass, such as Collect2qBlocks.
 """
 
-from qiskit.circuit import QuantumRegister, QuantumCircuit, Qubit
+from collections import defaultdict
+
+from qiskit.circuit import QuantumRegister, QuantumCircuit
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.quantum_info.operators import Operator
 from qiskit.extensions import UnitaryGate
@@ -32,7 +34,8 @@ class ConsolidateBlocks(TransformationPass):
     the same qubits into a Unitary node, to be resynthesized later,
     to a potentially more optimal subcircuit.
     Important note: this pass assumes that the 'blocks_list' property that
-    it reads is given such that blocks are in topological order.
+    it reads is given such that blocks are in topological order. The gates
+    outside of the blocks are added after the last block they depend on.
     """
     def run(self, dag):
         """iterate over each block and replace it with an equivalent Unitary
@@ -45,51 +48,48 @@ class ConsolidateBlocks(TransformationPass):
             new_dag.add_creg(creg)
 
         # compute ordered indices for the global circuit wires
-        global_index_map = {}
-        for wire in dag.wires:
-            if not isinstance(wire, Qubit):
-                continue
-            global_qregs = list(dag.qregs.values())
-            global_index_map[wire] = global_qregs.index(wire.register) + wire.index
+        global_index_map = {wire: index for index, wire in enumerate(dag.qubits())}
 
         blocks = self.property_set['block_list']
-        nodes_seen = set()
+        block_index = {}
+        for index, block in enumerate(blocks):
+            for nd in block:
+                block_index[nd] = index
 
+        # Nodes outside of the blocks are added after the last block they
+        # depend on, keeping their topological order
+        free_index = {}
+        free_nodes = defaultdict(list)
         for node in dag.topological_op_nodes():
-            # skip already-visited nodes or input/output nodes
-            if node in nodes_seen or node.type == 'in' or node.type == 'out':
+            if node in block_index:
                 continue
-            # check if the node belongs to the next block
-            if blocks and node in blocks[0]:
-                block = blocks[0]
-                # find the qubits involved in this block
-                block_qargs = set()
-                for nd in block:
-                    block_qargs |= set(nd.qargs)
-                # convert block to a sub-circuit, then simulate unitary and add
-                block_width = len(block_qargs)
-                q = QuantumRegister(block_width)
-                subcirc = QuantumCircuit(q)
-                block_index_map = self._block_qargs_to_indices(block_qargs,
-                                                               global_index_map)
-                for nd in block:
-                    nodes_seen.add(nd)
-                    subcirc.append(nd.op, [q[block_index_map[i]] for i in nd.qargs])
-                unitary = UnitaryGate(Operator(subcirc))  # simulates the circuit
-                new_dag.apply_operation_back(
-                    unitary, sorted(block_qargs, key=lambda x: block_index_map[x]))
-                del blocks[0]
-            else:
-                # the node could belong to some future block, but in that case
-                # we simply skip it. It is guaranteed that we will revisit that
-                # future block, via its other nodes
-                for block in blocks[1:]:
-                    if node in block:
-                        break
-                # freestanding nodes can just be added
-                else:
-                    nodes_seen.add(node)
-                    new_dag.apply_operation_back(node.op, node.qargs, node.cargs)
+            index = -1
+            for pred in dag.predecessors(node):
+                if pred.type == 'op':
+                    index = max(index, block_index.get(pred, free_index.get(pred, -1)))
+            free_index[node] = index
+            free_nodes[index].append(node)
+
+        for node in free_nodes[-1]:
+            new_dag.apply_operation_back(node.op, node.qargs, node.cargs, node.condition)
+        for index, block in enumerate(blocks):
+            # find the qubits involved in this block
+            block_qargs = set()
+            for nd in block:
+                block_qargs |= set(nd.qargs)
+            # convert block to a sub-circuit, then simulate unitary and add
+            block_width = len(block_qargs)
+            q = QuantumRegister(block_width)
+            subcirc = QuantumCircuit(q)
+            block_index_map = self._block_qargs_to_indices(block_qargs,
+                                                           global_index_map)
+            for nd in block:
+                subcirc.append(nd.op, [q[block_index_map[i]] for i in nd.qargs])
+            unitary = UnitaryGate(Operator(subcirc))  # simulates the circuit
+            new_dag.apply_operation_back(
+                unitary, sorted(block_qargs, key=lambda x: block_index_map[x]))
+            for node in free_nodes[index]:
+                new_dag.apply_operation_back(node.op, node.qargs, node.cargs, node.condition)
 
         return new_dag
 
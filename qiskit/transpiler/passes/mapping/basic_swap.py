@@ -22,6 +22,7 @@ compatible.
 
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.circuit import Gate
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.transpiler.layout import Layout
 from qiskit.extensions.standard import SwapGate
@@ -60,58 +61,56 @@ class BasicSwap(TransformationPass):
         """
         new_dag = DAGCircuit()
 
-        if self.initial_layout is None:
+        initial_layout = self.initial_layout
+        if initial_layout is None:
             if self.property_set["layout"]:
-                self.initial_layout = self.property_set["layout"]
+                initial_layout = self.property_set["layout"]
             else:
-                self.initial_layout = Layout.generate_trivial_layout(*dag.qregs.values())
+                initial_layout = Layout.generate_trivial_layout(*dag.qregs.values())
 
-        if len(dag.qubits()) != len(self.initial_layout):
+        if len(dag.qubits()) != len(initial_layout):
             raise TranspilerError('The layout does not match the amount of qubits in the DAG')
 
-        if len(self.coupling_map.physical_qubits) != len(self.initial_layout):
+        if len(self.coupling_map.physical_qubits) != len(initial_layout):
             raise TranspilerError(
                 "Mappers require to have the layout to be the same size as the coupling map")
 
-        current_layout = self.initial_layout.copy()
+        for qreg in dag.qregs.values():
+            new_dag.add_qreg(qreg)
+        for creg in dag.cregs.values():
+            new_dag.add_creg(creg)
+
+        current_layout = initial_layout.copy()
+        edge_map = current_layout.combine_into_edge_map(initial_layout)
 
         for layer in dag.serial_layers():
-            subdag = layer['graph']
-
-            for gate in subdag.twoQ_gates():
-                physical_q0 = current_layout[gate.qargs[0]]
-                physical_q1 = current_layout[gate.qargs[1]]
-                if self.coupling_map.distance(physical_q0, physical_q1) != 1:
-                    # Insert a new layer with the SWAP(s).
-                    swap_layer = DAGCircuit()
-
-                    path = self.coupling_map.shortest_undirected_path(physical_q0, physical_q1)
-                    for swap in range(len(path) - 2):
-                        connected_wire_1 = path[swap]
-                        connected_wire_2 = path[swap + 1]
-
-                        qubit_1 = current_layout[connected_wire_1]
-                        qubit_2 = current_layout[connected_wire_2]
-
-                        # create qregs
-                        for qreg in current_layout.get_registers():
-                            if qreg not in swap_layer.qregs.values():
-                                swap_layer.add_qreg(qreg)
-
-                        # create the swap operation
-                        swap_layer.apply_operation_back(SwapGate(),
-                                                        qargs=[qubit_1, qubit_2],
-                                                        cargs=[])
-
-                    # layer insertion
-                    edge_map = current_layout.combine_into_edge_map(self.initial_layout)
-                    new_dag.compose_back(swap_layer, edge_map)
-
-                    # update current_layout
-                    for swap in range(len(path) - 2):
-                        current_layout.swap(path[swap], path[swap + 1])
-
-            edge_map = current_layout.combine_into_edge_map(self.initial_layout)
-            new_dag.extend_back(subdag, edge_map)
+            for gate in layer.nodes:
+                if len(gate.qargs) == 2 and isinstance(gate.op, Gate):
+                    physical_q0 = current_layout[gate.qargs[0]]
+                    physical_q1 = current_layout[gate.qargs[1]]
+                    if self.coupling_map.distance(physical_q0, physical_q1) != 1:
+                        # Insert the SWAP(s) before the gate
+                        path = self.coupling_map.shortest_undirected_path(physical_q0,
+                                                                          physical_q1)
+                        for swap in range(len(path) - 2):
+                            connected_wire_1 = path[swap]
+                            connected_wire_2 = path[swap + 1]
+
+                            qubit_1 = current_layout[connected_wire_1]
+                            qubit_2 = current_layout[connected_wire_2]
+
+                            # create the swap operation
+                            new_dag.apply_operation_back(
+                                SwapGate(), qargs=[edge_map[qubit_1], edge_map[qubit_2]],
+                                cargs=[])
+
+                        # update current_layout
+                        for swap in range(len(path) - 2):
+                            current_layout.swap(path[swap], path[swap + 1])
+                        edge_map = current_layout.combine_into_edge_map(initial_layout)
+
+                new_dag.apply_operation_back(gate.op,
+                                             [edge_map[qubit] for qubit in gate.qargs],
+                                             gate.cargs, gate.condition)
 
         return new_dag
@@ -49,18 +49,19 @@ class CheckCXDirection(AnalysisPass):
         Args:
             dag (DAGCircuit): DAG to check.
         """
-        if self.layout is None:
+        layout = self.layout
+        if layout is None:
             if self.property_set["layout"]:
-                self.layout = self.property_set["layout"]
+                layout = self.property_set["layout"]
             else:
-                self.layout = Layout.generate_trivial_layout(*dag.qregs.values())
+                layout = Layout.generate_trivial_layout(*dag.qregs.values())
 
         self.property_set['is_direction_mapped'] = True
         edges = self.coupling_map.get_edges()
 
         for gate in dag.twoQ_gates():
-            physical_q0 = self.layout[gate.qargs[0]]
-            physical_q1 = self.layout[gate.qargs[1]]
+            physical_q0 = layout[gate.qargs[0]]
+            physical_q1 = layout[gate.qargs[1]]
 
             if isinstance(gate.op, (CXBase, CnotGate)) and (
                     physical_q0, physical_q1) not in edges:
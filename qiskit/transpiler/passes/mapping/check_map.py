@@ -46,17 +46,18 @@ class CheckMap(AnalysisPass):
         Args:
             dag (DAGCircuit): DAG to map.
         """
-        if self.layout is None:
+        layout = self.layout
+        if layout is None:
             if self.property_set["layout"]:
-                self.layout = self.property_set["layout"]
+                layout = self.property_set["layout"]
             else:
-                self.layout = Layout.generate_trivial_layout(*dag.qregs.values())
+                layout = Layout.generate_trivial_layout(*dag.qregs.values())
 
         self.property_set['is_swap_mapped'] = True
 
         for gate in dag.twoQ_gates():
-            physical_q0 = self.layout[gate.qargs[0]]
-            physical_q1 = self.layout[gate.qargs[1]]
+            physical_q0 = layout[gate.qargs[0]]
+            physical_q1 = layout[gate.qargs[1]]
 
             if self.coupling_map.distance(physical_q0, physical_q1) != 1:
                 self.property_set['is_swap_mapped'] = False
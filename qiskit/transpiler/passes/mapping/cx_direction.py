@@ -62,42 +62,44 @@ class CXDirection(TransformationPass):
                 cx nodes.
         """
         new_dag = DAGCircuit()
+        for qreg in dag.qregs.values():
+            new_dag.add_qreg(qreg)
+        for creg in dag.cregs.values():
+            new_dag.add_creg(creg)
 
-        if self.layout is None:
+        layout = self.layout
+        if layout is None:
             # LegacySwap renames the register in the DAG and does not match the property set
-            self.layout = Layout.generate_trivial_layout(*dag.qregs.values())
+            layout = Layout.generate_trivial_layout(*dag.qregs.values())
 
+        edges = set(self.coupling_map.get_edges())
         for layer in dag.serial_layers():
-            subdag = layer['graph']
+            for node in layer.nodes:
+                if node.name not in ('cx', 'CX'):
+                    new_dag.apply_operation_back(node.op, node.qargs, node.cargs,
+                                                 node.condition)
+                    continue
 
-            for cnot_node in subdag.named_nodes('cx', 'CX'):
-                control = cnot_node.qargs[0]
-                target = cnot_node.qargs[1]
+                control = node.qargs[0]
+                target = node.qargs[1]
 
-                physical_q0 = self.layout[control]
-                physical_q1 = self.layout[target]
+                physical_q0 = layout[control]
+                physical_q1 = layout[target]
                 if self.coupling_map.distance(physical_q0, physical_q1) != 1:
                     raise TranspilerError('The circuit requires a connection between physical '
                                           'qubits %s and %s' % (physical_q0, physical_q1))
 
-                if (physical_q0, physical_q1) not in self.coupling_map.get_edges():
-                    # A flip needs to be done
-
-                    # Create the involved registers
-                    if control.register not in subdag.qregs.values():
-                        subdag.add_qreg(control.register)
-                    if target.register not in subdag.qregs.values():
-                        subdag.add_qreg(target.register)
-
-                    # Add H gates around
-                    subdag.apply_operation_back(U2Gate(0, pi), [target], [])
-                    subdag.apply_operation_back(U2Gate(0, pi), [control], [])
-                    subdag.apply_operation_front(U2Gate(0, pi), [target], [])
-                    subdag.apply_operation_front(U2Gate(0, pi), [control], [])
-
-                    # Flips the CX
-                    cnot_node.qargs[0], cnot_node.qargs[1] = target, control
-
-            new_dag.extend_back(subdag)
+                if (physical_q0, physical_q1) in edges:
+                    new_dag.apply_operation_back(node.op, node.qargs, node.cargs,
+                                                 node.condition)
+                    continue
+
+                # A flip needs to be done: add H gates around the flipped CX
+                new_dag.apply_operation_back(U2Gate(0, pi), [target], [])
+                new_dag.apply_operation_back(U2Gate(0, pi), [control], [])
+                new_dag.apply_operation_back(node.op, [target, control], node.cargs,
+                                             node.condition)
+                new_dag.apply_operation_back(U2Gate(0, pi), [target], [])
+                new_dag.apply_operation_back(U2Gate(0, pi), [control], [])
 
         return new_dag
@@ -31,23 +31,32 @@ from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.transpiler.exceptions import TranspilerError
 
 
+# Best subsets of coupling maps found by DenseLayout passes
+_BEST_SUBSET_CACHE = {}
+_BEST_SUBSET_CACHE_SIZE = 64
+
+
 class DenseLayout(AnalysisPass):
     """
     Chooses a Layout by finding the most connected subset of qubits.
     """
 
-    def __init__(self, coupling_map):
+    def __init__(self, coupling_map, backend_prop=None):
         """
         Chooses a DenseLayout
 
         Args:
             coupling_map (Coupling): directed graph representing a coupling map.
+            backend_prop (BackendProperties): backend properties object. If
+                given, the most connected subset with the lowest CNOT and
+                readout errors is chosen.
 
         Raises:
             TranspilerError: if invalid options
         """
         super().__init__()
         self.coupling_map = coupling_map
+        self.backend_prop = backend_prop
 
     def run(self, dag):
         """
@@ -75,54 +84,119 @@ class DenseLayout(AnalysisPass):
     def _best_subset(self, n_qubits):
         """Computes the qubit mapping with the best connectivity.
 
+        The subsets are found for a coupling map and number of qubits once,
+        and shared with the other passes.
+
         Args:
             n_qubits (int): Number of subset qubits to consider.
 
         Returns:
             ndarray: Array of qubits to use for best connectivity mapping.
+
+        Raises:
+            TranspilerError: if no connected subset of n_qubits qubits exists.
         """
         if n_qubits == 1:
             return np.array([0])
 
         device_qubits = self.coupling_map.size()
-
-        cmap = np.asarray(self.coupling_map.get_edges())
-        data = np.ones_like(cmap[:, 0])
-        sp_cmap = sp.coo_matrix((data, (cmap[:, 0], cmap[:, 1])),
-                                shape=(device_qubits, device_qubits)).tocsr()
-        best = 0
-        best_map = None
-        # do bfs with each node as starting point
-        for k in range(sp_cmap.shape[0]):
-            bfs = cs.breadth_first_order(sp_cmap, i_start=k, directed=False,
-                                         return_predecessors=False)
-
-            connection_count = 0
-            sub_graph = []
-            for i in range(n_qubits):
-                node_idx = bfs[i]
-                for j in range(sp_cmap.indptr[node_idx],
-                               sp_cmap.indptr[node_idx + 1]):
-                    node = sp_cmap.indices[j]
-                    for counter in range(n_qubits):
-                        if node == bfs[counter]:
-                            connection_count += 1
-                            sub_graph.append([node_idx, node])
-                            break
-
-            if connection_count > best:
-                best = connection_count
-                best_map = bfs[0:n_qubits]
-                # Return a best mapping that has reduced bandwidth
-                mapping = {}
-                for edge in range(best_map.shape[0]):
-                    mapping[best_map[edge]] = edge
-                new_cmap = [[mapping[c[0]], mapping[c[1]]] for c in sub_graph]
-                rows = [edge[0] for edge in new_cmap]
-                cols = [edge[1] for edge in new_cmap]
-                data = [1]*len(rows)
-                sp_sub_graph = sp.coo_matrix((data, (rows, cols)),
-                                             shape=(n_qubits, n_qubits)).tocsr()
-                perm = cs.reverse_cuthill_mckee(sp_sub_graph)
-                best_map = best_map[perm]
-        return best_map
+        edges = self.coupling_map.get_edges()
+        cx_errors, readout_errors = None, None
+        if self.backend_prop is not None:
+            cx_errors, readout_errors = self._error_rates(edges, device_qubits)
+
+        key = (tuple(edges), device_qubits, n_qubits)
+        if cx_errors is not None:
+            key += (tuple(cx_errors), tuple(readout_errors))
+        if key not in _BEST_SUBSET_CACHE:
+            if len(_BEST_SUBSET_CACHE) >= _BEST_SUBSET_CACHE_SIZE:
+                _BEST_SUBSET_CACHE.clear()
+            best_map = _best_subset(np.asarray(edges), device_qubits, n_qubits,
+                                    cx_errors, readout_errors)
+            best_map.setflags(write=False)
+            _BEST_SUBSET_CACHE[key] = best_map
+        return _BEST_SUBSET_CACHE[key]
+
+    def _error_rates(self, edges, device_qubits):
+        """Return the error of the CNOT of each edge, and the readout error of each qubit.
+
+        Missing errors are taken as 0.
+        """
+        gate_errors = {}
+        for ginfo in self.backend_prop.gates:
+            if ginfo.gate == 'cx':
+                for item in ginfo.parameters:
+                    if item.name == 'gate_error':
+                        gate_errors[tuple(ginfo.qubits)] = item.value
+                        break
+        cx_errors = np.array([gate_errors.get(tuple(edge), 0.0) for edge in edges])
+
+        readout_errors = np.zeros(device_qubits)
+        for idx, qubit in enumerate(self.backend_prop.qubits[:device_qubits]):
+            for nduv in qubit:
+                if nduv.name == 'readout_error':
+                    readout_errors[idx] = nduv.value
+        return cx_errors, readout_errors
+
+
+def _best_subset(cmap, device_qubits, n_qubits, cx_errors=None, readout_errors=None):
+    """Find the subset of qubits with the most couplings between them.
+
+    The candidate subsets are the first qubits of a breadth first search from
+    each qubit. Their couplings are counted for all the candidates at once.
+
+    Args:
+        cmap (ndarray): the (control, target) qubits of each coupling.
+        device_qubits (int): the number of qubits of the device.
+        n_qubits (int): the number of qubits of the subset.
+        cx_errors (ndarray): the CNOT error of each coupling, if any.
+        readout_errors (ndarray): the readout error of each qubit, if any.
+
+    Returns:
+        ndarray: the qubits of the subset, ordered to reduce the bandwidth of
+            its coupling graph.
+
+    Raises:
+        TranspilerError: if no connected subset of n_qubits qubits exists.
+    """
+    data = np.ones_like(cmap[:, 0])
+    sp_cmap = sp.coo_matrix((data, (cmap[:, 0], cmap[:, 1])),
+                            shape=(device_qubits, device_qubits)).tocsr()
+
+    # subsets[k] are the first qubits of a bfs starting at k
+    subsets = np.zeros((device_qubits, n_qubits), dtype=int)
+    connected = np.zeros(device_qubits, dtype=bool)
+    for k in range(device_qubits):
+        bfs = cs.breadth_first_order(sp_cmap, i_start=k, directed=False,
+                                     return_predecessors=False)
+        if len(bfs) >= n_qubits:
+            subsets[k] = bfs[:n_qubits]
+            connected[k] = True
+    if not connected.any():
+        raise TranspilerError('No connected subset of %d qubits in the coupling map.'
+                              % n_qubits)
+    members = np.zeros((device_qubits, device_qubits), dtype=bool)
+    members[np.arange(device_qubits)[:, None], subsets] = True
+
+    # sub_edges[k, e] is set if the coupling e is within subset k
+    sub_edges = members[:, cmap[:, 0]] & members[:, cmap[:, 1]]
+    connection_count = np.where(connected, sub_edges.sum(axis=1), -1)
+    candidates = connection_count == connection_count.max()
+    if cx_errors is not None:
+        # Mean CNOT and readout errors of the most connected subsets
+        num_edges = np.maximum(sub_edges.sum(axis=1), 1)
+        error = (sub_edges @ cx_errors) / num_edges + (members @ readout_errors) / n_qubits
+        best = np.flatnonzero(candidates)[np.argmin(error[candidates])]
+    else:
+        best = np.argmax(candidates)
+
+    # Return a best mapping that has reduced bandwidth
+    best_map = subsets[best]
+    mapping = np.zeros(device_qubits, dtype=int)
+    mapping[best_map] = np.arange(n_qubits)
+    sub_graph = cmap[sub_edges[best]]
+    sp_sub_graph = sp.coo_matrix((np.ones(len(sub_graph), dtype=int),
+                                  (mapping[sub_graph[:, 0]], mapping[sub_graph[:, 1]])),
+                                 shape=(n_qubits, n_qubits)).tocsr()
+    perm = cs.reverse_cuthill_mckee(sp_sub_graph)
+    return best_map[perm]
@@ -64,13 +64,13 @@ class FullAncillaAllocation(AnalysisPass):
         Raises:
             TranspilerError: If there is not layout in the property set or not set at init time.
         """
-        self.layout = self.layout or self.property_set.get('layout')
+        layout = self.layout or self.property_set.get('layout')
 
-        if self.layout is None:
+        if layout is None:
             raise TranspilerError("FullAncilla pass requires property_set[\"layout\"] or"
                                   " \"layout\" parameter to run")
 
-        layout_physical_qubits = self.layout.get_physical_bits().keys()
+        layout_physical_qubits = layout.get_physical_bits().keys()
         coupling_physical_qubits = self.coupling_map.physical_qubits
         idle_physical_qubits = [q for q in coupling_physical_qubits
                                 if q not in layout_physical_qubits]
@@ -78,20 +78,21 @@ class LegacySwap(TransformationPass):
         # Schedule the input circuit
         layerlist = list(dag.layers())
 
-        if self.initial_layout is None and self.property_set["layout"]:
-            self.initial_layout = self.property_set["layout"]
+        given_layout = self.initial_layout
+        if given_layout is None and self.property_set["layout"]:
+            given_layout = self.property_set["layout"]
 
-        if self.initial_layout is not None:
+        if given_layout is not None:
             # update initial_layout from a user given dict{(regname,idx): (regname,idx)}
             # to an expected dict{(reg,idx): (reg,idx)}
 
-            virtual_qubits = self.initial_layout.get_virtual_bits()
-            self.initial_layout = {(v.register.name, v.index): ('q', self.initial_layout[v]) for v
-                                   in virtual_qubits}
+            virtual_qubits = given_layout.get_virtual_bits()
+            given_layout = {(v.register.name, v.index): ('q', given_layout[v]) for v
+                            in virtual_qubits}
 
             device_register = QuantumRegister(self.coupling_map.size(), 'q')
             initial_layout = {dag.qregs[k[0]][k[1]]: device_register[v[1]]
-                              for k, v in self.initial_layout.items()}
+                              for k, v in given_layout.items()}
             # Check the input layout
             circ_qubits = dag.qubits()
             coup_qubits = [(QuantumRegister(self.coupling_map.size(), 'q'), wire) for wire in
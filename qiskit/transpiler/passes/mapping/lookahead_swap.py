@@ -92,21 +92,22 @@ class LookaheadSwap(TransformationPass):
         coupling_map = self._coupling_map
         ordered_virtual_gates = list(dag.serial_layers())
 
-        if self.initial_layout is None:
+        initial_layout = self.initial_layout
+        if initial_layout is None:
             if self.property_set["layout"]:
-                self.initial_layout = self.property_set["layout"]
+                initial_layout = self.property_set["layout"]
             else:
-                self.initial_layout = Layout.generate_trivial_layout(*dag.qregs.values())
+                initial_layout = Layout.generate_trivial_layout(*dag.qregs.values())
 
-        if len(dag.qubits()) != len(self.initial_layout):
+        if len(dag.qubits()) != len(initial_layout):
             raise TranspilerError('The layout does not match the amount of qubits in the DAG')
 
-        if len(self._coupling_map.physical_qubits) != len(self.initial_layout):
+        if len(self._coupling_map.physical_qubits) != len(initial_layout):
             raise TranspilerError(
                 "Mappers require to have the layout to be the same size as the coupling map")
 
         mapped_gates = []
-        layout = self.initial_layout.copy()
+        layout = initial_layout.copy()
         gates_remaining = ordered_virtual_gates.copy()
 
         while gates_remaining:
@@ -209,8 +210,8 @@ def _map_free_gates(layout, gates, coupling_map):
     for gate in gates:
         # Gates without a partition (barrier, snapshot, save, load, noise) may
         # still have associated qubits. Look for them in the qargs.
-        if not gate['partition']:
-            qubits = [n for n in gate['graph'].nodes() if n.type == 'op'][0].qargs
+        if not gate.partition:
+            qubits = gate.nodes[0].qargs
 
             if not qubits:
                 continue
@@ -223,7 +224,7 @@ def _map_free_gates(layout, gates, coupling_map):
                 mapped_gates.append(mapped_gate)
             continue
 
-        qubits = gate['partition'][0]
+        qubits = gate.partition[0]
 
         if blocked_qubits.intersection(qubits):
             blocked_qubits.update(qubits)
@@ -249,9 +250,9 @@ def _calc_layout_distance(gates, coupling_map, layout, max_gates=None):
     if max_gates is None:
         max_gates = 50 + 10 * len(coupling_map.physical_qubits)
 
-    return sum(coupling_map.distance(*[layout[q] for q in gate['partition'][0]])
+    return sum(coupling_map.distance(*[layout[q] for q in gate.partition[0]])
                for gate in gates[:max_gates]
-               if gate['partition'] and len(gate['partition'][0]) == 2)
+               if gate.partition and len(gate.partition[0]) == 2)
 
 
 def _score_step(step):
@@ -282,7 +283,7 @@ def _copy_circuit_metadata(source_dag, coupling_map):
 def _transform_gate_for_layout(gate, layout):
     """Return op implementing a virtual gate on given layout."""
 
-    mapped_op_node = deepcopy([n for n in gate['graph'].nodes() if n.type == 'op'][0])
+    mapped_op_node = deepcopy(gate.nodes[0])
 
     # Workaround until #1816, apply mapped to qargs to both DAGNode and op
     device_qreg = QuantumRegister(len(layout.get_physical_bits()), 'q')
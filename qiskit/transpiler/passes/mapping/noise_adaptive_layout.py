@@ -44,13 +44,17 @@ in the transpiler architecture it is best passed around between passes by
 being set in `property_set`.
 """
 
-import math
+import numpy as np
 import networkx as nx
 
 from qiskit.transpiler.layout import Layout
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.transpiler.exceptions import TranspilerError
 
+# Swap costs of the calibrations seen by NoiseAdaptiveLayout passes
+_SWAP_COSTS_CACHE = {}
+_SWAP_COSTS_CACHE_SIZE = 16
+
 
 class NoiseAdaptiveLayout(AnalysisPass):
     """
@@ -70,14 +74,13 @@ class NoiseAdaptiveLayout(AnalysisPass):
         """
         super().__init__()
         self.backend_prop = backend_prop
-        self.swap_graph = nx.DiGraph()
         self.cx_errors = {}
         self.readout_errors = {}
         self.available_hw_qubits = []
         self.gate_list = []
         self.gate_cost = {}
-        self.swap_paths = {}
-        self.swap_costs = {}
+        self.swap_costs = None
+        self.num_cx_qubits = 0
         self.prog_graph = nx.Graph()
         self.qarg_to_id = {}
         self.pending_program_edges = []
@@ -86,51 +89,37 @@ class NoiseAdaptiveLayout(AnalysisPass):
     def _initialize_backend_prop(self):
         """
         Extract readout and CNOT errors and compute swap costs.
+
+        The swap costs of a calibration, identified by its update date and
+        CNOT errors, are computed once and shared with the other passes.
         """
         backend_prop = self.backend_prop
         for ginfo in backend_prop.gates:
             if ginfo.gate == 'cx':
+                g_reliab = 1.0
                 for item in ginfo.parameters:
                     if item.name == 'gate_error':
                         g_reliab = 1.0 - item.value
                         break
-                    else:
-                        g_reliab = 1.0
-                swap_reliab = pow(g_reliab, 3)
-                swap_reliab = -math.log(swap_reliab) if swap_reliab != 0 else -math.inf
-                self.swap_graph.add_edge(ginfo.qubits[0], ginfo.qubits[1], weight=swap_reliab)
-                self.swap_graph.add_edge(ginfo.qubits[1], ginfo.qubits[0], weight=swap_reliab)
                 self.cx_errors[(ginfo.qubits[0], ginfo.qubits[1])] = g_reliab
                 self.gate_list.append((ginfo.qubits[0], ginfo.qubits[1]))
-        idx = 0
-        for q in backend_prop.qubits:
-            for nduv in q:
+        for idx, qubit in enumerate(backend_prop.qubits):
+            for nduv in qubit:
                 if nduv.name == 'readout_error':
                     self.readout_errors[idx] = 1.0 - nduv.value
-                    self.available_hw_qubits.append(idx)
-            idx += 1
         for edge in self.cx_errors:
             self.gate_cost[edge] = self.cx_errors[edge] * self.readout_errors[edge[0]] *\
                 self.readout_errors[edge[1]]
-        self.swap_paths, swap_costs_temp = nx.algorithms.shortest_paths.dense.\
-            floyd_warshall_predecessor_and_distance(self.swap_graph, weight='weight')
-        for i in swap_costs_temp:
-            self.swap_costs[i] = {}
-            for j in swap_costs_temp[i]:
-                if (i, j) in self.cx_errors:
-                    self.swap_costs[i][j] = self.cx_errors[(i, j)]
-                elif (j, i) in self.cx_errors:
-                    self.swap_costs[i][j] = self.cx_errors[(j, i)]
-                else:
-                    best_reliab = 0.0
-                    for n in self.swap_graph.neighbors(j):
-                        if (n, j) in self.cx_errors:
-                            reliab = math.exp(-swap_costs_temp[i][n])*self.cx_errors[(n, j)]
-                        else:
-                            reliab = math.exp(-swap_costs_temp[i][n])*self.cx_errors[(j, n)]
-                        if reliab > best_reliab:
-                            best_reliab = reliab
-                    self.swap_costs[i][j] = best_reliab
+        self.num_cx_qubits = len({qubit for edge in self.cx_errors for qubit in edge})
+
+        key = (backend_prop.last_update_date, tuple(self.cx_errors.items()))
+        if key not in _SWAP_COSTS_CACHE:
+            if len(_SWAP_COSTS_CACHE) >= _SWAP_COSTS_CACHE_SIZE:
+                _SWAP_COSTS_CACHE.clear()
+            num_qubits = max([len(backend_prop.qubits)] +
+                             [qubit + 1 for edge in self.cx_errors for qubit in edge])
+            _SWAP_COSTS_CACHE[key] = _swap_costs(self.cx_errors, num_qubits)
+        self.swap_costs = _SWAP_COSTS_CACHE[key]
 
     def _qarg_to_id(self, qubit):
         """
@@ -213,9 +202,16 @@ class NoiseAdaptiveLayout(AnalysisPass):
 
     def run(self, dag):
         """Main run method for the noise adaptive layout."""
-        self._initialize_backend_prop()
+        if self.swap_costs is None:
+            self._initialize_backend_prop()
+        # Clear the state of a previous run
+        self.available_hw_qubits = list(self.readout_errors)
+        self.prog_graph = nx.Graph()
+        self.qarg_to_id = {}
+        self.pending_program_edges = []
+        self.prog2hw = {}
         num_qubits = self._create_program_graph(dag)
-        if num_qubits > len(self.swap_graph):
+        if num_qubits > self.num_cx_qubits:
             raise TranspilerError('Number of qubits greater than device.')
         for end1, end2, _ in sorted(self.prog_graph.edges(data=True),
                                     key=lambda x: x[2]['weight'], reverse=True):
@@ -251,3 +247,44 @@ class NoiseAdaptiveLayout(AnalysisPass):
             hwid = self.prog2hw[pid]
             layout[q] = hwid
         self.property_set['layout'] = layout
+
+
+def _swap_costs(cx_errors, num_qubits):
+    """Compute the reliability of a CNOT between each pair of hardware qubits.
+
+    The CNOT between coupled qubits is done directly. Otherwise, the first
+    qubit is swapped along the most reliable path to a neighbor of the
+    second one, a swap being three CNOTs.
+
+    Args:
+        cx_errors (dict): reliability of the CNOT of each coupled (q0, q1) pair
+        num_qubits (int): number of hardware qubits
+
+    Returns:
+        ndarray: read-only matrix of the reliability of a CNOT from the first
+            index to the second one.
+    """
+    cx_reliab = np.zeros((num_qubits, num_qubits))
+    coupled = np.zeros((num_qubits, num_qubits), dtype=bool)
+    swap_weight = np.full((num_qubits, num_qubits), np.inf)
+    for (qubit0, qubit1), g_reliab in cx_errors.items():
+        cx_reliab[qubit1, qubit0] = g_reliab
+        coupled[qubit0, qubit1] = coupled[qubit1, qubit0] = True
+        with np.errstate(divide='ignore'):
+            swap_weight[qubit0, qubit1] = swap_weight[qubit1, qubit0] = -3 * np.log(g_reliab)
+    # The reliability of a CNOT in the given direction takes precedence
+    for (qubit0, qubit1), g_reliab in cx_errors.items():
+        cx_reliab[qubit0, qubit1] = g_reliab
+
+    # All-pairs most reliable swap paths, as shortest paths of -log reliabilities
+    np.fill_diagonal(swap_weight, 0)
+    for qubit in range(num_qubits):
+        np.minimum(swap_weight, swap_weight[:, qubit, None] + swap_weight[None, qubit, :],
+                   out=swap_weight)
+
+    # Best swap path to a neighbor of the target, followed by a CNOT
+    path_reliab = np.exp(-swap_weight)
+    swap_costs = np.max(path_reliab[:, :, None] * cx_reliab[None, :, :], axis=1)
+    swap_costs[coupled] = cx_reliab[coupled]
+    swap_costs.setflags(write=False)
+    return swap_costs
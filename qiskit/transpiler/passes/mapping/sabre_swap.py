@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Passes implementing the SABRE swap-based bidirectional heuristic search.
+
+The heuristic is described in:
+Gushu Li, Yufei Ding, Yuan Xie. Tackling the Qubit Mapping Problem for
+NISQ-Era Quantum Devices. ASPLOS 2019 (arXiv:1809.02573).
+
+SabreSwap routes the circuit gate by gate. The two-qubit gates whose
+predecessors have all been executed form the front layer. Once no gate
+of the front layer can be executed, the swap on an edge next to a front
+layer qubit that minimizes the distance between the qubits of the front
+layer gates, and of a set of upcoming gates, is inserted. The distance
+cost is scaled by a decay of the recently swapped qubits, to favour
+swaps that can run in parallel.
+
+SabreLayout refines an initial layout by routing the circuit forward and
+backward, starting each traversal from the final layout of the previous one.
+"""
+
+from collections import deque
+
+import numpy as np
+
+from qiskit.circuit import Gate
+from qiskit.circuit import QuantumRegister
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.extensions.standard import SwapGate
+from qiskit.transpiler.basepasses import AnalysisPass
+from qiskit.transpiler.basepasses import TransformationPass
+from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.transpiler.layout import Layout
+
+# Number of upcoming two-qubit gates in the lookahead cost, and their weight
+_EXTENDED_SET_SIZE = 20
+_EXTENDED_SET_WEIGHT = 0.5
+
+# Decay added to the swapped qubits, reset every few swaps
+_DECAY_RATE = 0.001
+_DECAY_RESET_INTERVAL = 5
+
+
+class SabreSwap(TransformationPass):
+    """
+    Maps a DAGCircuit onto a `coupling_map` adding swap gates chosen by the
+    SABRE heuristic.
+
+    As the LegacySwap pass, the output circuit acts on a single register 'q'
+    of the physical qubits of the coupling map.
+    """
+
+    def __init__(self, coupling_map, initial_layout=None, seed=None):
+        """
+        Maps a DAGCircuit onto a `coupling_map` using swap gates.
+
+        Args:
+            coupling_map (CouplingMap): Directed graph represented a coupling map.
+            initial_layout (Layout): initial layout of qubits in mapping. If None,
+                the layout in the property set, or else a trivial layout, is used.
+            seed (int): seed for breaking ties between equally good swaps.
+        """
+        super().__init__()
+        self.coupling_map = coupling_map
+        self.initial_layout = initial_layout
+        self.seed = seed
+
+    def run(self, dag):
+        """Map a DAGCircuit onto the coupling map using swap gates.
+
+        Args:
+            dag (DAGCircuit): input DAG circuit
+
+        Returns:
+            DAGCircuit: circuit on the physical qubits of the coupling map,
+                equivalent to the input circuit up to the initial and final
+                permutations of the qubits.
+
+        Raises:
+            TranspilerError: if the circuit does not fit the coupling map, the
+                layout does not match the circuit, or the circuit has gates on
+                more than two qubits.
+        """
+        if len(dag.qubits()) > self.coupling_map.size():
+            raise TranspilerError("Not enough qubits in CouplingGraph")
+        for node in dag.threeQ_or_more_gates():
+            raise TranspilerError("SabreSwap only routes gates on 1 or 2 qubits, "
+                                  "%s acts on %d." % (node.name, len(node.qargs)))
+
+        layout = self.initial_layout or self.property_set['layout']
+        if layout is None:
+            layout = Layout.generate_trivial_layout(*dag.qregs.values())
+        try:
+            initial_v2p = [layout[qubit] for qubit in dag.qubits()]
+        except KeyError:
+            raise TranspilerError("The layout does not match the circuit qubits.")
+        if max(initial_v2p, default=-1) >= self.coupling_map.size():
+            raise TranspilerError("The layout does not match the coupling map.")
+
+        sabre_dag = _SabreDAG(dag)
+        router = _SabreRouter(self.coupling_map, np.random.RandomState(self.seed))
+        steps, _ = router.route(sabre_dag, np.array(initial_v2p, dtype=int), record=True)
+
+        dagcircuit_output = DAGCircuit()
+        dagcircuit_output.name = dag.name
+        device_register = QuantumRegister(self.coupling_map.size(), 'q')
+        dagcircuit_output.add_qreg(device_register)
+        for creg in dag.cregs.values():
+            dagcircuit_output.add_creg(creg)
+
+        for index, physical_qubits in steps:
+            qargs = [device_register[bit] for bit in physical_qubits]
+            if index < 0:
+                dagcircuit_output.apply_operation_back(SwapGate(), qargs, [])
+            else:
+                node = sabre_dag.nodes[index]
+                dagcircuit_output.apply_operation_back(node.op, qargs, node.cargs,
+                                                       node.condition)
+        return dagcircuit_output
+
+
+class SabreLayout(AnalysisPass):
+    """
+    Chooses a Layout by routing the circuit forward and backward with the
+    SABRE heuristic, starting from a random layout.
+
+    The final layout of routing the circuit is a good initial layout for
+    routing the reversed circuit, and conversely. The layout of the last
+    backward traversal is set in `property_set['layout']`. Gates on more
+    than two qubits are not taken into account.
+    """
+
+    def __init__(self, coupling_map, max_iterations=3, seed=None):
+        """
+        Args:
+            coupling_map (CouplingMap): directed graph representing a coupling map.
+            max_iterations (int): number of forward-backward traversals.
+            seed (int): seed of the random starting layout and of the tie breaks.
+        """
+        super().__init__()
+        self.coupling_map = coupling_map
+        self.max_iterations = max_iterations
+        self.seed = seed
+
+    def run(self, dag):
+        """Run the SabreLayout pass on `dag`.
+
+        Args:
+            dag (DAGCircuit): DAG to find layout for.
+
+        Raises:
+            TranspilerError: if dag wider than self.coupling_map.
+        """
+        num_qubits = len(dag.qubits())
+        if num_qubits > self.coupling_map.size():
+            raise TranspilerError('Number of qubits greater than device.')
+
+        forward = _SabreDAG(dag)
+        backward = forward.reverse()
+        rng = np.random.RandomState(self.seed)
+        router = _SabreRouter(self.coupling_map, rng)
+
+        v2p = rng.permutation(self.coupling_map.size())[:num_qubits]
+        for _ in range(self.max_iterations):
+            _, v2p = router.route(forward, v2p)
+            _, v2p = router.route(backward, v2p)
+
+        layout = Layout()
+        for qubit, physical_qubit in zip(dag.qubits(), v2p):
+            layout[qubit] = int(physical_qubit)
+        self.property_set['layout'] = layout
+
+
+class _SabreDAG:
+    """The op nodes of a DAGCircuit as integer arrays for routing.
+
+    Qubits are numbered by their position in `dag.qubits()`, and op nodes by
+    their position in a topological order.
+    """
+
+    def __init__(self, dag=None):
+        """
+        Args:
+            dag (DAGCircuit): the circuit to route. If None, the object is left
+                empty, to be filled by `reverse`.
+        """
+        self.nodes = []
+        self.qargs = []
+        self.pairs = np.zeros((0, 2), dtype=int)
+        self.routed = np.zeros(0, dtype=bool)
+        self.successors = []
+        self.num_predecessors = []
+        if dag is None:
+            return
+
+        self.nodes = list(dag.topological_op_nodes())
+        qubit_indices = {qubit: index for index, qubit in enumerate(dag.qubits())}
+        node_indices = {node: index for index, node in enumerate(self.nodes)}
+
+        self.qargs = [[qubit_indices[qubit] for qubit in node.qargs] for node in self.nodes]
+        self.pairs = np.zeros((len(self.nodes), 2), dtype=int)
+        self.routed = np.zeros(len(self.nodes), dtype=bool)
+        for index, node in enumerate(self.nodes):
+            if isinstance(node.op, Gate) and len(node.qargs) == 2:
+                self.pairs[index] = self.qargs[index]
+                self.routed[index] = True
+            self.successors.append([node_indices[succ] for succ in dag.successors(node)
+                                    if succ.type == 'op'])
+            self.num_predecessors.append(sum(1 for pred in dag.predecessors(node)
+                                             if pred.type == 'op'))
+
+    def reverse(self):
+        """Return the reversed circuit, with the same node indices.
+
+        Returns:
+            _SabreDAG: the circuit with the dependencies reversed.
+        """
+        reverse = _SabreDAG()
+        reverse.nodes = self.nodes
+        reverse.qargs = self.qargs
+        reverse.pairs = self.pairs
+        reverse.routed = self.routed
+        reverse.successors = [[] for _ in self.nodes]
+        for index, successors in enumerate(self.successors):
+            for succ in successors:
+                reverse.successors[succ].append(index)
+        reverse.num_predecessors = [len(successors) for successors in self.successors]
+        return reverse
+
+
+class _SabreRouter:
+    """Routing of _SabreDAG circuits on a coupling map with the SABRE heuristic."""
+
+    def __init__(self, coupling_map, rng):
+        """
+        Args:
+            coupling_map (CouplingMap): the coupling map to route on.
+            rng (RandomState): random number generator for the tie breaks.
+        """
+        self.rng = rng
+        self.size = coupling_map.size()
+        self.dist = coupling_map.distance_matrix
+
+        neighbors = [set() for _ in range(self.size)]
+        for src, dst in coupling_map.get_edges():
+            neighbors[src].add(dst)
+            neighbors[dst].add(src)
+        # Neighbors of each physical qubit, padded with -1
+        degree = max((len(bits) for bits in neighbors), default=0)
+        self.neighbors = np.full((self.size, degree), -1, dtype=int)
+        for bit, bits in enumerate(neighbors):
+            self.neighbors[bit, :len(bits)] = sorted(bits)
+
+        # Swaps without executing a gate before routing a gate along a shortest path
+        self.max_swaps_without_progress = 10 * max(int(self.dist.max()), 1) + 10
+
+    def route(self, sabre_dag, initial_v2p, record=False):
+        """Route a circuit from an initial layout.
+
+        Args:
+            sabre_dag (_SabreDAG): the circuit to route.
+            initial_v2p (ndarray): the physical qubit of each virtual qubit.
+            record (bool): if True, return the routed circuit.
+
+        Returns:
+            tuple(list, ndarray): the routed circuit as a list of
+                (node index, physical qubits) pairs, where swaps have the node
+                index -1 (empty if record is False), and the final physical qubit
+                of each virtual qubit.
+        """
+        dist = self.dist
+        routed = sabre_dag.routed
+        pairs = sabre_dag.pairs
+        successors = sabre_dag.successors
+        num_predecessors = list(sabre_dag.num_predecessors)
+
+        v2p = np.array(initial_v2p, dtype=int)
+        p2v = np.full(self.size, -1, dtype=int)
+        p2v[v2p] = np.arange(len(v2p))
+        decay = np.ones(self.size)
+        # The front layer gates, and the front layer gate on each physical qubit
+        front = {}
+        gate_of = np.full(self.size, -1, dtype=int)
+
+        steps = []
+        extended_set = None
+        ready = deque(index for index, count in enumerate(num_predecessors) if count == 0)
+        num_steps = 0
+        swaps_without_progress = 0
+
+        def apply_swap(bit0, bit1):
+            virtual0, virtual1 = p2v[bit0], p2v[bit1]
+            p2v[bit0], p2v[bit1] = virtual1, virtual0
+            if virtual1 >= 0:
+                v2p[virtual1] = bit0
+            if virtual0 >= 0:
+                v2p[virtual0] = bit1
+            gate0, gate1 = gate_of[bit0], gate_of[bit1]
+            gate_of[bit0], gate_of[bit1] = gate1, gate0
+            if record:
+                steps.append((-1, (int(bit0), int(bit1))))
+            # Only the gates on the swapped qubits may have become executable
+            for gate in {gate0, gate1}:
+                if gate >= 0 and dist[v2p[pairs[gate, 0]], v2p[pairs[gate, 1]]] == 1:
+                    del front[gate]
+                    gate_of[v2p[pairs[gate]]] = -1
+                    ready.append(gate)
+
+        while True:
+            # Execute the ready gates whose qubits are adjacent, and
+            # add the other ones to the front layer
+            executed = False
+            while ready:
+                index = ready.popleft()
+                if routed[index] and dist[v2p[pairs[index, 0]], v2p[pairs[index, 1]]] != 1:
+                    front[index] = None
+                    gate_of[v2p[pairs[index]]] = index
+                    continue
+                executed = True
+                if record:
+                    steps.append((index, [int(v2p[qubit]) for qubit in sabre_dag.qargs[index]]))
+                for succ in successors[index]:
+                    num_predecessors[succ] -= 1
+                    if num_predecessors[succ] == 0:
+                        ready.append(succ)
+            if not front:
+                break
+
+            if executed or extended_set is None:
+                decay.fill(1)
+                swaps_without_progress = 0
+                extended_set = self._extended_set(front, sabre_dag)
+
+            front_pairs = v2p[pairs[list(front)]]
+            if swaps_without_progress >= self.max_swaps_without_progress:
+                # Release valve: bring the qubits of the closest gate together
+                closest = np.argmin(dist[front_pairs[:, 0], front_pairs[:, 1]])
+                bit0, bit1 = front_pairs[closest]
+                while dist[bit0, bit1] > 1:
+                    step = next(bit for bit in self.neighbors[bit0]
+                                if bit >= 0 and dist[bit, bit1] == dist[bit0, bit1] - 1)
+                    apply_swap(bit0, step)
+                    bit0 = step
+                swaps_without_progress = 0
+                decay.fill(1)
+                continue
+
+            for bit0, bit1 in self._best_swaps(front_pairs, v2p[pairs[extended_set]],
+                                               decay, gate_of, v2p, pairs):
+                apply_swap(bit0, bit1)
+                decay[bit0] += _DECAY_RATE
+                decay[bit1] += _DECAY_RATE
+            num_steps += 1
+            swaps_without_progress += 1
+            if num_steps % _DECAY_RESET_INTERVAL == 0:
+                decay.fill(1)
+
+        return steps, v2p
+
+    def _best_swaps(self, front_pairs, extended_pairs, decay, gate_of, v2p, pairs):
+        """Return the swap with the lowest heuristic cost, and the swaps in
+        parallel with it that bring the qubits of other front layer gates closer.
+
+        The swaps are taken by increasing cost, each on qubits and front layer
+        gates not touched by the swaps before it, so that their distance
+        changes add up.
+
+        Args:
+            front_pairs (ndarray): physical qubits of the front layer gates.
+            extended_pairs (ndarray): physical qubits of the upcoming gates.
+            decay (ndarray): decay of each physical qubit.
+            gate_of (ndarray): the front layer gate on each physical qubit, or -1.
+            v2p (ndarray): the physical qubit of each virtual qubit.
+            pairs (ndarray): virtual qubits of the two-qubit gates.
+
+        Returns:
+            list[tuple(int, int)]: the physical qubits to swap.
+        """
+        dist = self.dist
+        # Candidate swaps on the edges next to the front layer qubits, with
+        # the edges between two front layer qubits taken once
+        bits = front_pairs.ravel()
+        bit0 = np.repeat(bits, self.neighbors.shape[1])
+        bit1 = self.neighbors[bits].ravel()
+        keep = (bit1 >= 0) & ((bit0 < bit1) | (gate_of[bit1] < 0))
+        bit0, bit1 = bit0[keep], bit1[keep]
+
+        # The gates of the front layer act on disjoint qubits, so a swap
+        # changes the distance of at most two of them
+        gate0, gate1 = gate_of[bit0], gate_of[bit1]
+        other_gate = (gate1 >= 0) & (gate1 != gate0)
+        partner0 = v2p[pairs[gate0]].sum(axis=1) - bit0
+        partner1 = np.where(other_gate, v2p[pairs[gate1]].sum(axis=1) - bit1, bit1)
+        delta = np.where(gate1 != gate0, dist[bit1, partner0] - dist[bit0, partner0], 0)
+        delta += np.where(other_gate, dist[bit0, partner1] - dist[bit1, partner1], 0)
+        front_sum = dist[front_pairs[:, 0], front_pairs[:, 1]].sum()
+        cost = (front_sum + delta) / len(front_pairs)
+
+        if extended_pairs.size:
+            swapped = np.broadcast_to(extended_pairs, (len(bit0),) + extended_pairs.shape)
+            swapped = np.where(swapped == bit0[:, None, None], bit1[:, None, None],
+                               np.where(swapped == bit1[:, None, None], bit0[:, None, None],
+                                        swapped))
+            # The extended set has a bounded size, so its cost is averaged over
+            # at least the front layer size, for an upcoming gate not to weigh
+            # more than a front layer gate in large circuits
+            cost += (_EXTENDED_SET_WEIGHT * dist[swapped[..., 0], swapped[..., 1]].sum(axis=1)
+                     / max(len(extended_pairs), len(front_pairs)))
+
+        cost *= np.maximum(decay[bit0], decay[bit1])
+        best = np.flatnonzero(cost <= cost.min() * (1 + 1e-10))
+        choice = best[self.rng.randint(len(best))]
+        swaps = [(int(bit0[choice]), int(bit1[choice]))]
+
+        used_bits = {bit0[choice], bit1[choice]}
+        used_gates = {gate0[choice], gate1[choice]}
+        improving = np.flatnonzero(delta < 0)
+        for index in improving[np.argsort(cost[improving], kind='stable')]:
+            if index == choice or bit0[index] in used_bits or bit1[index] in used_bits:
+                continue
+            if gate0[index] in used_gates or (other_gate[index] and gate1[index] in used_gates):
+                continue
+            swaps.append((int(bit0[index]), int(bit1[index])))
+            used_bits.update((bit0[index], bit1[index]))
+            used_gates.update((gate0[index], gate1[index]))
+        return swaps
+
+    @staticmethod
+    def _extended_set(front, sabre_dag):
+        """Return up to _EXTENDED_SET_SIZE two-qubit gates following the front layer."""
+        extended_set = []
+        visited = set(front)
+        queue = deque(front)
+        while queue and len(extended_set) < _EXTENDED_SET_SIZE:
+            for succ in sabre_dag.successors[queue.popleft()]:
+                if succ not in visited:
+                    visited.add(succ)
+                    queue.append(succ)
+                    if sabre_dag.routed[succ]:
+                        extended_set.append(succ)
+        return extended_set[:_EXTENDED_SET_SIZE]
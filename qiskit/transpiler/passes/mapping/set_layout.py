@@ -36,5 +36,6 @@ class SetLayout(AnalysisPass):
         self.layout = layout
 
     def run(self, dag):
-        self.property_set['layout'] = self.layout
+        # The layout is extended by later passes, so it is given a copy
+        self.property_set['layout'] = None if self.layout is None else self.layout.copy()
         return dag
@@ -98,29 +98,31 @@ class StochasticSwap(TransformationPass):
             compatible with the DAG
         """
 
-        if self.initial_layout is None:
+        initial_layout = self.initial_layout
+        if initial_layout is None:
             if self.property_set["layout"]:
-                self.initial_layout = self.property_set["layout"]
+                initial_layout = self.property_set["layout"]
             else:
-                self.initial_layout = Layout.generate_trivial_layout(*dag.qregs.values())
+                initial_layout = Layout.generate_trivial_layout(*dag.qregs.values())
 
-        if len(dag.qubits()) != len(self.initial_layout):
+        if len(dag.qubits()) != len(initial_layout):
             raise TranspilerError('The layout does not match the amount of qubits in the DAG')
 
-        if len(self.coupling_map.physical_qubits) != len(self.initial_layout):
+        if len(self.coupling_map.physical_qubits) != len(initial_layout):
             raise TranspilerError(
                 "Mappers require to have the layout to be the same size as the coupling map")
 
         self.qregs = dag.qregs
-        if self.seed is None:
-            self.seed = np.random.randint(0, np.iinfo(np.int32).max)
-        self.rng = np.random.RandomState(self.seed)
-        logger.debug("StochasticSwap RandomState seeded with seed=%s", self.seed)
+        seed = self.seed
+        if seed is None:
+            seed = np.random.randint(0, np.iinfo(np.int32).max)
+        self.rng = np.random.RandomState(seed)
+        logger.debug("StochasticSwap RandomState seeded with seed=%s", seed)
 
-        new_dag = self._mapper(dag, self.coupling_map, trials=self.trials)
+        new_dag = self._mapper(dag, self.coupling_map, initial_layout, trials=self.trials)
         return new_dag
 
-    def _layer_permutation(self, layer_partition, layout, qubit_subset,
+    def _layer_permutation(self, layer_partition, initial_layout, layout, qubit_subset,
                            coupling, trials):
         """Find a swap circuit that implements a permutation for this layer.
 
@@ -131,6 +133,7 @@ class StochasticSwap(TransformationPass):
 
         layer_partition (list): The layer_partition is a list of (qu)bit
             lists and each qubit is a tuple (qreg, index).
+        initial_layout (Layout): The initial layout of the circuit.
         layout (Layout): The layout is a Layout object mapping virtual
             qubits in the input circuit to physical qubits in the coupling
             graph. It reflects the current positions of the data.
@@ -146,7 +149,8 @@ class StochasticSwap(TransformationPass):
             Tuple: success_flag, best_circuit, best_depth, best_layout, trivial_flag
 
         If success_flag is True, then best_circuit contains a DAGCircuit with
-        the swap circuit, best_depth contains the depth of the swap circuit,
+        the swap circuit (None if no swaps are needed), best_depth contains
+        the depth of the swap circuit,
         and best_layout contains the new positions of the data qubits after the
         swap circuit has been applied. The trivial_flag is set if the layer
         has no multi-qubit gates.
@@ -154,58 +158,56 @@ class StochasticSwap(TransformationPass):
         Raises:
             TranspilerError: if anything went wrong.
      """
-        return _layer_permutation(layer_partition, self.initial_layout,
+        return _layer_permutation(layer_partition, initial_layout,
                                   layout, qubit_subset,
                                   coupling, trials,
                                   self.qregs, self.rng)
 
-    def _layer_update(self, i, best_layout, best_depth,
-                      best_circuit, layer_list):
-        """Provide a DAGCircuit for a new mapped layer.
+    def _layer_update(self, dagcircuit_output, layer, initial_layout, best_layout,
+                      best_depth, best_circuit):
+        """Append a new mapped layer to the output DAGCircuit.
 
-        i (int) = layer number
+        dagcircuit_output (DAGCircuit) = the output DAGCircuit that the
+            _mapper method is building
+        layer (DAGLayer) = layer of the input circuit, from the DAGCircuit
+            layers() or serial_layers() methods
+        initial_layout (Layout) = initial layout of the circuit
         best_layout (Layout) = layout returned from _layer_permutation
         best_depth (int) = depth returned from _layer_permutation
         best_circuit (DAGCircuit) = swap circuit returned
             from _layer_permutation
-        layer_list (list) = list of DAGCircuit objects for each layer,
-            output of DAGCircuit layers() method
 
-        Return a DAGCircuit object to append to the output DAGCircuit
-        that the _mapper method is building.
+        The swaps and the layer gates are applied to the output directly,
+        so no DAGCircuit is built for the layer.
         """
         layout = best_layout
         logger.debug("layer_update: layout = %s", pformat(layout))
-        logger.debug("layer_update: self.initial_layout = %s", pformat(self.initial_layout))
-        dagcircuit_output = DAGCircuit()
-        for qubit in layout.get_virtual_bits().keys():
-            if qubit.register not in dagcircuit_output.qregs.values():
-                dagcircuit_output.add_qreg(qubit.register)
+        logger.debug("layer_update: initial_layout = %s", pformat(initial_layout))
 
         # Output any swaps
         if best_depth > 0:
             logger.debug("layer_update: there are swaps in this layer, "
                          "depth %d", best_depth)
-            dagcircuit_output.extend_back(best_circuit)
+            for node in best_circuit.topological_op_nodes():
+                dagcircuit_output.apply_operation_back(node.op, node.qargs, node.cargs,
+                                                       node.condition)
         else:
             logger.debug("layer_update: there are no swaps in this layer")
-        # Make qubit edge map and extend by classical bits
-        edge_map = layout.combine_into_edge_map(self.initial_layout)
-        for bit in dagcircuit_output.clbits():
-            edge_map[bit] = bit
+        # Make qubit edge map, classical bits are mapped to themselves
+        edge_map = layout.combine_into_edge_map(initial_layout)
         # Output this layer
-        dagcircuit_output.compose_back(layer_list[i]["graph"], edge_map)
-
-        return dagcircuit_output
+        for node in layer.nodes:
+            dagcircuit_output.apply_operation_back(
+                node.op, [edge_map[qubit] for qubit in node.qargs], node.cargs,
+                node.condition)
 
-    def _mapper(self, circuit_graph, coupling_graph, trials=20):
+    def _mapper(self, circuit_graph, coupling_graph, initial_layout, trials=20):
         """Map a DAGCircuit onto a CouplingMap using swap gates.
 
-        Use self.initial_layout for the initial layout.
-
         Args:
             circuit_graph (DAGCircuit): input DAG circuit
             coupling_graph (CouplingMap): coupling graph to map onto
+            initial_layout (Layout): initial layout of circuit_graph on coupling_graph
             trials (int): number of trials.
 
         Returns:
@@ -226,12 +228,12 @@ class StochasticSwap(TransformationPass):
         layerlist = list(circuit_graph.layers())
         logger.debug("schedule:")
         for i, v in enumerate(layerlist):
-            logger.debug("    %d: %s", i, v["partition"])
+            logger.debug("    %d: %s", i, v.partition)
 
-        qubit_subset = self.initial_layout.get_virtual_bits().keys()
+        qubit_subset = initial_layout.get_virtual_bits().keys()
 
         # Find swap circuit to precede each layer of input circuit
-        layout = self.initial_layout.copy()
+        layout = initial_layout.copy()
 
         # Construct an empty DAGCircuit with the same set of
         # qregs and cregs as the input circuit
@@ -242,14 +244,6 @@ class StochasticSwap(TransformationPass):
         for creg in circuit_graph.cregs.values():
             dagcircuit_output.add_creg(creg)
 
-        # Make a trivial wire mapping between the subcircuits
-        # returned by _layer_update and the circuit we build
-        identity_wire_map = {}
-        for qubit in circuit_graph.qubits():
-            identity_wire_map[qubit] = qubit
-        for bit in circuit_graph.clbits():
-            identity_wire_map[bit] = bit
-
         logger.debug("initial_layout = %s", layout)
 
         # Iterate over layers
@@ -257,7 +251,7 @@ class StochasticSwap(TransformationPass):
 
             # Attempt to find a permutation for this layer
             success_flag, best_circuit, best_depth, best_layout, trivial_flag \
-                = self._layer_permutation(layer["partition"], layout,
+                = self._layer_permutation(layer.partition, initial_layout, layout,
                                           qubit_subset, coupling_graph,
                                           trials)
             logger.debug("mapper: layer %d", i)
@@ -268,15 +262,15 @@ class StochasticSwap(TransformationPass):
             if not success_flag:
                 logger.debug("mapper: failed, layer %d, "
                              "retrying sequentially", i)
-                serial_layerlist = list(layer["graph"].serial_layers())
+                serial_layerlist = list(layer.graph.serial_layers())
 
                 # Go through each gate in the layer
                 for j, serial_layer in enumerate(serial_layerlist):
 
                     success_flag, best_circuit, best_depth, best_layout, trivial_flag = \
                         self._layer_permutation(
-                            serial_layer["partition"],
-                            layout, qubit_subset,
+                            serial_layer.partition,
+                            initial_layout, layout, qubit_subset,
                             coupling_graph,
                             trials)
                     logger.debug("mapper: layer %d, sublayer %d", i, j)
@@ -300,32 +294,22 @@ class StochasticSwap(TransformationPass):
                     # for each inner iteration
                     layout = best_layout
                     # Update the DAG
-                    dagcircuit_output.extend_back(
-                        self._layer_update(j,
-                                           best_layout,
-                                           best_depth,
-                                           best_circuit,
-                                           serial_layerlist),
-                        identity_wire_map)
+                    self._layer_update(dagcircuit_output, serial_layer, initial_layout,
+                                       best_layout, best_depth, best_circuit)
 
             else:
                 # Update the record of qubit positions for each iteration
                 layout = best_layout
 
                 # Update the DAG
-                dagcircuit_output.extend_back(
-                    self._layer_update(i,
-                                       best_layout,
-                                       best_depth,
-                                       best_circuit,
-                                       layerlist),
-                    identity_wire_map)
+                self._layer_update(dagcircuit_output, layer, initial_layout,
+                                   best_layout, best_depth, best_circuit)
 
         # This is the final edgemap. We might use it to correctly replace
         # any measurements that needed to be removed earlier.
-        logger.debug("mapper: self.initial_layout = %s", pformat(self.initial_layout))
+        logger.debug("mapper: initial_layout = %s", pformat(initial_layout))
         logger.debug("mapper: layout = %s", pformat(layout))
-        last_edgemap = layout.combine_into_edge_map(self.initial_layout)
+        last_edgemap = layout.combine_into_edge_map(initial_layout)
         logger.debug("mapper: last_edgemap = %s", pformat(last_edgemap))
 
         return dagcircuit_output
@@ -380,17 +364,12 @@ def _layer_permutation(layer_partition, initial_layout, layout, qubit_subset,
     logger.debug("layer_permutation: distance = %s", dist)
     if dist == len(gates):
         logger.debug("layer_permutation: nothing to do")
-        circ = DAGCircuit()
-        for register in layout.get_virtual_bits().keys():
-            if register.register not in circ.qregs.values():
-                circ.add_qreg(register.register)
-        return True, circ, 0, layout, (not bool(gates))
+        return True, None, 0, layout, (not bool(gates))
 
     # Begin loop over trials of randomized algorithm
     num_qubits = len(layout)
     best_depth = inf  # initialize best depth
     best_edges = None  # best edges found
-    best_circuit = None  # initialize best swap circuit
     best_layout = None  # initialize best final layout
 
     cdist2 = coupling._dist_matrix**2
@@ -401,15 +380,6 @@ def _layer_permutation(layer_partition, initial_layout, layout, qubit_subset,
     int_gates = gates_to_idx(gates, qregs)
     int_layout = nlayout_from_layout(layout, qregs, coupling.size())
 
-    trial_circuit = DAGCircuit()  # SWAP circuit for this trial
-    for qubit in layout.get_virtual_bits().keys():
-        if qubit.register not in trial_circuit.qregs.values():
-            trial_circuit.add_qreg(qubit.register)
-
-    slice_circuit = DAGCircuit()  # circuit for this swap slice
-    for qubit in layout.get_virtual_bits().keys():
-        if qubit.register not in slice_circuit.qregs.values():
-            slice_circuit.add_qreg(qubit.register)
     edges = np.asarray(coupling.get_edges(), dtype=np.int32).ravel()
     cdist = coupling._dist_matrix
     for trial in range(trials):
@@ -440,12 +410,15 @@ def _layer_permutation(layer_partition, initial_layout, layout, qubit_subset,
         logger.debug("layer_permutation: failed!")
         return False, None, None, None, False
 
+    # Build the SWAP circuit of the best trial
+    best_circuit = DAGCircuit()
+    for qubit in layout.get_virtual_bits().keys():
+        if qubit.register not in best_circuit.qregs.values():
+            best_circuit.add_qreg(qubit.register)
     edgs = best_edges.edges()
     for idx in range(best_edges.size//2):
-        slice_circuit.apply_operation_back(
+        best_circuit.apply_operation_back(
             SwapGate(), [initial_layout[edgs[2*idx]], initial_layout[edgs[2*idx+1]]], [])
-    trial_circuit.extend_back(slice_circuit)
-    best_circuit = trial_circuit
 
     # Otherwise, we return our result for this layer
     logger.debug("layer_permutation: success!")
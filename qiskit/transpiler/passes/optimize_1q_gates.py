@@ -19,175 +19,100 @@ a single gate.
 """
 
 from itertools import groupby
+import math
 
 import numpy as np
+import sympy
+from mpmath.libmp import to_float
 
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.extensions.standard.u1 import U1Gate
 from qiskit.extensions.standard.u2 import U2Gate
 from qiskit.extensions.standard.u3 import U3Gate
-from qiskit.circuit.gate import Gate
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.quantum_info.operators.quaternion import quaternion_from_euler
-from qiskit.dagcircuit import DAGCircuit
-from qiskit.circuit import QuantumRegister, Parameter
+from qiskit.circuit import Parameter
 
 _CHOP_THRESHOLD = 1e-15
 
+# Tolerance to simplify merged rotations to u2, u1 or the identity
+_SIMPLIFY_THRESHOLD = 1e-12
+
+# Angles (theta, phi, lambda) of the u3 gate equal to each fixed gate,
+# up to a global phase
+_U3_ANGLES = {
+    'h': (np.pi / 2, 0, np.pi),
+    'x': (np.pi, 0, np.pi),
+    'y': (np.pi, np.pi / 2, np.pi / 2),
+}
+
+# Angle of the z rotation equal to each fixed gate, up to a global phase
+_Z_ANGLES = {
+    's': np.pi / 2,
+    'sdg': -np.pi / 2,
+    't': np.pi / 4,
+    'tdg': -np.pi / 4,
+    'z': np.pi,
+}
+
+_Z_ROTATIONS = {'u1', 'rz'}.union(_Z_ANGLES)
+
+_SUPPORTED_GATES = {'u2', 'u3', 'rx', 'ry'}.union(_U3_ANGLES, _Z_ROTATIONS)
+
 
 class Optimize1qGates(TransformationPass):
-    """Simplify runs of single qubit gates in the ["u1", "u2", "u3", "cx", "id"] basis."""
+    """Simplify runs of single qubit gates in the ["u1", "u2", "u3", "cx", "id"] basis.
+
+    Each run of gates is merged into a single u1, u2 or u3 gate, or removed
+    if it is the identity up to a global phase. The rotations of a run are
+    multiplied as unit quaternions with floats, and the Euler angles of the
+    merged gate are extracted once per run. Runs of z rotations add up their
+    angles, so they keep the global phase of u1 gates.
+    """
+
+    def __init__(self, gates=None):
+        """
+        Args:
+            gates (list[str]): names of the single qubit gates to merge, from
+                'u1', 'u2', 'u3', 'rx', 'ry', 'rz', 'h', 's', 'sdg', 't',
+                'tdg', 'x', 'y' and 'z'. The merged gates are always u1, u2
+                or u3 gates. Defaults to ['u1', 'u2', 'u3'].
+
+        Raises:
+            TranspilerError: if a gate cannot be merged.
+        """
+        super().__init__()
+        self.gates = ['u1', 'u2', 'u3'] if gates is None else list(gates)
+        unsupported = set(self.gates) - _SUPPORTED_GATES
+        if unsupported:
+            raise TranspilerError('Optimize1qGates cannot merge the gates %s'
+                                  % sorted(unsupported))
+
     def run(self, dag):
         """Return a new circuit that has been optimized."""
-        runs = dag.collect_runs(["u1", "u2", "u3"])
+        runs = dag.collect_runs(self.gates)
         runs = _split_runs_on_parameters(runs)
         for run in runs:
-            right_name = "u1"
-            right_parameters = (0, 0, 0)  # (theta, phi, lambda)
-
             for current_node in run:
-                left_name = current_node.name
                 if (current_node.condition is not None
-                        or len(current_node.qargs) != 1
-                        or left_name not in ["u1", "u2", "u3", "id"]):
+                        or len(current_node.qargs) != 1):
                     raise TranspilerError("internal error")
-                if left_name == "u1":
-                    left_parameters = (0, 0, current_node.op.params[0])
-                elif left_name == "u2":
-                    left_parameters = (np.pi / 2, current_node.op.params[0],
-                                       current_node.op.params[1])
-                elif left_name == "u3":
-                    left_parameters = tuple(current_node.op.params)
-                else:
-                    left_name = "u1"  # replace id with u1
-                    left_parameters = (0, 0, 0)
-                # If there are any sympy objects coming from the gate convert
-                # to numpy.
-                left_parameters = tuple([float(x) for x in left_parameters])
-                # Compose gates
-                name_tuple = (left_name, right_name)
-                if name_tuple == ("u1", "u1"):
-                    # u1(lambda1) * u1(lambda2) = u1(lambda1 + lambda2)
-                    right_parameters = (0, 0, right_parameters[2] +
-                                        left_parameters[2])
-                elif name_tuple == ("u1", "u2"):
-                    # u1(lambda1) * u2(phi2, lambda2) = u2(phi2 + lambda1, lambda2)
-                    right_parameters = (np.pi / 2, right_parameters[1] +
-                                        left_parameters[2], right_parameters[2])
-                elif name_tuple == ("u2", "u1"):
-                    # u2(phi1, lambda1) * u1(lambda2) = u2(phi1, lambda1 + lambda2)
-                    right_name = "u2"
-                    right_parameters = (np.pi / 2, left_parameters[1],
-                                        right_parameters[2] + left_parameters[2])
-                elif name_tuple == ("u1", "u3"):
-                    # u1(lambda1) * u3(theta2, phi2, lambda2) =
-                    #     u3(theta2, phi2 + lambda1, lambda2)
-                    right_parameters = (right_parameters[0], right_parameters[1] +
-                                        left_parameters[2], right_parameters[2])
-                elif name_tuple == ("u3", "u1"):
-                    # u3(theta1, phi1, lambda1) * u1(lambda2) =
-                    #     u3(theta1, phi1, lambda1 + lambda2)
-                    right_name = "u3"
-                    right_parameters = (left_parameters[0], left_parameters[1],
-                                        right_parameters[2] + left_parameters[2])
-                elif name_tuple == ("u2", "u2"):
-                    # Using Ry(pi/2).Rz(2*lambda).Ry(pi/2) =
-                    #    Rz(pi/2).Ry(pi-2*lambda).Rz(pi/2),
-                    # u2(phi1, lambda1) * u2(phi2, lambda2) =
-                    #    u3(pi - lambda1 - phi2, phi1 + pi/2, lambda2 + pi/2)
-                    right_name = "u3"
-                    right_parameters = (np.pi - left_parameters[2] -
-                                        right_parameters[1], left_parameters[1] +
-                                        np.pi / 2, right_parameters[2] +
-                                        np.pi / 2)
-                elif name_tuple[1] == "nop":
-                    right_name = left_name
-                    right_parameters = left_parameters
-                else:
-                    # For composing u3's or u2's with u3's, use
-                    # u2(phi, lambda) = u3(pi/2, phi, lambda)
-                    # together with the qiskit.mapper.compose_u3 method.
-                    right_name = "u3"
-                    # Evaluate the symbolic expressions for efficiency
-                    right_parameters = Optimize1qGates.compose_u3(left_parameters[0],
-                                                                  left_parameters[1],
-                                                                  left_parameters[2],
-                                                                  right_parameters[0],
-                                                                  right_parameters[1],
-                                                                  right_parameters[2])
-                    # Why evalf()? This program:
-                    #   OPENQASM 2.0;
-                    #   include "qelib1.inc";
-                    #   qreg q[2];
-                    #   creg c[2];
-                    #   u3(0.518016983430947*pi,1.37051598592907*pi,1.36816383603222*pi) q[0];
-                    #   u3(1.69867232277986*pi,0.371448347747471*pi,0.461117217930936*pi) q[0];
-                    #   u3(0.294319836336836*pi,0.450325871124225*pi,1.46804720442555*pi) q[0];
-                    #   measure q -> c;
-                    # took >630 seconds (did not complete) to optimize without
-                    # calling evalf() at all, 19 seconds to optimize calling
-                    # evalf() AFTER compose_u3, and 1 second to optimize
-                    # calling evalf() BEFORE compose_u3.
-                # 1. Here down, when we simplify, we add f(theta) to lambda to
-                # correct the global phase when f(theta) is 2*pi. This isn't
-                # necessary but the other steps preserve the global phase, so
-                # we continue in that manner.
-                # 2. The final step will remove Z rotations by 2*pi.
-                # 3. Note that is_zero is true only if the expression is exactly
-                # zero. If the input expressions have already been evaluated
-                # then these final simplifications will not occur.
-                # TODO After we refactor, we should have separate passes for
-                # exact and approximate rewriting.
-
-                # Y rotation is 0 mod 2*pi, so the gate is a u1
-                if np.mod(right_parameters[0], (2 * np.pi)) == 0 \
-                        and right_name != "u1":
-                    right_name = "u1"
-                    right_parameters = (0, 0, right_parameters[1] +
-                                        right_parameters[2] +
-                                        right_parameters[0])
-                # Y rotation is pi/2 or -pi/2 mod 2*pi, so the gate is a u2
-                if right_name == "u3":
-                    # theta = pi/2 + 2*k*pi
-                    if np.mod((right_parameters[0] - np.pi / 2), (2 * np.pi)) == 0:
-                        right_name = "u2"
-                        right_parameters = (np.pi / 2, right_parameters[1],
-                                            right_parameters[2] +
-                                            (right_parameters[0] - np.pi / 2))
-                    # theta = -pi/2 + 2*k*pi
-                    if np.mod((right_parameters[0] + np.pi / 2), (2 * np.pi)) == 0:
-                        right_name = "u2"
-                        right_parameters = (np.pi / 2, right_parameters[1] +
-                                            np.pi, right_parameters[2] -
-                                            np.pi + (right_parameters[0] +
-                                                     np.pi / 2))
-                # u1 and lambda is 0 mod 2*pi so gate is nop (up to a global phase)
-                if right_name == "u1" and np.mod(right_parameters[2], (2 * np.pi)) == 0:
-                    right_name = "nop"
-
-            # Replace the the first node in the run with a dummy DAG which contains a dummy
-            # qubit. The name is irrelevant, because substitute_node_with_dag will take care of
-            # putting it in the right place.
-            run_qarg = QuantumRegister(1, 'q')[0]
-            new_op = Gate(name="", num_qubits=1, params=[])
-            if right_name == "u1":
-                new_op = U1Gate(right_parameters[2])
-            if right_name == "u2":
-                new_op = U2Gate(right_parameters[1], right_parameters[2])
-            if right_name == "u3":
-                new_op = U3Gate(*right_parameters)
-
-            if right_name != 'nop':
-                new_dag = DAGCircuit()
-                new_dag.add_qreg(run_qarg.register)
-                new_dag.apply_operation_back(new_op, [run_qarg], [])
-                dag.substitute_node_with_dag(run[0], new_dag)
-
-            # Delete the other nodes in the run
-            for current_node in run[1:]:
-                dag.remove_op_node(current_node)
-            if right_name == "nop":
-                dag.remove_op_node(run[0])
+
+            if all(node.name in _Z_ROTATIONS for node in run):
+                new_op = _merge_z_rotations(run)
+            else:
+                new_op = _merge_rotations(run)
+
+            if len(run) == 1 and new_op is not None and new_op.name == run[0].name:
+                # Nothing to merge or simplify, leave the dag untouched
+                continue
+
+            if new_op is None:
+                dag.remove_op_nodes(run)
+            else:
+                # Replace the first node in the run and delete the other ones
+                dag.substitute_node(run[0], new_op)
+                dag.remove_op_nodes(run[1:])
 
         return dag
 
@@ -242,7 +167,10 @@ def _split_runs_on_parameters(runs):
     """
 
     def _is_dagnode_parameterized(node):
-        return any(isinstance(param, Parameter) for param in node.op.params)
+        for param in node.op.params:
+            if isinstance(param, Parameter):
+                return True
+        return False
 
     out = []
     for run in runs:
@@ -253,3 +181,125 @@ def _split_runs_on_parameters(runs):
                 out.append(list(gates))
 
     return out
+
+
+def _merge_z_rotations(run):
+    """Return the u1 gate, or None for the identity, equal to a run of z rotations.
+
+    The angles are added, so the global phase of u1 gates is kept.
+    """
+    lam = 0
+    for node in run:
+        if node.name in _Z_ANGLES:
+            lam += _Z_ANGLES[node.name]
+        else:
+            lam += _float_params(node.op)[0]
+    if _is_zero_mod_2pi(lam):
+        return None
+    return U1Gate(lam)
+
+
+def _merge_rotations(run):
+    """Return the u1, u2 or u3 gate, or None for the identity, equal to a run.
+
+    The gates of the run are multiplied as unit quaternions (w, x, y, z)
+    and the merged gate is equal to the run up to a global phase.
+    """
+    quat = (1.0, 0.0, 0.0, 0.0)
+    for node in run:
+        quat = _quaternion_product(_gate_quaternion(node), quat)
+    theta, phi, lam = _quaternion_to_u3_angles(quat)
+    if abs(theta) < _SIMPLIFY_THRESHOLD:
+        # Y rotation is 0, so the gate is a u1, or a nop if the z rotation is 0
+        if _is_zero_mod_2pi(phi + lam):
+            return None
+        return U1Gate(_normalize_angle(phi + lam))
+    if abs(theta - np.pi / 2) < _SIMPLIFY_THRESHOLD:
+        # Y rotation is pi/2, so the gate is a u2
+        return U2Gate(phi, lam)
+    return U3Gate(theta, phi, lam)
+
+
+def _gate_quaternion(node):
+    """Return the unit quaternion of the rotation of a single qubit gate node."""
+    name = node.name
+    if name in _U3_ANGLES:
+        return _zyz_quaternion(*_U3_ANGLES[name])
+    if name in _Z_ANGLES:
+        params = [_Z_ANGLES[name]]
+    else:
+        params = _float_params(node.op)
+    if name in _Z_ROTATIONS:
+        return _zyz_quaternion(0, 0, params[0])
+    if name == 'u2':
+        return _zyz_quaternion(np.pi / 2, params[0], params[1])
+    if name == 'u3':
+        return _zyz_quaternion(params[0], params[1], params[2])
+    if name in ('rx', 'ry'):
+        half = params[0] / 2
+        if name == 'rx':
+            return (math.cos(half), math.sin(half), 0.0, 0.0)
+        return (math.cos(half), 0.0, math.sin(half), 0.0)
+    raise TranspilerError("internal error")
+
+
+def _float_params(op):
+    """Return the parameters of a gate as floats.
+
+    The parameters are usually sympy Floats, which are converted from their
+    mpmath value directly, several times faster than with float().
+    """
+    # pylint: disable=unidiomatic-typecheck
+    return [to_float(param._mpf_) if type(param) is sympy.Float else float(param)
+            for param in op.params]
+
+
+def _zyz_quaternion(theta, phi, lam):
+    """Return the unit quaternion of Rz(phi).Ry(theta).Rz(lam)."""
+    cos_theta = math.cos(theta / 2)
+    sin_theta = math.sin(theta / 2)
+    return (cos_theta * math.cos((phi + lam) / 2),
+            -sin_theta * math.sin((phi - lam) / 2),
+            sin_theta * math.cos((phi - lam) / 2),
+            cos_theta * math.sin((phi + lam) / 2))
+
+
+def _quaternion_product(left, right):
+    """Return the Hamilton product of two quaternions, the rotation right then left."""
+    w, x, y, z = left
+    r_w, r_x, r_y, r_z = right
+    return (w * r_w - x * r_x - y * r_y - z * r_z,
+            w * r_x + x * r_w + y * r_z - z * r_y,
+            w * r_y - x * r_z + y * r_w + z * r_x,
+            w * r_z + x * r_y - y * r_x + z * r_w)
+
+
+def _quaternion_to_u3_angles(quat):
+    """Return the angles (theta, phi, lambda) of the u3 gate of a unit quaternion.
+
+    Theta is in [0, pi] and phi and lambda are in (-pi, pi].
+    """
+    w, x, y, z = quat
+    theta = 2 * math.atan2(math.sqrt(x * x + y * y), math.sqrt(w * w + z * z))
+    # (phi + lambda) / 2 and (phi - lambda) / 2
+    plus = math.atan2(z, w)
+    minus = math.atan2(-x, y)
+    return (theta, _normalize_angle(plus + minus), _normalize_angle(plus - minus))
+
+
+def _normalize_angle(angle):
+    """Return an angle equal modulo 2*pi, in (-pi, pi] and with tiny values set to 0."""
+    angle = math.fmod(angle, 2 * np.pi)
+    if angle <= -np.pi + _SIMPLIFY_THRESHOLD:
+        angle += 2 * np.pi
+    elif angle > np.pi + _SIMPLIFY_THRESHOLD:
+        angle -= 2 * np.pi
+    if abs(angle) < _CHOP_THRESHOLD:
+        angle = 0.0
+    return angle
+
+
+def _is_zero_mod_2pi(angle):
+    """Return True if an angle is 0 modulo 2*pi, within the simplification threshold."""
+    angle = np.mod(angle, 2 * np.pi)
+    return angle < _SIMPLIFY_THRESHOLD or 2 * np.pi - angle < _SIMPLIFY_THRESHOLD
@@ -17,22 +17,34 @@
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.exceptions import QiskitError
-from qiskit.circuit import Parameter
+from qiskit.circuit import Parameter, Instruction, Gate
+
+# Unrolled decompositions shared between Unroller runs, keyed by basis
+_SHARED_DECOMPOSITIONS = {}
+_SHARED_DECOMPOSITIONS_SIZE = 1024
 
 
 class Unroller(TransformationPass):
     """
     Unroll (expand) non-basis, non-opaque instructions recursively
     to a desired basis, using decomposition rules defined for each instruction.
+
+    Each instruction type and parameter values is decomposed and unrolled
+    once per run, and copies of the instructions of the unrolled
+    decomposition are spliced in for every instance of it.
     """
 
-    def __init__(self, basis):
+    def __init__(self, basis, shared_cache=False):
         """
         Args:
             basis (list[str]): Target basis names to unroll to, e.g. `['u3', 'cx']` .
+            shared_cache (bool): If True, unrolled decompositions of library
+                instructions are kept between runs and shared with other
+                Unroller passes with the same basis.
         """
         super().__init__()
         self.basis = basis
+        self.shared_cache = shared_cache
 
     def run(self, dag):
         """Expand all op nodes to the given basis.
@@ -47,6 +59,23 @@ class Unroller(TransformationPass):
         Returns:
             DAGCircuit: output unrolled dag
         """
+        cache = {}
+        dag = self._unroll(dag, cache)
+
+        # The unrolled instances share the ops of the cached decompositions,
+        # which are copied so that every instance has its own instructions
+        cached_ops = {id(cached_node.op) for _, unrolled_dag in cache.values()
+                      for cached_node in unrolled_dag.op_nodes()}
+        for node in dag.op_nodes():
+            if id(node.op) in cached_ops:
+                op = node.op.copy()
+                op.params = list(op.params)
+                # The dag structure is unchanged, so the op is swapped in place
+                node.data_dict['op'] = op
+        return dag
+
+    def _unroll(self, dag, cache):
+        """Expand all op nodes of a dag, reusing the unrolled decompositions in cache."""
         # Walk through the DAG and expand each non-basis node
         for node in dag.op_nodes():
             basic_insts = ['measure', 'reset', 'barrier', 'snapshot']
@@ -58,27 +87,90 @@ class Unroller(TransformationPass):
             if node.name in self.basis:  # If already a base, ignore.
                 continue
 
-            # TODO: allow choosing other possible decompositions
-            try:
-                rule = node.op.definition
-            except TypeError as err:
-                if any(isinstance(p, Parameter) for p in node.op.params):
-                    raise QiskitError('Unrolling gates parameterized by expressions '
-                                      'is currently unsupported.')
-                raise QiskitError('Error decomposing node {}: {}'.format(node.name, err))
-
-            if not rule:
-                raise QiskitError("Cannot unroll the circuit to the given basis, %s. "
-                                  "No rule to expand instruction %s." %
-                                  (str(self.basis), node.op.name))
-
-            # hacky way to build a dag on the same register as the rule is defined
-            # TODO: need anonymous rules to address wires by index
-            decomposition = DAGCircuit()
-            decomposition.add_qreg(rule[0][1][0].register)
-            for inst in rule:
-                decomposition.apply_operation_back(*inst)
-
-            unrolled_dag = self.run(decomposition)  # recursively unroll ops
+            unrolled_dag = self._unrolled_decomposition(node.op, cache)
+            if node.condition:
+                # Conditioning modifies the substituted dag, so it is
+                # given a copy of the cached decomposition
+                unrolled_dag = _copy_dag(unrolled_dag)
             dag.substitute_node_with_dag(node, unrolled_dag)
         return dag
+
+    def _unrolled_decomposition(self, op, cache):
+        """Return the decomposition of op unrolled to the basis as a dag.
+
+        The returned dag is cached and must not be modified.
+        """
+        key, shared = self._cache_key(op)
+        if key is not None:
+            if key in cache:
+                return cache[key][1]
+            if shared and key in _SHARED_DECOMPOSITIONS:
+                cache[key] = _SHARED_DECOMPOSITIONS[key]
+                return cache[key][1]
+
+        # TODO: allow choosing other possible decompositions
+        try:
+            rule = op.definition
+        except TypeError as err:
+            if any(isinstance(p, Parameter) for p in op.params):
+                raise QiskitError('Unrolling gates parameterized by expressions '
+                                  'is currently unsupported.')
+            raise QiskitError('Error decomposing node {}: {}'.format(op.name, err))
+
+        if not rule:
+            raise QiskitError("Cannot unroll the circuit to the given basis, %s. "
+                              "No rule to expand instruction %s." %
+                              (str(self.basis), op.name))
+
+        # hacky way to build a dag on the same register as the rule is defined
+        # TODO: need anonymous rules to address wires by index
+        decomposition = DAGCircuit()
+        decomposition.add_qreg(rule[0][1][0].register)
+        for inst in rule:
+            decomposition.apply_operation_back(*inst)
+
+        unrolled_dag = self._unroll(decomposition, cache)  # recursively unroll ops
+        if key is not None:
+            # The op is kept with its decomposition so that keys using the
+            # op identity stay valid for the lifetime of the cache
+            cache[key] = (op, unrolled_dag)
+            if shared:
+                if len(_SHARED_DECOMPOSITIONS) >= _SHARED_DECOMPOSITIONS_SIZE:
+                    _SHARED_DECOMPOSITIONS.clear()
+                _SHARED_DECOMPOSITIONS[key] = cache[key]
+        return unrolled_dag
+
+    def _cache_key(self, op):
+        """Return the cache key of the decomposition of op, and if it may be shared.
+
+        The key is None if the decomposition cannot be cached.
+        """
+        if type(op) in (Instruction, Gate):  # pylint: disable=unidiomatic-typecheck
+            # Custom instructions (e.g. from QuantumCircuit.to_instruction)
+            # are only identified by the instruction object within a run
+            key = (id(op),)
+            shared = False
+        else:
+            key = (type(op), op.name, tuple(op.params), op.num_qubits, op.num_clbits)
+            shared = self.shared_cache
+        key = (tuple(self.basis),) + key
+        try:
+            hash(key)
+        except TypeError:
+            # Parameters such as matrices are not hashable
+            return None, False
+        return key, shared
+
+
+def _copy_dag(dag):
+    """Return a copy of a dag with copies of its ops and their parameters."""
+    new_dag = DAGCircuit()
+    for qreg in dag.qregs.values():
+        new_dag.add_qreg(qreg)
+    for creg in dag.cregs.values():
+        new_dag.add_creg(creg)
+    for node in dag.topological_op_nodes():
+        op = node.op.copy()
+        op.params = list(op.params)
+        new_dag.apply_operation_back(op, node.qargs, node.cargs, node.condition)
+    return new_dag
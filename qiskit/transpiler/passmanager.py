@@ -15,11 +15,13 @@
 
 from functools import partial
 from collections import OrderedDict
-from time import time
+from time import time, process_time
+import tracemalloc
 
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.visualization import pass_manager_drawer
+from qiskit.tools.events.pubsub import Publisher
 from .propertyset import PropertySet
 from .basepasses import BasePass
 from .fencedobjs import FencedPropertySet, FencedDAGCircuit
@@ -27,7 +29,13 @@ from .exceptions import TranspilerError
 
 
 class PassManager():
-    """A PassManager schedules the passes"""
+    """A PassManager schedules the passes
+
+    Events:
+        terra.transpiler.run_pass.done: A pass has been executed while
+            ``profile_passes`` is set. The event carries the profile dictionary
+            of the execution (see ``PassManagerContext``).
+    """
 
     def __init__(self, passes=None,
                  max_iteration=None):
@@ -53,12 +61,20 @@ class PassManager():
         # passes already run that have not been invalidated
         self.valid_passes = set()
 
+        # wires modified since the last run of each incremental analysis pass. An incremental
+        # pass that is not a key has to run on the whole dag.
+        self.modified_wires = {}
+
         # pass manager's overriding options for the passes it runs (for debugging)
         self.passmanager_options = {'max_iteration': max_iteration}
 
         # The property log_passes allows to log and time the passes as they run in the pass manager
         self.log_passes = False
 
+        # The property profile_passes allows to measure the time, memory and dag size of the
+        # passes as they run in the pass manager
+        self.profile_passes = False
+
         if passes is not None:
             self.append(passes)
 
@@ -117,29 +133,66 @@ class PassManager():
     def reset(self):
         """ "Resets the pass manager instance """
         self.valid_passes = set()
+        self.modified_wires = {}
         self.property_set.clear()
 
     def run(self, circuit):
         """Run all the passes on a QuantumCircuit
 
+        The circuit is converted to a ``DAGCircuit`` that shares the circuit's
+        instructions, so no instruction is copied while the passes run. Only
+        the instructions still shared with the input circuit at the end are
+        copied into the returned circuit, so the two circuits can be modified
+        independently. A ``DAGCircuit`` can also be given directly, in which case
+        no conversion happens at all and the transformed ``DAGCircuit`` is
+        returned. This allows chaining pass managers without converting back
+        and forth between circuits and dags.
+
         Args:
-            circuit (QuantumCircuit): circuit to transform via all the registered passes
+            circuit (QuantumCircuit or DAGCircuit): circuit to transform via all
+                the registered passes. A ``DAGCircuit`` may be modified in place.
 
         Returns:
-            QuantumCircuit: Transformed circuit.
+            QuantumCircuit or DAGCircuit: Transformed circuit, of the same type
+                as the input.
         """
+        if isinstance(circuit, DAGCircuit):
+            return self._run_passes(circuit)
+
         name = circuit.name
-        dag = circuit_to_dag(circuit)
+        input_ops = {id(inst) for inst, _, _ in circuit.data}
+        dag = circuit_to_dag(circuit, copy_operations=False)
         del circuit
+        dag = self._run_passes(dag)
+
+        # Copy on write: the instructions left untouched by the passes are
+        # copied, along with their parameters, before they are returned
+        for node in dag.op_nodes():
+            if id(node.op) in input_ops:
+                op = node.op.copy()
+                op.params = list(op.params)
+                # The dag structure is unchanged, so the op is swapped in place
+                node.data_dict['op'] = op
+        circuit = dag_to_circuit(dag, copy_operations=False)
+        circuit.name = name
+        return circuit
+
+    def _run_passes(self, dag):
+        """Run all the scheduled passes on a dag.
+
+        Args:
+            dag (DAGCircuit): dag to transform via all the registered passes.
+
+        Returns:
+            DAGCircuit: Transformed dag.
+        """
         self.reset()  # Reset passmanager instance before starting
 
         for passset in self.working_list:
             for pass_ in passset:
                 dag = self._do_pass(pass_, dag, passset.options)
 
-        circuit = dag_to_circuit(dag)
-        circuit.name = name
-        return circuit
+        return dag
 
     def draw(self, filename, style=None, raw=False):
         """ Draw the pass manager"""
@@ -175,21 +228,45 @@ class PassManager():
     def _run_this_pass(self, pass_, dag):
         if pass_.is_transformation_pass:
             pass_.property_set = self.fenced_property_set
-            with PassManagerContext(self, pass_):
+            dag.reset_modified_wires()
+            with PassManagerContext(self, pass_, dag) as context:
                 new_dag = pass_.run(dag)
+                context.output_dag = new_dag
             if not isinstance(new_dag, DAGCircuit):
                 raise TranspilerError("Transformation passes should return a transformed dag."
                                       "The pass %s is returning a %s" % (type(pass_).__name__,
                                                                          type(new_dag)))
+            self._update_modified_wires(dag, new_dag)
             dag = new_dag
         elif pass_.is_analysis_pass:
             pass_.property_set = self.property_set
-            with PassManagerContext(self, pass_):
-                pass_.run(FencedDAGCircuit(dag))
+            modified_wires = self.modified_wires.get(pass_)
+            with PassManagerContext(self, pass_, dag):
+                if modified_wires is None:
+                    pass_.run(FencedDAGCircuit(dag))
+                else:
+                    pass_.run_on_wires(FencedDAGCircuit(dag), modified_wires)
+            if pass_.is_incremental:
+                self.modified_wires[pass_] = set()
         else:
             raise TranspilerError("I dont know how to handle this type of pass")
         return dag
 
+    def _update_modified_wires(self, dag, new_dag):
+        """Add the wires modified by a transformation pass to those of the incremental passes.
+
+        Args:
+            dag (DAGCircuit): the dag given to the transformation pass.
+            new_dag (DAGCircuit): the dag returned by the transformation pass.
+        """
+        if new_dag is dag:
+            modified_wires = dag.modified_wires()
+            for wires in self.modified_wires.values():
+                wires.update(modified_wires)
+        else:
+            # the pass built a new dag, so the incremental passes have to run on the whole dag
+            self.modified_wires.clear()
+
     def _update_valid_passes(self, pass_):
         self.valid_passes.add(pass_)
         if not pass_.is_analysis_pass:  # Analysis passes preserve all
@@ -208,20 +285,79 @@ class PassManager():
 
 
 class PassManagerContext:
-    """ A wrap around the execution of a pass."""
-
-    def __init__(self, pm_instance, pass_instance):
+    """ A wrap around the execution of a pass.
+
+    If ``log_passes`` is set in the pass manager, the running time of the pass
+    is logged in the ``pass_log`` and ``pass_raw_log`` properties.
+
+    If ``profile_passes`` is set in the pass manager, a profile dictionary of
+    the execution is appended to the ``pass_profile`` property and published
+    with the ``terra.transpiler.run_pass.done`` event. The profile has the
+    following keys:
+
+        * name (str): name of the pass.
+        * start_time (float): wall time when the pass started.
+        * running_time (float): wall time taken by the pass, in seconds.
+        * cpu_time (float): CPU time of the process taken by the pass, in seconds.
+        * memory_peak (int): peak of the memory allocated during the pass, in
+          bytes, as traced by ``tracemalloc``.
+        * size_before (int): number of operations of the dag before the pass.
+        * size_after (int): number of operations of the dag after the pass.
+
+    Memory tracing slows down the execution of the passes, so the times of a
+    profiled run are only meaningful relative to each other.
+
+    If ``tracemalloc`` is already tracing when the pass starts, its peak is
+    reset before the pass on Python 3.9 and later. Earlier versions cannot
+    reset the peak, so if the pass does not exceed the peak traced before it,
+    ``memory_peak`` is the memory still allocated at the end of the pass,
+    which is a lower bound of its peak.
+    """
+
+    def __init__(self, pm_instance, pass_instance, dag=None):
         self.pm_instance = pm_instance
         self.pass_instance = pass_instance
         self.start_time = None
+        self.start_cpu_time = None
+        self.start_memory = None
+        self.start_peak = None
+        self.started_tracing = False
+        self.input_dag = dag
+        self.size_before = None
+        # transformation passes set the dag they return, analysis passes keep the input dag
+        self.output_dag = dag
 
     def __enter__(self):
-        if self.pm_instance.log_passes:
+        if self.pm_instance.profile_passes:
+            # passes can modify the input dag in place, so its size is taken now
+            self.size_before = _dag_size(self.input_dag)
+            self.started_tracing = not tracemalloc.is_tracing()
+            if self.started_tracing:
+                tracemalloc.start()
+            elif hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()  # pylint: disable=no-member
+            self.start_memory, self.start_peak = tracemalloc.get_traced_memory()
+            self.start_cpu_time = process_time()
+        if self.pm_instance.log_passes or self.pm_instance.profile_passes:
             self.start_time = time()
+        return self
 
     def __exit__(self, *exc_info):
-        if self.pm_instance.log_passes:
+        if self.pm_instance.log_passes or self.pm_instance.profile_passes:
             end_time = time()
+        if self.pm_instance.profile_passes:
+            end_cpu_time = process_time()
+            end_memory, end_peak = tracemalloc.get_traced_memory()
+            if end_peak > self.start_peak:
+                memory_peak = end_peak - self.start_memory
+            else:
+                # the peak traced before the pass was not exceeded, so it can
+                # not tell the peak of the pass
+                memory_peak = end_memory - self.start_memory
+            if self.started_tracing:
+                tracemalloc.stop()
+            self._profile(end_time, end_cpu_time, memory_peak)
+        if self.pm_instance.log_passes:
             raw_log_dict = {
                 'name': self.pass_instance.name(),
                 'start_time': self.start_time,
@@ -237,6 +373,29 @@ class PassManagerContext:
             self.pm_instance.property_set['pass_raw_log'].append(raw_log_dict)
             self.pm_instance.property_set['pass_log'].append(log_dict)
 
+    def _profile(self, end_time, end_cpu_time, memory_peak):
+        """Store and publish the profile of the pass execution."""
+        profile_dict = {
+            'name': self.pass_instance.name(),
+            'start_time': self.start_time,
+            'running_time': end_time - self.start_time,
+            'cpu_time': end_cpu_time - self.start_cpu_time,
+            'memory_peak': max(memory_peak, 0),
+            'size_before': self.size_before,
+            'size_after': _dag_size(self.output_dag)
+        }
+        if self.pm_instance.property_set['pass_profile'] is None:
+            self.pm_instance.property_set['pass_profile'] = []
+        self.pm_instance.property_set['pass_profile'].append(profile_dict)
+        Publisher().publish("terra.transpiler.run_pass.done", profile_dict)
+
+
+def _dag_size(dag):
+    """Size of a dag, or None if a pass did not return a dag."""
+    if isinstance(dag, DAGCircuit):
+        return dag.size()
+    return None
+
 
 class FlowController():
     """This class is a base class for multiple types of working list. When you iterate on it, it
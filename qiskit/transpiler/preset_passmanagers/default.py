@@ -32,6 +32,8 @@ from qiskit.transpiler.passes import TrivialLayout
 from qiskit.transpiler.passes import SetLayout
 from qiskit.transpiler.passes import BarrierBeforeFinalMeasurements
 from qiskit.transpiler.passes import LegacySwap
+from qiskit.transpiler.passes import SabreSwap
+from qiskit.transpiler.passes import SabreLayout
 from qiskit.transpiler.passes import FullAncillaAllocation
 from qiskit.transpiler.passes import EnlargeWithAncilla
 
@@ -50,9 +52,11 @@ def default_pass_manager(transpile_config):
     coupling_map = transpile_config.coupling_map
     initial_layout = transpile_config.initial_layout
     seed_transpiler = transpile_config.seed_transpiler
+    routing_method = transpile_config.routing_method
     pass_manager = PassManager()
     pass_manager.append(SetLayout(initial_layout))
-    pass_manager.append(Unroller(basis_gates))
+    if not transpile_config.unrolled:
+        pass_manager.append(Unroller(basis_gates))
 
     # Use the trivial layout if no layout is found
     pass_manager.append(TrivialLayout(coupling_map),
@@ -61,7 +65,10 @@ def default_pass_manager(transpile_config):
     # if the circuit and layout already satisfy the coupling_constraints, use that layout
     # otherwise layout on the most densely connected physical qubit subset
     pass_manager.append(CheckMap(coupling_map))
-    pass_manager.append(DenseLayout(coupling_map),
+    _improve_layout = DenseLayout(coupling_map)
+    if routing_method == 'sabre':
+        _improve_layout = SabreLayout(coupling_map, seed=seed_transpiler)
+    pass_manager.append(_improve_layout,
                         condition=lambda property_set: not property_set['is_swap_mapped'])
 
     # Extend the the dag/layout with ancillas using the full coupling map
@@ -73,7 +80,10 @@ def default_pass_manager(transpile_config):
 
     # Swap mapper
     pass_manager.append(BarrierBeforeFinalMeasurements())
-    pass_manager.append(LegacySwap(coupling_map, trials=20, seed=seed_transpiler))
+    if routing_method == 'sabre':
+        pass_manager.append(SabreSwap(coupling_map, seed=seed_transpiler))
+    else:
+        pass_manager.append(LegacySwap(coupling_map, trials=20, seed=seed_transpiler))
 
     # Expand swaps
     pass_manager.append(Decompose(SwapGate))
@@ -105,7 +115,8 @@ def default_pass_manager_simulator(transpile_config):
     basis_gates = transpile_config.basis_gates
 
     pass_manager = PassManager()
-    pass_manager.append(Unroller(basis_gates))
+    if not transpile_config.unrolled:
+        pass_manager.append(Unroller(basis_gates))
     pass_manager.append([RemoveResetInZeroState(), Depth(), FixedPoint('depth')],
                         do_while=lambda property_set: not property_set['depth_fixed_point'])
 
@@ -28,6 +28,7 @@ from qiskit.transpiler.passes import SetLayout
 from qiskit.transpiler.passes import TrivialLayout
 from qiskit.transpiler.passes import BarrierBeforeFinalMeasurements
 from qiskit.transpiler.passes import LegacySwap
+from qiskit.transpiler.passes import SabreSwap
 from qiskit.transpiler.passes import FullAncillaAllocation
 from qiskit.transpiler.passes import EnlargeWithAncilla
 from qiskit.transpiler.passes import RemoveResetInZeroState
@@ -44,6 +45,8 @@ def level_0_pass_manager(transpile_config):
     circuit to match the coupling map. Finally, extra resets are removed.
     Note: in simulators where coupling_map=None, only the unrolling and optimization
     stages are done.
+    If the circuit is already unrolled (transpile_config.unrolled), the unrolling stage
+    is skipped.
 
     Args:
         transpile_config (TranspileConfig)
@@ -55,6 +58,7 @@ def level_0_pass_manager(transpile_config):
     coupling_map = transpile_config.coupling_map
     initial_layout = transpile_config.initial_layout
     seed_transpiler = transpile_config.seed_transpiler
+    routing_method = transpile_config.routing_method
 
     # 1. Use trivial layout if no layout given
     _given_layout = SetLayout(initial_layout)
@@ -76,8 +80,12 @@ def level_0_pass_manager(transpile_config):
     def _swap_condition(property_set):
         return not property_set['is_swap_mapped']
 
+    _swap_pass = LegacySwap(coupling_map, trials=20, seed=seed_transpiler)
+    if routing_method == 'sabre':
+        _swap_pass = SabreSwap(coupling_map, seed=seed_transpiler)
+
     _swap = [BarrierBeforeFinalMeasurements(),
-             LegacySwap(coupling_map, trials=20, seed=seed_transpiler),
+             _swap_pass,
              Decompose(SwapGate)]
 
     # 5. Fix any bad CX directions
@@ -95,7 +103,8 @@ def level_0_pass_manager(transpile_config):
         pm0.append(_given_layout)
         pm0.append(_choose_layout, condition=_choose_layout_condition)
         pm0.append(_embed)
-    pm0.append(_unroll)
+    if not transpile_config.unrolled:
+        pm0.append(_unroll)
     if coupling_map:
         pm0.append(_swap_check)
         pm0.append(_swap, condition=_swap_condition)
@@ -30,6 +30,8 @@ from qiskit.transpiler.passes import TrivialLayout
 from qiskit.transpiler.passes import DenseLayout
 from qiskit.transpiler.passes import BarrierBeforeFinalMeasurements
 from qiskit.transpiler.passes import LegacySwap
+from qiskit.transpiler.passes import SabreSwap
+from qiskit.transpiler.passes import SabreLayout
 from qiskit.transpiler.passes import FullAncillaAllocation
 from qiskit.transpiler.passes import EnlargeWithAncilla
 from qiskit.transpiler.passes import FixedPoint
@@ -51,6 +53,8 @@ def level_1_pass_manager(transpile_config):
     gate collapse and redundant reset removal are performed.
     Note: in simulators where coupling_map=None, only the unrolling and optimization
     stages are done.
+    If the circuit is already unrolled (transpile_config.unrolled), the unrolling stage
+    is skipped.
 
     Args:
         transpile_config (TranspileConfig)
@@ -62,6 +66,7 @@ def level_1_pass_manager(transpile_config):
     coupling_map = transpile_config.coupling_map
     initial_layout = transpile_config.initial_layout
     seed_transpiler = transpile_config.seed_transpiler
+    routing_method = transpile_config.routing_method
 
     # 1. Use trivial layout if no layout given
     _given_layout = SetLayout(initial_layout)
@@ -78,6 +83,8 @@ def level_1_pass_manager(transpile_config):
         return not property_set['is_swap_mapped']
 
     _improve_layout = DenseLayout(coupling_map)
+    if routing_method == 'sabre':
+        _improve_layout = SabreLayout(coupling_map, seed=seed_transpiler)
 
     # 2. Extend dag/layout with ancillas using the full coupling map
     _embed = [FullAncillaAllocation(coupling_map), EnlargeWithAncilla()]
@@ -91,8 +98,12 @@ def level_1_pass_manager(transpile_config):
     def _swap_condition(property_set):
         return not property_set['is_swap_mapped']
 
+    _swap_pass = LegacySwap(coupling_map, trials=20, seed=seed_transpiler)
+    if routing_method == 'sabre':
+        _swap_pass = SabreSwap(coupling_map, seed=seed_transpiler)
+
     _swap = [BarrierBeforeFinalMeasurements(),
-             LegacySwap(coupling_map, trials=20, seed=seed_transpiler),
+             _swap_pass,
              Decompose(SwapGate)]
 
     # 5. Fix any bad CX directions
@@ -119,7 +130,8 @@ def level_1_pass_manager(transpile_config):
         pm1.append(_layout_check)
         pm1.append(_improve_layout, condition=_improve_layout_condition)
         pm1.append(_embed)
-    pm1.append(_unroll)
+    if not transpile_config.unrolled:
+        pm1.append(_unroll)
     if coupling_map:
         pm1.append(_swap_check)
         pm1.append(_swap, condition=_swap_condition)
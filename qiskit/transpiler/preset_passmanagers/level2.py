@@ -32,6 +32,8 @@ from qiskit.transpiler.passes import DenseLayout
 from qiskit.transpiler.passes import NoiseAdaptiveLayout
 from qiskit.transpiler.passes import BarrierBeforeFinalMeasurements
 from qiskit.transpiler.passes import LegacySwap
+from qiskit.transpiler.passes import SabreSwap
+from qiskit.transpiler.passes import SabreLayout
 from qiskit.transpiler.passes import FullAncillaAllocation
 from qiskit.transpiler.passes import EnlargeWithAncilla
 from qiskit.transpiler.passes import FixedPoint
@@ -56,6 +58,8 @@ def level_2_pass_manager(transpile_config):
     reset removal are performed.
     Note: in simulators where coupling_map=None, only the unrolling and optimization
     stages are done.
+    If the circuit is already unrolled (transpile_config.unrolled), the unrolling stage
+    is skipped.
 
     Args:
         transpile_config (TranspileConfig)
@@ -67,6 +71,7 @@ def level_2_pass_manager(transpile_config):
     coupling_map = transpile_config.coupling_map
     initial_layout = transpile_config.initial_layout
     seed_transpiler = transpile_config.seed_transpiler
+    routing_method = transpile_config.routing_method
     backend_properties = transpile_config.backend_properties
 
     # 1. Layout on good qubits if calibration info available, otherwise on dense links
@@ -78,6 +83,8 @@ def level_2_pass_manager(transpile_config):
     _choose_layout = DenseLayout(coupling_map)
     if backend_properties:
         _choose_layout = NoiseAdaptiveLayout(backend_properties)
+    if routing_method == 'sabre':
+        _choose_layout = SabreLayout(coupling_map, seed=seed_transpiler)
 
     # 2. Extend dag/layout with ancillas using the full coupling map
     _embed = [FullAncillaAllocation(coupling_map), EnlargeWithAncilla()]
@@ -88,9 +95,13 @@ def level_2_pass_manager(transpile_config):
     def _swap_condition(property_set):
         return not property_set['is_swap_mapped']
 
+    _swap_pass = LegacySwap(coupling_map, trials=20, seed=seed_transpiler)
+    if routing_method == 'sabre':
+        _swap_pass = SabreSwap(coupling_map, seed=seed_transpiler)
+
     _swap = [BarrierBeforeFinalMeasurements(),
              Unroll3qOrMore(),
-             LegacySwap(coupling_map, trials=20, seed=seed_transpiler),
+             _swap_pass,
              Decompose(SwapGate)]
 
     # 4. Unroll to the basis
@@ -119,7 +130,8 @@ def level_2_pass_manager(transpile_config):
         pm2.append(_given_layout)
         pm2.append(_choose_layout, condition=_choose_layout_condition)
         pm2.append(_embed)
-    pm2.append(_unroll)
+    if not transpile_config.unrolled:
+        pm2.append(_unroll)
     if coupling_map:
         pm2.append(_swap_check)
         pm2.append(_swap, condition=_swap_condition)
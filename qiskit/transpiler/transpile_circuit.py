@@ -14,6 +14,9 @@
 
 """Circuit transpile function"""
 
+import hashlib
+import json
+
 from qiskit.transpiler.preset_passmanagers import (default_pass_manager_simulator,
                                                    default_pass_manager,
                                                    level_0_pass_manager,
@@ -22,6 +25,9 @@ from qiskit.transpiler.preset_passmanagers import (default_pass_manager_simulato
                                                    level_3_pass_manager)
 from qiskit.transpiler.exceptions import TranspilerError
 
+# The last backend properties digested, with their digest
+_PROPERTIES_DIGEST = [None, None]
+
 
 def transpile_circuit(circuit, transpile_config):
     """Select a PassManager and run a single circuit through it.
@@ -36,11 +42,42 @@ def transpile_circuit(circuit, transpile_config):
     Raises:
         TranspilerError: if transpile_config is not valid or transpilation incurs error
     """
+    pass_manager = _select_pass_manager(transpile_config)
+
+    return pass_manager.run(circuit)
+
+
+def _select_pass_manager(transpile_config, pass_managers=None):
+    """Select the PassManager dictated by a transpile configuration.
+
+    Preset pass managers can be reused for the following circuits of a
+    transpilation, together with the state their passes derive from the
+    configuration (e.g. the coupling map distances). They are only reused
+    with a seed_transpiler, since passes without a seed draw one on their
+    first run.
+
+    Args:
+        transpile_config (TranspileConfig): configuration dictating how to transpile
+        pass_managers (dict): the preset pass managers built so far, keyed by
+            their configuration. A new pass manager is added to it.
+
+    Returns:
+        PassManager: the pass manager to run the circuit through.
+
+    Raises:
+        TranspilerError: if transpile_config is not valid
+    """
     # if the pass manager is not already selected, choose an appropriate one.
     if transpile_config.pass_manager:
-        pass_manager = transpile_config.pass_manager
+        return transpile_config.pass_manager
 
-    elif transpile_config.optimization_level is not None:
+    key = None
+    if pass_managers is not None and transpile_config.seed_transpiler is not None:
+        key = _pass_manager_key(transpile_config)
+        if key in pass_managers:
+            return pass_managers[key]
+
+    if transpile_config.optimization_level is not None:
         level = transpile_config.optimization_level
         if level == 0:
             pass_manager = level_0_pass_manager(transpile_config)
@@ -59,4 +96,55 @@ def transpile_circuit(circuit, transpile_config):
     else:
         pass_manager = default_pass_manager_simulator(transpile_config)
 
-    return pass_manager.run(circuit)
+    if key is not None:
+        pass_managers[key] = pass_manager
+    return pass_manager
+
+
+def _pass_manager_key(transpile_config):
+    """Return the cache key of the preset pass manager of a configuration.
+
+    Two configurations with the same key build the same pass manager. The
+    backend properties are identified by the digest of their values.
+    """
+    basis_gates = transpile_config.basis_gates
+    coupling_map = transpile_config.coupling_map
+    initial_layout = transpile_config.initial_layout
+
+    if basis_gates is not None:
+        basis_gates = tuple(basis_gates)
+    if coupling_map is not None:
+        coupling_map = tuple(sorted(coupling_map.get_edges()))
+    if initial_layout is not None:
+        initial_layout = tuple(sorted(initial_layout.get_physical_bits().items()))
+
+    return (transpile_config.optimization_level, basis_gates, coupling_map,
+            initial_layout, transpile_config.seed_transpiler,
+            _properties_digest(transpile_config.backend_properties),
+            transpile_config.routing_method, transpile_config.unrolled)
+
+
+def _properties_digest(backend_properties):
+    """Return a digest of the values of backend properties, without their dates.
+
+    The digest of the last properties is kept, since the circuits of a
+    chunk share the same properties object.
+    """
+    if backend_properties is None:
+        return None
+    if _PROPERTIES_DIGEST[0] is not backend_properties:
+        properties = _without_dates(backend_properties.to_dict())
+        digest = hashlib.sha1(json.dumps(properties, sort_keys=True,
+                                         default=str).encode()).hexdigest()
+        _PROPERTIES_DIGEST[:] = [backend_properties, digest]
+    return _PROPERTIES_DIGEST[1]
+
+
+def _without_dates(value):
+    """Return a copy of serialized backend properties without their dates."""
+    if isinstance(value, dict):
+        return {key: _without_dates(item) for key, item in value.items()
+                if key not in ('date', 'last_update_date')}
+    if isinstance(value, list):
+        return [_without_dates(item) for item in value]
+    return value
@@ -29,7 +29,14 @@ class TranspileConfig(BaseModel):
         optimization_level (int): a non-negative integer indicating the
             optimization level. 0 means no transformation on the circuit. Higher
             levels may produce more optimized circuits, but may take longer.
+        routing_method (str): the routing of the preset pass managers, 'legacy'
+            (the default, if None) or 'sabre'.
+        unrolled (bool): the circuits are already unrolled to the basis
+            gates, so the preset pass managers only lay out, route and
+            optimize them after routing.
     """
-    def __init__(self, optimization_level, **kwargs):
+    def __init__(self, optimization_level, routing_method=None, unrolled=False, **kwargs):
         self.optimization_level = optimization_level
+        self.routing_method = routing_method
+        self.unrolled = unrolled
         super().__init__(**kwargs)
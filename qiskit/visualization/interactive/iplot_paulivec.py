@@ -35,7 +35,7 @@ def process_data(rho):
 
     num = int(np.log2(len(rho)))
     labels = list(map(lambda x: x.to_label(), pauli_group(num)))
-    values = list(map(lambda x: np.real(np.trace(np.dot(x.to_matrix(), rho))),
+    values = list(map(lambda x: x.expectation(rho),
                       pauli_group(num)))
 
     for position, label in enumerate(labels):
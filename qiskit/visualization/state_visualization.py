@@ -189,7 +189,7 @@ def plot_bloch_multivector(rho, title='', figsize=None):
             Pauli.pauli_single(num, i, 'Z')
         ]
         bloch_state = list(
-            map(lambda x: np.real(np.trace(np.dot(x.to_matrix(), rho))),
+            map(lambda x: x.expectation(rho),
                 pauli_singles))
         plot_bloch_vector(bloch_state, "qubit " + str(i), ax=ax,
                           figsize=figsize)
@@ -369,7 +369,7 @@ def plot_state_paulivec(rho, title="", figsize=None, color=None):
         figsize = (7, 5)
     num = int(np.log2(len(rho)))
     labels = list(map(lambda x: x.to_label(), pauli_group(num)))
-    values = list(map(lambda x: np.real(np.trace(np.dot(x.to_matrix(), rho))),
+    values = list(map(lambda x: x.expectation(rho),
                       pauli_group(num)))
     numelem = len(values)
     if color is None:
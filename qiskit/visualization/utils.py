@@ -105,8 +105,7 @@ def _get_layered_instructions(circuit, reverse_bits=False, justify=None):
             layers = []
             current_layer = []
 
-            dag_nodes = dag_layer['graph'].op_nodes()
-            dag_nodes.sort(key=lambda nd: nd._node_id)
+            dag_nodes = sorted(dag_layer.nodes, key=lambda nd: nd._node_id)
 
             for node in dag_nodes:
                 multibit_gate = len(node.qargs) + len(node.cargs) > 1
@@ -147,10 +146,8 @@ def _get_layered_instructions(circuit, reverse_bits=False, justify=None):
 
         for dag_layer in dag_layers:
 
-            dag_instructions = dag_layer['graph'].op_nodes()
-
             # sort into the order they were input
-            dag_instructions.sort(key=lambda nd: nd._node_id)
+            dag_instructions = sorted(dag_layer.nodes, key=lambda nd: nd._node_id)
             for instruction_node in dag_instructions:
 
                 gate_span = _get_gate_span(qregs, instruction_node)
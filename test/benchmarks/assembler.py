@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of the assembly of circuits into a Qobj, and back."""
+
+from qiskit import transpile
+from qiskit.assembler import disassemble
+from qiskit.compiler import assemble
+from qiskit.qobj import QasmQobj
+
+from .utils import random_circuit
+
+
+class AssemblerBench:
+    params = ([8], [32, 256], [1, 20])
+    param_names = ['n_qubits', 'depth', 'number of circuits']
+    timeout = 600
+
+    def setup(self, n_qubits, depth, number_of_circuits):
+        circuit = random_circuit(n_qubits, depth, measure=True, conditional=True, seed=42)
+        circuit = transpile(circuit, basis_gates=['u1', 'u2', 'u3', 'cx', 'id'])
+        self.circuits = []
+        for i in range(number_of_circuits):
+            copy = circuit.copy()
+            copy.name = 'circuit%d' % i
+            self.circuits.append(copy)
+        self.qobj = assemble(self.circuits)
+        self.qobj_dict = self.qobj.to_dict()
+
+    def time_assemble(self, _, __, ___):
+        assemble(self.circuits)
+
+    def time_disassemble(self, _, __, ___):
+        disassemble(self.qobj)
+
+    def time_qobj_to_dict(self, _, __, ___):
+        self.qobj.to_dict()
+
+    def time_qobj_from_dict(self, _, __, ___):
+        QasmQobj.from_dict(self.qobj_dict)
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of the construction and conversion of circuits."""
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.converters import circuit_to_dag, dag_to_circuit
+
+
+def build_circuit(width, gates):
+    qr = QuantumRegister(width)
+    circuit = QuantumCircuit(qr)
+    while len(circuit) < gates:
+        for k in range(width):
+            circuit.h(qr[k])
+        for k in range(width - 1):
+            circuit.cx(qr[k], qr[k + 1])
+    return circuit
+
+
+def build_parameterized_circuit(width, gates, param_count):
+    params = [Parameter('param-%s' % x) for x in range(param_count)]
+    qr = QuantumRegister(width)
+    circuit = QuantumCircuit(qr)
+    count = 0
+    while len(circuit) < gates:
+        for k in range(width):
+            param = params[count % param_count]
+            count += 1
+            circuit.u3(param, param, param, qr[k])
+        for k in range(width - 1):
+            circuit.cx(qr[k], qr[k + 1])
+    return circuit, params
+
+
+class CircuitConstructionBench:
+    params = ([1, 2, 5, 8, 14, 20], [8, 128, 2048, 8192])
+    param_names = ['width', 'gates']
+    timeout = 600
+
+    def setup(self, width, gates):
+        self.empty_circuit = build_circuit(width, 0)
+        self.sample_circuit = build_circuit(width, gates)
+
+    def time_circuit_construction(self, width, gates):
+        build_circuit(width, gates)
+
+    def time_circuit_extend(self, _, __):
+        self.empty_circuit.extend(self.sample_circuit)
+
+    def time_circuit_copy(self, _, __):
+        self.sample_circuit.copy()
+
+    def time_circuit_to_instruction(self, _, __):
+        self.sample_circuit.to_instruction()
+
+
+class ConverterBench:
+    params = ([1, 5, 14, 20], [8, 128, 2048, 8192])
+    param_names = ['width', 'gates']
+    timeout = 600
+
+    def setup(self, width, gates):
+        self.circuit = build_circuit(width, gates)
+        self.dag = circuit_to_dag(self.circuit)
+
+    def time_circuit_to_dag(self, _, __):
+        circuit_to_dag(self.circuit)
+
+    def time_dag_to_circuit(self, _, __):
+        dag_to_circuit(self.dag)
+
+
+class ParameterizedCircuitConstructionBench:
+    params = ([20], [8, 128, 2048, 8192], [1, 2, 8, 128])
+    param_names = ['width', 'gates', 'number of params']
+    timeout = 600
+
+    def setup(self, _, gates, params):
+        if params > gates:
+            raise NotImplementedError
+
+    def time_build_parameterized_circuit(self, width, gates, params):
+        build_parameterized_circuit(width, gates, params)
+
+
+class ParameterizedCircuitBindBench:
+    params = ([20], [8, 128, 2048, 8192], [1, 2, 8, 128])
+    param_names = ['width', 'gates', 'number of params']
+    timeout = 600
+
+    def setup(self, width, gates, params):
+        if params > gates:
+            raise NotImplementedError
+        self.circuit, _ = build_parameterized_circuit(width, gates, params)
+
+    def time_bind_params(self, _, __, ___):
+        self.circuit.bind_parameters({x: 3.14 for x in self.circuit.parameters})
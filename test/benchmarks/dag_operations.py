@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of the DAGCircuit operations used by the transpiler passes."""
+
+from qiskit import QuantumRegister
+from qiskit.converters import circuit_to_dag
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.extensions.standard import CnotGate, HGate
+
+from .utils import random_circuit
+
+
+class DAGCircuitBench:
+    params = ([5, 14, 20], [10, 100, 1000])
+    param_names = ['width', 'depth']
+    timeout = 600
+
+    def setup(self, width, depth):
+        circuit = random_circuit(width, depth, max_operands=2, measure=True, seed=42)
+        self.dag = circuit_to_dag(circuit)
+
+    def time_topological_op_nodes(self, _, __):
+        list(self.dag.topological_op_nodes())
+
+    def time_layers(self, _, __):
+        list(self.dag.layers())
+
+    def time_serial_layers(self, _, __):
+        list(self.dag.serial_layers())
+
+    def time_depth(self, _, __):
+        self.dag.depth()
+
+    def time_count_ops(self, _, __):
+        self.dag.count_ops()
+
+    def time_collect_runs(self, _, __):
+        self.dag.collect_runs(['u1', 'u2', 'u3', 'id'])
+
+    def time_twoQ_gates(self, _, __):
+        self.dag.twoQ_gates()
+
+
+class DAGCircuitEditBench:
+    params = ([5, 14, 20], [10, 100, 1000])
+    param_names = ['width', 'depth']
+    timeout = 600
+
+    def setup(self, width, depth):
+        self.circuit = random_circuit(width, depth, max_operands=2, seed=42)
+        # A two-qubit decomposition to substitute for the cx gates
+        self.replacement = DAGCircuit()
+        qreg = QuantumRegister(2, 'r')
+        self.replacement.add_qreg(qreg)
+        self.replacement.apply_operation_back(HGate(), [qreg[1]], [])
+        self.replacement.apply_operation_back(CnotGate(), [qreg[0], qreg[1]], [])
+        self.replacement.apply_operation_back(HGate(), [qreg[1]], [])
+
+    def time_circuit_to_dag_apply_operation_back(self, _, __):
+        circuit_to_dag(self.circuit)
+
+    def time_substitute_node_with_dag(self, _, __):
+        dag = circuit_to_dag(self.circuit)
+        for node in dag.named_nodes('cx'):
+            dag.substitute_node_with_dag(node, self.replacement)
+
+    def time_remove_op_node(self, _, __):
+        dag = circuit_to_dag(self.circuit)
+        for node in dag.op_nodes():
+            dag.remove_op_node(node)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of the parsing and export of OpenQASM."""
+
+from qiskit import QuantumCircuit
+
+from .utils import random_circuit, build_qft_circuit
+
+
+class QasmParseBench:
+    params = ([5, 14, 20], [10, 100, 1000])
+    param_names = ['width', 'depth']
+    timeout = 600
+
+    def setup(self, width, depth):
+        self.circuit = random_circuit(width, depth, measure=True, seed=42)
+        self.qasm = self.circuit.qasm()
+
+    def time_parse(self, _, __):
+        QuantumCircuit.from_qasm_str(self.qasm)
+
+    def time_export(self, _, __):
+        self.circuit.qasm()
+
+
+class QasmQftParseBench:
+    params = [5, 14, 20, 53]
+    param_names = ['width']
+    timeout = 600
+
+    def setup(self, width):
+        self.qasm = build_qft_circuit(width, measure=True).qasm()
+
+    def time_parse(self, _):
+        QuantumCircuit.from_qasm_str(self.qasm)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of the parsing of the results of the simulators."""
+
+from qiskit import BasicAer, execute
+from qiskit.result import Result
+
+from .utils import random_circuit
+
+
+class ResultBench:
+    params = ([1, 100], [1024, 8192])
+    param_names = ['number of circuits', 'shots']
+    timeout = 600
+
+    def setup(self, number_of_circuits, shots):
+        circuits = [random_circuit(10, 5, max_operands=2, measure=True, seed=i)
+                    for i in range(number_of_circuits)]
+        backend = BasicAer.get_backend('qasm_simulator')
+        self.result = execute(circuits, backend, shots=shots, memory=True,
+                              seed_simulator=42).result()
+        self.result_dict = self.result.to_dict()
+
+    def time_result_from_dict(self, _, __):
+        Result.from_dict(self.result_dict)
+
+    def time_result_to_dict(self, _, __):
+        self.result.to_dict()
+
+    def time_get_counts(self, number_of_circuits, _):
+        for i in range(number_of_circuits):
+            self.result.get_counts(i)
+
+    def time_get_memory(self, number_of_circuits, _):
+        for i in range(number_of_circuits):
+            self.result.get_memory(i)
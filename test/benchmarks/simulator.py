@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of the gate throughput of the BasicAer simulators.
+
+The circuits are transpiled and assembled in the setup, so only the
+simulation is timed.
+"""
+
+from qiskit import BasicAer, transpile
+from qiskit.compiler import assemble
+
+from .utils import random_circuit, build_qft_circuit
+
+_BASIS_GATES = ['u1', 'u2', 'u3', 'cx', 'id']
+
+
+def _qobj(circuit, **run_config):
+    return assemble(transpile(circuit, basis_gates=_BASIS_GATES), seed_simulator=42,
+                    **run_config)
+
+
+class QasmSimulatorBench:
+    params = ([5, 10, 15], [10, 100])
+    param_names = ['n_qubits', 'depth']
+    timeout = 600
+
+    def setup(self, n_qubits, depth):
+        self.backend = BasicAer.get_backend('qasm_simulator')
+        self.qobj = _qobj(random_circuit(n_qubits, depth, max_operands=2,
+                                         measure=True, seed=42), shots=1024)
+        # Gates after measurements disable the sampling of the measurements,
+        # and every shot is simulated
+        first = random_circuit(n_qubits, depth // 2, max_operands=2, measure=True, seed=42)
+        second = random_circuit(n_qubits, depth // 2, max_operands=2, measure=True, seed=43)
+        self.mid_measure_qobj = _qobj(first + second, shots=4)
+
+    def time_qasm_simulator(self, _, __):
+        self.backend.run(self.qobj).result()
+
+    def time_qasm_simulator_mid_measure(self, _, __):
+        self.backend.run(self.mid_measure_qobj).result()
+
+
+class StatevectorSimulatorBench:
+    params = [5, 10, 15, 18]
+    param_names = ['n_qubits']
+    timeout = 600
+
+    def setup(self, n_qubits):
+        self.backend = BasicAer.get_backend('statevector_simulator')
+        self.random_qobj = _qobj(random_circuit(n_qubits, 10, max_operands=2, seed=42))
+        self.qft_qobj = _qobj(build_qft_circuit(n_qubits))
+
+    def time_statevector_random(self, _):
+        self.backend.run(self.random_qobj).result()
+
+    def time_statevector_qft(self, _):
+        self.backend.run(self.qft_qobj).result()
+
+
+class UnitarySimulatorBench:
+    params = [2, 5, 8]
+    param_names = ['n_qubits']
+    timeout = 600
+
+    def setup(self, n_qubits):
+        self.backend = BasicAer.get_backend('unitary_simulator')
+        self.qobj = _qobj(random_circuit(n_qubits, 10, max_operands=2, seed=42))
+
+    def time_unitary_simulator(self, _):
+        self.backend.run(self.qobj).result()
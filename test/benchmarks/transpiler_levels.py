@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of the preset pass managers on the mock backends.
+
+The ``track_*`` benchmarks record the depth and the number of cx gates of
+the transpiled circuits, to follow the quality of the transpiler along with
+its speed.
+"""
+
+from qiskit import transpile
+from qiskit.test import mock
+
+from .utils import random_circuit, build_qft_circuit, build_qv_model_circuit
+
+_BACKENDS = {'tenerife': mock.FakeTenerife,
+             'melbourne': mock.FakeMelbourne,
+             'rueschlikon': mock.FakeRueschlikon,
+             'tokyo': mock.FakeTokyo,
+             'poughkeepsie': mock.FakePoughkeepsie}
+
+
+def _cx_count(circuit):
+    return circuit.count_ops().get('cx', 0)
+
+
+class TranspilerLevelBenchmarks:
+    params = [0, 1, 2, 3]
+    param_names = ['transpiler optimization level']
+    timeout = 600
+
+    def setup(self, _):
+        self.backend = mock.FakeMelbourne()
+        self.qft_14 = build_qft_circuit(14, measure=True)
+        self.random_14 = random_circuit(14, 8, measure=True, seed=42)
+        self.qv_14 = build_qv_model_circuit(14, 14, seed=42, measure=True)
+
+    def _transpile(self, circuit, level):
+        return transpile(circuit, self.backend, optimization_level=level,
+                         seed_transpiler=0)
+
+    def time_transpile_qft_14(self, level):
+        self._transpile(self.qft_14, level)
+
+    def time_transpile_random_14(self, level):
+        self._transpile(self.random_14, level)
+
+    def time_transpile_qv_14(self, level):
+        self._transpile(self.qv_14, level)
+
+    def track_depth_qft_14(self, level):
+        return self._transpile(self.qft_14, level).depth()
+
+    def track_depth_random_14(self, level):
+        return self._transpile(self.random_14, level).depth()
+
+    def track_depth_qv_14(self, level):
+        return self._transpile(self.qv_14, level).depth()
+
+    def track_cx_qft_14(self, level):
+        return _cx_count(self._transpile(self.qft_14, level))
+
+    def track_cx_qv_14(self, level):
+        return _cx_count(self._transpile(self.qv_14, level))
+
+
+class TranspilerBackendBenchmarks:
+    params = (sorted(_BACKENDS), [0, 1, 2, 3])
+    param_names = ['backend', 'transpiler optimization level']
+    timeout = 600
+
+    def setup(self, backend, _):
+        self.backend = _BACKENDS[backend]()
+        self.qft_5 = build_qft_circuit(5, measure=True)
+        self.qv_5 = build_qv_model_circuit(5, 5, seed=42, measure=True)
+
+    def time_transpile_qft_5(self, _, level):
+        transpile(self.qft_5, self.backend, optimization_level=level, seed_transpiler=0)
+
+    def time_transpile_qv_5(self, _, level):
+        transpile(self.qv_5, self.backend, optimization_level=level, seed_transpiler=0)
+
+    def time_transpile_many_circuits(self, _, level):
+        transpile([self.qft_5] * 20, self.backend, optimization_level=level,
+                  seed_transpiler=0)
+
+
+class RoutingBenchmarks:
+    params = (['legacy', 'sabre'], [5, 10, 15])
+    param_names = ['routing method', 'width']
+    timeout = 600
+
+    def setup(self, _, width):
+        self.backend = mock.FakeTokyo()
+        self.qft = build_qft_circuit(width, measure=True)
+        self.qv = build_qv_model_circuit(width, width, seed=42, measure=True)
+
+    def _transpile(self, circuit, routing_method):
+        # The trivial layout of level 0 isolates the routing
+        return transpile(circuit, self.backend, optimization_level=0,
+                         seed_transpiler=0, routing_method=routing_method)
+
+    def time_route_qft(self, routing_method, _):
+        self._transpile(self.qft, routing_method)
+
+    def time_route_qv(self, routing_method, _):
+        self._transpile(self.qv, routing_method)
+
+    def track_cx_qft(self, routing_method, _):
+        return _cx_count(self._transpile(self.qft, routing_method))
+
+    def track_cx_qv(self, routing_method, _):
+        return _cx_count(self._transpile(self.qv, routing_method))
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Circuits used by the benchmarks."""
+
+import math
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.extensions import standard
+from qiskit.quantum_info.random import random_unitary
+
+# Gates of the random circuits, by number of qubits
+_ONE_Q_GATES = [standard.IdGate, standard.XGate, standard.YGate, standard.ZGate,
+                standard.HGate, standard.SGate, standard.SdgGate, standard.TGate,
+                standard.TdgGate, standard.RXGate, standard.RYGate, standard.RZGate,
+                standard.U1Gate, standard.U3Gate]
+_TWO_Q_GATES = [standard.CnotGate, standard.CyGate, standard.CzGate, standard.CHGate,
+                standard.CrzGate, standard.Cu1Gate, standard.Cu3Gate, standard.SwapGate]
+_THREE_Q_GATES = [standard.ToffoliGate, standard.FredkinGate]
+_NUM_PARAMS = {standard.RXGate: 1, standard.RYGate: 1, standard.RZGate: 1,
+               standard.U1Gate: 1, standard.U3Gate: 3, standard.CrzGate: 1,
+               standard.Cu1Gate: 1, standard.Cu3Gate: 3}
+
+
+def random_circuit(n_qubits, depth, max_operands=3, measure=False,
+                   conditional=False, seed=None):
+    """Generate a random circuit of standard gates.
+
+    Args:
+        n_qubits (int): number of qubits.
+        depth (int): number of layers of gates.
+        max_operands (int): maximum number of qubits of the gates (1 to 3).
+        measure (bool): if True, measure all the qubits at the end.
+        conditional (bool): if True, condition some gates on the classical register.
+        seed (int): seed of the random generator.
+
+    Returns:
+        QuantumCircuit: the random circuit.
+    """
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    circuit = QuantumCircuit(qr)
+    if measure or conditional:
+        cr = ClassicalRegister(n_qubits, 'c')
+        circuit.add_register(cr)
+
+    gates = [_ONE_Q_GATES, _TWO_Q_GATES, _THREE_Q_GATES][:max_operands]
+    for _ in range(depth):
+        # Fill a layer of the circuit with gates on random disjoint qubits
+        qubits = [int(qubit) for qubit in rng.permutation(n_qubits)]
+        while qubits:
+            num_operands = rng.randint(1, min(max_operands, len(qubits)) + 1)
+            operands = [qubits.pop() for _ in range(num_operands)]
+            gate_class = gates[num_operands - 1][rng.randint(len(gates[num_operands - 1]))]
+            params = rng.uniform(0, 2 * math.pi, _NUM_PARAMS.get(gate_class, 0))
+            instruction = circuit.append(gate_class(*params), [qr[i] for i in operands])
+            if conditional and rng.randint(10) == 0:
+                instruction.c_if(cr, int(rng.randint(2 ** n_qubits)))
+
+    if measure:
+        circuit.measure(qr, cr)
+    return circuit
+
+
+def build_qft_circuit(n_qubits, measure=False):
+    """Generate a quantum Fourier transform circuit.
+
+    Args:
+        n_qubits (int): number of qubits.
+        measure (bool): if True, measure all the qubits at the end.
+
+    Returns:
+        QuantumCircuit: the quantum Fourier transform circuit.
+    """
+    qr = QuantumRegister(n_qubits, 'q')
+    circuit = QuantumCircuit(qr, name='qft')
+    for j in range(n_qubits):
+        for k in range(j):
+            circuit.cu1(math.pi / float(2 ** (j - k)), qr[j], qr[k])
+        circuit.h(qr[j])
+    if measure:
+        cr = ClassicalRegister(n_qubits, 'c')
+        circuit.add_register(cr)
+        circuit.measure(qr, cr)
+    return circuit
+
+
+def build_qv_model_circuit(width, depth, seed=None, measure=False):
+    """Generate a quantum volume model circuit.
+
+    Each layer applies random SU(4) unitaries to the qubits paired by a
+    random permutation.
+
+    Args:
+        width (int): number of qubits.
+        depth (int): number of layers.
+        seed (int): seed of the random generator.
+        measure (bool): if True, measure all the qubits at the end.
+
+    Returns:
+        QuantumCircuit: the quantum volume model circuit.
+    """
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(width, 'q')
+    circuit = QuantumCircuit(qr, name='qv')
+    for _ in range(depth):
+        perm = rng.permutation(width)
+        for k in range(width // 2):
+            unitary = random_unitary(4, seed=rng.randint(2 ** 31))
+            circuit.unitary(unitary, [qr[int(perm[2 * k])], qr[int(perm[2 * k + 1])]])
+    if measure:
+        cr = ClassicalRegister(width, 'c')
+        circuit.add_register(cr)
+        circuit.measure(qr, cr)
+    return circuit
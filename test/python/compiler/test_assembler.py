@@ -417,6 +417,23 @@ class TestPulseAssembler(QiskitTestCase):
         self.assertEqual(qobj.experiments[0].instructions[0].name, 'pulse0')
         self.assertNotEqual(qobj.experiments[0].instructions[1].name, 'pulse0')
 
+    def test_pulse_library_shared_by_content(self):
+        """Test pulses with the same samples share one entry of the pulse library."""
+        samples = np.array([0.02739068, 0.05, 0.05, 0.05, 0.02739068], dtype=np.complex128)
+        same_samples_pulse = pulse.SamplePulse(samples=samples, name='pulse1')
+        other_schedule = same_samples_pulse(self.device.q[1].drive)
+
+        qobj = assemble([self.schedule, other_schedule, self.schedule],
+                        qobj_header=self.header,
+                        qubit_lo_freq=self.default_qubit_lo_freq,
+                        meas_lo_freq=self.default_meas_lo_freq,
+                        schedule_los=[],
+                        **self.config)
+
+        self.assertEqual([item.name for item in qobj.config.pulse_library], ['pulse0'])
+        self.assertEqual(qobj.experiments[1].instructions[0].name, 'pulse0')
+        self.assertEqual(qobj.experiments[1].instructions[0].ch, 'd1')
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
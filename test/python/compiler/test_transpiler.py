@@ -14,6 +14,7 @@
 
 """Tests basic functionality of the transpile function"""
 
+import datetime
 import math
 import unittest
 from unittest.mock import patch
@@ -22,14 +23,21 @@ from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit import BasicAer
 from qiskit.extensions.standard import CnotGate
 from qiskit.transpiler import PassManager
+from qiskit.transpiler.transpile_config import TranspileConfig
 from qiskit.compiler import transpile
+from qiskit.compiler.transpile import _balanced_chunks, _split_components
+from qiskit.execute import execute
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase, Path
 from qiskit.test.mock import FakeMelbourne, FakeRueschlikon
 from qiskit.transpiler.passes import BarrierBeforeFinalMeasurements, CXDirection
 from qiskit.transpiler import Layout, CouplingMap
-from qiskit.circuit import Parameter
+from qiskit.circuit import Parameter, Instruction
 from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.transpiler.transpile_circuit import _select_pass_manager
+from qiskit.tools.events import PassProfiler
+from qiskit.quantum_info import Operator
+from qiskit.quantum_info.operators.predicates import matrix_equal
 
 
 class TestTranspile(QiskitTestCase):
@@ -602,3 +610,257 @@ class TestTranspile(QiskitTestCase):
 
         with self.assertRaises(TranspilerError):
             transpile(qc, coupling_map=cmap)
+
+    def test_profile_passes(self):
+        """Test the pass profiles of each transpiled circuit are collected."""
+        qr = QuantumRegister(3, 'qr')
+        circuit1 = QuantumCircuit(qr, name='circuit1')
+        circuit1.ccx(qr[0], qr[1], qr[2])
+        circuit2 = QuantumCircuit(qr, name='circuit2')
+        circuit2.h(qr[0])
+
+        with PassProfiler() as profiler:
+            transpile([circuit1, circuit2], basis_gates=['u3', 'cx'],
+                      optimization_level=1, profile_passes=True)
+
+        self.assertEqual([report['circuit'] for report in profiler.reports],
+                         ['circuit1', 'circuit2'])
+        unroller = [profile for profile in profiler.reports[0]['passes']
+                    if profile['name'] == 'Unroller'][0]
+        self.assertEqual(unroller['size_before'], 1)
+        self.assertEqual(unroller['size_after'], 15)
+        self.assertGreaterEqual(unroller['cpu_time'], 0)
+        self.assertGreater(unroller['memory_peak'], 0)
+
+        summary = {total['name']: total for total in profiler.summary()}
+        self.assertEqual(summary['Unroller']['count'], 2)
+
+    def test_optimize_components(self):
+        """Test transpiling the components of a circuit separately."""
+        qr = QuantumRegister(4, 'qr')
+        qr2 = QuantumRegister(2, 'qr2')
+        circuit = QuantumCircuit(qr, qr2)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[3])
+        circuit.ccx(qr2[0], qr[1], qr2[1])
+        circuit.barrier(qr, qr2)
+        circuit.t(qr[3])
+        circuit.h(qr[2])
+        circuit.u3(0.1, 0.2, 0.3, qr2[0])
+        circuit.cx(qr[2], qr2[0])
+        circuit.h(qr[0])
+        expected = circuit.copy()
+        expected.data = [inst for inst in circuit.data if inst[0].name != 'barrier']
+
+        for optimization_level in range(4):
+            result = transpile(circuit, basis_gates=['u1', 'u2', 'u3', 'cx'],
+                               optimization_level=optimization_level,
+                               optimize_components=True)
+            self.assertEqual(result.qregs, circuit.qregs)
+            result.data = [inst for inst in result.data if inst[0].name != 'barrier']
+            self.assertTrue(matrix_equal(Operator(expected).data, Operator(result).data,
+                                         ignore_phase=True))
+
+    def test_optimize_components_with_measurements(self):
+        """Test the components of a circuit with measurements and conditions on a device."""
+        qr = QuantumRegister(6, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        cr2 = ClassicalRegister(4, 'cr2')
+        circuit = QuantumCircuit(qr, cr, cr2)
+        circuit.x(qr[0])
+        circuit.cx(qr[0], qr[5])
+        circuit.measure(qr[0], cr[0])
+        circuit.x(qr[1]).c_if(cr, 1)
+        circuit.measure(qr[1], cr[1])
+        circuit.x(qr[2])
+        circuit.x(qr[4])
+        circuit.ccx(qr[2], qr[4], qr[3])
+        circuit.measure(qr[3], cr2[0])
+        circuit.measure(qr[5], cr2[3])
+
+        backend = BasicAer.get_backend('qasm_simulator')
+        for optimization_level in range(4):
+            result = transpile(circuit, backend=FakeRueschlikon(),
+                               optimization_level=optimization_level,
+                               seed_transpiler=42, optimize_components=True)
+            counts = execute(result, backend, shots=10).result().get_counts()
+            self.assertEqual(counts, {'1001 11': 10})
+
+    def test_optimize_components_with_coupling_map(self):
+        """Test the components are unrolled before the joined circuit is laid out and routed."""
+        qr = QuantumRegister(4, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[2], qr[3])
+
+        with PassProfiler() as profiler:
+            transpile(circuit, backend=FakeRueschlikon(), optimization_level=1,
+                      seed_transpiler=42, profile_passes=True, optimize_components=True)
+        passes = [profile['name'] for profile in profiler.reports[0]['passes']]
+        self.assertEqual(passes.count('Unroller'), 2)
+        self.assertEqual(passes.count('SetLayout'), 1)
+        self.assertLess(max(index for index, name in enumerate(passes) if name == 'Unroller'),
+                        passes.index('SetLayout'))
+
+    def test_optimize_components_routed(self):
+        """Test the joined components are routed as the whole circuit."""
+        qr = QuantumRegister(6, 'qr')
+        cr = ClassicalRegister(6, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.x(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[1], qr[2])
+        circuit.cx(qr[0], qr[2])
+        circuit.h(qr[3])
+        circuit.h(qr[3])
+        circuit.x(qr[4])
+        circuit.ccx(qr[3], qr[4], qr[5])
+        circuit.x(qr[5])
+        circuit.measure(qr, cr)
+
+        coupling_map = FakeRueschlikon().configuration().coupling_map
+        backend = BasicAer.get_backend('qasm_simulator')
+        for optimization_level in range(4):
+            for routing_method in ['legacy', 'sabre']:
+                results = [transpile(circuit, backend=FakeRueschlikon(),
+                                     optimization_level=optimization_level,
+                                     routing_method=routing_method,
+                                     initial_layout=[0, 5, 10, 2, 13, 7],
+                                     seed_transpiler=42, optimize_components=optimize_components)
+                           for optimize_components in [False, True]]
+                self.assertEqual(results[0].qregs, results[1].qregs)
+                for result in results:
+                    for instruction, qargs, _ in result.data:
+                        if instruction.name == 'cx':
+                            self.assertIn([qargs[0].index, qargs[1].index], coupling_map)
+                    counts = execute(result, backend, shots=10).result().get_counts()
+                    self.assertEqual(counts, {'110011': 10})
+
+    def test_split_components_without_bits(self):
+        """Test splitting a circuit with an instruction on no bits."""
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit._append(Instruction('nobits', 0, 0, []), [], [])
+        circuit.h(qr[0])
+        circuit.h(qr[1])
+
+        components = _split_components(circuit)
+        self.assertEqual(len(components), 2)
+        self.assertEqual([list(bit_map.values()) for _, bit_map in components],
+                         [[qr[0]], [qr[1]]])
+
+    def test_pass_manager_reused(self):
+        """Test the pass manager of a configuration is reused for circuits on other registers."""
+        circuits = []
+        for name in ['qa', 'qb', 'qc']:
+            qr = QuantumRegister(3, name)
+            cr = ClassicalRegister(3)
+            circuit = QuantumCircuit(qr, cr, name=name)
+            circuit.h(qr[0])
+            circuit.cx(qr[0], qr[1])
+            circuit.cx(qr[0], qr[2])
+            circuit.cx(qr[1], qr[2])
+            circuit.measure(qr, cr)
+            circuits.append(circuit)
+        layout = Layout.from_intlist([4, 5, 6], *circuits[0].qregs)
+
+        for optimization_level in range(4):
+            results = transpile(circuits, backend=FakeMelbourne(),
+                                optimization_level=optimization_level, seed_transpiler=42)
+            for circuit, result in zip(circuits, results):
+                expected = transpile(circuit, backend=FakeMelbourne(),
+                                     optimization_level=optimization_level,
+                                     seed_transpiler=42)
+                # The 2q unitary synthesis of level 3 is not deterministic,
+                # but the layout and routing are
+                self.assertEqual([inst for inst in result.data
+                                  if inst[0].name in ['cx', 'measure']],
+                                 [inst for inst in expected.data
+                                  if inst[0].name in ['cx', 'measure']])
+                if optimization_level < 3:
+                    self.assertEqual(result, expected)
+
+            # A given layout is not extended with the ancillas of the device
+            transpile(circuits[0], backend=FakeMelbourne(), initial_layout=layout,
+                      optimization_level=optimization_level, seed_transpiler=42)
+            self.assertEqual(len(layout), 3)
+
+    def test_pass_manager_cache_key(self):
+        """Test the pass managers are reused for the same values of the backend properties."""
+        def config(backend_properties, seed_transpiler=42):
+            return TranspileConfig(basis_gates=['u1', 'u2', 'u3', 'cx'],
+                                   coupling_map=CouplingMap(FakeMelbourne().configuration()
+                                                            .coupling_map),
+                                   backend_properties=backend_properties,
+                                   initial_layout=None, seed_transpiler=seed_transpiler,
+                                   optimization_level=1, pass_manager=None,
+                                   routing_method=None)
+
+        pass_managers = {}
+        pass_manager = _select_pass_manager(config(FakeMelbourne().properties()),
+                                            pass_managers)
+        self.assertIs(_select_pass_manager(config(FakeMelbourne().properties()),
+                                           pass_managers), pass_manager)
+
+        properties = FakeMelbourne().properties()
+        properties.last_update_date = datetime.datetime(2019, 10, 1)
+        properties.qubits[0][0].date = datetime.datetime(2019, 10, 1)
+        self.assertIs(_select_pass_manager(config(properties), pass_managers), pass_manager)
+
+        properties = FakeMelbourne().properties()
+        properties.gates[0].parameters[0].value = 0.5
+        self.assertIsNot(_select_pass_manager(config(properties), pass_managers),
+                         pass_manager)
+        self.assertEqual(len(pass_managers), 2)
+
+    def test_pass_manager_not_reused_without_seed(self):
+        """Test the pass managers are not reused without a seed_transpiler."""
+        config = TranspileConfig(basis_gates=['u1', 'u2', 'u3', 'cx'],
+                                 coupling_map=CouplingMap([[0, 1], [1, 2], [2, 3], [3, 4]]),
+                                 backend_properties=None, initial_layout=None,
+                                 seed_transpiler=None, optimization_level=1,
+                                 pass_manager=None, routing_method=None)
+
+        pass_managers = {}
+        pass_manager = _select_pass_manager(config, pass_managers)
+        self.assertIsNot(_select_pass_manager(config, pass_managers), pass_manager)
+        self.assertEqual(pass_managers, {})
+
+    def test_sabre_routing(self):
+        """Test circuits routed with SABRE keep their outcome at all levels."""
+        qr = QuantumRegister(5, 'qr')
+        cr = ClassicalRegister(5, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.x(qr[0])
+        circuit.x(qr[3])
+        for control in range(5):
+            for target in range(5):
+                if control != target:
+                    circuit.cx(qr[control], qr[target])
+        circuit.ccx(qr[0], qr[1], qr[4])
+        circuit.measure(qr, cr)
+
+        backend = BasicAer.get_backend('qasm_simulator')
+        coupling_map = CouplingMap(FakeMelbourne().configuration().coupling_map)
+        for optimization_level in range(4):
+            result = transpile(circuit, backend=FakeMelbourne(),
+                               optimization_level=optimization_level,
+                               seed_transpiler=42, routing_method='sabre')
+            for inst, qargs, _ in result.data:
+                if inst.name == 'cx':
+                    self.assertIn((qargs[0].index, qargs[1].index),
+                                  coupling_map.get_edges())
+            counts = execute(result, backend, shots=10).result().get_counts()
+            self.assertEqual(counts, {'10010': 10})
+
+    def test_unknown_routing_method(self):
+        """Test an unknown routing method raises."""
+        circuit = QuantumCircuit(QuantumRegister(2))
+        with self.assertRaises(TranspilerError):
+            transpile(circuit, backend=FakeMelbourne(), routing_method='fastest')
+
+    def test_balanced_chunks(self):
+        """Test circuits are sent in chunks of balanced size, largest first."""
+        chunks = _balanced_chunks([5, 1, 8, 3, 3, 2], 3)
+        self.assertEqual(chunks, [[2], [0, 5], [3, 4, 1]])
+        self.assertEqual(_balanced_chunks([2, 1], 4), [[0], [1]])
@@ -41,6 +41,35 @@ class TestCircuitToDag(QiskitTestCase):
         circuit_out = dag_to_circuit(dag)
         self.assertEqual(circuit_out, circuit_in)
 
+    def test_circuit_and_dag_without_copy(self):
+        """Check convert to dag and back sharing the instructions"""
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        circuit_in = QuantumCircuit(qr, cr)
+        circuit_in.h(qr[0])
+        circuit_in.cx(qr[0], qr[1])
+        circuit_in.x(qr[1]).c_if(cr, 0x1)
+        circuit_in.measure(qr, cr)
+        dag = circuit_to_dag(circuit_in, copy_operations=False)
+        circuit_out = dag_to_circuit(dag, copy_operations=False)
+        self.assertEqual(circuit_out, circuit_in)
+        for (inst_in, _, _), (inst_out, _, _) in zip(circuit_in.data, circuit_out.data):
+            self.assertIs(inst_in, inst_out)
+
+    def test_copy_operations_on_condition_change(self):
+        """Check a shared op is copied when the node condition differs"""
+        qr = QuantumRegister(1)
+        cr = ClassicalRegister(1)
+        circuit_in = QuantumCircuit(qr, cr)
+        circuit_in.x(qr[0])
+        dag = circuit_to_dag(circuit_in, copy_operations=False)
+        node = dag.op_nodes()[0]
+        node.data_dict['condition'] = (cr, 1)
+        circuit_out = dag_to_circuit(dag, copy_operations=False)
+        self.assertIsNot(circuit_out.data[0][0], circuit_in.data[0][0])
+        self.assertEqual(circuit_out.data[0][0].control, (cr, 1))
+        self.assertIsNone(circuit_in.data[0][0].control)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -133,6 +133,34 @@ class TestCmdDef(QiskitTestCase):
         self.assertEqual(sched.instructions[1][-1].command.phase, 2)
         self.assertEqual(sched.instructions[2][-1].command.phase, 3)
 
+    def test_bind_many(self):
+        """Test binding a parameterized schedule to arrays of parameter values."""
+        converter = QobjToInstructionConverter([], buffer=0)
+        qobjs = [PulseQobjInstruction(name='fc', ch='d0', t0=10, phase='P1'),
+                 PulseQobjInstruction(name='pv', ch='u1', t0=10, val='P2*cos(np.pi*P1)')]
+        param_sched = ParameterizedSchedule(*[converter(qobj) for qobj in qobjs],
+                                            name='sweep')
+
+        scheds = param_sched.bind_many([0, 1, 2], P2=[0.2, 0.4, 0.6])
+        self.assertEqual(len(scheds), 3)
+        for sched, phase, amp in zip(scheds, [0, 1, 2], [0.2, 0.4, 0.6]):
+            expected = param_sched.bind_parameters(phase, amp)
+            self.assertEqual(sched.name, 'sweep')
+            self.assertEqual(sched.instructions[0][-1].command.phase, phase)
+            self.assertEqual(sched.instructions[1][-1].command.value,
+                             expected.instructions[1][-1].command.value)
+
+        # scalars are broadcast
+        scheds = param_sched.bind_many(np.linspace(0, 1, 5), P2=0.5)
+        self.assertEqual([sched.instructions[0][-1].command.phase for sched in scheds],
+                         [0, 0.25, 0.5, 0.75, 1])
+
+        with self.assertRaises(PulseError):
+            param_sched.bind_many([0, 1], [0.1, 0.2, 0.3])
+
+        with self.assertRaises(PulseError):
+            param_sched.bind_many([0, 1], P3=[0.1, 0.2])
+
     def test_build_cmd_def(self):
         """Test building of parameterized cmd_def from defaults."""
         defaults = self.backend.defaults()
@@ -19,7 +19,7 @@
 import unittest
 import numpy as np
 
-from qiskit.pulse import (Acquire, FrameChange, PersistentValue,
+from qiskit.pulse import (Acquire, FrameChange, PersistentValue, SamplePulse,
                           Snapshot, Kernel, Discriminator, functional_pulse)
 from qiskit.test import QiskitTestCase
 
@@ -103,6 +103,49 @@ class TestFunctionalPulse(QiskitTestCase):
         self.assertEqual(pulse_command.duration, 10)
 
 
+class TestSamplePulse(QiskitTestCase):
+    """SamplePulse tests."""
+
+    def test_digest(self):
+        """Test pulses are compared and hashed by the digest of their samples.
+        """
+        samples = np.linspace(0, 0.5, 10)
+        pulse = SamplePulse(samples, name='pulse')
+        same_pulse = SamplePulse(samples.copy(), name='pulse')
+        other_pulse = SamplePulse(samples[::-1], name='pulse')
+
+        self.assertEqual(pulse.digest, same_pulse.digest)
+        self.assertNotEqual(pulse.digest, other_pulse.digest)
+        self.assertEqual(pulse, same_pulse)
+        self.assertEqual(hash(pulse), hash(same_pulse))
+        self.assertNotEqual(pulse, other_pulse)
+        self.assertNotEqual(pulse, SamplePulse(samples, name='renamed'))
+
+    def test_signed_zeros(self):
+        """Test pulses with samples differing by the sign of zeros are equal.
+        """
+        pulse = SamplePulse([0.0, complex(0.5, 0.0)], name='pulse')
+        same_pulse = SamplePulse([-0.0, complex(0.5, -0.0)], name='pulse')
+
+        self.assertEqual(pulse, same_pulse)
+        self.assertEqual(pulse.digest, same_pulse.digest)
+        self.assertEqual(hash(pulse), hash(same_pulse))
+
+    def test_samples_read_only(self):
+        """Test the samples of a pulse cannot be modified after its digest is computed.
+        """
+        samples = np.linspace(0, 0.5, 10)
+        pulse = SamplePulse(samples, name='pulse')
+        digest = pulse.digest
+        samples[0] = 0.25
+
+        with self.assertRaises(ValueError):
+            pulse.samples[0] = 0.25
+        self.assertEqual(pulse.samples[0], 0)
+        self.assertEqual(pulse.digest, digest)
+        self.assertTrue(samples.flags.writeable)
+
+
 class TestPersistentValue(QiskitTestCase):
     """PersistentValue tests."""
 
@@ -17,7 +17,7 @@
 import numpy as np
 
 from qiskit.test import QiskitTestCase
-from qiskit.pulse import SamplePulse
+from qiskit.pulse import SamplePulse, PulseError
 import qiskit.pulse.pulse_lib as pulse_lib
 import qiskit.pulse.pulse_lib.continuous as continuous
 
@@ -185,3 +185,21 @@ class TestDiscretePulses(QiskitTestCase):
         drag_pulse = pulse_lib.drag(duration, amp, sigma, beta=beta)
         self.assertIsInstance(drag_pulse, SamplePulse)
         np.testing.assert_array_almost_equal(drag_pulse.samples, drag_ref)
+
+    def test_sample_many(self):
+        """Test sampling a family of pulses as a 2-D array."""
+        amps = np.linspace(0, 0.5, 6)
+        samples = pulse_lib.sample_many(pulse_lib.gaussian, 10, amps, sigma=2)
+        self.assertEqual(samples.shape, (6, 10))
+        for amp, row in zip(amps, samples):
+            np.testing.assert_array_almost_equal(row, pulse_lib.gaussian(10, amp, 2).samples)
+
+        samples = pulse_lib.sample_many(pulse_lib.drag, 10, [[0.1], [0.2]], 2, beta=[0, 1, 2])
+        self.assertEqual(samples.shape, (6, 10))
+        np.testing.assert_array_almost_equal(samples[5], pulse_lib.drag(10, 0.2, 2, 2).samples)
+
+        samples = pulse_lib.sample_many(pulse_lib.constant, 4, 0.5j)
+        np.testing.assert_array_almost_equal(samples, [[0.5j] * 4])
+
+        with self.assertRaises(PulseError):
+            pulse_lib.sample_many(pulse_lib.gaussian, 10, [0.1, 0.2], sigma=[1, 2, 3])
@@ -14,6 +14,8 @@
 
 """Parser Test."""
 
+import cmath
+
 from qiskit.test import QiskitTestCase
 from qiskit.pulse.parser import parse_string_expr
 from qiskit.pulse.exceptions import PulseError
@@ -214,6 +216,20 @@ class TestInstructionToQobjConverter(QiskitTestCase):
         self.assertEqual(bound_four_new(P5=5), -2.925)
         self.assertEqual(bound_four_new(5), -2.925)
 
+    def test_compiled_expression(self):
+        """Test binding all parameters matches the evaluation of the expression tree."""
+        expr = 'P1*sin(P2)**2+sqrt(P3-4)'
+
+        parsed_expr = parse_string_expr(expr)
+        tree_expr = parse_string_expr(expr, partial_binding=True)
+        partial_value = tree_expr(P1=2)(P2=0.5, P3=1)
+        self.assertEqual(parsed_expr(2, 0.5, 1), partial_value)
+        self.assertEqual(parsed_expr(2, 0.5, 5), 2*cmath.sin(0.5).real**2 + 1)
+        self.assertIsInstance(parsed_expr(2, 0.5, 5), float)
+
+        with self.assertRaises(PulseError):
+            parsed_expr(2, 0.5, 'abc')
+
     def test_argument_duplication(self):
         """Test duplication of *args and **kwargs."""
 
@@ -94,3 +94,19 @@ class TestSampler(QiskitTestCase):
         pulse = left_linear_pulse_fun(duration, m=m)
         self.assertIsInstance(pulse, commands.SamplePulse)
         np.testing.assert_array_almost_equal(pulse.samples, reference)
+
+    def test_cached_samples(self):
+        """Test that pulses sampled with the same arguments share their samples."""
+        left_linear_pulse_fun = samplers.left(linear)
+        pulse = left_linear_pulse_fun(3, 0.1, b=0.2)
+        same_pulse = left_linear_pulse_fun(3, 0.1, b=0.2, name='same')
+
+        self.assertIs(pulse.samples, same_pulse.samples)
+        self.assertFalse(pulse.samples.flags.writeable)
+        self.assertIsNot(pulse.samples, left_linear_pulse_fun(3, 0.1, b=0.3).samples)
+        self.assertIsNot(pulse.samples, samplers.right(linear)(3, 0.1, b=0.2).samples)
+
+        # unhashable arguments are sampled without cache
+        slopes = np.array([0.1, 0.2, 0.3])
+        np.testing.assert_array_almost_equal(left_linear_pulse_fun(3, slopes).samples,
+                                             [0.1, 0.3, 0.7])
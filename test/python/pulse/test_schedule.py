@@ -223,6 +223,38 @@ class TestSchedule(QiskitTestCase):
         start_times = sorted([shft+instr.start_time for shft, instr in sched.instructions])
         self.assertEqual([0, 30, 40], start_times)
 
+    def test_repeated_subschedule_instructions(self):
+        """Test the instructions of a sub-schedule used several times in a schedule."""
+        device = self.two_qubit_device
+        lp0 = self.linear(duration=10, slope=0.02, intercept=0.01)
+        frame_change = FrameChange(0.1)
+
+        subsched = Schedule(lp0(device.q[0].drive), (10, frame_change(device.q[0].drive)))
+        sched = Schedule((5, subsched), (20, subsched), lp0(device.q[1].drive))
+        sched = sched.append(subsched)
+
+        instructions = sched.instructions
+        self.assertEqual([5, 15, 20, 30, 0, 30, 40], [time for time, _ in instructions])
+        self.assertEqual(instructions[:2], subsched.shift(5).instructions)
+        self.assertIs(instructions, sched.instructions)
+        # flattening a schedule does not flatten its children
+        self.assertIsNone(subsched._flat_instructions)
+
+        # already flattened children are reused
+        parent = Schedule(sched, (100, sched))
+        self.assertEqual(instructions + tuple((time + 100, inst) for time, inst in instructions),
+                         parent.instructions)
+
+    def test_deeply_nested_schedule_instructions(self):
+        """Test getting the instructions of a schedule built by many appends."""
+        device = self.two_qubit_device
+        lp0 = self.linear(duration=2, slope=0.02, intercept=0.01)
+
+        sched = Schedule()
+        for _ in range(2000):
+            sched = sched.append(lp0(device.q[0].drive))
+        self.assertEqual(list(range(0, 4000, 2)), [time for time, _ in sched.instructions])
+
     def test_shift_schedule(self):
         """Test shift schedule."""
         device = self.two_qubit_device
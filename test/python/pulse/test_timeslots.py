@@ -14,9 +14,11 @@
 
 """Test cases for the timeslots."""
 
+import time
 import unittest
 
 from qiskit.pulse.channels import AcquireChannel
+from qiskit.pulse.exceptions import PulseError
 from qiskit.pulse.timeslots import Interval, Timeslot, TimeslotCollection
 from qiskit.test import QiskitTestCase
 
@@ -137,6 +139,97 @@ class TestTimeslotCollection(QiskitTestCase):
         col1.is_mergeable_with(col2)
         self.assertEqual(col1.channels, expected_channels)
 
+    def test_unordered_timeslots(self):
+        """Test overlaps are found regardless of the order of the time-slots."""
+        slots = [Timeslot(Interval(5, 7), AcquireChannel(0)),
+                 Timeslot(Interval(0, 2), AcquireChannel(0)),
+                 Timeslot(Interval(2, 2), AcquireChannel(0)),
+                 Timeslot(Interval(2, 5), AcquireChannel(0))]
+        collection = TimeslotCollection(*slots)
+        self.assertEqual(tuple(slots), collection.timeslots)
+        self.assertEqual(0, collection.start_time)
+        self.assertEqual(7, collection.stop_time)
+
+        with self.assertRaises(PulseError):
+            TimeslotCollection(Timeslot(Interval(5, 7), AcquireChannel(0)),
+                               Timeslot(Interval(0, 2), AcquireChannel(0)),
+                               Timeslot(Interval(1, 3), AcquireChannel(0)))
+        with self.assertRaises(PulseError):
+            TimeslotCollection(Timeslot(Interval(0, 4), AcquireChannel(0)),
+                               Timeslot(Interval(2, 2), AcquireChannel(0)))
+
+    def test_merge_interleaved_collections(self):
+        """Test merging collections whose time-slots interleave on a channel."""
+        col1 = TimeslotCollection(Timeslot(Interval(0, 2), AcquireChannel(0)),
+                                  Timeslot(Interval(4, 6), AcquireChannel(0)))
+        col2 = TimeslotCollection(Timeslot(Interval(2, 4), AcquireChannel(0)),
+                                  Timeslot(Interval(6, 6), AcquireChannel(0)),
+                                  Timeslot(Interval(0, 1), AcquireChannel(1)))
+        self.assertTrue(col1.is_mergeable_with(col2))
+        merged = col1.merged(col2)
+        self.assertEqual(col1.timeslots + col2.timeslots, merged.timeslots)
+        self.assertEqual((AcquireChannel(0), AcquireChannel(1)), merged.channels)
+        self.assertEqual(6, merged.ch_stop_time(AcquireChannel(0)))
+        self.assertEqual(1, merged.ch_stop_time(AcquireChannel(1)))
+
+        col3 = TimeslotCollection(Timeslot(Interval(3, 5), AcquireChannel(0)))
+        self.assertFalse(merged.is_mergeable_with(col3))
+        with self.assertRaises(PulseError):
+            merged.merged(col3)
+
+    def test_merge_and_shift_do_not_mutate(self):
+        """Test merging and shifting leave the original collections unchanged."""
+        col1 = TimeslotCollection(Timeslot(Interval(0, 2), AcquireChannel(0)))
+        col2 = col1.merged(col1.shift(4))
+        col3 = col2.merged(col1.shift(2))
+        self.assertEqual((0, 2), (col1.start_time, col1.stop_time))
+        self.assertEqual(len(col2.timeslots), 2)
+        self.assertTrue(col2.is_mergeable_with(col1.shift(2)))
+        self.assertEqual(TimeslotCollection(Timeslot(Interval(0, 2), AcquireChannel(0)),
+                                            Timeslot(Interval(4, 6), AcquireChannel(0)),
+                                            Timeslot(Interval(2, 4), AcquireChannel(0))), col3)
+
+    def test_branching_appends_do_not_mutate(self):
+        """Test appending different time-slots to the same collection."""
+        base = TimeslotCollection(Timeslot(Interval(0, 2), AcquireChannel(0)))
+        col1 = base.merged(TimeslotCollection(Timeslot(Interval(2, 4), AcquireChannel(0))))
+        col2 = base.merged(TimeslotCollection(Timeslot(Interval(3, 8), AcquireChannel(0))))
+        col3 = col1.merged(TimeslotCollection(Timeslot(Interval(4, 5), AcquireChannel(0))))
+        self.assertEqual((2, 4, 8, 5), (base.stop_time, col1.stop_time,
+                                        col2.stop_time, col3.stop_time))
+        self.assertTrue(base.is_mergeable_with(
+            TimeslotCollection(Timeslot(Interval(2, 3), AcquireChannel(0)))))
+        self.assertTrue(col1.is_mergeable_with(
+            TimeslotCollection(Timeslot(Interval(4, 8), AcquireChannel(0)))))
+        self.assertFalse(col2.is_mergeable_with(
+            TimeslotCollection(Timeslot(Interval(2, 4), AcquireChannel(0)))))
+        self.assertEqual(5, len(col3.merged(col2.shift(8)).timeslots))
+
+    def test_append_scales_linearly(self):
+        """Test appending time-slots one by one takes linear time."""
+        def build(size):
+            slots = [TimeslotCollection(Timeslot(Interval(time, time + 1), AcquireChannel(0)))
+                     for time in range(size)]
+            start = time.process_time()
+            collection = TimeslotCollection()
+            for slot in slots:
+                collection = collection.merged(slot)
+            elapsed = time.process_time() - start
+            self.assertEqual(size, collection.stop_time)
+            return elapsed
+
+        small = min(build(2000) for _ in range(3))
+        large = min(build(16000) for _ in range(3))
+        # quadratic construction takes about 64 times longer
+        self.assertLess(large, 24 * max(small, 1e-3))
+
+    def test_shift_to_negative_time(self):
+        """Test shifting a collection before time zero fails."""
+        collection = TimeslotCollection(Timeslot(Interval(1, 3), AcquireChannel(0)))
+        self.assertEqual(0, collection.shift(-1).start_time)
+        with self.assertRaises(PulseError):
+            collection.shift(-2)
+
 
 if __name__ == '__main__':
     unittest.main()
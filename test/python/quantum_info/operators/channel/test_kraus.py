@@ -18,7 +18,7 @@ import unittest
 import numpy as np
 
 from qiskit import QiskitError
-from qiskit.quantum_info.operators.channel import Kraus
+from qiskit.quantum_info.operators.channel import Kraus, SuperOp, Choi
 from .channel_test_case import ChannelTestCase
 
 
@@ -236,6 +236,76 @@ class TestKraus(ChannelTestCase):
         self.assertEqual(chan.dim, (2, 2))
         self.assertAllClose(chan._evolve(rho), targ)
 
+    def test_compose_subsystem(self):
+        """Test subsystem compose stays in the Kraus representation."""
+        kraus1 = self.rand_kraus(8, 8, 3)
+        kraus2 = self.rand_kraus(4, 4, 2)
+        for qargs in [[0, 1], [2, 0], [1, 2]]:
+            for front in [False, True]:
+                for kraus_r in [None, self.rand_kraus(8, 8, 3)]:
+                    chan = Kraus((kraus1, kraus_r)).compose(
+                        Kraus(kraus2), qargs=qargs, front=front)
+                    targ = SuperOp(Kraus((kraus1, kraus_r))).compose(
+                        SuperOp(Kraus(kraus2)), qargs=qargs, front=front)
+                    self.assertIsInstance(chan, Kraus)
+                    self.assertEqual(SuperOp(chan), targ)
+        with self.assertRaises(QiskitError):
+            Kraus(kraus1).compose(Kraus(kraus2), qargs=[0])
+
+    def test_compose_truncate(self):
+        """Test composition does not grow beyond the maximum Kraus rank."""
+        chan = Kraus(self.depol_kraus(0.5))
+        targ = Kraus(self.depol_kraus(1 - 0.5 ** 4))
+        comp = chan.compose(chan).compose(chan).compose(chan)
+        self.assertLessEqual(len(comp.data), 4)
+        self.assertEqual(SuperOp(comp), SuperOp(targ))
+        self.assertTrue(comp.is_cptp())
+
+    def test_is_cp_tp(self):
+        """Test CP and TP checks in the Kraus representation."""
+        chan = Kraus(self.depol_kraus(0.5))
+        self.assertTrue(chan.is_cp())
+        self.assertTrue(chan.is_tp())
+        chan = Kraus(self.rand_kraus(2, 2, 3))
+        self.assertTrue(chan.is_cp())
+        self.assertFalse(chan.is_tp())
+        kraus = self.depol_kraus(0.5)
+        chan = Kraus((kraus, [-1 * kraus[0]] + kraus[1:]))
+        self.assertFalse(chan.is_cp())
+        self.assertFalse(chan.is_tp())
+
+    def test_conversion_cache(self):
+        """Test conversions of a channel are computed once."""
+        chan = Kraus(self.depol_kraus(0.5))
+        choi = chan._converted_data('Choi')
+        self.assertIs(chan._converted_data('Choi'), choi)
+        self.assertTrue(chan.is_cptp())
+        self.assertIs(chan._converted_data('Choi'), choi)
+        self.assertIs(chan._converted_data('Kraus'), chan._data)
+
+    def test_conversions_not_shared(self):
+        """Test channels converted from the same channel do not share data."""
+        chan = Kraus(self.depol_kraus(0.5))
+        choi1 = Choi(chan)
+        choi2 = Choi(chan)
+        self.assertIsNot(choi1.data, choi2.data)
+        targ = choi2.data.copy()
+        choi1.data[0, 0] = 42
+        self.assertAllClose(choi2.data, targ)
+        self.assertAllClose(Choi(chan).data, targ)
+
+        chan = Kraus(self.UX)
+        op = chan.to_operator()
+        op.data[0, 0] = 42
+        self.assertAllClose(chan.to_operator().data, self.UX)
+
+    def test_conversions_after_data_modified(self):
+        """Test channel data modified in place is converted again."""
+        chan = Kraus(self.UI)
+        self.assertAllClose(Choi(chan).data, Choi(Kraus(self.UI)).data)
+        chan.data[0][:] = self.UX
+        self.assertAllClose(Choi(chan).data, Choi(Kraus(self.UX)).data)
+
     def test_expand(self):
         """Test expand method."""
         rho0, rho1 = np.diag([1, 0]), np.diag([0, 1])
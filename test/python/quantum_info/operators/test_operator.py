@@ -166,6 +166,58 @@ class TestOperator(OperatorTestCase):
         circuit = self.simple_circuit_with_measure()
         self.assertRaises(QiskitError, Operator, circuit)
 
+    def test_circuit_init_composite(self):
+        """Test initialization from a circuit with a composite instruction."""
+        inner = QuantumCircuit(2)
+        inner.h(0)
+        inner.cx(0, 1)
+        qr = QuantumRegister(3)
+        circuit = QuantumCircuit(qr)
+        circuit.append(inner.to_instruction(), [qr[2], qr[0]])
+        target = QuantumCircuit(qr)
+        target.h(qr[2])
+        target.cx(qr[2], qr[0])
+        self.assertEqual(Operator(circuit), Operator(target))
+
+    def test_circuit_init_deep(self):
+        """Test initialization from a deep circuit matches composing each gate."""
+        np.random.seed(42)
+        qr = QuantumRegister(6)
+        circuit = QuantumCircuit(qr)
+        target = Operator(np.eye(2 ** 6))
+        for layer in range(8):
+            for qubit in range(6):
+                params = np.random.rand(3)
+                circuit.u3(*params, qr[qubit])
+                target = target.compose(
+                    Operator(circuit.data[-1][0].to_matrix()), qargs=[qubit])
+            for qubit in range(layer % 2, 5, 2):
+                circuit.cx(qr[qubit], qr[qubit + 1])
+                target = target.compose(CnotGate().to_matrix(), qargs=[qubit, qubit + 1])
+            circuit.ch(qr[5], qr[0])
+            target = target.compose(Operator(CHGate()), qargs=[5, 0])
+        self.assertEqual(Operator(circuit), target)
+
+    def test_append_instruction_mixed_dims(self):
+        """Test applying a circuit to the qubits of an operator with a qutrit."""
+        dims = (2, 2, 2, 2, 2, 3)
+        mat = self.rand_matrix(96, 96)
+        qr = QuantumRegister(5)
+        circuit = QuantumCircuit(qr)
+        for qubit in range(4):
+            circuit.h(qr[qubit])
+            circuit.cx(qr[qubit], qr[qubit + 1])
+        circuit.cx(qr[4], qr[0])
+        circuit.t(qr[0])
+        circuit.s(qr[4])
+        # The gates do not fit in a single fused block, so the tensor of the
+        # operator is transposed between blocks with subsystems of mixed dims
+        op = Operator(mat, input_dims=dims, output_dims=dims)
+        op._append_instruction(circuit, qargs=[0, 1, 2, 3, 4])
+        target = Operator(mat, input_dims=dims, output_dims=dims).compose(
+            Operator(circuit), qargs=[0, 1, 2, 3, 4])
+        self.assertEqual(op, target)
+
     def test_equal(self):
         """Test __eq__ method"""
         mat = self.rand_matrix(2, 2, real=True)
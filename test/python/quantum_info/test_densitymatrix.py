@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for DensityMatrix quantum state class."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info import Statevector, DensityMatrix
+from qiskit.quantum_info import Operator, Pauli, Kraus, SuperOp
+from qiskit.quantum_info.random import random_state, random_unitary
+from qiskit.quantum_info.random import random_density_matrix
+from qiskit.test import QiskitTestCase
+
+
+class TestDensityMatrix(QiskitTestCase):
+    """Tests for DensityMatrix class."""
+
+    def test_init(self):
+        """Test initialization from matrices and statevectors."""
+        rho = random_density_matrix(4, seed=21)
+        state = DensityMatrix(rho)
+        np.testing.assert_allclose(state.data, rho)
+        self.assertEqual(state.dims(), (2, 2))
+        vec = random_state(6, seed=22)
+        state = DensityMatrix(Statevector(vec, dims=(3, 2)))
+        np.testing.assert_allclose(state.data, np.outer(vec, vec.conj()))
+        self.assertEqual(state.dims(), (3, 2))
+        self.assertEqual(DensityMatrix(vec, dims=(3, 2)), state)
+        self.assertRaises(QiskitError, DensityMatrix, np.ones((2, 3)))
+        self.assertRaises(QiskitError, DensityMatrix, rho, dims=(3,))
+
+    def test_is_valid_and_purity(self):
+        """Test validity checks and purity."""
+        state = DensityMatrix(random_density_matrix(4, seed=23))
+        self.assertTrue(state.is_valid())
+        self.assertAlmostEqual(state.purity(), np.trace(state.data.dot(state.data)).real)
+        self.assertAlmostEqual(DensityMatrix(np.eye(4) / 4).purity(), 0.25)
+        self.assertFalse(DensityMatrix(np.eye(2)).is_valid())
+        self.assertFalse(DensityMatrix(np.diag([1.5, -0.5])).is_valid())
+
+    def test_evolve_operator(self):
+        """Test evolving subsystems by an operator."""
+        rho = random_density_matrix(8, seed=24)
+        state = DensityMatrix(rho)
+        op = random_unitary(4, seed=25)
+        full = Operator(np.eye(8)).compose(op, qargs=[2, 0]).data
+        target = full.dot(rho).dot(full.conj().T)
+        np.testing.assert_allclose(state.evolve(op, qargs=[2, 0]).data, target)
+        self.assertRaises(QiskitError, state.evolve, Operator(np.eye(3)), qargs=[0])
+        np.testing.assert_allclose(state.data, rho)
+
+    def test_evolve_circuit(self):
+        """Test evolving by a circuit matches evolving the statevector."""
+        qr = QuantumRegister(2)
+        circ = QuantumCircuit(qr)
+        circ.h(qr[0])
+        circ.cx(qr[0], qr[1])
+        circ.rz(0.2, qr[1])
+        vec = random_state(8, seed=26)
+        state = DensityMatrix(vec).evolve(circ, qargs=[1, 2])
+        self.assertEqual(state, DensityMatrix(Statevector(vec).evolve(circ, qargs=[1, 2])))
+
+    def test_evolve_channel(self):
+        """Test evolving subsystems by a channel."""
+        rho = random_density_matrix(8, seed=27)
+        state = DensityMatrix(rho)
+        kraus = [np.sqrt(0.7) * np.eye(2), np.sqrt(0.3) * np.diag([1, -1])]
+        target = sum(np.kron(np.eye(4), mat).dot(rho).dot(np.kron(np.eye(4), mat).conj().T)
+                     for mat in kraus)
+        np.testing.assert_allclose(state.evolve(Kraus(kraus), qargs=[0]).data, target,
+                                   atol=1e-10)
+        # Channels in other representations are converted to Kraus form
+        np.testing.assert_allclose(state.evolve(SuperOp(Kraus(kraus)), qargs=[0]).data,
+                                   target, atol=1e-10)
+        self.assertRaises(QiskitError, state.evolve, Kraus(kraus), qargs=[0, 1])
+
+    def test_expectation_value(self):
+        """Test expectation values of Paulis and operators."""
+        rho = random_density_matrix(8, seed=28)
+        state = DensityMatrix(rho)
+        pauli = Pauli.from_label('ZXY')
+        target = np.trace(pauli.to_matrix().dot(rho))
+        self.assertAlmostEqual(state.expectation_value(pauli), target)
+        op = Operator(Pauli.from_label('XZ'))
+        target = np.trace(Operator(np.eye(8)).compose(op, qargs=[2, 1]).data.dot(rho))
+        self.assertAlmostEqual(state.expectation_value(op, qargs=[2, 1]), target)
+
+    def test_expectation_value_type(self):
+        """Test expectation values are complex for any operator representation."""
+        state = DensityMatrix(random_density_matrix(4, seed=5))
+        pauli = Pauli.from_label('ZY')
+        values = [state.expectation_value(pauli), state.expectation_value(Operator(pauli))]
+        for value in values:
+            self.assertIsInstance(value, complex)
+        self.assertAlmostEqual(values[0], values[1])
+
+    def test_probabilities(self):
+        """Test marginal probabilities and sampling."""
+        state = DensityMatrix(np.diag([0.5, 0, 0, 0.5]))
+        np.testing.assert_allclose(state.probabilities(), [0.5, 0, 0, 0.5])
+        np.testing.assert_allclose(state.probabilities([1]), [0.5, 0.5])
+        counts = state.sample_counts(100, seed=29)
+        self.assertEqual(set(counts), {'00', '11'})
+        self.assertEqual(sum(counts.values()), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,6 +20,7 @@ import unittest
 from copy import deepcopy
 import numpy as np
 
+from qiskit.exceptions import QiskitError
 from qiskit.quantum_info import Pauli, pauli_group
 from qiskit.test import QiskitTestCase
 
@@ -249,6 +250,33 @@ class TestPauli(QiskitTestCase):
         """Test pauli to matrix."""
         np.testing.assert_allclose(self.ref_p.to_matrix(), self.ref_matrix)
 
+    def test_to_spmatrix(self):
+        """Test pauli to sparse matrix."""
+        mat = self.ref_p.to_spmatrix()
+        self.assertEqual(mat.nnz, 16)
+        np.testing.assert_allclose(mat.toarray(), self.ref_matrix)
+
+    def test_evolve(self):
+        """Test applying the pauli to a statevector and a density matrix."""
+        rng = np.random.RandomState(12)
+        vec = rng.randn(16) + 1j * rng.randn(16)
+        rho = np.outer(vec, vec.conj())
+        np.testing.assert_allclose(self.ref_p.evolve(vec), self.ref_matrix.dot(vec))
+        np.testing.assert_allclose(self.ref_p.evolve(rho),
+                                   self.ref_matrix.dot(rho).dot(self.ref_matrix.conj().T))
+        with self.assertRaises(QiskitError):
+            self.ref_p.evolve(vec[:8])
+
+    def test_expectation(self):
+        """Test the expectation value of the pauli."""
+        rng = np.random.RandomState(12)
+        vec = rng.randn(16) + 1j * rng.randn(16)
+        rho = np.outer(vec, vec.conj())
+        expected = np.real(np.vdot(vec, self.ref_matrix.dot(vec)))
+        self.assertAlmostEqual(self.ref_p.expectation(vec), expected)
+        self.assertAlmostEqual(self.ref_p.expectation(rho), expected)
+        self.assertAlmostEqual(Pauli.from_label('ZI').expectation([0, 0, 1, 0]), -1)
+
     def test_delete_qubit(self):
         """Test deleting single qubit."""
         p1 = self.ref_p
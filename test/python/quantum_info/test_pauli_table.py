@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=invalid-name
+
+"""Tests for PauliTable class."""
+
+import unittest
+from itertools import combinations
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info import Pauli, PauliTable
+from qiskit.test import QiskitTestCase
+
+
+class TestPauliTable(QiskitTestCase):
+    """Tests for PauliTable class."""
+
+    def setUp(self):
+        rng = np.random.RandomState(1234)
+        self.z = rng.randint(2, size=(20, 3)).astype(bool)
+        self.x = rng.randint(2, size=(20, 3)).astype(bool)
+        self.table = PauliTable(self.z, self.x)
+        self.paulis = [Pauli(z, x) for z, x in zip(self.z, self.x)]
+
+    def test_create(self):
+        """Test the table stores the z and x vectors of each Pauli."""
+        self.assertEqual(self.table.size, 20)
+        self.assertEqual(len(self.table), 20)
+        self.assertEqual(self.table.num_qubits, 3)
+        np.testing.assert_array_equal(self.table.z, self.z)
+        np.testing.assert_array_equal(self.table.x, self.x)
+        self.assertEqual(self.table.to_paulis(), self.paulis)
+        self.assertEqual(PauliTable.from_paulis(self.paulis), self.table)
+
+    def test_many_qubits(self):
+        """Test Paulis on more qubits than fit in one packed word."""
+        labels = ['X' * 70, 'I' * 35 + 'Y' * 35, 'Z' + 'I' * 69]
+        table = PauliTable.from_labels(labels)
+        self.assertEqual(table.num_qubits, 70)
+        self.assertEqual(table.to_labels(), labels)
+        np.testing.assert_array_equal(table.commutes(table[[0]]), [True, False, False])
+
+    def test_labels(self):
+        """Test conversion from and to labels."""
+        labels = ['IZXY', 'YYII', 'ZIIX']
+        table = PauliTable.from_labels(labels)
+        self.assertEqual(table.to_labels(), labels)
+        self.assertEqual(table[0], Pauli.from_label('IZXY'))
+        self.assertEqual(table[-1], Pauli.from_label('ZIIX'))
+        self.assertEqual(table[1:], PauliTable.from_labels(labels[1:]))
+        with self.assertRaises(QiskitError):
+            PauliTable.from_labels(['IZ', 'IA'])
+        with self.assertRaises(QiskitError):
+            PauliTable.from_labels(['IZ', 'IZX'])
+
+    def test_mul(self):
+        """Test row by row multiplication without phases."""
+        other = self.table[::-1]
+        expected = [p1 * p2 for p1, p2 in zip(self.paulis, self.paulis[::-1])]
+        self.assertEqual((self.table * other).to_paulis(), expected)
+
+    def test_sgn_prod(self):
+        """Test row by row multiplication with phases matches Pauli.sgn_prod."""
+        table, phases = self.table.sgn_prod(self.table[::-1])
+        for i, (p1, p2) in enumerate(zip(self.paulis, self.paulis[::-1])):
+            pauli, phase = Pauli.sgn_prod(p1, p2)
+            self.assertEqual(table[i], pauli)
+            self.assertEqual(phases[i], phase)
+
+    def test_sgn_prod_broadcast(self):
+        """Test multiplying every row by a single Pauli."""
+        table, phases = PauliTable.from_labels(['X', 'Y', 'Z']).sgn_prod(
+            Pauli.from_label('Y'))
+        self.assertEqual(table.to_labels(), ['Z', 'I', 'X'])
+        np.testing.assert_array_equal(phases, [1j, 1, -1j])
+        with self.assertRaises(QiskitError):
+            self.table.sgn_prod(self.table[:2])
+        with self.assertRaises(QiskitError):
+            self.table.sgn_prod(Pauli.from_label('X'))
+
+    def test_kron(self):
+        """Test row by row Kronecker product matches Pauli.kron."""
+        table = self.table.kron(PauliTable.from_labels(['XY']))
+        expected = [Pauli(p.z, p.x).kron(Pauli.from_label('XY')) for p in self.paulis]
+        self.assertEqual(table.to_paulis(), expected)
+
+    def test_commutes(self):
+        """Test commutation checks match the matrix commutators."""
+        other = self.table[::-1]
+        commutes = self.table.commutes(other)
+        for i, (p1, p2) in enumerate(zip(self.paulis, self.paulis[::-1])):
+            mat1, mat2 = p1.to_matrix(), p2.to_matrix()
+            self.assertEqual(commutes[i], np.allclose(mat1.dot(mat2), mat2.dot(mat1)))
+
+    def test_commutes_qubitwise(self):
+        """Test qubit-wise commutation checks."""
+        table = PauliTable.from_labels(['XX', 'XI', 'YY', 'ZZ'])
+        np.testing.assert_array_equal(table.commutes_qubitwise(table[[0]]),
+                                      [True, True, False, False])
+        np.testing.assert_array_equal(table.commutes(table[[0]]),
+                                      [True, True, True, True])
+
+    def test_group_commuting(self):
+        """Test grouping into sets of commuting Paulis."""
+        for qubit_wise in [False, True]:
+            groups = self.table.group_commuting(qubit_wise=qubit_wise)
+            self.assertEqual(sorted(np.concatenate(groups)), list(range(20)))
+            for group in groups:
+                for i, j in combinations(group, 2):
+                    if qubit_wise:
+                        self.assertTrue(self.table.commutes_qubitwise(self.table[[j]])[i])
+                    else:
+                        self.assertTrue(self.table.commutes(self.table[[j]])[i])
+
+        groups = PauliTable.from_labels(['XX', 'ZZ', 'XI', 'ZI']).group_commuting()
+        self.assertEqual([list(group) for group in groups], [[0, 1], [2], [3]])
+        groups = PauliTable.from_labels(['XX', 'ZZ', 'XI', 'ZI']).group_commuting(
+            qubit_wise=True)
+        self.assertEqual([list(group) for group in groups], [[0, 2], [1, 3]])
+
+    def test_to_spmatrix(self):
+        """Test the weighted sum of the Paulis as a sparse matrix."""
+        coeffs = np.arange(20) - 0.5j
+        expected = sum(coeff * pauli.to_matrix() for coeff, pauli in zip(coeffs, self.paulis))
+        np.testing.assert_allclose(self.table.to_spmatrix(coeffs).toarray(), expected)
+        np.testing.assert_allclose(self.table[[3]].to_spmatrix().toarray(),
+                                   self.paulis[3].to_matrix())
+        with self.assertRaises(QiskitError):
+            self.table.to_spmatrix([1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the random quantum information object generators."""
+
+import unittest
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.random import random_state, random_states
+from qiskit.quantum_info.random import random_unitary, random_unitaries
+from qiskit.quantum_info.random import random_density_matrix, random_density_matrices
+from qiskit.test import QiskitTestCase
+
+
+class TestRandom(QiskitTestCase):
+    """Tests for the random generators."""
+
+    def test_random_states(self):
+        """Test a batch of random states."""
+        states = random_states(50, 8, seed=10)
+        self.assertEqual(states.shape, (50, 8))
+        np.testing.assert_allclose(np.linalg.norm(states, axis=1), np.ones(50))
+        np.testing.assert_allclose(states[0], random_state(8, seed=10))
+        rng = np.random.RandomState(10)
+        np.testing.assert_allclose(states[:3], [random_state(8, seed=rng) for _ in range(3)])
+
+    def test_random_unitaries(self):
+        """Test a batch of random unitaries."""
+        unitaries = random_unitaries(50, 4, seed=11)
+        self.assertEqual(unitaries.shape, (50, 4, 4))
+        for mat in unitaries:
+            np.testing.assert_allclose(mat.dot(mat.conj().T), np.eye(4), atol=1e-10)
+        np.testing.assert_allclose(unitaries[0], random_unitary(4, seed=11).data)
+        rng = np.random.RandomState(11)
+        np.testing.assert_allclose(unitaries[:3],
+                                   [random_unitary(4, seed=rng).data for _ in range(3)])
+        self.assertEqual(random_unitaries(2, 3, seed=11).shape, (2, 3, 3))
+        self.assertRaises(QiskitError, random_unitaries, 2, 0)
+
+    def test_random_density_matrices(self):
+        """Test a batch of random density matrices."""
+        for method in ['Hilbert-Schmidt', 'Bures']:
+            rhos = random_density_matrices(20, 4, rank=2, method=method, seed=12)
+            self.assertEqual(rhos.shape, (20, 4, 4))
+            for rho in rhos:
+                np.testing.assert_allclose(np.trace(rho), 1)
+                np.testing.assert_allclose(rho, rho.conj().T, atol=1e-10)
+                self.assertEqual(np.linalg.matrix_rank(rho), 2)
+            np.testing.assert_allclose(
+                rhos, random_density_matrices(20, 4, rank=2, method=method, seed=12))
+        np.testing.assert_allclose(random_density_matrices(3, 4, seed=13)[0],
+                                   random_density_matrix(4, seed=13))
+        self.assertRaises(QiskitError, random_density_matrices, 2, 4, method='Other')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,8 @@
 
 """Quick program to test the quantum information states modules."""
 
+import os
+import tempfile
 import unittest
 import numpy as np
 
@@ -24,9 +26,26 @@ from qiskit.quantum_info import basis_state, random_state
 from qiskit.quantum_info import state_fidelity
 from qiskit.quantum_info import projector
 from qiskit.quantum_info import purity
+from qiskit.quantum_info import partial_trace, partial_trace_stream
+from qiskit.quantum_info import Statevector, DensityMatrix
+from qiskit.exceptions import QiskitError
 from qiskit.test import QiskitTestCase
 
 
+class _ReadRecorder(np.ndarray):
+    """Array recording the sizes of the blocks read from it."""
+
+    def __array_finalize__(self, obj):
+        # pylint: disable=attribute-defined-outside-init
+        self.reads = getattr(obj, 'reads', None)
+
+    def __getitem__(self, key):
+        block = super().__getitem__(key)
+        if self.reads is not None:
+            self.reads.append(np.size(block))
+        return block
+
+
 class TestStates(QiskitTestCase):
     """Tests for qi.py"""
 
@@ -158,6 +177,57 @@ class TestStates(QiskitTestCase):
         self.assertEqual(purity(state_1), 0.5)
         self.assertEqual(purity(state_2), 1.0/3)
 
+    def test_partial_trace(self):
+        psi = [random_state(2, seed=1), random_state(3, seed=2), random_state(2, seed=3)]
+        rhos = [np.outer(vec, vec.conj()) for vec in psi]
+        vec = np.kron(psi[2], np.kron(psi[1], psi[0]))
+        for state in [Statevector(vec, dims=(2, 3, 2)), DensityMatrix(vec, dims=(2, 3, 2))]:
+            reduced = partial_trace(state, [1])
+            self.assertEqual(reduced.dims(), (2, 2))
+            np.testing.assert_allclose(reduced.data, np.kron(rhos[2], rhos[0]), atol=1e-10)
+            reduced = partial_trace(state, [2, 0])
+            np.testing.assert_allclose(reduced.data, rhos[1], atol=1e-10)
+        self.assertRaises(QiskitError, partial_trace, Statevector(vec), [3])
+        self.assertRaises(QiskitError, partial_trace, vec, [0])
+
+    def test_partial_trace_stream(self):
+        vec = random_state(2 ** 6, seed=4)
+        state = Statevector(vec)
+        for qargs in [[0], [5], [1, 4], [4, 1, 2], [0, 1, 2, 3, 4]]:
+            target = partial_trace(state, qargs)
+            for chunk_size in [1, 4, 16, 2 ** 6]:
+                np.testing.assert_allclose(
+                    partial_trace_stream(vec, qargs, chunk_size=chunk_size).data,
+                    target.data, atol=1e-10)
+        # memory-mapped statevector
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            mapped = np.memmap(path, dtype=complex, mode='w+', shape=vec.shape)
+            mapped[:] = vec
+            mapped.flush()
+            mapped = np.memmap(path, dtype=complex, mode='r', shape=vec.shape)
+            reduced = partial_trace_stream(mapped, [0, 2, 3, 5], chunk_size=8)
+            del mapped
+        finally:
+            os.remove(path)
+        self.assertEqual(reduced, partial_trace(state, [0, 2, 3, 5]))
+        self.assertRaises(QiskitError, partial_trace_stream, vec, [0], dims=(2, 3))
+
+    def test_partial_trace_stream_chunk_size(self):
+        vec = random_state(2 ** 6, seed=7)
+        state = Statevector(vec)
+        # The remaining subsystems have a dimension larger than chunk_size
+        for qargs in [[0], [5], [2, 3], []]:
+            for chunk_size in [2, 8]:
+                recorder = vec.view(_ReadRecorder)
+                recorder.reads = []
+                reduced = partial_trace_stream(recorder, qargs, chunk_size=chunk_size)
+                np.testing.assert_allclose(reduced.data, partial_trace(state, qargs).data,
+                                           atol=1e-10)
+                self.assertTrue(recorder.reads)
+                self.assertLessEqual(max(recorder.reads), chunk_size // 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for Statevector quantum state class."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.exceptions import QiskitError
+from qiskit.extensions.standard import HGate, CnotGate
+from qiskit.quantum_info import Statevector, DensityMatrix
+from qiskit.quantum_info import Operator, Pauli, Kraus
+from qiskit.quantum_info.random import random_state, random_unitary
+from qiskit.test import QiskitTestCase
+
+
+class TestStatevector(QiskitTestCase):
+    """Tests for Statevector class."""
+
+    def test_init(self):
+        """Test initialization and automatic subsystem dimensions."""
+        vec = random_state(8, seed=11)
+        state = Statevector(vec)
+        np.testing.assert_allclose(state.data, vec)
+        self.assertEqual(state.dims(), (2, 2, 2))
+        self.assertEqual(state.dim, 8)
+        self.assertEqual(Statevector(vec.reshape(8, 1)), state)
+        self.assertEqual(Statevector(state), state)
+        self.assertEqual(Statevector(np.ones(6) / np.sqrt(6)).dims(), (6,))
+        self.assertEqual(Statevector(np.ones(6) / np.sqrt(6), dims=(2, 3)).dims(), (2, 3))
+        self.assertRaises(QiskitError, Statevector, np.eye(2))
+        self.assertRaises(QiskitError, Statevector, vec, dims=(2, 2))
+        self.assertRaises(QiskitError, Statevector, 'state')
+
+    def test_is_valid_and_purity(self):
+        """Test the norm based validity check and purity."""
+        state = Statevector(random_state(4, seed=12))
+        self.assertTrue(state.is_valid())
+        self.assertAlmostEqual(state.purity(), 1.0)
+        self.assertFalse(Statevector([1, 1]).is_valid())
+
+    def test_evolve_operator(self):
+        """Test evolving subsystems by an operator."""
+        dims = (2, 3, 2)
+        vec = random_state(12, seed=13)
+        state = Statevector(vec, dims=dims)
+        rng = np.random.RandomState(14)
+        mat = np.linalg.qr(rng.randn(6, 6) + 1j * rng.randn(6, 6))[0]
+        op = Operator(mat, input_dims=(2, 3), output_dims=(2, 3))
+        identity = Operator(np.eye(12), input_dims=dims, output_dims=dims)
+        target = identity.compose(op, qargs=[0, 1]).data.dot(vec)
+        np.testing.assert_allclose(state.evolve(op, qargs=[0, 1]).data, target)
+        op2 = random_unitary(4, seed=15)
+        target = identity.compose(op2, qargs=[2, 0]).data.dot(vec)
+        np.testing.assert_allclose(state.evolve(op2, qargs=[2, 0]).data, target)
+        self.assertRaises(QiskitError, state.evolve, op2, qargs=[0, 1])
+        # The original state is unchanged
+        np.testing.assert_allclose(state.data, vec)
+
+    def test_evolve_circuit(self):
+        """Test evolving by a circuit matches the circuit operator."""
+        qr = QuantumRegister(3)
+        circ = QuantumCircuit(qr)
+        circ.h(qr[0])
+        circ.cx(qr[0], qr[1])
+        circ.ry(0.3, qr[2])
+        circ.cz(qr[2], qr[0])
+        state = Statevector(random_state(16, seed=16))
+        target = Operator(np.eye(2)).tensor(Operator(circ))
+        np.testing.assert_allclose(state.evolve(circ, qargs=[0, 1, 2]).data,
+                                   target.data.dot(state.data))
+        bell = Statevector([1, 0, 0, 0]).evolve(HGate(), [0]).evolve(CnotGate(), [0, 1])
+        self.assertEqual(bell, Statevector(np.array([1, 0, 0, 1]) / np.sqrt(2)))
+        self.assertRaises(QiskitError, state.evolve, circ, qargs=[0, 1])
+
+    def test_evolve_channel(self):
+        """Test evolving by a channel returns a density matrix."""
+        state = Statevector([1, 0, 0, 0])
+        channel = Kraus([np.sqrt(0.5) * np.eye(2), np.sqrt(0.5) * np.array([[0, 1], [1, 0]])])
+        rho = state.evolve(channel, qargs=[1])
+        self.assertIsInstance(rho, DensityMatrix)
+        np.testing.assert_allclose(rho.data, np.diag([0.5, 0, 0.5, 0]), atol=1e-10)
+
+    def test_expectation_value(self):
+        """Test expectation values of Paulis and operators."""
+        vec = random_state(8, seed=17)
+        state = Statevector(vec)
+        pauli = Pauli.from_label('XYZ')
+        target = np.vdot(vec, pauli.to_matrix().dot(vec))
+        self.assertAlmostEqual(state.expectation_value(pauli), target)
+        self.assertAlmostEqual(state.expectation_value(Operator(pauli)), target)
+        op = Operator(Pauli.from_label('XZ'))
+        target = np.vdot(vec, np.kron(np.eye(2), op.data).dot(vec))
+        self.assertAlmostEqual(state.expectation_value(op, qargs=[0, 1]), target)
+
+    def test_expectation_value_type(self):
+        """Test expectation values are complex for any operator representation."""
+        state = Statevector(random_state(4, seed=5))
+        pauli = Pauli.from_label('XY')
+        values = [state.expectation_value(pauli), state.expectation_value(Operator(pauli))]
+        for value in values:
+            self.assertIsInstance(value, complex)
+        self.assertAlmostEqual(values[0], values[1])
+
+    def test_probabilities(self):
+        """Test marginal probabilities of subsystems."""
+        # |psi> = |011> with qubit 0 least significant
+        state = Statevector(np.eye(8)[3])
+        np.testing.assert_allclose(state.probabilities(), np.eye(8)[3])
+        np.testing.assert_allclose(state.probabilities([0]), [0, 1])
+        np.testing.assert_allclose(state.probabilities([2]), [1, 0])
+        np.testing.assert_allclose(state.probabilities([0, 2]), [0, 1, 0, 0])
+        np.testing.assert_allclose(state.probabilities([2, 0]), [0, 0, 1, 0])
+        state = Statevector(random_state(8, seed=18))
+        probs = np.abs(state.data.reshape(2, 2, 2)) ** 2
+        np.testing.assert_allclose(state.probabilities([1, 2]),
+                                   np.sum(probs, axis=2).reshape(4))
+
+    def test_sample_counts(self):
+        """Test sampling measurement outcomes."""
+        state = Statevector(np.array([1, 0, 0, 1]) / np.sqrt(2))
+        counts = state.sample_counts(1000, seed=19)
+        self.assertEqual(set(counts), {'00', '11'})
+        self.assertEqual(sum(counts.values()), 1000)
+        self.assertEqual(counts, state.sample_counts(1000, seed=19))
+        self.assertEqual(Statevector(np.eye(8)[3]).sample_counts(10, qargs=[2, 0]),
+                         {'10': 10})
+        memory = state.sample_memory(20, seed=19)
+        self.assertEqual(len(memory), 20)
+        self.assertTrue(all(label in ['00', '11'] for label in memory))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,7 +17,7 @@
 
 import unittest
 
-from qiskit.dagcircuit import DAGCircuit
+from qiskit.dagcircuit import DAGCircuit, DAGLayer
 from qiskit.circuit import QuantumRegister
 from qiskit.circuit import ClassicalRegister
 from qiskit.circuit import QuantumCircuit
@@ -30,7 +30,7 @@ from qiskit.extensions.standard.x import XGate
 from qiskit.extensions.standard.u1 import U1Gate
 from qiskit.extensions.standard.barrier import Barrier
 from qiskit.dagcircuit.exceptions import DAGCircuitError
-from qiskit.converters import circuit_to_dag
+from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.test import QiskitTestCase
 
 
@@ -279,6 +279,39 @@ class TestDagOperations(QiskitTestCase):
                     ('h', [(QuantumRegister(3, 'qr'), 2)])]
         self.assertEqual(expected, [(i.name, i.qargs) for i in named_nodes])
 
+    def test_topological_op_nodes_after_edits(self):
+        """The topological order follows every modification of the dag."""
+        self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1], [])
+        self.dag.apply_operation_back(HGate(), [self.qubit0], [])
+        self.dag.apply_operation_back(CnotGate(), [self.qubit2, self.qubit1], [])
+        self.dag.apply_operation_back(XGate(), [self.qubit2], [])
+
+        def assert_order_is_current():
+            expected = circuit_to_dag(dag_to_circuit(self.dag)).topological_op_nodes()
+            self.assertEqual([(node.name, node.qargs) for node in expected],
+                             [(node.name, node.qargs)
+                              for node in self.dag.topological_op_nodes()])
+
+        assert_order_is_current()
+        replacement = DAGCircuit()
+        qreg = QuantumRegister(2, 'r')
+        replacement.add_qreg(qreg)
+        replacement.apply_operation_back(XGate(), [qreg[1]], [])
+        replacement.apply_operation_back(CnotGate(), [qreg[1], qreg[0]], [])
+        self.dag.substitute_node_with_dag(self.dag.named_nodes('cx')[0], replacement)
+        assert_order_is_current()
+        self.dag.substitute_node(self.dag.named_nodes('h')[0], XGate())
+        assert_order_is_current()
+        self.dag.remove_op_node(self.dag.named_nodes('x')[0])
+        assert_order_is_current()
+        self.dag.apply_operation_front(HGate(), [self.qubit1], [])
+        assert_order_is_current()
+        self.dag.remove_op_nodes(list(self.dag.topological_op_nodes())[:2])
+        assert_order_is_current()
+        self.dag.add_qreg(QuantumRegister(1, 'q2'))
+        self.dag.apply_operation_back(HGate(), [self.dag.qubits()[-1]], [])
+        assert_order_is_current()
+
     def test_dag_nodes_on_wire(self):
         """Test that listing the gates on a qubit/classical bit gets the correct gates"""
         self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1], [])
@@ -352,6 +385,39 @@ class TestDagOperations(QiskitTestCase):
         in_node = next(self.dag.topological_nodes())
         self.assertRaises(DAGCircuitError, self.dag.remove_op_node, in_node)
 
+    def test_remove_op_nodes(self):
+        """Test remove_op_nodes method with a run of nodes."""
+        self.dag.apply_operation_back(HGate(), [self.qubit0])
+        self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1])
+        self.dag.apply_operation_back(HGate(), [self.qubit0])
+        self.dag.apply_operation_back(XGate(), [self.qubit0])
+        self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1])
+
+        op_nodes = list(self.dag.topological_op_nodes())
+        self.dag.remove_op_nodes(op_nodes[1:4])
+
+        expected = [('h', [self.qubit0]),
+                    ('cx', [self.qubit0, self.qubit1])]
+        self.assertEqual(expected,
+                         [(i.name, i.qargs) for i in self.dag.topological_op_nodes()])
+        self.assertEqual(self.dag.depth(), 2)
+
+        in_node = next(self.dag.topological_nodes())
+        self.assertRaises(DAGCircuitError, self.dag.remove_op_nodes, [in_node])
+
+    def test_substitute_node(self):
+        """Test substitute_node method."""
+        self.dag.apply_operation_back(HGate(), [self.qubit0])
+        self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1])
+
+        h_node, cx_node = list(self.dag.topological_op_nodes())
+        self.dag.substitute_node(h_node, XGate())
+
+        self.assertEqual(h_node.name, 'x')
+        self.assertEqual([(i.name, i.qargs) for i in self.dag.topological_op_nodes()],
+                         [('x', [self.qubit0]), ('cx', [self.qubit0, self.qubit1])])
+        self.assertRaises(DAGCircuitError, self.dag.substitute_node, cx_node, XGate())
+
     def test_dag_collect_runs(self):
         """Test the collect_runs method with 3 different gates."""
         self.dag.apply_operation_back(U1Gate(3.14), [self.qubit0])
@@ -410,6 +476,30 @@ class TestDagOperations(QiskitTestCase):
             self.assertEqual(['h'], [x.name for x in run])
             self.assertEqual([[self.qubit0]], [x.qargs for x in run])
 
+    def test_modified_wires(self):
+        """The wires of added, removed and substituted nodes are tracked."""
+        self.assertEqual(self.dag.modified_wires(),
+                         {self.qubit0, self.qubit1, self.qubit2, self.clbit0, self.clbit1})
+        self.dag.reset_modified_wires()
+        self.assertEqual(self.dag.modified_wires(), set())
+
+        h_node = self.dag.apply_operation_back(HGate(), [self.qubit0])
+        self.dag.apply_operation_back(XGate(), [self.qubit1], condition=self.condition)
+        self.assertEqual(self.dag.modified_wires(),
+                         {self.qubit0, self.qubit1, self.clbit0, self.clbit1})
+
+        self.dag.reset_modified_wires()
+        self.dag.remove_op_node(h_node)
+        self.assertEqual(self.dag.modified_wires(), {self.qubit0})
+
+        self.dag.reset_modified_wires()
+        cx_node = self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit2])
+        self.dag.reset_modified_wires()
+        empty = DAGCircuit()
+        empty.add_qreg(QuantumRegister(2))
+        self.dag.substitute_node_with_dag(cx_node, empty)
+        self.assertEqual(self.dag.modified_wires(), {self.qubit0, self.qubit2})
+
 
 class TestDagLayers(QiskitTestCase):
     """Test finding layers on the dag"""
@@ -449,6 +539,43 @@ class TestDagLayers(QiskitTestCase):
             ['measure', 'measure']
         ], name_layers)
 
+    def test_layers_views(self):
+        """The layers share the nodes of the dag and build their graph on demand."""
+        qreg = QuantumRegister(3, 'qr')
+        creg = ClassicalRegister(1, 'cr')
+        dag = DAGCircuit()
+        dag.add_qreg(qreg)
+        dag.add_creg(creg)
+        dag.apply_operation_back(HGate(), [qreg[0]], [])
+        dag.apply_operation_back(CnotGate(), [qreg[1], qreg[2]], [])
+        dag.apply_operation_back(CnotGate(), [qreg[0], qreg[1]], [])
+        dag.apply_operation_back(XGate(), [qreg[2]], [], condition=(creg, 1))
+
+        layers = list(dag.layers())
+        self.assertEqual([[node.name for node in layer.nodes] for layer in layers],
+                         [['h', 'cx'], ['cx', 'x']])
+        self.assertEqual(layers[0].partition, [[qreg[0]], [qreg[1], qreg[2]]])
+        self.assertEqual(layers[0]['partition'], layers[0].partition)
+        dag_nodes = dag.op_nodes()
+        for layer in layers:
+            self.assertIsInstance(layer, DAGLayer)
+            self.assertIsNone(layer._graph)
+            for node in layer.nodes:
+                self.assertIn(node, dag_nodes)
+            graph = layer['graph']
+            self.assertIs(layer.graph, graph)
+            self.assertEqual(set(graph.op_nodes()), set(layer.nodes))
+
+        serial_layers = list(dag.serial_layers())
+        self.assertEqual([layer.nodes for layer in serial_layers],
+                         [[node] for node in dag.topological_op_nodes()])
+        x_layer = [layer for layer in serial_layers if layer.nodes[0].name == 'x'][0]
+        self.assertEqual(x_layer.partition, [[qreg[2]]])
+        graph = x_layer.graph
+        self.assertEqual(len(graph.op_nodes()), 1)
+        self.assertEqual(graph.op_nodes()[0].condition, (creg, 1))
+        self.assertEqual(len(graph.wires), len(dag.wires))
+
 
 class TestCircuitProperties(QiskitTestCase):
     """DAGCircuit properties test."""
@@ -28,6 +28,7 @@ from qiskit.tools.qi.qi import shannon_entropy, entropy, mutual_information
 from qiskit.tools.qi.qi import choi_to_rauli, random_density_matrix
 from qiskit.tools.qi.qi import entanglement_of_formation, is_pos_def
 from qiskit.tools.qi.qi import __eof_qubit as eof_qubit
+from qiskit.quantum_info import random_state
 from qiskit.exceptions import QiskitError
 from qiskit.test import QiskitTestCase
 
@@ -62,6 +63,21 @@ class TestQI(QiskitTestCase):
             all_pass &= (np.linalg.norm(i - j) == 0)
         self.assertTrue(all_pass)
 
+    def test_partial_trace_vector(self):
+        """Test partial trace of vectors matches that of their projectors."""
+        vec = random_state(24, seed=5)
+        rho = np.outer(vec, vec.conj())
+        for dims in [[2, 3, 4], [4, 3, 2]]:
+            for reverse in [True, False]:
+                for trace_systems in [[0], [1], [2, 0], [0, 1]]:
+                    np.testing.assert_allclose(
+                        partial_trace(vec, trace_systems, dims, reverse),
+                        partial_trace(rho, trace_systems, dims, reverse), atol=1e-10)
+        # system-0 the left most system
+        rho0 = partial_trace(rho, [1, 2], [4, 3, 2], reverse=False)
+        target = rho.reshape(4, 6, 4, 6).trace(axis1=1, axis2=3)
+        np.testing.assert_allclose(rho0, target, atol=1e-10)
+
     def test_vectorize(self):
         mat = [[1, 2], [3, 4]]
         col = [1, 3, 2, 4]
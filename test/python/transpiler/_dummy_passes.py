@@ -226,3 +226,31 @@ class PassM_AP_NR_NP(DummyAP):
         super().run(dag)
         self.argument1 *= 2
         logging.getLogger(logger).info('self.argument1 = %s', self.argument1)
+
+
+class PassN_AP_incremental(DummyAP):
+    """ A dummy analysis pass that can be updated on the modified wires only.
+    AP: Analysis Pass
+    """
+
+    def run(self, dag):
+        super().run(dag)
+        self.property_set['analyzed_wires'] = len(dag.wires)
+
+    def run_on_wires(self, dag, wires):
+        logging.getLogger(logger).info('run analysis pass %s on %i wires', self.name(),
+                                       len(wires))
+        self.property_set['analyzed_wires'] = len(wires)
+
+
+class PassO_TP_remove_op(DummyTP):
+    """ A dummy transformation pass that removes the first op node of the dag.
+    TP: Transformation Pass
+    """
+
+    def run(self, dag):
+        super().run(dag)
+        op_nodes = dag.op_nodes()
+        if op_nodes:
+            dag.remove_op_node(op_nodes[0])
+        return dag
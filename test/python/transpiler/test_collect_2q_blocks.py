@@ -18,7 +18,7 @@ Tests for the Collect2qBlocks transpiler pass.
 
 import unittest
 
-from qiskit.circuit import QuantumCircuit, QuantumRegister
+from qiskit.circuit import QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit.converters import circuit_to_dag
 from qiskit.transpiler.passes import Collect2qBlocks
 from qiskit.test import QiskitTestCase
@@ -54,6 +54,58 @@ class TestCollect2qBlocks(QiskitTestCase):
         pass_.run(dag)
         self.assertTrue(pass_.property_set['block_list'], [block_1, block_2])
 
+    def test_blocks_closed_by_other_gates(self):
+        """gates outside of the gate set and conditions close the blocks
+                                       ┌─┐
+         q0:--[u1]--.-------.---------┤M├----
+                    |       |         └╥┘
+         q1:-------(+)-[h]-(+)--.------╫-----
+                                |      ║
+         q2:-------------------(+)-----╫-----
+        """
+        qr = QuantumRegister(3, "qr")
+        cr = ClassicalRegister(1, "cr")
+        qc = QuantumCircuit(qr, cr)
+        qc.u1(0.5, qr[0])
+        qc.cx(qr[0], qr[1])
+        qc.h(qr[1])
+        qc.cx(qr[0], qr[1])
+        qc.cx(qr[1], qr[2])
+        qc.measure(qr[0], cr[0])
+        dag = circuit_to_dag(qc)
+
+        topo_ops = list(dag.topological_op_nodes())
+        pass_ = Collect2qBlocks()
+        pass_.run(dag)
+        self.assertEqual(pass_.property_set['block_list'],
+                         [(topo_ops[0], topo_ops[1]), (topo_ops[3],), (topo_ops[4],)])
+
+        pass_ = Collect2qBlocks(gates=['u1', 'h', 'cx'])
+        pass_.run(dag)
+        self.assertEqual(pass_.property_set['block_list'],
+                         [tuple(topo_ops[:4]), (topo_ops[4],)])
+
+    def test_3q_blocks(self):
+        """blocks of up to max_block_width qubits are collected"""
+        qr = QuantumRegister(4, "qr")
+        qc = QuantumCircuit(qr)
+        qc.u1(0.5, qr[0])
+        qc.cx(qr[0], qr[1])
+        qc.cx(qr[1], qr[2])
+        qc.u2(0.1, 0.2, qr[1])
+        qc.cx(qr[2], qr[3])
+        qc.cx(qr[2], qr[0])
+        dag = circuit_to_dag(qc)
+
+        pass_ = Collect2qBlocks(max_block_width=3)
+        pass_.run(dag)
+        block_list = [[(nd.name, nd.qargs) for nd in block]
+                      for block in pass_.property_set['block_list']]
+        self.assertEqual(block_list,
+                         [[('u1', [qr[0]]), ('cx', [qr[0], qr[1]]), ('cx', [qr[1], qr[2]]),
+                           ('u2', [qr[1]])],
+                          [('cx', [qr[2], qr[3]]), ('cx', [qr[2], qr[0]])]])
+
 
 if __name__ == '__main__':
     unittest.main()
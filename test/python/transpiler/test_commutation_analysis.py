@@ -286,6 +286,32 @@ class TestCommutationAnalysis(QiskitTestCase):
                     'qr[4]': [[9], [13, 16, 19], [10]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
+    def test_run_on_wires(self):
+        """Test updating the commutation sets on the modified wires only"""
+        qr = QuantumRegister(3, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.x(qr[1])
+        circuit.z(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.h(qr[2])
+        dag = circuit_to_dag(circuit)
+        self.pass_.run(dag)
+
+        x_node = dag.named_nodes('x')[0]
+        h_node = dag.named_nodes('h')[0]
+        dag.reset_modified_wires()
+        dag.remove_op_node(x_node)
+        self.pass_.run_on_wires(dag, dag.modified_wires())
+
+        self.assertNotIn((x_node, 'qr[1]'), self.pset['commutation_set'])
+        self.assertIn((h_node, 'qr[2]'), self.pset['commutation_set'])
+
+        expected = CommutationAnalysis()
+        expected.property_set = PropertySet()
+        expected.run(dag)
+        self.assertEqual(self.pset['commutation_set'], expected.property_set['commutation_set'])
+
 
 if __name__ == '__main__':
     unittest.main()
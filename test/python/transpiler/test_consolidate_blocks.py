@@ -23,7 +23,11 @@ from qiskit.circuit import QuantumCircuit, QuantumRegister
 from qiskit.extensions import UnitaryGate
 from qiskit.converters import circuit_to_dag
 from qiskit.execute import execute
-from qiskit.transpiler.passes import ConsolidateBlocks
+from qiskit.compiler import transpile
+from qiskit.transpiler import PassManager
+from qiskit.transpiler.passes import Collect2qBlocks, ConsolidateBlocks
+from qiskit.quantum_info import Operator
+from qiskit.quantum_info.operators.predicates import matrix_equal
 from qiskit.providers.basicaer import UnitarySimulatorPy
 from qiskit.quantum_info.operators.measures import process_fidelity
 from qiskit.test import QiskitTestCase
@@ -146,6 +150,27 @@ class TestConsolidateBlocks(QiskitTestCase):
         fidelity = process_fidelity(new_dag.op_nodes()[0].op.to_matrix(), unitary.to_matrix())
         self.assertAlmostEqual(fidelity, 1.0, places=7)
 
+    def test_collected_blocks_with_gates_in_between(self):
+        """blocks from Collect2qBlocks and the gates in between keep their order"""
+        qr = QuantumRegister(3, "qr")
+        qc = QuantumCircuit(qr)
+        qc.cx(qr[2], qr[0])
+        qc.cx(qr[2], qr[1])
+        qc.cx(qr[2], qr[0])
+        qc.h(qr[0])
+        qc.u1(0.3, qr[2])
+        qc.cx(qr[2], qr[0])
+        qc.h(qr[0])
+        qc.cx(qr[0], qr[1])
+
+        pass_manager = PassManager()
+        pass_manager.append(Collect2qBlocks())
+        pass_manager.append(ConsolidateBlocks())
+        result = transpile(qc, pass_manager=pass_manager)
+
+        self.assertEqual(result.count_ops(), {'unitary': 5, 'h': 2})
+        self.assertTrue(matrix_equal(Operator(qc).data, Operator(result).data))
+
 
 if __name__ == '__main__':
     unittest.main()
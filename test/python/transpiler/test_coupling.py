@@ -44,6 +44,12 @@ class CouplingTest(QiskitTestCase):
         result = coupling.distance(physical_qubits[0], physical_qubits[1])
         self.assertEqual(1, result)
 
+    def test_coupling_distance_matrix(self):
+        coupling = CouplingMap([(0, 1), (2, 1), (3, 2)])
+        expected = [[0, 1, 2, 3], [1, 0, 1, 2], [2, 1, 0, 1], [3, 2, 1, 0]]
+        self.assertEqual(coupling.distance_matrix.tolist(), expected)
+        self.assertEqual(coupling.distance(3, 0), 3)
+
     def test_add_physical_qubits(self):
         coupling = CouplingMap()
         self.assertEqual("", str(coupling))
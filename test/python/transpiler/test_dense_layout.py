@@ -15,11 +15,15 @@
 """Test the DenseLayout pass"""
 
 import unittest
+from datetime import datetime
 
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.transpiler import CouplingMap
 from qiskit.transpiler.passes import DenseLayout
+from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.converters import circuit_to_dag
+from qiskit.providers.models import BackendProperties
+from qiskit.providers.models.backendproperties import Nduv, Gate
 from qiskit.test import QiskitTestCase
 from qiskit.test.mock import FakeTokyo
 
@@ -72,6 +76,50 @@ class TestDenseLayout(QiskitTestCase):
         self.assertEqual(layout[qr1[1]], 1)
         self.assertEqual(layout[qr1[2]], 0)
 
+    def test_backend_prop_errors(self):
+        """Test the most connected subset with the lowest errors is chosen.
+        """
+        calib_time = datetime(year=2019, month=2, day=1, hour=0, minute=0, second=0)
+        qubit_list = [[Nduv(name="readout_error", date=calib_time, unit="", value=0.01)]
+                      for _ in range(5)]
+        edges = [[0, 1], [1, 0], [1, 2], [2, 1], [2, 3], [3, 2], [3, 4], [4, 3]]
+        gate_list = []
+        for qubit0, qubit1 in edges:
+            error = 0.01 if {qubit0, qubit1} == {2, 3} else 0.1
+            gate_list.append(Gate(name="CX%d_%d" % (qubit0, qubit1), gate="cx",
+                                  qubits=[qubit0, qubit1],
+                                  parameters=[Nduv(date=calib_time, name='gate_error',
+                                                   unit='', value=error)]))
+        bprop = BackendProperties(last_update_date=calib_time, backend_name="test_backend",
+                                  qubits=qubit_list, backend_version="1.0.0", gates=gate_list,
+                                  general=[])
+        qr = QuantumRegister(2, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        dag = circuit_to_dag(circuit)
+
+        pass_ = DenseLayout(CouplingMap(edges))
+        pass_.run(dag)
+        layout = pass_.property_set['layout']
+        self.assertEqual({layout[qr[0]], layout[qr[1]]}, {0, 1})
+
+        pass_ = DenseLayout(CouplingMap(edges), backend_prop=bprop)
+        pass_.run(dag)
+        layout = pass_.property_set['layout']
+        self.assertEqual({layout[qr[0]], layout[qr[1]]}, {2, 3})
+
+    def test_disconnected_coupling(self):
+        """Test an error is raised if no subset of the circuit width is connected.
+        """
+        qr = QuantumRegister(3, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        dag = circuit_to_dag(circuit)
+
+        pass_ = DenseLayout(CouplingMap([[0, 1], [2, 3]]))
+        with self.assertRaises(TranspilerError):
+            pass_.run(dag)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -130,6 +130,55 @@ class TestNoiseAdaptiveLayout(QiskitTestCase):
             for qloc in [0, 2]:
                 self.assertNotEqual(initial_layout[qr[qid]], qloc)
 
+    def test_swap_costs(self):
+        """Test the reliability of CNOTs through swaps on a linear topology."""
+        calib_time = datetime(year=2019, month=2, day=1, hour=0, minute=0, second=0)
+        qr = QuantumRegister(2, name='q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        dag = circuit_to_dag(circuit)
+        qubit_list = [make_qubit_with_error(0.01) for _ in range(3)]
+        p01 = [Nduv(date=calib_time, name='gate_error', unit='', value=0.1)]
+        g01 = Gate(name="CX0_1", gate="cx", parameters=p01, qubits=[0, 1])
+        p12 = [Nduv(date=calib_time, name='gate_error', unit='', value=0.2)]
+        g12 = Gate(name="CX1_2", gate="cx", parameters=p12, qubits=[1, 2])
+        bprop = BackendProperties(last_update_date=calib_time, backend_name="test_backend",
+                                  qubits=qubit_list, backend_version="1.0.0",
+                                  gates=[g01, g12], general=[])
+        nalayout = NoiseAdaptiveLayout(bprop)
+        nalayout.run(dag)
+        self.assertAlmostEqual(nalayout.swap_costs[0][1], 0.9)
+        self.assertAlmostEqual(nalayout.swap_costs[2][1], 0.8)
+        self.assertAlmostEqual(nalayout.swap_costs[0][2], 0.9 ** 3 * 0.8)
+        self.assertAlmostEqual(nalayout.swap_costs[2][0], 0.8 ** 3 * 0.9)
+
+    def test_shared_calibration(self):
+        """Test the swap costs of a calibration are shared between passes."""
+        calib_time = datetime(year=2019, month=2, day=1, hour=0, minute=0, second=0)
+        qr = QuantumRegister(2, name='q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        dag = circuit_to_dag(circuit)
+
+        def make_bprop(cx_error):
+            qubit_list = [make_qubit_with_error(0.01) for _ in range(3)]
+            p01 = [Nduv(date=calib_time, name='gate_error', unit='', value=cx_error)]
+            g01 = Gate(name="CX0_1", gate="cx", parameters=p01, qubits=[0, 1])
+            p12 = [Nduv(date=calib_time, name='gate_error', unit='', value=0.1)]
+            g12 = Gate(name="CX1_2", gate="cx", parameters=p12, qubits=[1, 2])
+            return BackendProperties(last_update_date=calib_time, backend_name="test_backend",
+                                     qubits=qubit_list, backend_version="1.0.0",
+                                     gates=[g01, g12], general=[])
+
+        layouts = []
+        for bprop in [make_bprop(0.1), make_bprop(0.1), make_bprop(0.9)]:
+            nalayout = NoiseAdaptiveLayout(bprop)
+            nalayout.run(dag)
+            layouts.append(nalayout)
+        self.assertIs(layouts[0].swap_costs, layouts[1].swap_costs)
+        self.assertIsNot(layouts[0].swap_costs, layouts[2].swap_costs)
+        self.assertAlmostEqual(layouts[2].swap_costs[0][1], 0.1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -22,10 +22,13 @@ from qiskit import QuantumRegister, QuantumCircuit, ClassicalRegister
 from qiskit.transpiler import PassManager
 from qiskit.compiler import transpile
 from qiskit.transpiler.passes import Optimize1qGates, Unroller
-from qiskit.converters import circuit_to_dag
+from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.test import QiskitTestCase
 from qiskit.test.mock import FakeRueschlikon
 from qiskit.circuit import Parameter
+from qiskit.quantum_info import Operator
+from qiskit.quantum_info.operators.predicates import matrix_equal
+from qiskit.transpiler.exceptions import TranspilerError
 
 
 class TestOptimize1qGates(QiskitTestCase):
@@ -228,6 +231,63 @@ class TestOptimize1qGates(QiskitTestCase):
 
         self.assertEqual(circuit_to_dag(expected), after)
 
+    def test_merge_native_gates(self):
+        """Runs of native 1q gates are merged into a single u gate."""
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.t(qr[0])
+        circuit.rx(0.3, qr[0])
+        circuit.ry(-1.2, qr[0])
+        circuit.rz(0.7, qr[0])
+        circuit.sdg(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.y(qr[1])
+        circuit.u3(0.1, 0.2, 0.3, qr[1])
+        circuit.s(qr[1])
+        dag = circuit_to_dag(circuit)
+
+        pass_ = Optimize1qGates(['u1', 'u2', 'u3', 'rx', 'ry', 'rz', 'h', 's', 'sdg',
+                                 't', 'y'])
+        after = pass_.run(dag)
+
+        self.assertEqual(after.count_ops(), {'u3': 2, 'cx': 1})
+        self.assertTrue(matrix_equal(Operator(circuit).data,
+                                     Operator(dag_to_circuit(after)).data,
+                                     ignore_phase=True))
+
+    def test_merge_native_gates_identity(self):
+        """Runs of native 1q gates equal to the identity are removed."""
+        qr = QuantumRegister(1, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.h(qr[0])
+        circuit.x(qr[0])
+        circuit.rx(-np.pi, qr[0])
+        dag = circuit_to_dag(circuit)
+
+        after = Optimize1qGates(['h', 'x', 'rx']).run(dag)
+
+        self.assertEqual(after.size(), 0)
+
+    def test_simplify_within_tolerance(self):
+        """Merged rotations within 1e-12 of a u1 or u2 gate are simplified."""
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.u3(1e-13, 0.1, 0.2, qr[0])
+        circuit.u1(0.3, qr[0])
+        circuit.u3(np.pi / 2 + 1e-13, 0.1, 0.2, qr[1])
+        circuit.u1(0.3, qr[1])
+        dag = circuit_to_dag(circuit)
+
+        after = Optimize1qGates().run(dag)
+
+        self.assertEqual(after.count_ops(), {'u1': 1, 'u2': 1})
+
+    def test_unsupported_gates(self):
+        """Gates other than the supported 1q gates cannot be merged."""
+        self.assertRaises(TranspilerError, Optimize1qGates, ['u3', 'cx'])
+
 
 if __name__ == '__main__':
     unittest.main()
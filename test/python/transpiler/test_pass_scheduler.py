@@ -16,10 +16,15 @@
 
 """Transpiler testing"""
 
+import tracemalloc
 import unittest.mock
 
-from qiskit import QuantumRegister, QuantumCircuit
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.dagcircuit import DAGCircuit
 from qiskit.transpiler import PassManager
+from qiskit.transpiler.passes import Unroller
+from qiskit.tools.events.pubsub import Subscriber
 from qiskit.compiler import transpile
 from qiskit.transpiler import TranspilerAccessError, TranspilerError
 from qiskit.transpiler.passmanager import DoWhileController, ConditionalController, \
@@ -28,7 +33,8 @@ from qiskit.test import QiskitTestCase
 from ._dummy_passes import (PassA_TP_NR_NP, PassB_TP_RA_PA, PassC_TP_RA_PA,
                             PassD_TP_NR_NP, PassE_AP_NR_NP, PassF_reduce_dag_property,
                             PassH_Bad_TP, PassI_Bad_AP, PassJ_Bad_NoReturn,
-                            PassK_check_fixed_point_property, PassM_AP_NR_NP)
+                            PassK_check_fixed_point_property, PassM_AP_NR_NP,
+                            PassN_AP_incremental, PassO_TP_remove_op)
 
 logger = "LocalLogger"
 
@@ -425,6 +431,65 @@ class TestUseCases(SchedulerTestCase):
                               'run analysis pass PassM_AP_NR_NP',
                               'self.argument1 = 2'])
 
+    def test_incremental_analysis(self):
+        """An incremental analysis pass is updated on the wires modified since its last run."""
+        qr = QuantumRegister(3)
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.cx(qr[1], qr[2])
+        self.passmanager.append(PassN_AP_incremental())
+        self.passmanager.append(PassO_TP_remove_op())
+        self.passmanager.append(PassN_AP_incremental())
+        self.passmanager.append(PassO_TP_remove_op())
+        self.passmanager.append(PassA_TP_NR_NP())
+        self.passmanager.append(PassN_AP_incremental())
+        self.assertScheduler(circuit, self.passmanager,
+                             ['run analysis pass PassN_AP_incremental',
+                              'run transformation pass PassO_TP_remove_op',
+                              'run analysis pass PassN_AP_incremental on 1 wires',
+                              'run transformation pass PassO_TP_remove_op',
+                              'run transformation pass PassA_TP_NR_NP',
+                              'run analysis pass PassN_AP_incremental on 2 wires'])
+
+    def test_run_dag(self):
+        """A DAGCircuit input is transformed and returned as a DAGCircuit."""
+        self.passmanager.append(PassA_TP_NR_NP())
+        self.passmanager.append(PassE_AP_NR_NP(True))
+        dag = circuit_to_dag(self.circuit)
+        with self.assertLogs(logger, level='INFO') as cm:
+            out = self.passmanager.run(dag)
+        self.assertIsInstance(out, DAGCircuit)
+        self.assertEqual(out, dag)
+        self.assertEqual([record.message for record in cm.records],
+                         ['run transformation pass PassA_TP_NR_NP',
+                          'run analysis pass PassE_AP_NR_NP',
+                          'set property as True'])
+
+    def test_instructions_not_modified(self):
+        """The input circuit instructions are not modified when unrolling conditionals."""
+        qr = QuantumRegister(1)
+        cr = ClassicalRegister(1)
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0]).c_if(cr, 1)
+        circuit.h(qr[0])
+        self.passmanager.append(Unroller(['u2']))
+        out = self.passmanager.run(circuit)
+        self.assertEqual([inst.control for inst, _, _ in circuit.data], [(cr, 1), None])
+        self.assertIsNone(circuit.data[0][0].definition[0][0].control)
+        self.assertEqual([inst.control for inst, _, _ in out.data], [(cr, 1), None])
+
+    def test_output_independent_of_input(self):
+        """The returned circuit does not share instructions with the input circuit."""
+        qr = QuantumRegister(2)
+        circuit = QuantumCircuit(qr)
+        circuit.u3(0.1, 0.2, 0.3, qr[0])
+        circuit.cx(qr[0], qr[1])
+        out = PassManager([Unroller(['u3', 'cx'])]).run(circuit)
+        out.data[0][0].params[0] = 9.0
+        out.data[1][0].name = 'edited'
+        self.assertEqual(circuit.data[0][0].params[0], 0.1)
+        self.assertEqual(circuit.data[1][0].name, 'cx')
+
 
 class DoXTimesController(FlowController):
     """A control-flow plugin for running a set of passes an X amount of times."""
@@ -631,6 +696,63 @@ class TestLogPasses(QiskitTestCase):
         self.assertPassLog(passmanager, ['PassE_AP_NR_NP'])
 
 
+class TestProfilePasses(QiskitTestCase):
+    """Testing the profile_passes option."""
+
+    def test_profile_loop(self):
+        """Every execution in a do-while loop is profiled and published."""
+        passmanager = PassManager()
+        passmanager.profile_passes = True
+        passmanager.append(
+            [PassK_check_fixed_point_property(),
+             PassA_TP_NR_NP(),
+             PassF_reduce_dag_property()],
+            do_while=lambda property_set: not property_set['property_fixed_point'])
+
+        published = []
+        subscriber = Subscriber()
+        subscriber.subscribe("terra.transpiler.run_pass.done", published.append)
+        try:
+            passmanager.run(QuantumCircuit(QuantumRegister(1)))
+        finally:
+            subscriber.unsubscribe("terra.transpiler.run_pass.done", published.append)
+
+        profile = passmanager.property_set['pass_profile']
+        self.assertEqual(profile, published)
+        self.assertEqual([pass_profile['name'] for pass_profile in profile],
+                         ['PassG_calculates_dag_property', 'PassK_check_fixed_point_property',
+                          'PassA_TP_NR_NP', 'PassF_reduce_dag_property'] * 7)
+        for pass_profile in profile:
+            self.assertEqual(pass_profile['size_before'], 0)
+            self.assertEqual(pass_profile['size_after'], 0)
+            self.assertGreaterEqual(pass_profile['running_time'], 0)
+            self.assertGreaterEqual(pass_profile['memory_peak'], 0)
+
+    def test_profile_while_tracing(self):
+        """The peak traced before a pass is not reported as the peak of the pass."""
+        passmanager = PassManager(PassA_TP_NR_NP())
+        passmanager.profile_passes = True
+        tracemalloc.start()
+        try:
+            blob = bytearray(10 ** 7)
+            del blob
+            passmanager.run(QuantumCircuit(QuantumRegister(1)))
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+
+        pass_profile = passmanager.property_set['pass_profile'][0]
+        self.assertEqual(pass_profile['name'], 'PassA_TP_NR_NP')
+        self.assertGreaterEqual(pass_profile['memory_peak'], 0)
+        self.assertLess(pass_profile['memory_peak'], 10 ** 6)
+
+    def test_no_profile(self):
+        """Passes are not profiled by default."""
+        passmanager = PassManager(PassA_TP_NR_NP())
+        passmanager.run(QuantumCircuit(QuantumRegister(1)))
+        self.assertIsNone(passmanager.property_set['pass_profile'])
+
+
 class TestPassManagerReuse(SchedulerTestCase):
     """The PassManager instance should be resusable."""
 
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the SabreSwap and SabreLayout passes"""
+
+import unittest
+
+from qiskit import ClassicalRegister, QuantumRegister, QuantumCircuit
+from qiskit import BasicAer, execute
+from qiskit.converters import circuit_to_dag, dag_to_circuit
+from qiskit.test import QiskitTestCase
+from qiskit.transpiler import CouplingMap, Layout
+from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.transpiler.passes import SabreSwap, SabreLayout, CheckMap
+
+
+class TestSabreSwap(QiskitTestCase):
+    """Tests the SabreSwap pass."""
+
+    def setUp(self):
+        # A 3x3 grid
+        self.coupling_map = CouplingMap([[0, 1], [1, 2], [3, 4], [4, 5], [6, 7], [7, 8],
+                                         [0, 3], [3, 6], [1, 4], [4, 7], [2, 5], [5, 8]])
+
+    def assertMapped(self, dag, coupling_map):
+        """Assert that the two-qubit gates of dag are on coupled qubits."""
+        check_map = CheckMap(coupling_map)
+        check_map.run(dag)
+        self.assertTrue(check_map.property_set['is_swap_mapped'])
+
+    def test_mapped_circuit_unchanged(self):
+        """A circuit compatible with the coupling map gets no swap."""
+        qr = QuantumRegister(3, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[1], qr[2])
+        dag = circuit_to_dag(circuit)
+
+        mapped_dag = SabreSwap(CouplingMap([[0, 1], [1, 2]])).run(dag)
+
+        self.assertEqual(dag_to_circuit(mapped_dag), circuit)
+
+    def test_single_swap(self):
+        """A cx between qubits at distance two needs a single swap."""
+        qr = QuantumRegister(3, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[2])
+        dag = circuit_to_dag(circuit)
+
+        mapped_dag = SabreSwap(CouplingMap([[0, 1], [1, 2]])).run(dag)
+
+        self.assertEqual(mapped_dag.count_ops(), {'swap': 1, 'cx': 1})
+
+    def test_output_on_physical_qubits(self):
+        """The circuit is routed from the layout, on a register of the physical qubits."""
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        dag = circuit_to_dag(circuit)
+
+        sabre_swap = SabreSwap(self.coupling_map)
+        sabre_swap.property_set['layout'] = Layout({qr[0]: 8, qr[1]: 5})
+        mapped_dag = sabre_swap.run(dag)
+
+        device = QuantumRegister(9, 'q')
+        expected = QuantumCircuit(device)
+        expected.cx(device[8], device[5])
+        self.assertEqual(dag_to_circuit(mapped_dag), expected)
+
+    def test_measurements_and_conditions(self):
+        """The routed circuit measures the same values."""
+        qr = QuantumRegister(9, 'qr')
+        cr = ClassicalRegister(9, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.x(qr[0])
+        circuit.x(qr[4])
+        circuit.cx(qr[0], qr[8])
+        circuit.cx(qr[2], qr[6])
+        circuit.cx(qr[8], qr[1])
+        circuit.cx(qr[4], qr[3])
+        circuit.barrier(qr)
+        circuit.cx(qr[3], qr[5])
+        circuit.measure(qr[5], cr[5])
+        circuit.x(qr[7]).c_if(cr, 32)
+        circuit.measure(qr, cr)
+        dag = circuit_to_dag(circuit)
+
+        mapped_dag = SabreSwap(self.coupling_map, seed=0).run(dag)
+
+        self.assertMapped(mapped_dag, self.coupling_map)
+        self.assertGreater(mapped_dag.count_ops()['swap'], 0)
+        backend = BasicAer.get_backend('qasm_simulator')
+        counts = execute(dag_to_circuit(mapped_dag), backend, shots=10).result().get_counts()
+        self.assertEqual(counts, {'110111011': 10})
+
+    def test_seed(self):
+        """Routing with a seed is reproducible."""
+        qr = QuantumRegister(9, 'qr')
+        circuit = QuantumCircuit(qr)
+        for control in range(9):
+            for target in range(9):
+                if control != target:
+                    circuit.cx(qr[control], qr[target])
+        dag = circuit_to_dag(circuit)
+
+        mapped_dag = SabreSwap(self.coupling_map, seed=42).run(dag)
+
+        self.assertMapped(mapped_dag, self.coupling_map)
+        self.assertEqual(mapped_dag, SabreSwap(self.coupling_map, seed=42).run(dag))
+
+    def test_three_qubit_gates(self):
+        """Gates on more than two qubits must be unrolled first."""
+        qr = QuantumRegister(3, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.ccx(qr[0], qr[1], qr[2])
+
+        with self.assertRaises(TranspilerError):
+            SabreSwap(self.coupling_map).run(circuit_to_dag(circuit))
+
+
+class TestSabreLayout(QiskitTestCase):
+    """Tests the SabreLayout pass."""
+
+    def test_chain_on_line(self):
+        """A chain of cx gates gets a layout that needs no swap."""
+        coupling_map = CouplingMap([[0, 1], [1, 2], [2, 3], [3, 4], [4, 5]])
+        qr = QuantumRegister(6, 'qr')
+        circuit = QuantumCircuit(qr)
+        for control, target in [(0, 3), (3, 5), (5, 1), (1, 4), (4, 2)]:
+            circuit.cx(qr[control], qr[target])
+        dag = circuit_to_dag(circuit)
+
+        sabre_layout = SabreLayout(coupling_map, seed=0)
+        sabre_layout.run(dag)
+        layout = sabre_layout.property_set['layout']
+
+        self.assertEqual(sorted(layout[qubit] for qubit in qr), list(range(6)))
+        sabre_swap = SabreSwap(coupling_map, initial_layout=layout)
+        self.assertEqual(sabre_swap.run(dag).count_ops(), {'cx': 5})
+
+    def test_too_wide(self):
+        """The circuit must fit the coupling map."""
+        circuit = QuantumCircuit(QuantumRegister(3, 'q'))
+
+        with self.assertRaises(TranspilerError):
+            SabreLayout(CouplingMap([[0, 1]])).run(circuit_to_dag(circuit))
+
+
+if __name__ == '__main__':
+    unittest.main()
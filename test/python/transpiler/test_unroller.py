@@ -21,6 +21,7 @@ from sympy import pi
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.extensions.simulator import snapshot
 from qiskit.transpiler.passes import Unroller
+from qiskit.transpiler.passes.unroller import _SHARED_DECOMPOSITIONS
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
 from qiskit.exceptions import QiskitError
@@ -321,3 +322,58 @@ class TestUnroller(QiskitTestCase):
         expected.u1(gamma, qr2[3])
 
         self.assertEqual(circuit_to_dag(expected), out_dag)
+
+    def test_unroll_repeated_gates(self):
+        """Test unrolling repeated, conditioned and custom gates reusing decompositions."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        sub = QuantumCircuit(QuantumRegister(2, 'q'))
+        sub.h(0)
+        sub.cx(0, 1)
+        circuit = QuantumCircuit(qr, cr)
+        for _ in range(3):
+            circuit.ccx(qr[0], qr[1], qr[2])
+            circuit.cswap(qr[2], qr[0], qr[1])
+            circuit.rx(0.5, qr[1]).c_if(cr, 1)
+            circuit.append(sub.to_instruction(), [qr[2], qr[0]])
+        basis = ['u1', 'u2', 'u3', 'cx']
+        out_dag = Unroller(basis).run(circuit_to_dag(circuit))
+
+        # Unroll one instruction at a time, so no decomposition is reused
+        expected = circuit_to_dag(QuantumCircuit(qr, cr))
+        for inst, qargs, cargs in circuit.data:
+            single = QuantumCircuit(qr, cr)
+            single.append(inst, qargs, cargs)
+            expected.extend_back(Unroller(basis).run(circuit_to_dag(single)))
+        self.assertEqual(out_dag, expected)
+        conditions = [node.condition for node in out_dag.op_nodes()
+                      if node.condition is not None]
+        self.assertEqual(conditions, [(cr, 1)] * 3)
+
+        for _ in range(2):
+            shared_dag = Unroller(basis, shared_cache=True).run(circuit_to_dag(circuit))
+            self.assertEqual(shared_dag, expected)
+            self.assertTrue(_SHARED_DECOMPOSITIONS)
+
+    def test_unrolled_ops_not_shared(self):
+        """Test every unrolled instance has its own instructions."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.rx(0.5, qr[0])
+        circuit.rx(0.5, qr[1])
+        circuit.rx(0.5, qr[0]).c_if(cr, 1)
+        basis = ['u1', 'u2', 'u3', 'cx']
+
+        first_dag = Unroller(basis, shared_cache=True).run(circuit_to_dag(circuit))
+        second_dag = Unroller(basis, shared_cache=True).run(circuit_to_dag(circuit))
+        first_ops = [node.op for node in first_dag.topological_op_nodes()]
+        first_ops[0].params[0] = 9.0
+        first_ops[2].params[0] = 9.0
+        first_ops[0].control = (cr, 1)
+
+        self.assertEqual([float(node.op.params[0]) for node in first_dag.topological_op_nodes()],
+                         [9.0, 0.5, 9.0])
+        for node in second_dag.topological_op_nodes():
+            self.assertEqual(float(node.op.params[0]), 0.5)
+            self.assertEqual(node.op.control, node.condition)